@@ -0,0 +1,34 @@
+"""Helpers shared by the benchmark scripts of this directory.
+
+Each script benchmarks one change made to the packages vendored in the
+layer and is run on its own, e.g. ``python bench_botocore_parsers.py``.
+"""
+import os
+import sys
+import time
+
+LAYER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'python'
+)
+
+
+def use_layer():
+    """Import the packages from the layer instead of the interpreter's."""
+    if LAYER_PATH not in sys.path:
+        sys.path.insert(0, LAYER_PATH)
+
+
+def best_of(func, repeat=5, number=1):
+    """Return the best time in seconds of ``number`` calls to ``func``."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def report(name, seconds, unit='ms'):
+    scale = {'s': 1, 'ms': 1e3, 'us': 1e6}[unit]
+    print(f'{name:40s} {seconds * scale:10.2f} {unit}')
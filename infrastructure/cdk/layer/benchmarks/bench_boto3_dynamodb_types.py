@@ -0,0 +1,118 @@
+"""Serialize and deserialize a 400 KB item and a 1 MB page of items.
+
+Compares boto3's TypeSerializer and TypeDeserializer with the per-value
+getattr dispatch and context lookups they used before.
+"""
+import json
+from decimal import Decimal
+
+from _util import best_of, report, use_layer
+
+use_layer()
+
+from boto3.dynamodb.types import (  # noqa: E402
+    DYNAMODB_CONTEXT,
+    Binary,
+    TypeDeserializer,
+    TypeSerializer,
+)
+
+
+class ReferenceSerializer(TypeSerializer):
+    def serialize(self, value):
+        dynamodb_type = self._reference_dynamodb_type(value)
+        serializer = getattr(self, f'_serialize_{dynamodb_type}'.lower())
+        return {dynamodb_type: serializer(value)}
+
+    def _reference_dynamodb_type(self, value):
+        if self._is_null(value):
+            return 'NULL'
+        elif self._is_boolean(value):
+            return 'BOOL'
+        elif self._is_number(value):
+            return 'N'
+        elif self._is_string(value):
+            return 'S'
+        elif self._is_binary(value):
+            return 'B'
+        elif self._is_type_set(value, self._is_number):
+            return 'NS'
+        elif self._is_type_set(value, self._is_string):
+            return 'SS'
+        elif self._is_type_set(value, self._is_binary):
+            return 'BS'
+        elif self._is_map(value):
+            return 'M'
+        elif self._is_listlike(value):
+            return 'L'
+        raise TypeError(f'Unsupported type "{type(value)}"')
+
+    def _serialize_n(self, value):
+        number = str(DYNAMODB_CONTEXT.create_decimal(value))
+        if number in ['Infinity', 'NaN']:
+            raise TypeError('Infinity and NaN not supported')
+        return number
+
+
+class ReferenceDeserializer(TypeDeserializer):
+    def deserialize(self, value):
+        dynamodb_type = list(value.keys())[0]
+        deserializer = getattr(self, f'_deserialize_{dynamodb_type}'.lower())
+        return deserializer(value[dynamodb_type])
+
+    def _deserialize_n(self, value):
+        return DYNAMODB_CONTEXT.create_decimal(value)
+
+
+def _schedule(i):
+    return {
+        'pk': f'home#{i}',
+        'sk': 'date#2023-01-01',
+        'charge': Decimal('0.55'),
+        'capacity': 75,
+        'raw': Binary(b'\x00\x01'),
+        'tags': {'solar', 'night'},
+        'slots': [
+            {'time': f'{hour:02d}:00', 'on': hour % 2 == 0, 'kw': hour * 7}
+            for hour in range(24)
+        ],
+    }
+
+
+def _items(size):
+    # About ``size`` bytes once serialized to DynamoDB JSON.
+    serialized = TypeSerializer().serialize(_schedule(0))
+    item_size = len(json.dumps(serialized, default=repr))
+    return [_schedule(i) for i in range(size // item_size + 1)]
+
+
+def main():
+    item = {'pk': 'big', 'schedules': _items(400_000)}
+    page = _items(1_000_000)
+    cases = [('400 KB item', [item]), ('1 MB page', page)]
+    for label, items in cases:
+        for name, serializer, deserializer in (
+            ('reference', ReferenceSerializer(), ReferenceDeserializer()),
+            ('current', TypeSerializer(), TypeDeserializer()),
+        ):
+            serialized = [
+                {k: serializer.serialize(v) for k, v in item.items()}
+                for item in items
+            ]
+
+            def serialize():
+                for item in items:
+                    for value in item.values():
+                        serializer.serialize(value)
+
+            def deserialize():
+                for item in serialized:
+                    for value in item.values():
+                        deserializer.deserialize(value)
+
+            report(f'{label} serialize, {name}', best_of(serialize))
+            report(f'{label} deserialize, {name}', best_of(deserialize))
+
+
+if __name__ == '__main__':
+    main()
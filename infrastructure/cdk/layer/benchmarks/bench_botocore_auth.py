@@ -0,0 +1,85 @@
+"""Sign small DynamoDB and CloudWatch requests with SigV4Auth.add_auth.
+
+Compares the cached signing key and single-pass canonical headers with the
+original code paths, which a subclass overriding ``_sign`` and
+``_header_value`` still takes.
+"""
+from _util import best_of, report, use_layer
+
+use_layer()
+
+from botocore.auth import SigV4Auth  # noqa: E402
+from botocore.awsrequest import AWSRequest  # noqa: E402
+from botocore.credentials import Credentials  # noqa: E402
+
+USER_AGENT = (
+    'Boto3/1.28.85 md/Botocore#1.31.85 ua/2.0 os/linux#6.1 '
+    'md/arch#x86_64 lang/python#3.11.6 md/pyimpl#CPython Botocore/1.31.85'
+)
+REQUESTS = {
+    'dynamodb': dict(
+        method='POST',
+        url='https://dynamodb.us-east-1.amazonaws.com/',
+        data=(
+            b'{"TableName":"t","Key":{"id":{"S":"car-1"}},'
+            b'"UpdateExpression":"SET a=:a",'
+            b'"ExpressionAttributeValues":{":a":{"N":"1"}}}'
+        ),
+        headers={
+            'X-Amz-Target': 'DynamoDB_20120810.UpdateItem',
+            'Content-Type': 'application/x-amz-json-1.0',
+            'User-Agent': USER_AGENT,
+        },
+    ),
+    'monitoring': dict(
+        method='POST',
+        url='https://monitoring.us-east-1.amazonaws.com/',
+        data=(
+            b'Action=PutMetricData&Version=2010-08-01&Namespace=Sim&'
+            b'MetricData.member.1.MetricName=Speed&'
+            b'MetricData.member.1.Value=42.0'
+        ),
+        headers={
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'User-Agent': USER_AGENT,
+        },
+    ),
+}
+
+
+class UncachedSigV4Auth(SigV4Auth):
+    def _sign(self, key, msg, hex=False):
+        return super()._sign(key, msg, hex)
+
+    def _header_value(self, value):
+        return super()._header_value(value)
+
+
+def main():
+    credentials = Credentials(
+        'AKIDEXAMPLE',
+        'wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY',
+        'session-token' * 20,
+    )
+    number = 2000
+    for service_name, request_kwargs in REQUESTS.items():
+        for name, signer_cls in (
+            ('uncached', UncachedSigV4Auth),
+            ('cached', SigV4Auth),
+        ):
+
+            def sign():
+                request = AWSRequest(**request_kwargs)
+                signer_cls(credentials, service_name, 'us-east-1').add_auth(
+                    request
+                )
+
+            report(
+                f'{service_name} add_auth, {name}',
+                best_of(sign, number=number),
+                'us',
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""Create clients from a session that already loaded the service models.
+
+Compares generating the client class for every client, by making the shared
+class cache of ``botocore.client`` hold nothing, with reusing the class
+generated for the first client of a service.
+"""
+import os
+
+from _util import best_of, report, use_layer
+
+use_layer()
+
+import botocore.session  # noqa: E402
+from botocore import client  # noqa: E402
+
+SERVICES = ('dynamodb', 'iotsitewise', 's3')
+
+
+def main():
+    os.environ.setdefault('AWS_ACCESS_KEY_ID', 'access')
+    os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'secret')
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+    cache_size = client._CLIENT_CLASS_CACHE_SIZE
+    for service_name in SERVICES:
+        # One session loads the models, as a warm Lambda container would.
+        session = botocore.session.get_session()
+        session.create_client(service_name)
+
+        def create():
+            session.create_client(service_name)
+
+        for name, size in (('unshared', 0), ('shared', cache_size)):
+            client._CLIENT_CLASS_CACHE_SIZE = size
+            client._CLIENT_CLASS_CACHE.clear()
+            report(
+                f'{service_name} create_client, {name}',
+                best_of(create, number=20),
+            )
+    client._CLIENT_CLASS_CACHE_SIZE = cache_size
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Paginate 100 ListTables pages with and without PrefetchPages.
+
+Each fake request takes 10 ms and the caller spends 10 ms on every page, so
+prefetching can overlap the two.
+"""
+import time
+
+from _util import report, use_layer
+
+use_layer()
+
+import botocore.session  # noqa: E402
+
+PAGES = 100
+LATENCY = 0.01
+
+
+def _list_tables(**kwargs):
+    time.sleep(LATENCY)
+    n = int(kwargs.get('ExclusiveStartTableName', 't-1')[1:]) + 1
+    response = {'TableNames': ['t%d' % n]}
+    if n + 1 < PAGES:
+        response['LastEvaluatedTableName'] = 't%d' % n
+    return response
+
+
+def main():
+    session = botocore.session.get_session()
+    client = session.create_client(
+        'dynamodb',
+        region_name='us-east-1',
+        aws_access_key_id='access',
+        aws_secret_access_key='secret',
+    )
+    paginator = client.get_paginator('list_tables')
+    paginator._method = _list_tables
+
+    for prefetch in (None, 1, 2, 4):
+        config = {} if prefetch is None else {'PrefetchPages': prefetch}
+        start = time.perf_counter()
+        for _ in paginator.paginate(PaginationConfig=config):
+            time.sleep(LATENCY)
+        report(
+            f'PrefetchPages={prefetch}', time.perf_counter() - start, 's'
+        )
+
+
+if __name__ == '__main__':
+    main()
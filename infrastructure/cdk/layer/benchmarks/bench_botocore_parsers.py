@@ -0,0 +1,78 @@
+"""Parse a ~1 MB DynamoDB Query page with the JSON response parsers.
+
+Compares the generic shape walk, the compiled per-shape parser and the
+compiled parser in raw AttributeValue mode. Their times exclude the
+``json.loads`` of the body, which is reported on its own.
+"""
+import base64
+import json
+
+from _util import best_of, report, use_layer
+
+use_layer()
+
+import botocore.session  # noqa: E402
+from botocore import parsers  # noqa: E402
+
+
+def _item(i):
+    return {
+        'pk': {'S': 'type#home%d' % i},
+        'sk': {'S': 'date#2023-01-01'},
+        'charge': {'N': '0.55'},
+        'bin': {'B': base64.b64encode(b'abc').decode()},
+        'schedule': {
+            'L': [
+                {
+                    'M': {
+                        'time': {'S': '2023-01-01T%02d:00Z' % h},
+                        'charging': {'BOOL': h % 2 == 0},
+                        'ns': {'NS': ['1', '2']},
+                    }
+                }
+                for h in range(24)
+            ]
+        },
+    }
+
+
+def main():
+    session = botocore.session.get_session()
+    shape = (
+        session.get_service_model('dynamodb')
+        .operation_model('Query')
+        .output_shape
+    )
+    body = {'Items': [], 'Count': 0, 'ScannedCount': 0}
+    while len(json.dumps(body)) < 1000000:
+        body['Items'].append(_item(len(body['Items'])))
+    raw = json.dumps(body).encode()
+    print(f"{len(body['Items'])} items, {len(raw)} bytes")
+
+    parser = parsers.create_parser('json')
+    factory = parsers.ResponseParserFactory()
+    factory.set_parser_defaults(raw_attribute_values=True)
+    raw_parser = factory.create_parser('json')
+
+    def timed(parse):
+        # The raw mode decodes in place, so every run gets a fresh document.
+        def run():
+            parse(json.loads(raw))
+
+        return best_of(run, repeat=5) - loads
+
+    loads = best_of(lambda: json.loads(raw), repeat=5)
+    report('json.loads', loads)
+    report('shape walk', timed(lambda d: parser._parse_shape(shape, d)))
+    report(
+        'compiled',
+        timed(lambda d: parser._parse_compiled_shape(shape, d)),
+    )
+    report(
+        'compiled, raw attribute values',
+        timed(lambda d: raw_parser._parse_compiled_shape(shape, d)),
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""Serialize typical requests with the compiled request serializers.
+
+Compares serialize_to_request with the per-shape functions against the
+generic _serialize walk they replace, for the JSON and query protocols.
+"""
+import datetime
+
+from _util import best_of, report, use_layer
+
+use_layer()
+
+import botocore.session  # noqa: E402
+from botocore import serialize  # noqa: E402
+
+NOW = datetime.datetime(2023, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+SCHEDULE = {
+    'L': [
+        {'M': {'time': {'S': f'{hour:02d}:00'}, 'on': {'BOOL': hour % 2 == 0}}}
+        for hour in range(24)
+    ]
+}
+CALLS = [
+    (
+        'dynamodb',
+        'UpdateItem',
+        {
+            'TableName': 'schedules',
+            'Key': {'pk': {'S': 'home#1'}, 'sk': {'S': 'date#2023-01-01'}},
+            'UpdateExpression': 'SET #s = :s, #c = :c',
+            'ExpressionAttributeNames': {'#s': 'schedule', '#c': 'charge'},
+            'ExpressionAttributeValues': {
+                ':s': SCHEDULE,
+                ':c': {'N': '0.55'},
+            },
+        },
+    ),
+    (
+        'dynamodb',
+        'BatchWriteItem',
+        {
+            'RequestItems': {
+                'schedules': [
+                    {
+                        'PutRequest': {
+                            'Item': {'pk': {'S': f'home#{i}'}, 's': SCHEDULE}
+                        }
+                    }
+                    for i in range(25)
+                ]
+            }
+        },
+    ),
+    (
+        'cloudwatch',
+        'PutMetricData',
+        {
+            'Namespace': 'Simulation',
+            'MetricData': [
+                {
+                    'MetricName': 'Speed',
+                    'Dimensions': [{'Name': 'Car', 'Value': f'car-{i}'}],
+                    'Timestamp': NOW,
+                    'Value': 42.0,
+                    'Unit': 'None',
+                }
+                for i in range(20)
+            ],
+        },
+    ),
+    (
+        'iotsitewise',
+        'BatchPutAssetPropertyValue',
+        {
+            'entries': [
+                {
+                    'entryId': f'e{i}',
+                    'propertyAlias': f'/car/{i}/speed',
+                    'propertyValues': [
+                        {
+                            'value': {'doubleValue': 42.0},
+                            'timestamp': {'timeInSeconds': 1672628645},
+                            'quality': 'GOOD',
+                        }
+                    ],
+                }
+                for i in range(10)
+            ]
+        },
+    ),
+]
+
+
+def _walk_serializer(protocol):
+    base = serialize.SERIALIZERS[protocol]
+    if issubclass(base, serialize.QuerySerializer):
+
+        def _get_compiled_serializer(self, shape):
+            def walk(serializer, serialized, value, prefix):
+                serializer._serialize(serialized, value, shape, prefix)
+
+            return walk
+
+    else:
+
+        def _get_compiled_serializer(self, shape):
+            def walk(serializer, value):
+                serialized = serializer.MAP_TYPE()
+                serializer._serialize(serialized, value, shape)
+                return serialized
+
+            return walk
+
+    walk_class = type(
+        f'Walk{base.__name__}',
+        (base,),
+        {'_get_compiled_serializer': _get_compiled_serializer},
+    )
+    return walk_class()
+
+
+def main():
+    session = botocore.session.get_session()
+    for service_name, operation_name, params in CALLS:
+        service_model = session.get_service_model(service_name)
+        operation_model = service_model.operation_model(operation_name)
+        protocol = service_model.protocol
+        compiled = serialize.SERIALIZERS[protocol]()
+        walk = _walk_serializer(protocol)
+        assert compiled.serialize_to_request(
+            params, operation_model
+        ) == walk.serialize_to_request(params, operation_model)
+        for name, serializer in (('walk', walk), ('compiled', compiled)):
+            report(
+                f'{operation_name} {name}',
+                best_of(
+                    lambda: serializer.serialize_to_request(
+                        params, operation_model
+                    ),
+                    number=2000,
+                ),
+                'us',
+            )
+
+
+if __name__ == '__main__':
+    main()
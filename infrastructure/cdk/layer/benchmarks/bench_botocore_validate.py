@@ -0,0 +1,63 @@
+"""Validate a BatchWriteItem request of 25 deeply nested items.
+
+Compares the full ``_validate`` walk with ``ParamValidator.validate``, which
+runs the compiled check and only walks the parameters when it fails.
+"""
+from _util import best_of, report, use_layer
+
+use_layer()
+
+import botocore.session  # noqa: E402
+from botocore import validate  # noqa: E402
+
+
+def _attribute_value(depth):
+    if depth == 0:
+        return {'S': 'leaf'}
+    return {
+        'M': {
+            'a': _attribute_value(depth - 1),
+            'l': {'L': [{'N': '1'}, _attribute_value(depth - 1)]},
+        }
+    }
+
+
+def main():
+    session = botocore.session.get_session()
+    shape = (
+        session.get_service_model('dynamodb')
+        .operation_model('BatchWriteItem')
+        .input_shape
+    )
+    params = {
+        'RequestItems': {
+            'table': [
+                {
+                    'PutRequest': {
+                        'Item': {
+                            'pk': {'S': 'type#home%d' % i},
+                            'sk': {'S': 'status'},
+                            'doc': _attribute_value(5),
+                        }
+                    }
+                }
+                for i in range(25)
+            ]
+        }
+    }
+    validator = validate.ParamValidator()
+    assert not validator.validate(params, shape).has_errors()
+
+    def walk():
+        errors = validate.ValidationErrors()
+        validator._validate(params, shape, errors, name='')
+
+    report('full walk', best_of(walk, number=20))
+    report(
+        'compiled check',
+        best_of(lambda: validator.validate(params, shape), number=20),
+    )
+
+
+if __name__ == '__main__':
+    main()
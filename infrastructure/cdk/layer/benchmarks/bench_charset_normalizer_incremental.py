@@ -0,0 +1,49 @@
+"""Detect the charset of a minified JSON download chunk by chunk.
+
+Compares from_bytes on the whole payload with an IncrementalDetector fed
+16 kB chunks, which stops once the first 64 kB sample is conclusive.
+"""
+import json
+
+from _util import best_of, report, use_layer
+
+use_layer()
+
+from charset_normalizer import from_bytes  # noqa: E402
+from charset_normalizer.api import IncrementalDetector  # noqa: E402
+
+CHUNK_SIZE = 16384
+
+
+def _payload(size):
+    entries = [{'name': 'Société Générale café', 'id': 0}]
+    while len(json.dumps(entries, ensure_ascii=False)) < size:
+        entries.extend(
+            {'name': 'Société Générale café', 'id': i}
+            for i in range(len(entries), 2 * len(entries))
+        )
+    return json.dumps(entries, ensure_ascii=False).encode('utf-8')
+
+
+def main():
+    for size in (1_000_000, 5_000_000):
+        payload = _payload(size)
+
+        def incremental():
+            detector = IncrementalDetector()
+            for start in range(0, len(payload), CHUNK_SIZE):
+                if detector.feed(payload[start : start + CHUNK_SIZE]):
+                    break
+            return detector.close().best().encoding
+
+        assert incremental() == from_bytes(payload).best().encoding
+        label = f'{len(payload) / 1e6:.1f} MB'
+        report(
+            f'{label} from_bytes',
+            best_of(lambda: from_bytes(payload), repeat=3),
+        )
+        report(f'{label} IncrementalDetector', best_of(incremental, repeat=3))
+
+
+if __name__ == '__main__':
+    main()
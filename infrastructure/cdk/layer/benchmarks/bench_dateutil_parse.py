@@ -0,0 +1,41 @@
+"""Parse ISO-8601 timestamps with dateutil.
+
+Compares parser.parse() through the tokenizer, parser.parse() taking the
+ISO fast path, and isoparse().
+"""
+from _util import best_of, report, use_layer
+
+use_layer()
+
+from dateutil.parser import isoparse, parse, parser  # noqa: E402
+
+TIMESTAMPS = {
+    'naive': '2023-06-01T10:30:00',
+    'Z': '2023-06-01T10:30:00Z',
+    'offset': '2023-06-01T10:30:00.123456+02:00',
+}
+
+
+class TokenizerParser(parser):
+    def _parse_iso(self, timestr, ignoretz):
+        return None
+
+
+def main():
+    tokenizer = TokenizerParser()
+    for name, timestamp in TIMESTAMPS.items():
+        assert parse(timestamp) == tokenizer.parse(timestamp)
+        for label, func in (
+            ('tokenizer', tokenizer.parse),
+            ('parse', parse),
+            ('isoparse', isoparse),
+        ):
+            report(
+                f'{name} {label}',
+                best_of(lambda: func(timestamp), number=2000),
+                'us',
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Import idna and encode host names with it.
+
+Measures the import with the first UTS46 encode, in a fresh interpreter,
+and compares encoding a host name with and without the encode cache.
+"""
+import subprocess
+import sys
+
+from _util import LAYER_PATH, best_of, report, use_layer
+
+use_layer()
+
+import idna  # noqa: E402
+from idna import core  # noqa: E402
+
+HOSTS = [
+    'dynamodb.eu-west-1.amazonaws.com',
+    'bücher.example',
+    'ドメイン.テスト',
+]
+
+
+def _run(code):
+    setup = f'import sys; sys.path.insert(0, {LAYER_PATH!r})'
+    subprocess.run([sys.executable, '-c', f'{setup}; {code}'], check=True)
+
+
+def main():
+    report('interpreter start', best_of(lambda: _run('pass')))
+    report('import idna', best_of(lambda: _run('import idna')))
+    report(
+        'import idna, uts46 encode',
+        best_of(
+            lambda: _run(
+                'import idna; idna.encode("bücher.example", uts46=True)'
+            )
+        ),
+    )
+    uncached_encode = core._encode.__wrapped__
+    for host in HOSTS:
+        report(
+            f'{host} uncached',
+            best_of(
+                lambda: uncached_encode(host, False, True, False, False),
+                number=1000,
+            ),
+            'us',
+        )
+        report(
+            f'{host} cached',
+            best_of(lambda: idna.encode(host, uts46=True), number=1000),
+            'us',
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Parse a JSON forecast response with requests' Response.json().
+
+Compares decoding the body to text before parsing it, parsing the UTF-8
+bytes directly and, when orjson is installed, using it as ``json_loads``.
+"""
+import json
+
+from _util import best_of, report, use_layer
+
+use_layer()
+
+from requests.models import Response  # noqa: E402
+from requests.structures import CaseInsensitiveDict  # noqa: E402
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _forecast(size):
+    entries = []
+    body = b''
+    while len(body) < size:
+        entries.extend(
+            {
+                'time': f'2023-01-01T{hour:02d}:00:00Z',
+                'price': 0.1 + hour / 100,
+                'zone': 'Société Générale café',
+                'charging': hour % 2 == 0,
+            }
+            for hour in range(24)
+        )
+        body = json.dumps({'entries': entries}, ensure_ascii=False).encode()
+    return body
+
+
+def _response(body, text_path=False, json_loads=None):
+    response = Response()
+    response.status_code = 200
+    response.headers = CaseInsensitiveDict(
+        {'Content-Type': 'application/json'}
+    )
+    response.encoding = 'utf-8'
+    response._content = body
+    response.json_loads = json_loads
+    if text_path:
+        response._is_utf8_json = lambda: False
+    return response
+
+
+def main():
+    for size in (100_000, 1_000_000):
+        body = _forecast(size)
+        cases = [
+            ('text', _response(body, text_path=True)),
+            ('bytes', _response(body)),
+        ]
+        if orjson is not None:
+            cases.append(
+                ('bytes, orjson', _response(body, json_loads=orjson.loads))
+            )
+        for name, response in cases:
+            report(
+                f'{len(body) // 1000} kB json(), {name}',
+                best_of(response.json, number=5),
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -92,6 +92,15 @@ def client(*args, **kwargs):
     return _get_default_session().client(*args, **kwargs)
 
 
+def cached_client(*args, **kwargs):
+    """
+    Return a shared low-level service client using the default session.
+
+    See :py:meth:`boto3.session.Session.cached_client`.
+    """
+    return _get_default_session().cached_client(*args, **kwargs)
+
+
 def resource(*args, **kwargs):
     """
     Create a resource service client by name using the default session.
@@ -11,9 +11,17 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 import logging
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 logger = logging.getLogger(__name__)
 
+# Base and cap, in seconds, of the jittered exponential backoff applied
+# before resending items DynamoDB returned as unprocessed.
+UNPROCESSED_BACKOFF_BASE = 0.05
+UNPROCESSED_BACKOFF_CAP = 20
+
 
 def register_table_methods(base_classes, **kwargs):
     base_classes.insert(0, TableResource)
@@ -28,7 +36,7 @@ class TableResource:
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    def batch_writer(self, overwrite_by_pkeys=None):
+    def batch_writer(self, overwrite_by_pkeys=None, max_concurrency=1):
         """Create a batch writer object.
 
         This method creates a context manager for writing
@@ -54,17 +62,90 @@ class TableResource:
             if match new request item on specified primary keys. i.e
             ``["partition_key1", "sort_key2", "sort_key3"]``
 
+        :type max_concurrency: int
+        :param max_concurrency: The maximum number of ``batch_write_item``
+            requests in flight at once.  With the default of 1 batches are
+            sent synchronously.  Higher values send batches from a thread
+            pool, so writes to the same item that end up in different
+            batches may be applied in any order.  With ``overwrite_by_pkeys``
+            an unprocessed request is not resent once a newer request for
+            the same item was buffered or sent.
+
         """
         return BatchWriter(
-            self.name, self.meta.client, overwrite_by_pkeys=overwrite_by_pkeys
+            self.name,
+            self.meta.client,
+            overwrite_by_pkeys=overwrite_by_pkeys,
+            max_concurrency=max_concurrency,
+        )
+
+    def batch_reader(self, keys, max_concurrency=4, **kwargs):
+        """Create a batch reader object.
+
+        This method creates an iterator that reads the items for many keys
+        from Amazon DynamoDB in batch.
+
+        The batch reader splits ``keys`` into ``batch_get_item`` requests
+        of up to 100 keys each, sends up to ``max_concurrency`` of them at
+        once and automatically resends any unprocessed keys, backing off
+        between attempts.  Items are yielded as soon as the request that
+        read them completes, so they are not in the order of ``keys``, and
+        keys for items that do not exist yield nothing.
+
+        Example usage::
+
+            keys = [
+                {'pk': 'type#car', 'sk': 'status#charge'},
+                {'pk': 'type#ac', 'sk': 'status#temperature'},
+            ]
+            for item in table.batch_reader(keys):
+                print(item)
+
+        :type keys: list(dict)
+        :param keys: The primary keys of the items to read.  A key must not
+            appear more than once.
+
+        :type max_concurrency: int
+        :param max_concurrency: The maximum number of ``batch_get_item``
+            requests in flight at once.
+
+        :param kwargs: Any other parameters of a ``KeysAndAttributes``
+            request item, i.e ``ConsistentRead``,
+            ``ProjectionExpression`` and ``ExpressionAttributeNames``.
+
+        """
+        return BatchReader(
+            self.name,
+            self.meta.client,
+            keys,
+            max_concurrency=max_concurrency,
+            **kwargs,
         )
 
 
+def _backoff_unprocessed(attempt):
+    # Full jitter exponential backoff before resending unprocessed items
+    # or keys for the ``attempt``-th time in a row.
+    cap = min(UNPROCESSED_BACKOFF_CAP, UNPROCESSED_BACKOFF_BASE * 2**attempt)
+    delay = random.uniform(0, cap)
+    logger.debug(
+        "Resending unprocessed requests (attempt %s), backing off %.3fs",
+        attempt,
+        delay,
+    )
+    time.sleep(delay)
+
+
 class BatchWriter:
     """Automatically handle batch writes to DynamoDB for a single table."""
 
     def __init__(
-        self, table_name, client, flush_amount=25, overwrite_by_pkeys=None
+        self,
+        table_name,
+        client,
+        flush_amount=25,
+        overwrite_by_pkeys=None,
+        max_concurrency=1,
     ):
         """
 
@@ -92,12 +173,40 @@ class BatchWriter:
             if match new request item on specified primary keys. i.e
             ``["partition_key1", "sort_key2", "sort_key3"]``
 
+        :type max_concurrency: int
+        :param max_concurrency: The maximum number of ``batch_write_item``
+            requests in flight at once.  With the default of 1 batches are
+            sent synchronously.  Higher values send batches from a bounded
+            thread pool while new items keep being buffered, so writes to
+            the same item that end up in different batches may be applied
+            in any order.  With ``overwrite_by_pkeys`` an unprocessed
+            request is not resent once a newer request for the same item
+            was buffered or sent.
+
         """
         self._table_name = table_name
         self._client = client
         self._items_buffer = []
         self._flush_amount = flush_amount
         self._overwrite_by_pkeys = overwrite_by_pkeys
+        # Maps the primary key values of each buffered request to the
+        # request, so duplicates are found without scanning the buffer.
+        self._pkey_index = {}
+        self._max_concurrency = max_concurrency
+        self._executor = None
+        if max_concurrency > 1:
+            self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        # Maps each batch in flight to the requests it holds and its
+        # sequence number.
+        self._in_flight = {}
+        self._sequence = 0
+        # Maps the primary key values of each request in flight to the
+        # number of batches in flight holding the key and the sequence
+        # number of the latest of them.
+        self._sent_pkeys = {}
+        # Number of times each re-queued unprocessed request was already
+        # returned as unprocessed, keyed by id() of the buffered request.
+        self._unprocessed_attempts = {}
 
     def put_item(self, Item):
         self._add_request_and_process({'PutRequest': {'Item': Item}})
@@ -113,13 +222,69 @@ class BatchWriter:
 
     def _remove_dup_pkeys_request_if_any(self, request):
         pkey_values_new = self._extract_pkey_values(request)
-        for item in self._items_buffer:
-            if self._extract_pkey_values(item) == pkey_values_new:
-                self._items_buffer.remove(item)
-                logger.debug(
-                    "With overwrite_by_pkeys enabled, skipping " "request:%s",
-                    item,
-                )
+        try:
+            pkey = tuple(pkey_values_new)
+            duplicate = self._pkey_index.pop(pkey, None)
+        except TypeError:
+            # Unhashable key values can only be compared by scanning.
+            duplicate = None
+            for item in self._items_buffer:
+                if self._extract_pkey_values(item) == pkey_values_new:
+                    duplicate = item
+                    break
+        else:
+            self._pkey_index[pkey] = request
+        if duplicate is not None:
+            self._remove_from_buffer(duplicate)
+            logger.debug(
+                "With overwrite_by_pkeys enabled, skipping " "request:%s",
+                duplicate,
+            )
+
+    def _remove_from_buffer(self, request):
+        self._unprocessed_attempts.pop(id(request), None)
+        for i, item in enumerate(self._items_buffer):
+            if item is request:
+                del self._items_buffer[i]
+                return
+
+    def _forget_pkeys(self, requests):
+        # Drops sent requests from the primary key index.  A newer request
+        # for the same key that is still buffered keeps its entry.
+        if not self._overwrite_by_pkeys:
+            return
+        for request in requests:
+            try:
+                pkey = tuple(self._extract_pkey_values(request))
+                if self._pkey_index.get(pkey) is request:
+                    del self._pkey_index[pkey]
+            except TypeError:
+                pass
+
+    def _track_sent(self, requests, sequence):
+        if not self._overwrite_by_pkeys:
+            return
+        for request in requests:
+            try:
+                pkey = tuple(self._extract_pkey_values(request))
+            except TypeError:
+                continue
+            count, _ = self._sent_pkeys.get(pkey, (0, 0))
+            self._sent_pkeys[pkey] = (count + 1, sequence)
+
+    def _untrack_sent(self, requests):
+        if not self._overwrite_by_pkeys:
+            return
+        for request in requests:
+            try:
+                pkey = tuple(self._extract_pkey_values(request))
+                count, sequence = self._sent_pkeys[pkey]
+            except (TypeError, KeyError):
+                continue
+            if count > 1:
+                self._sent_pkeys[pkey] = (count - 1, sequence)
+            else:
+                del self._sent_pkeys[pkey]
 
     def _extract_pkey_values(self, request):
         if request.get('PutRequest'):
@@ -135,12 +300,47 @@ class BatchWriter:
         return None
 
     def _flush_if_needed(self):
+        if self._in_flight:
+            self._collect_finished_batches()
         if len(self._items_buffer) >= self._flush_amount:
             self._flush()
 
     def _flush(self):
         items_to_send = self._items_buffer[: self._flush_amount]
         self._items_buffer = self._items_buffer[self._flush_amount :]
+        self._forget_pkeys(items_to_send)
+        attempts = [
+            self._unprocessed_attempts.pop(id(request), 0)
+            for request in items_to_send
+        ]
+        self._sequence += 1
+        sequence = self._sequence
+        self._track_sent(items_to_send, sequence)
+        if self._executor is None:
+            try:
+                self._requeue_unprocessed(
+                    self._send_batch(items_to_send, attempts), sequence
+                )
+            finally:
+                self._untrack_sent(items_to_send)
+            return
+        # Keep at most max_concurrency batches in flight; wait for one to
+        # finish before sending another.
+        while len(self._in_flight) >= self._max_concurrency:
+            self._collect_finished_batches(block=True)
+        future = self._executor.submit(
+            self._send_batch, items_to_send, attempts
+        )
+        self._in_flight[future] = (items_to_send, sequence)
+
+    def _send_batch(self, items_to_send, attempts):
+        # ``attempts`` holds, for each request, how many times in a row it
+        # was returned as unprocessed.  Resends are delayed by a jittered
+        # exponential backoff instead of going out immediately.  Returns
+        # the unprocessed requests paired with their new attempt count.
+        attempt = max(attempts, default=0)
+        if attempt:
+            self._backoff(attempt)
         response = self._client.batch_write_item(
             RequestItems={self._table_name: items_to_send}
         )
@@ -148,20 +348,187 @@ class BatchWriter:
         if not unprocessed_items:
             unprocessed_items = {}
         item_list = unprocessed_items.get(self._table_name, [])
-        # Any unprocessed_items are immediately added to the
-        # next batch we send.
-        self._items_buffer.extend(item_list)
         logger.debug(
             "Batch write sent %s, unprocessed: %s",
             len(items_to_send),
-            len(self._items_buffer),
+            len(item_list),
         )
+        return [
+            (request, self._previous_attempt(request, items_to_send, attempts))
+            for request in item_list
+        ]
+
+    def _previous_attempt(self, request, items_to_send, attempts):
+        # Unprocessed items come back as new (deserialized) objects, so
+        # match them to the requests that were sent by value.
+        for sent, sent_attempt in zip(items_to_send, attempts):
+            if sent_attempt and sent == request:
+                return sent_attempt + 1
+        return 1
+
+    def _collect_finished_batches(self, block=False):
+        timeout = None if block else 0
+        done, _ = wait(
+            list(self._in_flight), timeout=timeout, return_when=FIRST_COMPLETED
+        )
+        # Requeue the unprocessed items of every finished batch before
+        # raising a failed batch's error, so the other batches' items are
+        # not lost with it.
+        error = None
+        for future in done:
+            items_to_send, sequence = self._in_flight.pop(future)
+            try:
+                unprocessed = future.result()
+            except Exception as e:
+                if error is None:
+                    error = e
+            else:
+                self._requeue_unprocessed(unprocessed, sequence)
+            self._untrack_sent(items_to_send)
+        if error is not None:
+            raise error
+
+    def _requeue_unprocessed(self, unprocessed, sequence):
+        # Any unprocessed_items are added to the next batch we send, and
+        # _send_batch backs off before sending it.  ``sequence`` is the
+        # sequence number of the batch they were sent in.
+        for request, attempt in unprocessed:
+            if self._overwrite_by_pkeys:
+                try:
+                    pkey = tuple(self._extract_pkey_values(request))
+                    if pkey in self._pkey_index:
+                        # A newer request for this item is already buffered.
+                        continue
+                    _, latest = self._sent_pkeys.get(pkey, (0, sequence))
+                    if latest > sequence:
+                        # A newer request for this item was sent in another
+                        # batch, so resending this one would revert it.
+                        continue
+                    self._pkey_index[pkey] = request
+                except TypeError:
+                    pass
+            self._unprocessed_attempts[id(request)] = attempt
+            self._items_buffer.append(request)
+
+    def _backoff(self, attempt):
+        _backoff_unprocessed(attempt)
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, tb):
         # When we exit, we need to keep flushing whatever's left
-        # until there's nothing left in our items buffer.
-        while self._items_buffer:
-            self._flush()
+        # until there's nothing left in our items buffer or in flight.
+        try:
+            while self._items_buffer or self._in_flight:
+                if self._items_buffer:
+                    self._flush()
+                else:
+                    self._collect_finished_batches(block=True)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+
+
+class BatchReader:
+    """Automatically handle batch reads from DynamoDB for a single table."""
+
+    def __init__(
+        self,
+        table_name,
+        client,
+        keys,
+        max_concurrency=4,
+        batch_size=100,
+        **kwargs,
+    ):
+        """
+
+        :type table_name: str
+        :param table_name: The name of the table.  The class handles
+            batch reads from a single table.
+
+        :type client: ``botocore.client.Client``
+        :param client: A botocore client.  Note this client
+            **must** have the dynamodb customizations applied
+            to it for transforming AttributeValues into the
+            wire protocol, i.e
+            ``boto3.resource('dynamodb').Table('foo').meta.client``.
+
+        :type keys: list(dict)
+        :param keys: The primary keys of the items to read.
+
+        :type max_concurrency: int
+        :param max_concurrency: The maximum number of ``batch_get_item``
+            requests in flight at once.
+
+        :type batch_size: int
+        :param batch_size: The number of keys to send in each
+            ``batch_get_item`` request.  DynamoDB accepts at most 100.
+
+        :param kwargs: Any other parameters of a ``KeysAndAttributes``
+            request item, i.e ``ConsistentRead``,
+            ``ProjectionExpression`` and ``ExpressionAttributeNames``.
+
+        """
+        self._table_name = table_name
+        self._client = client
+        self._keys = keys
+        self._max_concurrency = max_concurrency
+        self._batch_size = batch_size
+        self._request_kwargs = kwargs
+
+    def __iter__(self):
+        pending = self._chunk_keys()
+        in_flight = set()
+        with ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+            try:
+                while pending or in_flight:
+                    while pending and len(in_flight) < self._max_concurrency:
+                        keys, attempt = pending.pop()
+                        in_flight.add(
+                            executor.submit(self._read_batch, keys, attempt)
+                        )
+                    done, in_flight = wait(
+                        in_flight, return_when=FIRST_COMPLETED
+                    )
+                    for future in done:
+                        items, unprocessed_keys, attempt = future.result()
+                        if unprocessed_keys:
+                            pending.append((unprocessed_keys, attempt + 1))
+                        yield from items
+            finally:
+                # Don't start any more requests if the caller stops early.
+                for future in in_flight:
+                    future.cancel()
+
+    def _chunk_keys(self):
+        # Chunks are popped from the end, so reverse them to send the keys
+        # roughly in the order they were given.
+        size = self._batch_size
+        chunks = [
+            (self._keys[i : i + size], 0)
+            for i in range(0, len(self._keys), size)
+        ]
+        chunks.reverse()
+        return chunks
+
+    def _read_batch(self, keys, attempt):
+        if attempt:
+            _backoff_unprocessed(attempt)
+        request_items = dict(self._request_kwargs, Keys=keys)
+        response = self._client.batch_get_item(
+            RequestItems={self._table_name: request_items}
+        )
+        items = response['Responses'].get(self._table_name, [])
+        unprocessed = response.get('UnprocessedKeys') or {}
+        unprocessed_keys = unprocessed.get(self._table_name, {}).get(
+            'Keys', []
+        )
+        logger.debug(
+            "Batch read requested %s, returned: %s, unprocessed: %s",
+            len(keys),
+            len(items),
+            len(unprocessed_keys),
+        )
+        return items, unprocessed_keys, attempt
@@ -286,58 +286,127 @@ class ParameterTransformer:
         :param target_shape: The name of the shape to apply the
             transformation to
         """
-        self._transform_parameters(model, params, transformation, target_shape)
-
-    def _transform_parameters(
-        self, model, params, transformation, target_shape
-    ):
-        type_name = model.type_name
-        if type_name in ('structure', 'map', 'list'):
-            getattr(self, f'_transform_{type_name}')(
-                model, params, transformation, target_shape
+        walk = self._get_transform_plan(model, target_shape)
+        if walk is not None:
+            walk(params, transformation)
+
+    def _get_transform_plan(self, model, target_shape):
+        # The walk for a (shape, target shape) pair is planned once and
+        # cached on the shape.  Operation input and output shapes are
+        # cached on the OperationModel, so each operation is planned once
+        # and every later call only visits the parts of the parameters
+        # that can actually contain the target shape.
+        cache_key = ('dynamodb-transform', target_shape)
+        if cache_key not in model._cache:
+            model._cache[cache_key] = self._plan_transform(
+                model, target_shape, {}
             )
+        return model._cache[cache_key]
 
-    def _transform_structure(
-        self, model, params, transformation, target_shape
-    ):
-        if not isinstance(params, collections_abc.Mapping):
-            return
-        for param in params:
-            if param in model.members:
-                member_model = model.members[param]
-                member_shape = member_model.name
-                if member_shape == target_shape:
+    def _plan_transform(self, model, target_shape, planned):
+        # Returns a function of (params, transformation) that replaces, in
+        # place, every value of ``params`` whose shape is the target shape
+        # with the result of ``transformation``, or None when no value of
+        # ``model`` can contain the target shape.
+        type_name = model.type_name
+        if type_name not in ('structure', 'map', 'list'):
+            return None
+        if not _contains_shape(model, target_shape):
+            return None
+        key = (model.name, type_name)
+        if key in planned:
+            return planned[key]
+
+        def _deferred(params, transformation):
+            planned[key](params, transformation)
+
+        planned[key] = _deferred
+        planned[key] = getattr(self, f'_plan_{type_name}')(
+            model, target_shape, planned
+        )
+        return planned[key]
+
+    def _plan_member(self, member_model, target_shape, planned):
+        if member_model.name == target_shape:
+            return _apply_transformation
+        return self._plan_transform(member_model, target_shape, planned)
+
+    def _plan_structure(self, model, target_shape, planned):
+        members = {}
+        for member_name, member_model in model.members.items():
+            walk = self._plan_member(member_model, target_shape, planned)
+            if walk is not None:
+                members[member_name] = walk
+
+        def _walk_structure(params, transformation):
+            if not isinstance(params, collections_abc.Mapping):
+                return
+            for param in params:
+                walk = members.get(param)
+                if walk is _apply_transformation:
                     params[param] = transformation(params[param])
-                else:
-                    self._transform_parameters(
-                        member_model,
-                        params[param],
-                        transformation,
-                        target_shape,
-                    )
-
-    def _transform_map(self, model, params, transformation, target_shape):
-        if not isinstance(params, collections_abc.Mapping):
-            return
-        value_model = model.value
-        value_shape = value_model.name
-        for key, value in params.items():
-            if value_shape == target_shape:
-                params[key] = transformation(value)
+                elif walk is not None:
+                    walk(params[param], transformation)
+
+        return _walk_structure
+
+    def _plan_map(self, model, target_shape, planned):
+        walk = self._plan_member(model.value, target_shape, planned)
+
+        def _walk_map(params, transformation):
+            if not isinstance(params, collections_abc.Mapping):
+                return
+            if walk is _apply_transformation:
+                for key, value in params.items():
+                    params[key] = transformation(value)
             else:
-                self._transform_parameters(
-                    value_model, params[key], transformation, target_shape
-                )
-
-    def _transform_list(self, model, params, transformation, target_shape):
-        if not isinstance(params, collections_abc.MutableSequence):
-            return
-        member_model = model.member
-        member_shape = member_model.name
-        for i, item in enumerate(params):
-            if member_shape == target_shape:
-                params[i] = transformation(item)
+                for value in params.values():
+                    walk(value, transformation)
+
+        return _walk_map
+
+    def _plan_list(self, model, target_shape, planned):
+        walk = self._plan_member(model.member, target_shape, planned)
+
+        def _walk_list(params, transformation):
+            if not isinstance(params, collections_abc.MutableSequence):
+                return
+            if walk is _apply_transformation:
+                for i, item in enumerate(params):
+                    params[i] = transformation(item)
             else:
-                self._transform_parameters(
-                    member_model, params[i], transformation, target_shape
-                )
+                for item in params:
+                    walk(item, transformation)
+
+        return _walk_list
+
+
+def _apply_transformation(params, transformation):
+    # Marks a member whose shape is the target shape in a transform plan.
+    return transformation(params)
+
+
+def _child_shapes(model):
+    type_name = model.type_name
+    if type_name == 'structure':
+        return model.members.values()
+    elif type_name == 'map':
+        return [model.value]
+    elif type_name == 'list':
+        return [model.member]
+    return []
+
+
+def _contains_shape(model, target_shape):
+    # Whether any shape nested below ``model`` is named ``target_shape``.
+    seen = set()
+    pending = [model]
+    while pending:
+        for child in _child_shapes(pending.pop()):
+            if child.name == target_shape:
+                return True
+            key = (child.name, child.type_name)
+            if key not in seen:
+                seen.add(key)
+                pending.append(child)
+    return False
@@ -33,6 +33,19 @@ BOOLEAN = 'BOOL'
 MAP = 'M'
 LIST = 'L'
 
+DYNAMODB_TYPES = (
+    STRING,
+    NUMBER,
+    BINARY,
+    STRING_SET,
+    NUMBER_SET,
+    BINARY_SET,
+    NULL,
+    BOOLEAN,
+    MAP,
+    LIST,
+)
+
 
 DYNAMODB_CONTEXT = Context(
     Emin=-128,
@@ -44,6 +57,14 @@ DYNAMODB_CONTEXT = Context(
 
 BINARY_TYPES = (bytearray, bytes)
 
+# Bound once so that number conversions do not look up the method on the
+# context for every value.
+_create_decimal = DYNAMODB_CONTEXT.create_decimal
+
+# Any int below this magnitude fits the 38 digits of DYNAMODB_CONTEXT, so
+# converting it through the context can neither round nor trap.
+_MAX_EXACT_INT = 10 ** DYNAMODB_CONTEXT.prec
+
 
 class Binary:
     """A class for representing Binary in dynamodb
@@ -80,6 +101,21 @@ class Binary:
         return hash(self.value)
 
 
+_DYNAMODB_TYPES_BY_PYTHON_TYPE = {
+    type(None): NULL,
+    bool: BOOLEAN,
+    int: NUMBER,
+    Decimal: NUMBER,
+    str: STRING,
+    bytes: BINARY,
+    bytearray: BINARY,
+    Binary: BINARY,
+    dict: MAP,
+    list: LIST,
+    tuple: LIST,
+}
+
+
 class TypeSerializer:
     """This class serializes Python data types to DynamoDB types."""
 
@@ -112,11 +148,29 @@ class TypeSerializer:
             dictionaries can be directly passed to botocore methods.
         """
         dynamodb_type = self._get_dynamodb_type(value)
-        serializer = getattr(self, f'_serialize_{dynamodb_type}'.lower())
+        serializer = self._get_serializers()[dynamodb_type]
         return {dynamodb_type: serializer(value)}
 
+    def _get_serializers(self):
+        # Bound serializer methods keyed by DynamoDB type, built on first
+        # use so subclass overrides of the _serialize_* methods still apply.
+        try:
+            return self._serializers
+        except AttributeError:
+            self._serializers = {
+                dynamodb_type: getattr(
+                    self, f'_serialize_{dynamodb_type}'.lower()
+                )
+                for dynamodb_type in DYNAMODB_TYPES
+            }
+            return self._serializers
+
     def _get_dynamodb_type(self, value):
-        dynamodb_type = None
+        # Exact builtin types map straight to their DynamoDB type; anything
+        # else (subclasses, sets, floats) goes through the predicates below.
+        dynamodb_type = _DYNAMODB_TYPES_BY_PYTHON_TYPE.get(type(value))
+        if dynamodb_type is not None:
+            return dynamodb_type
 
         if self._is_null(value):
             dynamodb_type = NULL
@@ -211,7 +265,9 @@ class TypeSerializer:
         return value
 
     def _serialize_n(self, value):
-        number = str(DYNAMODB_CONTEXT.create_decimal(value))
+        if type(value) is int and -_MAX_EXACT_INT < value < _MAX_EXACT_INT:
+            return str(value)
+        number = str(_create_decimal(value))
         if number in ['Infinity', 'NaN']:
             raise TypeError('Infinity and NaN not supported')
         return number
@@ -270,14 +326,33 @@ class TypeDeserializer:
                 'Value must be a nonempty dictionary whose key '
                 'is a valid dynamodb type.'
             )
-        dynamodb_type = list(value.keys())[0]
+        dynamodb_type = next(iter(value))
+        deserializer = self._get_deserializers().get(dynamodb_type)
+        if deserializer is None:
+            try:
+                deserializer = getattr(
+                    self, f'_deserialize_{dynamodb_type}'.lower()
+                )
+            except AttributeError:
+                raise TypeError(
+                    f'Dynamodb type {dynamodb_type} is not supported'
+                )
+        return deserializer(value[dynamodb_type])
+
+    def _get_deserializers(self):
+        # Bound deserializer methods keyed by DynamoDB type, built on first
+        # use so subclass overrides of the _deserialize_* methods still
+        # apply.
         try:
-            deserializer = getattr(
-                self, f'_deserialize_{dynamodb_type}'.lower()
-            )
+            return self._deserializers
         except AttributeError:
-            raise TypeError(f'Dynamodb type {dynamodb_type} is not supported')
-        return deserializer(value[dynamodb_type])
+            self._deserializers = {
+                dynamodb_type: getattr(
+                    self, f'_deserialize_{dynamodb_type}'.lower()
+                )
+                for dynamodb_type in DYNAMODB_TYPES
+            }
+            return self._deserializers
 
     def _deserialize_null(self, value):
         return None
@@ -286,7 +361,7 @@ class TypeDeserializer:
         return value
 
     def _deserialize_n(self, value):
-        return DYNAMODB_CONTEXT.create_decimal(value)
+        return _create_decimal(value)
 
     def _deserialize_s(self, value):
         return value
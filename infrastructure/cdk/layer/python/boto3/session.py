@@ -309,6 +309,44 @@ class Session:
             config=config,
         )
 
+    def cached_client(
+        self,
+        service_name,
+        region_name=None,
+        api_version=None,
+        use_ssl=True,
+        verify=None,
+        endpoint_url=None,
+        aws_access_key_id=None,
+        aws_secret_access_key=None,
+        aws_session_token=None,
+        config=None,
+    ):
+        """
+        Return a shared low-level service client, creating it on first use.
+
+        This takes the same arguments as :py:meth:`client`. Calls with the
+        same service, region, endpoint, config and credentials return the
+        same client instance, which is safe to share between threads.
+        Hit and construction counts are available from
+        ``session._session.get_client_cache_stats()``.
+
+        :return: Service client instance
+
+        """
+        return self._session.get_cached_client(
+            service_name,
+            region_name=region_name,
+            api_version=api_version,
+            use_ssl=use_ssl,
+            verify=verify,
+            endpoint_url=endpoint_url,
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            aws_session_token=aws_session_token,
+            config=config,
+        )
+
     def resource(
         self,
         service_name,
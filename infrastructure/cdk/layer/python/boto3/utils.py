@@ -58,6 +58,22 @@ def import_module(name):
 
 
 def lazy_call(full_name, **kwargs):
+    if not kwargs:
+        # Handlers without arguments are shared, so that sessions register
+        # the same handler object and can share what it was used to build.
+        handler = _LAZY_HANDLERS.get(full_name)
+        if handler is None:
+            handler = _LAZY_HANDLERS.setdefault(
+                full_name, _create_lazy_handler(full_name, kwargs)
+            )
+        return handler
+    return _create_lazy_handler(full_name, kwargs)
+
+
+_LAZY_HANDLERS = {}
+
+
+def _create_lazy_handler(full_name, kwargs):
     parent_kwargs = kwargs
 
     def _handler(**kwargs):
@@ -25,6 +25,7 @@ import botocore.parsers
 import botocore.serialize
 from botocore.config import Config
 from botocore.endpoint import EndpointCreator
+from botocore.httpsession import URLLib3Session
 from botocore.regions import EndpointResolverBuiltins as EPRBuiltins
 from botocore.regions import EndpointRulesetResolver
 from botocore.signers import RequestSigner
@@ -146,6 +147,10 @@ class ClientArgsCreator:
             socket_options=socket_options,
             client_cert=new_config.client_cert,
             proxies_config=new_config.proxies_config,
+            http_session_cls=_get_http_session_cls(
+                new_config.http_transport
+            ),
+            pool_metrics=new_config.pool_metrics,
         )
 
         serializer = botocore.serialize.create_serializer(
@@ -267,6 +272,8 @@ class ClientArgsCreator:
                     client_config.disable_request_compression
                 ),
                 client_context_params=client_config.client_context_params,
+                http_transport=client_config.http_transport,
+                pool_metrics=client_config.pool_metrics,
             )
         self._compute_retry_config(config_kwargs)
         self._compute_connect_timeout(config_kwargs)
@@ -767,3 +774,13 @@ class ClientArgsCreator:
                 f'maximum length of {USERAGENT_APPID_MAXLEN} characters.'
             )
         config_kwargs['user_agent_appid'] = user_agent_appid
+
+
+def _get_http_session_cls(http_transport):
+    if http_transport == 'asyncio':
+        # Imported on first use, as importing asyncio adds to the start up
+        # time of every process that creates a client.
+        from botocore.asynchttpsession import AsyncioHTTPSession
+
+        return AsyncioHTTPSession
+    return URLLib3Session
@@ -0,0 +1,548 @@
+"""An HTTP session built on asyncio streams.
+
+``AsyncioHTTPSession`` has the same constructor and ``send(request)``
+contract as ``URLLib3Session`` so it can be plugged into an endpoint in its
+place, and additionally provides ``send_async(request)`` for use from a
+running event loop.  Many requests can then be in flight at once on a single
+thread, each holding a pooled keep-alive connection only while it is reading
+or writing.
+"""
+import asyncio
+import io
+import logging
+import re
+import socket
+import ssl
+import threading
+import time
+import weakref
+from urllib.parse import urlsplit
+
+import botocore.awsrequest
+from botocore.exceptions import (
+    BotoCoreError,
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    HTTPClientError,
+    ReadTimeoutError,
+    SSLError,
+)
+from botocore.httpsession import (
+    DEFAULT_TIMEOUT,
+    MAX_POOL_CONNECTIONS,
+    ProxyConfiguration,
+    URLLib3Session,
+    create_urllib3_context,
+    get_cert_path,
+)
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+_READ_CHUNK_SIZE = 64 * 1024
+
+# The checks http.client makes before putting a request on the wire, so
+# that CR, LF or NUL in a header or the request target cannot inject
+# headers or a second request.
+_is_legal_header_name = re.compile(r'[^:\s][^:\r\n]*').fullmatch
+_is_illegal_header_value = re.compile(r'\n(?![ \t])|\r(?![ \t\n])|\0').search
+_contains_disallowed_method_char = re.compile(r'[\x00-\x1f]').search
+_contains_disallowed_target_char = re.compile(r'[\x00-\x20\x7f]').search
+
+_background_loop = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop():
+    # Synchronous sends from any thread are run on one shared event loop so
+    # that they use the same connection pools as each other.
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name='botocore-asyncio-http',
+                daemon=True,
+            )
+            thread.start()
+            _background_loop = loop
+        return _background_loop
+
+
+class _StaleConnectionError(Exception):
+    """A reused connection was closed by the peer before responding."""
+
+
+class _Connection:
+    __slots__ = ('reader', 'writer', 'connected_at')
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.connected_at = time.monotonic()
+
+    def is_usable(self):
+        return not (self.reader.at_eof() or self.writer.is_closing())
+
+    def close(self):
+        self.writer.close()
+
+
+class _HostPool(list):
+    """The idle connections to one host, most recently used last."""
+
+    def __init__(self, scheme, host, port):
+        super().__init__()
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+
+
+class _ResponseBody(io.BytesIO):
+    """A buffered response body with the ``stream()`` method of urllib3."""
+
+    def stream(self, amt=_READ_CHUNK_SIZE, decode_content=None):
+        while True:
+            chunk = self.read(amt)
+            if not chunk:
+                break
+            yield chunk
+
+
+class AsyncioHTTPSession:
+    """An HTTP/1.1 client that sends requests with asyncio.
+
+    Connections are pooled per host and per event loop; up to
+    ``max_pool_connections`` idle connections are kept for each host.
+    File-like request bodies are read into memory before they are sent,
+    and response bodies are read in full before the response is returned.
+    Requests to be sent through a proxy are handed to a ``URLLib3Session``.
+    """
+
+    def __init__(
+        self,
+        verify=True,
+        proxies=None,
+        timeout=None,
+        max_pool_connections=MAX_POOL_CONNECTIONS,
+        socket_options=None,
+        client_cert=None,
+        proxies_config=None,
+        pool_metrics=None,
+    ):
+        self._verify = verify
+        self._proxies = proxies
+        self._proxies_config = proxies_config
+        self._proxy_config = ProxyConfiguration(
+            proxies=proxies, proxies_settings=proxies_config
+        )
+        if timeout is None:
+            timeout = DEFAULT_TIMEOUT
+        if isinstance(timeout, (int, float)):
+            self._connect_timeout = self._read_timeout = timeout
+        else:
+            self._connect_timeout, self._read_timeout = timeout
+        self._max_pool_connections = max_pool_connections
+        self._socket_options = socket_options or []
+        self._client_cert = client_cert
+        self._pool_metrics = pool_metrics
+        self._ssl_context = None
+        self._proxy_session = None
+        # Guards the proxy session, the pools of each loop and the
+        # counters, as sends on different loops run on different threads.
+        self._lock = threading.Lock()
+        # Streams are bound to the loop they were opened on, so each loop
+        # gets pools of its own.
+        self._pools = weakref.WeakKeyDictionary()
+        # Connection and request counters per (scheme, host, port).
+        self._counters = {}
+
+    def _get_ssl_context(self):
+        if self._ssl_context is None:
+            context = create_urllib3_context()
+            if self._verify is False:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            else:
+                context.verify_mode = ssl.CERT_REQUIRED
+                context.check_hostname = True
+                context.load_verify_locations(get_cert_path(self._verify))
+            if isinstance(self._client_cert, str):
+                context.load_cert_chain(self._client_cert)
+            elif isinstance(self._client_cert, tuple):
+                context.load_cert_chain(*self._client_cert)
+            self._ssl_context = context
+        return self._ssl_context
+
+    def _get_proxy_session(self):
+        with self._lock:
+            if self._proxy_session is None:
+                self._proxy_session = URLLib3Session(
+                    verify=self._verify,
+                    proxies=self._proxies,
+                    timeout=(self._connect_timeout, self._read_timeout),
+                    max_pool_connections=self._max_pool_connections,
+                    socket_options=self._socket_options,
+                    client_cert=self._client_cert,
+                    proxies_config=self._proxies_config,
+                    pool_metrics=self._pool_metrics,
+                )
+            return self._proxy_session
+
+    def _get_pool(self, key):
+        # The pool itself is only used by the loop it belongs to.
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pools = self._pools.get(loop)
+            if pools is None:
+                pools = self._pools[loop] = {}
+            pool = pools.get(key)
+            if pool is None:
+                pool = pools[key] = _HostPool(*key)
+            return pool
+
+    def close(self):
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools = weakref.WeakKeyDictionary()
+        for host_pools in pools:
+            for pool in list(host_pools.values()):
+                while pool:
+                    pool.pop().close()
+        if self._proxy_session is not None:
+            self._proxy_session.close()
+
+    def send(self, request):
+        future = asyncio.run_coroutine_threadsafe(
+            self.send_async(request), _get_background_loop()
+        )
+        return future.result()
+
+    def prewarm(self, url, count):
+        """Open up to ``count`` pooled connections to the host of ``url``.
+
+        The connections are kept in the pool used by ``send``.  Returns the
+        number of connections that were newly opened.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.prewarm_async(url, count), _get_background_loop()
+        )
+        return future.result()
+
+    async def prewarm_async(self, url, count):
+        """Like ``prewarm`` but for the pool of the running event loop."""
+        if self._proxy_config.proxy_url_for(url):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self._get_proxy_session().prewarm, url, count
+            )
+        scheme, host, port = self._pool_key(urlsplit(url))
+        pool = self._get_pool((scheme, host, port))
+        pool[:] = [conn for conn in pool if conn.is_usable()]
+        missing = min(count, self._max_pool_connections) - len(pool)
+        conns = await asyncio.gather(
+            *[
+                self._open_connection(url, scheme, host, port)
+                for _ in range(max(missing, 0))
+            ]
+        )
+        pool.extend(conns)
+        if self._pool_metrics is not None:
+            for _ in conns:
+                self._pool_metrics.on_new_connection(pool)
+        return len(conns)
+
+    def connection_stats(self):
+        """Return connection reuse and age statistics of each pool.
+
+        The statistics are keyed by ``scheme://host:port``.
+        ``idle_connection_ages`` lists how many seconds ago each pooled
+        connection was opened, oldest first.
+        """
+        now = time.monotonic()
+        with self._lock:
+            counters_by_key = {
+                key: dict(counters) for key, counters in self._counters.items()
+            }
+            pools = list(self._pools.values())
+        stats = {}
+        for key, counters in counters_by_key.items():
+            idle_ages = sorted(
+                (
+                    now - conn.connected_at
+                    for host_pools in pools
+                    for conn in list(host_pools.get(key, ()))
+                ),
+                reverse=True,
+            )
+            num_requests = counters['num_requests']
+            reuses = counters['num_connection_reuses']
+            stats['%s://%s:%s' % key] = dict(
+                counters,
+                reuse_ratio=reuses / num_requests if num_requests else 0.0,
+                idle_connections=len(idle_ages),
+                idle_connection_ages=idle_ages,
+            )
+        if self._proxy_session is not None:
+            stats.update(self._proxy_session.connection_stats())
+        return stats
+
+    def _count(self, key, name, amount=1):
+        with self._lock:
+            counters = self._counters.get(key)
+            if counters is None:
+                counters = self._counters[key] = {
+                    'num_connections': 0,
+                    'num_requests': 0,
+                    'num_connection_reuses': 0,
+                }
+            counters[name] += amount
+
+    async def send_async(self, request):
+        if self._proxy_config.proxy_url_for(request.url):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self._get_proxy_session().send, request
+            )
+        try:
+            return await self._send(request)
+        except ssl.SSLError as e:
+            raise SSLError(endpoint_url=request.url, error=e)
+        except BotoCoreError:
+            raise
+        except (asyncio.IncompleteReadError, OSError) as e:
+            raise ConnectionClosedError(
+                error=e, request=request, endpoint_url=request.url
+            )
+        except Exception as e:
+            message = 'Exception received when sending asyncio HTTP request'
+            logger.debug(message, exc_info=True)
+            raise HTTPClientError(error=e)
+
+    def _pool_key(self, url):
+        scheme = url.scheme.lower()
+        return scheme, url.hostname, url.port or _DEFAULT_PORTS[scheme]
+
+    async def _send(self, request):
+        url = urlsplit(request.url)
+        scheme, host, port = self._pool_key(url)
+        target = url.path or '/'
+        if url.query:
+            target = f'{target}?{url.query}'
+        key = (scheme, host, port)
+        pool = self._get_pool(key)
+        head, body = self._encode_request(request, url.netloc, target)
+        self._count(key, 'num_requests')
+        while pool:
+            conn = pool.pop()
+            if not conn.is_usable():
+                conn.close()
+                continue
+            try:
+                self._count(key, 'num_connection_reuses')
+                return await self._exchange(
+                    request, conn, pool, head, body, reused=True
+                )
+            except _StaleConnectionError:
+                # The peer closed the idle connection, so send the request
+                # again on the next one.
+                self._count(key, 'num_connection_reuses', -1)
+                request.reset_stream()
+                head, body = self._encode_request(
+                    request, url.netloc, target
+                )
+        conn = await self._open_connection(request.url, scheme, host, port)
+        if self._pool_metrics is not None:
+            self._pool_metrics.on_new_connection(pool)
+        return await self._exchange(
+            request, conn, pool, head, body, reused=False
+        )
+
+    async def _open_connection(self, url, scheme, host, port):
+        kwargs = {}
+        if scheme == 'https':
+            kwargs['ssl'] = self._get_ssl_context()
+            kwargs['server_hostname'] = host
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port, **kwargs),
+                self._connect_timeout,
+            )
+        except asyncio.TimeoutError as e:
+            raise ConnectTimeoutError(endpoint_url=url, error=e)
+        except ssl.SSLError as e:
+            raise SSLError(endpoint_url=url, error=e)
+        except (OSError, socket.gaierror) as e:
+            raise EndpointConnectionError(endpoint_url=url, error=e)
+        self._count((scheme, host, port), 'num_connections')
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            for option in self._socket_options:
+                sock.setsockopt(*option)
+        return _Connection(reader, writer)
+
+    def _encode_request(self, request, netloc, target):
+        headers = request.headers
+        if _contains_disallowed_method_char(request.method):
+            raise ValueError(
+                f'method can\'t contain control characters. {request.method!r}'
+            )
+        if _contains_disallowed_target_char(target):
+            raise ValueError(
+                f'URL can\'t contain control characters. {target!r}'
+            )
+        lines = [f'{request.method} {target} HTTP/1.1']
+        names = set()
+        for name, value in headers.items():
+            lines.append(self._encode_header(name, value))
+            names.add(name.lower())
+        if 'host' not in names:
+            lines.append(self._encode_header('Host', netloc))
+        if 'accept-encoding' not in names:
+            lines.append('Accept-Encoding: identity')
+        body = request.body
+        if body is not None and not isinstance(body, (bytes, bytearray)):
+            if isinstance(body, str):
+                body = body.encode('utf-8')
+            else:
+                body = body.read()
+        chunked = 'transfer-encoding' in names
+        if body and chunked:
+            body = b'%x\r\n%s\r\n0\r\n\r\n' % (len(body), body)
+        elif chunked:
+            body = b'0\r\n\r\n'
+        elif 'content-length' not in names and (
+            body or request.method in ('POST', 'PUT', 'PATCH')
+        ):
+            lines.append(f'Content-Length: {len(body or b"")}')
+        head = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+        return head, body
+
+    def _encode_header(self, name, value):
+        if isinstance(name, bytes):
+            name = name.decode('latin-1')
+        if isinstance(value, bytes):
+            value = value.decode('latin-1')
+        else:
+            value = str(value)
+        if not _is_legal_header_name(name):
+            raise ValueError(f'Invalid header name {name!r}')
+        if _is_illegal_header_value(value):
+            raise ValueError(f'Invalid header value {value!r}')
+        return f'{name}: {value}'
+
+    async def _exchange(self, request, conn, pool, head, body, reused):
+        reader, writer = conn.reader, conn.writer
+        if self._pool_metrics is not None:
+            self._pool_metrics.on_request(pool, reused)
+        try:
+            writer.write(head)
+            if body:
+                writer.write(body)
+            await writer.drain()
+            status, headers, keep_alive = await self._read_head(
+                request, reader, reused
+            )
+            content, delimited = await self._read_body(
+                request, reader, status, headers
+            )
+        except BaseException:
+            writer.close()
+            raise
+        if not (keep_alive and delimited):
+            writer.close()
+        elif len(pool) < self._max_pool_connections:
+            pool.append(conn)
+        else:
+            writer.close()
+            if self._pool_metrics is not None:
+                self._pool_metrics.on_connection_discarded(pool)
+        return botocore.awsrequest.AWSResponse(
+            request.url, status, headers, _ResponseBody(content)
+        )
+
+    async def _readline(self, request, reader):
+        try:
+            return await asyncio.wait_for(
+                reader.readuntil(b'\r\n'), self._read_timeout
+            )
+        except asyncio.TimeoutError as e:
+            raise ReadTimeoutError(endpoint_url=request.url, error=e)
+
+    async def _readexactly(self, request, reader, size):
+        try:
+            return await asyncio.wait_for(
+                reader.readexactly(size), self._read_timeout
+            )
+        except asyncio.TimeoutError as e:
+            raise ReadTimeoutError(endpoint_url=request.url, error=e)
+
+    async def _read_head(self, request, reader, reused):
+        while True:
+            try:
+                status_line = await self._readline(request, reader)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                if reused:
+                    raise _StaleConnectionError()
+                raise
+            version, status, _ = (
+                status_line.decode('latin-1').rstrip('\r\n') + ' '
+            ).split(' ', 2)
+            status = int(status)
+            headers = botocore.awsrequest.HeadersDict()
+            while True:
+                line = await self._readline(request, reader)
+                if line == b'\r\n':
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                name = name.strip()
+                value = value.strip()
+                if name in headers:
+                    value = f'{headers[name]}, {value}'
+                headers[name] = value
+            # Interim responses (such as 100 Continue) precede the final one.
+            if status >= 200 or status == 101:
+                break
+        connection = headers.get('connection', '').lower()
+        if version == 'HTTP/1.0':
+            keep_alive = connection == 'keep-alive'
+        else:
+            keep_alive = connection != 'close'
+        return status, headers, keep_alive
+
+    async def _read_body(self, request, reader, status, headers):
+        if (
+            request.method == 'HEAD'
+            or status in (204, 304)
+            or 100 <= status < 200
+        ):
+            return b'', True
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            parts = []
+            while True:
+                size_line = await self._readline(request, reader)
+                size = int(size_line.split(b';', 1)[0].strip(), 16)
+                if size == 0:
+                    # Skip any trailers up to the terminating blank line.
+                    while await self._readline(request, reader) != b'\r\n':
+                        pass
+                    return b''.join(parts), True
+                parts.append(await self._readexactly(request, reader, size))
+                await self._readexactly(request, reader, 2)
+        content_length = headers.get('content-length')
+        if content_length is not None:
+            content = await self._readexactly(
+                request, reader, int(content_length)
+            )
+            return content, True
+        # Without framing the body runs until the server closes the
+        # connection, which therefore cannot be reused.
+        try:
+            content = await asyncio.wait_for(
+                reader.read(), self._read_timeout
+            )
+            return content, False
+        except asyncio.TimeoutError as e:
+            raise ReadTimeoutError(endpoint_url=request.url, error=e)
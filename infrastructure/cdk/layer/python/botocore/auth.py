@@ -18,7 +18,9 @@ import functools
 import hmac
 import json
 import logging
+import threading
 import time
+from collections import OrderedDict
 from collections.abc import Mapping
 from email.utils import formatdate
 from hashlib import sha1, sha256
@@ -67,6 +69,7 @@ UNSIGNED_PAYLOAD = 'UNSIGNED-PAYLOAD'
 STREAMING_UNSIGNED_PAYLOAD_TRAILER = 'STREAMING-UNSIGNED-PAYLOAD-TRAILER'
 
 
+@functools.lru_cache(maxsize=256)
 def _host_from_url(url):
     # Given URL, derive value for host header. Ensure that value:
     # 1) is lowercase
@@ -86,6 +89,43 @@ def _host_from_url(url):
     return host
 
 
+# Derived SigV4 signing keys, keyed on a digest of the secret key so that
+# the cache never holds secret keys, including rotated or expired ones. A
+# signing key is only valid for its date, region and service.
+_SIGNING_KEY_CACHE = OrderedDict()
+_SIGNING_KEY_CACHE_SIZE = 64
+_signing_key_cache_lock = threading.Lock()
+
+
+def _derive_signing_key(secret_key, datestamp, region_name, service_name):
+    # The SigV4 signing key only changes with the date, so it is derived
+    # once per (secret key, date, region, service) instead of per request.
+    cache_key = (
+        sha256(secret_key.encode('utf-8')).digest(),
+        datestamp,
+        region_name,
+        service_name,
+    )
+    with _signing_key_cache_lock:
+        k_signing = _SIGNING_KEY_CACHE.get(cache_key)
+        if k_signing is not None:
+            _SIGNING_KEY_CACHE.move_to_end(cache_key)
+            return k_signing
+    k_date = hmac.new(
+        f"AWS4{secret_key}".encode(), datestamp.encode('utf-8'), sha256
+    ).digest()
+    k_region = hmac.new(k_date, region_name.encode('utf-8'), sha256).digest()
+    k_service = hmac.new(
+        k_region, service_name.encode('utf-8'), sha256
+    ).digest()
+    k_signing = hmac.new(k_service, b'aws4_request', sha256).digest()
+    with _signing_key_cache_lock:
+        _SIGNING_KEY_CACHE[cache_key] = k_signing
+        if len(_SIGNING_KEY_CACHE) > _SIGNING_KEY_CACHE_SIZE:
+            _SIGNING_KEY_CACHE.popitem(last=False)
+    return k_signing
+
+
 def _get_body_as_dict(request):
     # For query services, request.data is form-encoded and is already a
     # dict, but for other services such as rest-json it could be a json
@@ -296,9 +336,22 @@ class SigV4Auth(BaseSigner):
         """
         headers = []
         sorted_header_names = sorted(set(headers_to_sign))
+        if type(self)._header_value is not SigV4Auth._header_value:
+            for key in sorted_header_names:
+                value = ','.join(
+                    self._header_value(v)
+                    for v in headers_to_sign.get_all(key)
+                )
+                headers.append(f'{key}:{ensure_unicode(value)}')
+            return '\n'.join(headers)
+        # Group the values in one pass rather than calling get_all() for
+        # every name, which scans all headers each time.
+        values_by_name = {}
+        for name, value in headers_to_sign.items():
+            values_by_name.setdefault(name.lower(), []).append(value)
         for key in sorted_header_names:
             value = ','.join(
-                self._header_value(v) for v in headers_to_sign.get_all(key)
+                ' '.join(v.split()) for v in values_by_name[key.lower()]
             )
             headers.append(f'{key}:{ensure_unicode(value)}')
         return '\n'.join(headers)
@@ -363,7 +416,10 @@ class SigV4Auth(BaseSigner):
         cr.append(self.canonical_query_string(request))
         headers_to_sign = self.headers_to_sign(request)
         cr.append(self.canonical_headers(headers_to_sign) + '\n')
-        cr.append(self.signed_headers(headers_to_sign))
+        signed_headers = self.signed_headers(headers_to_sign)
+        # Reused by _inject_signature_to_request while signing this request.
+        self._signed_headers = (request, signed_headers)
+        cr.append(signed_headers)
         if 'X-Amz-Content-SHA256' in request.headers:
             body_checksum = request.headers['X-Amz-Content-SHA256']
         else:
@@ -405,6 +461,16 @@ class SigV4Auth(BaseSigner):
 
     def signature(self, string_to_sign, request):
         key = self.credentials.secret_key
+        if type(self)._sign is SigV4Auth._sign:
+            k_signing = _derive_signing_key(
+                key,
+                request.context["timestamp"][0:8],
+                self._region_name,
+                self._service_name,
+            )
+            return hmac.new(
+                k_signing, string_to_sign.encode('utf-8'), sha256
+            ).hexdigest()
         k_date = self._sign(
             (f"AWS4{key}").encode(), request.context["timestamp"][0:8]
         )
@@ -429,18 +495,24 @@ class SigV4Auth(BaseSigner):
         signature = self.signature(string_to_sign, request)
         logger.debug('Signature:\n%s', signature)
 
-        self._inject_signature_to_request(request, signature)
+        try:
+            self._inject_signature_to_request(request, signature)
+        finally:
+            self._signed_headers = None
 
     def _inject_signature_to_request(self, request, signature):
         auth_str = ['AWS4-HMAC-SHA256 Credential=%s' % self.scope(request)]
-        headers_to_sign = self.headers_to_sign(request)
-        auth_str.append(
-            f"SignedHeaders={self.signed_headers(headers_to_sign)}"
-        )
+        auth_str.append(f"SignedHeaders={self._get_signed_headers(request)}")
         auth_str.append('Signature=%s' % signature)
         request.headers['Authorization'] = ', '.join(auth_str)
         return request
 
+    def _get_signed_headers(self, request):
+        signed_headers = getattr(self, '_signed_headers', None)
+        if signed_headers is not None and signed_headers[0] is request:
+            return signed_headers[1]
+        return self.signed_headers(self.headers_to_sign(request))
+
     def _modify_request_before_signing(self, request):
         if 'Authorization' in request.headers:
             del request.headers['Authorization']
@@ -370,7 +370,9 @@ class AWSRequestPreparer:
         headers = self._prepare_headers(original, body)
         stream_output = original.stream_output
 
-        return AWSPreparedRequest(method, url, headers, body, stream_output)
+        return AWSPreparedRequest(
+            method, url, headers, body, stream_output, original.context
+        )
 
     def _prepare_url(self, original):
         url = original.url
@@ -499,14 +501,18 @@ class AWSPreparedRequest:
     :ivar headers: The HTTP headers to send.
     :ivar body: The HTTP body.
     :ivar stream_output: If the response for this request should be streamed.
+    :ivar context: The ``context`` of the request it was prepared from.
     """
 
-    def __init__(self, method, url, headers, body, stream_output):
+    def __init__(
+        self, method, url, headers, body, stream_output, context=None
+    ):
         self.method = method
         self.url = url
         self.headers = headers
         self.body = body
         self.stream_output = stream_output
+        self.context = {} if context is None else context
 
     def __repr__(self):
         fmt = (
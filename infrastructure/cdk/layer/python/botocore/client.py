@@ -10,12 +10,17 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import hashlib
 import logging
+import threading
+import weakref
+from collections import OrderedDict
 
 from botocore import waiter, xform_name
 from botocore.args import ClientArgsCreator
 from botocore.auth import AUTH_TYPE_MAPS
 from botocore.awsrequest import prepare_request_dict
+from botocore.compat import json
 from botocore.compress import maybe_compress_request
 from botocore.config import Config
 from botocore.discovery import (
@@ -78,6 +83,38 @@ _LEGACY_SIGNATURE_VERSIONS = frozenset(
 logger = logging.getLogger(__name__)
 history_recorder = get_global_history_recorder()
 
+# Generated client classes shared by every ClientCreator in the process.
+# A class is only reused when the service model and the handlers of the
+# creating-client-class event are the same, and the handlers customize the
+# class the same way again, as those determine its attributes.
+_CLIENT_CLASS_CACHE = OrderedDict()
+_CLIENT_CLASS_CACHE_SIZE = 128
+_client_class_cache_lock = threading.Lock()
+
+# Digests of the service models loaded by each loader, keyed by the id()
+# of the model.  A loader caches the models it loads, so their ids are not
+# reused while it is alive.
+_MODEL_FINGERPRINTS = weakref.WeakKeyDictionary()
+
+
+def _model_fingerprint(loader, service_description):
+    # Digest of the whole service model, computed once per loaded model.
+    # Models with the same operations but different shapes or
+    # documentation generate different client methods and docstrings.
+    with _client_class_cache_lock:
+        try:
+            fingerprints = _MODEL_FINGERPRINTS.setdefault(loader, {})
+        except TypeError:
+            fingerprints = {}
+        fingerprint = fingerprints.get(id(service_description))
+    if fingerprint is None:
+        fingerprint = hashlib.sha256(
+            json.dumps(service_description, default=repr).encode('utf-8')
+        ).digest()
+        with _client_class_cache_lock:
+            fingerprints[id(service_description)] = fingerprint
+    return fingerprint
+
 
 class ClientCreator:
     """Creates client objects for a service."""
@@ -190,16 +227,99 @@ class ClientCreator:
         return self._create_client_class(service_name, service_model)
 
     def _create_client_class(self, service_name, service_model):
+        cache_key = self._get_client_class_cache_key(
+            service_name, service_model
+        )
+        if cache_key is None:
+            return self._build_client_class(service_name, service_model)
+        with _client_class_cache_lock:
+            cached = _CLIENT_CLASS_CACHE.get(cache_key)
+            if cached is not None:
+                _CLIENT_CLASS_CACHE.move_to_end(cache_key)
+        if cached is not None:
+            generated_attributes, class_attributes, bases, cls = cached
+        else:
+            generated_attributes = self._generate_class_attributes(
+                service_model
+            )
+        # The creating-client-class handlers run for every client, as they
+        # may have side effects.  The cached class is reused when they make
+        # the same changes as when it was built.
+        new_class_attributes = dict(generated_attributes)
+        new_bases = [BaseClient]
+        self._emit_creating_client_class(
+            service_model, new_class_attributes, new_bases
+        )
+        if cached is not None:
+            if new_class_attributes == class_attributes and new_bases == bases:
+                return cls
+            return self._create_class(
+                service_model, new_class_attributes, new_bases
+            )
+        cls = self._create_class(service_model, new_class_attributes, new_bases)
+        with _client_class_cache_lock:
+            _CLIENT_CLASS_CACHE.setdefault(
+                cache_key,
+                (
+                    generated_attributes,
+                    dict(new_class_attributes),
+                    list(new_bases),
+                    cls,
+                ),
+            )
+            if len(_CLIENT_CLASS_CACHE) > _CLIENT_CLASS_CACHE_SIZE:
+                _CLIENT_CLASS_CACHE.popitem(last=False)
+        return cls
+
+    def _get_client_class_cache_key(self, service_name, service_model):
+        # Returns None when the class cannot safely be shared.
+        get_handlers = getattr(self._event_emitter, 'get_handlers', None)
+        if get_handlers is None:
+            return None
+        service_id = service_model.service_id.hyphenize()
+        handlers = get_handlers('creating-client-class.%s' % service_id)
+        if handlers is None:
+            return None
+        cache_key = (
+            type(self),
+            service_name,
+            service_model.api_version,
+            _model_fingerprint(
+                self._loader, service_model._service_description
+            ),
+            handlers,
+        )
+        try:
+            hash(cache_key)
+        except TypeError:
+            return None
+        return cache_key
+
+    def _build_client_class(self, service_name, service_model):
+        class_attributes = self._generate_class_attributes(service_model)
+        bases = [BaseClient]
+        self._emit_creating_client_class(
+            service_model, class_attributes, bases
+        )
+        return self._create_class(service_model, class_attributes, bases)
+
+    def _generate_class_attributes(self, service_model):
         class_attributes = self._create_methods(service_model)
         py_name_to_operation_name = self._create_name_mapping(service_model)
         class_attributes['_PY_TO_OP_NAME'] = py_name_to_operation_name
-        bases = [BaseClient]
+        return class_attributes
+
+    def _emit_creating_client_class(
+        self, service_model, class_attributes, bases
+    ):
         service_id = service_model.service_id.hyphenize()
         self._event_emitter.emit(
             'creating-client-class.%s' % service_id,
             class_attributes=class_attributes,
             base_classes=bases,
         )
+
+    def _create_class(self, service_model, class_attributes, bases):
         class_name = get_service_module_name(service_model)
         cls = type(str(class_name), tuple(bases), class_attributes)
         return cls
@@ -258,7 +378,10 @@ class ClientCreator:
         standard.register_retry_handler(**kwargs)
 
     def _register_v2_adaptive_retries(self, client):
-        adaptive.register_retry_handler(client)
+        scope = client.meta.config.retries.get('rate_limiter_scope')
+        if scope is None:
+            scope = 'client'
+        adaptive.register_retry_handler(client, scope=scope)
 
     def _register_legacy_retries(self, client):
         endpoint_prefix = client.meta.service_model.endpoint_prefix
@@ -893,6 +1016,41 @@ class BaseClient:
         """Closes underlying endpoint connections."""
         self._endpoint.close()
 
+    def prewarm_connections(self, count=1, endpoint_urls=None):
+        """Open pooled connections to the client's endpoints ahead of time.
+
+        This moves DNS resolution and the TCP and TLS handshakes of the first
+        requests out of the request path, e.g. into a Lambda function's
+        initialization phase.
+
+        :type count: int
+        :param count: The number of connections to open to each endpoint.
+            At most ``max_pool_connections`` are kept per endpoint.
+
+        :type endpoint_urls: list
+        :param endpoint_urls: The endpoint URLs to connect to.  Defaults to
+            the client's resolved endpoint URL.
+
+        :rtype: int
+        :return: The number of connections that were newly opened.
+        """
+        if endpoint_urls is None:
+            endpoint_urls = [self.meta.endpoint_url]
+        return sum(
+            self._endpoint.prewarm(count, url=url) for url in endpoint_urls
+        )
+
+    def get_connection_stats(self):
+        """Returns connection reuse and age statistics of the client's pools.
+
+        :rtype: dict
+        :return: Statistics keyed by ``scheme://host:port``, each with the
+            number of connections opened, requests sent, requests that
+            reused an open connection, the reuse ratio and the ages in
+            seconds of the idle pooled connections.
+        """
+        return self._endpoint.connection_stats()
+
     def _register_handlers(self):
         # Register the handler required to sign requests.
         service_id = self.meta.service_model.service_id.hyphenize()
@@ -904,7 +1062,48 @@ class BaseClient:
     def _service_model(self):
         return self.meta.service_model
 
+    @property
+    def aio(self):
+        """Awaitable versions of the client's operation methods.
+
+        ``await client.aio.get_item(...)`` behaves like
+        ``client.get_item(...)`` but awaits the HTTP exchange and any retry
+        delays instead of blocking on them.  With the ``asyncio``
+        ``http_transport`` many such calls can be in flight on one event
+        loop; other transports send each request in the loop's default
+        executor.
+        """
+        return _AsyncClientMethods(self)
+
     def _make_api_call(self, operation_name, api_params):
+        operation_model, request_dict, request_context, event_response = (
+            self._prepare_api_call(operation_name, api_params)
+        )
+        if event_response is not None:
+            http, parsed_response = event_response
+        else:
+            http, parsed_response = self._make_request(
+                operation_model, request_dict, request_context
+            )
+        return self._finish_api_call(
+            operation_model, request_context, http, parsed_response
+        )
+
+    async def _make_api_call_async(self, operation_name, api_params):
+        operation_model, request_dict, request_context, event_response = (
+            self._prepare_api_call(operation_name, api_params)
+        )
+        if event_response is not None:
+            http, parsed_response = event_response
+        else:
+            http, parsed_response = await self._make_request_async(
+                operation_model, request_dict, request_context
+            )
+        return self._finish_api_call(
+            operation_model, request_context, http, parsed_response
+        )
+
+    def _prepare_api_call(self, operation_name, api_params):
         operation_model = self._service_model.operation_model(operation_name)
         service_name = self._service_model.service_name
         history_recorder.record(
@@ -953,17 +1152,18 @@ class BaseClient:
             context=request_context,
         )
 
-        if event_response is not None:
-            http, parsed_response = event_response
-        else:
+        if event_response is None:
             maybe_compress_request(
                 self.meta.config, request_dict, operation_model
             )
             apply_request_checksum(request_dict)
-            http, parsed_response = self._make_request(
-                operation_model, request_dict, request_context
-            )
+        return operation_model, request_dict, request_context, event_response
 
+    def _finish_api_call(
+        self, operation_model, request_context, http, parsed_response
+    ):
+        operation_name = operation_model.name
+        service_id = self._service_model.service_id.hyphenize()
         self.meta.events.emit(
             'after-call.{service_id}.{operation_name}'.format(
                 service_id=service_id, operation_name=operation_name
@@ -988,16 +1188,30 @@ class BaseClient:
         try:
             return self._endpoint.make_request(operation_model, request_dict)
         except Exception as e:
-            self.meta.events.emit(
-                'after-call-error.{service_id}.{operation_name}'.format(
-                    service_id=self._service_model.service_id.hyphenize(),
-                    operation_name=operation_model.name,
-                ),
-                exception=e,
-                context=request_context,
+            self._emit_after_call_error(operation_model, request_context, e)
+            raise
+
+    async def _make_request_async(
+        self, operation_model, request_dict, request_context
+    ):
+        try:
+            return await self._endpoint.make_request_async(
+                operation_model, request_dict
             )
+        except Exception as e:
+            self._emit_after_call_error(operation_model, request_context, e)
             raise
 
+    def _emit_after_call_error(self, operation_model, request_context, error):
+        self.meta.events.emit(
+            'after-call-error.{service_id}.{operation_name}'.format(
+                service_id=self._service_model.service_id.hyphenize(),
+                operation_name=operation_model.name,
+            ),
+            exception=error,
+            context=request_context,
+        )
+
     def _convert_to_request_dict(
         self,
         api_params,
@@ -1337,3 +1551,28 @@ def _get_configured_signature_version(
                 )
                 return version
     return None
+
+
+class _AsyncClientMethods:
+    """Exposes a client's operations as coroutine functions."""
+
+    def __init__(self, client):
+        self._client = client
+
+    def __getattr__(self, item):
+        try:
+            operation_name = self._client._PY_TO_OP_NAME[item]
+        except KeyError:
+            raise AttributeError(
+                f"'{self._client.__class__.__name__}' client has no "
+                f"operation '{item}'"
+            )
+        client = self._client
+
+        async def _api_call(*args, **kwargs):
+            if args:
+                raise TypeError(f"{item}() only accepts keyword arguments.")
+            return await client._make_api_call_async(operation_name, kwargs)
+
+        _api_call.__name__ = str(item)
+        return _api_call
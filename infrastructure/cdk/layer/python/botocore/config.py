@@ -15,7 +15,9 @@ import copy
 from botocore.compat import OrderedDict
 from botocore.endpoint import DEFAULT_TIMEOUT, MAX_POOL_CONNECTIONS
 from botocore.exceptions import (
+    InvalidHTTPTransportError,
     InvalidMaxRetryAttemptsError,
+    InvalidRateLimiterScopeError,
     InvalidRetryConfigurationError,
     InvalidRetryModeError,
     InvalidS3AddressingStyleError,
@@ -162,6 +164,16 @@ class Config:
 
           * ``adaptive`` - Retries with additional client side throttling.
 
+        * ``rate_limiter_scope`` -- A string controlling which clients share
+          the client side rate limiter of the ``adaptive`` mode.  Valid
+          values are:
+
+          * ``client`` - Each client has its own rate limiter. This is the
+            default.
+
+          * ``process`` - All clients of the same service, region and
+            endpoint URL in the process share one rate limiter.
+
     :type client_cert: str, (str, str)
     :param client_cert: The path to a certificate for TLS client authentication.
 
@@ -228,6 +240,37 @@ class Config:
         documentation. Invalid parameters or ones that are not used by the
         specified service will be ignored.
 
+        Defaults to None.
+
+    :type http_transport: str
+    :param http_transport: The HTTP transport used to send requests.  Valid
+        values are:
+
+        * ``urllib3`` -- Requests are sent with a urllib3 connection pool.
+
+        * ``asyncio`` -- Requests are sent with asyncio streams.  Operations
+          can then also be awaited through the client's ``aio`` attribute,
+          e.g. ``await client.aio.get_item(...)``, so that many requests can
+          be in flight on a single thread.  Requests sent through a proxy
+          still use urllib3.  Request and response bodies are held in
+          memory in full: file-like request bodies are read before they
+          are sent, and streaming response bodies, such as the ``Body`` of
+          S3 ``GetObject``, are read before the response is returned.  Use
+          ``urllib3`` for large uploads and downloads.
+
+        Defaults to ``urllib3``.
+
+    :type pool_metrics: urllib3.util.PoolMetrics
+    :param pool_metrics: Receives the connection pool events of the client:
+        time spent waiting for a pooled connection, new connections,
+        reconnections of pooled connections that were closed, TLS handshake
+        durations, connections discarded because the pool was full, and
+        whether each request reused an open connection.  Pass a
+        ``urllib3.util.PoolStatistics()`` to aggregate them in memory, and
+        share one instance between clients to aggregate their pools.  The
+        ``asyncio`` ``http_transport`` reports no pool waits, reconnections
+        or TLS handshakes.
+
         Defaults to None.
     """
 
@@ -257,6 +300,8 @@ class Config:
             ('request_min_compression_size_bytes', None),
             ('disable_request_compression', None),
             ('client_context_params', None),
+            ('http_transport', None),
+            ('pool_metrics', None),
         ]
     )
 
@@ -287,6 +332,8 @@ class Config:
 
         self._validate_retry_configuration(self.retries)
 
+        self._validate_http_transport(self.http_transport)
+
     def _record_user_provided_options(self, args, kwargs):
         option_order = list(self.OPTION_DEFAULTS)
         user_provided_options = {}
@@ -327,9 +374,26 @@ class Config:
                     s3_addressing_style=addressing_style
                 )
 
+    def _validate_http_transport(self, http_transport):
+        valid_transports = ('urllib3', 'asyncio')
+        if (
+            http_transport is not None
+            and http_transport not in valid_transports
+        ):
+            raise InvalidHTTPTransportError(
+                provided_transport=http_transport,
+                valid_transports=valid_transports,
+            )
+
     def _validate_retry_configuration(self, retries):
-        valid_options = ('max_attempts', 'mode', 'total_max_attempts')
+        valid_options = (
+            'max_attempts',
+            'mode',
+            'total_max_attempts',
+            'rate_limiter_scope',
+        )
         valid_modes = ('legacy', 'standard', 'adaptive')
+        valid_rate_limiter_scopes = ('client', 'process')
         if retries is not None:
             for key, value in retries.items():
                 if key not in valid_options:
@@ -352,6 +416,14 @@ class Config:
                         provided_retry_mode=value,
                         valid_modes=valid_modes,
                     )
+                if (
+                    key == 'rate_limiter_scope'
+                    and value not in valid_rate_limiter_scopes
+                ):
+                    raise InvalidRateLimiterScopeError(
+                        provided_scope=value,
+                        valid_scopes=valid_rate_limiter_scopes,
+                    )
 
     def merge(self, other_config):
         """Merges the config object with another config object
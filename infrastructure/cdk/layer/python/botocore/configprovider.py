@@ -118,6 +118,14 @@ BOTOCORE_DEFAUT_SESSION_VARIABLES = {
         utils.ensure_boolean,
     ),
     'parameter_validation': ('parameter_validation', None, True, None),
+    # Refresh temporary credentials on a background thread instead of
+    # inline on the request thread.
+    'credential_background_refresh': (
+        'credential_background_refresh',
+        'AWS_CREDENTIAL_BACKGROUND_REFRESH',
+        False,
+        utils.ensure_boolean,
+    ),
     # Client side monitoring configurations.
     # Note: These configurations are considered internal to botocore.
     # Do not use them until publicly documented.
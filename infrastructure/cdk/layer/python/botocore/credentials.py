@@ -19,6 +19,7 @@ import os
 import subprocess
 import threading
 import time
+import weakref
 from collections import namedtuple
 from copy import deepcopy
 from hashlib import sha1
@@ -60,6 +61,9 @@ ReadOnlyCredentials = namedtuple(
 
 _DEFAULT_MANDATORY_REFRESH_TIMEOUT = 10 * 60  # 10 min
 _DEFAULT_ADVISORY_REFRESH_TIMEOUT = 15 * 60  # 15 min
+# How long the background refresher waits before trying again when a
+# refresh did not move the credentials out of the advisory window.
+_BACKGROUND_REFRESH_RETRY_INTERVAL = 30
 
 
 def create_credential_resolver(session, cache=None, region_name=None):
@@ -69,11 +73,41 @@ def create_credential_resolver(session, cache=None, region_name=None):
     that includes the default lookup chain for
     credentials.
 
+    Unless a profile was explicitly set on the session, the returned
+    resolver checks the environment variables before the rest of the
+    chain is built.  Runtimes such as AWS Lambda provide credentials
+    through the environment, so the other providers, and the config
+    lookups they need, are never created there.
+
     """
     profile_name = session.get_config_variable('profile') or 'default'
+    disable_env_vars = session.instance_variables().get('profile') is not None
+
+    if cache is None:
+        cache = {}
+
+    env_provider = EnvProvider()
+
+    def create_providers():
+        return _create_credential_providers(
+            session,
+            cache,
+            region_name,
+            profile_name,
+            disable_env_vars,
+            env_provider,
+        )
+
+    if disable_env_vars:
+        return CredentialResolver(providers=create_providers())
+    return EnvFirstCredentialResolver(env_provider, create_providers)
+
+
+def _create_credential_providers(
+    session, cache, region_name, profile_name, disable_env_vars, env_provider
+):
     metadata_timeout = session.get_config_variable('metadata_service_timeout')
     num_attempts = session.get_config_variable('metadata_service_num_attempts')
-    disable_env_vars = session.instance_variables().get('profile') is not None
 
     imds_config = {
         'ec2_metadata_service_endpoint': session.get_config_variable(
@@ -85,10 +119,6 @@ def create_credential_resolver(session, cache=None, region_name=None):
         'ec2_credential_refresh_window': _DEFAULT_ADVISORY_REFRESH_TIMEOUT,
     }
 
-    if cache is None:
-        cache = {}
-
-    env_provider = EnvProvider()
     container_provider = ContainerProvider()
     instance_metadata_provider = InstanceMetadataProvider(
         iam_role_fetcher=InstanceMetadataFetcher(
@@ -151,8 +181,7 @@ def create_credential_resolver(session, cache=None, region_name=None):
             ' because profile name was explicitly set.'
         )
 
-    resolver = CredentialResolver(providers=providers)
-    return resolver
+    return providers
 
 
 class ProfileProviderBuilder:
@@ -357,6 +386,8 @@ class RefreshableCredentials(Credentials):
     # The time at which all threads will block waiting for
     # refreshed credentials.
     _mandatory_refresh_timeout = _DEFAULT_MANDATORY_REFRESH_TIMEOUT
+    # Set while a background refresher is running.
+    _background_refresh_stop = None
 
     def __init__(
         self,
@@ -380,6 +411,15 @@ class RefreshableCredentials(Credentials):
             access_key, secret_key, token
         )
         self._normalize()
+        self._init_background_refresh()
+
+    def _init_background_refresh(self):
+        self._background_refresh_stop = None
+        self._refresh_metrics = {
+            'background_refreshes': 0,
+            'background_refresh_failures': 0,
+            'blocking_refreshes': 0,
+        }
 
     def _normalize(self):
         self._access_key = botocore.compat.ensure_unicode(self._access_key)
@@ -478,6 +518,67 @@ class RefreshableCredentials(Credentials):
         # Checks if the current credentials are expired.
         return self.refresh_needed(refresh_in=0)
 
+    @property
+    def refresh_metrics(self):
+        """Counters describing how the credentials were refreshed.
+
+        ``background_refreshes`` and ``background_refresh_failures`` count
+        the attempts made by the background refresher, and
+        ``blocking_refreshes`` counts the times a caller reached the
+        mandatory refresh window while background refresh was enabled and
+        had to wait for new credentials.
+        """
+        return dict(self._refresh_metrics)
+
+    def enable_background_refresh(self):
+        """Refresh the credentials on a daemon thread.
+
+        The thread refreshes the credentials as soon as they enter the
+        advisory refresh window.  Callers then only refresh inline, and
+        block doing so, once the mandatory refresh window is reached.
+        """
+        with self._refresh_lock:
+            if self._background_refresh_stop is not None:
+                return
+            self._background_refresh_stop = threading.Event()
+        # Wake the thread up so it can exit once the credentials are gone.
+        weakref.finalize(self, self._background_refresh_stop.set)
+        refresher = threading.Thread(
+            target=_background_refresh_loop,
+            args=(weakref.ref(self), self._background_refresh_stop),
+            name='botocore-credential-refresh',
+            daemon=True,
+        )
+        refresher.start()
+
+    def disable_background_refresh(self):
+        """Stop the thread started by ``enable_background_refresh``."""
+        with self._refresh_lock:
+            stop = self._background_refresh_stop
+            self._background_refresh_stop = None
+        if stop is not None:
+            stop.set()
+
+    def _seconds_until_background_refresh(self):
+        if self._expiry_time is None:
+            if self.refresh_needed():
+                return 0
+            return None
+        return self._seconds_remaining() - self._advisory_refresh_timeout
+
+    def _background_refresh(self):
+        # Returns True if the credentials are out of the advisory window.
+        with self._refresh_lock:
+            if not self.refresh_needed(self._advisory_refresh_timeout):
+                return True
+            self._refresh_metrics['background_refreshes'] += 1
+            try:
+                self._protected_refresh(is_mandatory=True)
+            except Exception:
+                self._refresh_metrics['background_refresh_failures'] += 1
+                return False
+            return not self.refresh_needed(self._advisory_refresh_timeout)
+
     def _refresh(self):
         # In the common case where we don't need a refresh, we
         # can immediately exit and not require acquiring the
@@ -485,6 +586,17 @@ class RefreshableCredentials(Credentials):
         if not self.refresh_needed(self._advisory_refresh_timeout):
             return
 
+        if self._background_refresh_stop is not None:
+            # The background refresher handles the advisory window.
+            if not self.refresh_needed(self._mandatory_refresh_timeout):
+                return
+            with self._refresh_lock:
+                if not self.refresh_needed(self._mandatory_refresh_timeout):
+                    return
+                self._refresh_metrics['blocking_refreshes'] += 1
+                self._protected_refresh(is_mandatory=True)
+            return
+
         # acquire() doesn't accept kwargs, but False is indicating
         # that we should not block if we can't acquire the lock.
         # If we aren't able to acquire the lock, we'll trigger
@@ -612,6 +724,30 @@ class RefreshableCredentials(Credentials):
         return self._frozen_credentials
 
 
+def _background_refresh_loop(credentials_ref, stop):
+    # Only a weak reference is held between refreshes so that the thread
+    # exits once the credentials are no longer used.
+    retry = False
+    while not stop.is_set():
+        credentials = credentials_ref()
+        if credentials is None:
+            return
+        delay = credentials._seconds_until_background_refresh()
+        del credentials
+        if delay is None:
+            # The credentials never expire.
+            return
+        if delay <= 0 and retry:
+            delay = _BACKGROUND_REFRESH_RETRY_INTERVAL
+        if stop.wait(max(delay, 0)):
+            return
+        credentials = credentials_ref()
+        if credentials is None:
+            return
+        retry = not credentials._background_refresh()
+        del credentials
+
+
 class DeferredRefreshableCredentials(RefreshableCredentials):
     """Refreshable credentials that don't require initial credentials.
 
@@ -628,6 +764,7 @@ class DeferredRefreshableCredentials(RefreshableCredentials):
         self._refresh_lock = threading.Lock()
         self.method = method
         self._frozen_credentials = None
+        self._init_background_refresh()
 
     def refresh_needed(self, refresh_in=None):
         if self._frozen_credentials is None:
@@ -2034,10 +2171,12 @@ class CredentialResolver:
         that could be loaded.
         """
         # First provider to return a non-None response wins.
+        start_time = time.perf_counter()
         for provider in self.providers:
             logger.debug("Looking for credentials via: %s", provider.METHOD)
             creds = provider.load()
             if creds is not None:
+                _log_credential_load_time(provider, start_time)
                 return creds
 
         # If we got here, no credentials could be found.
@@ -2049,6 +2188,49 @@ class CredentialResolver:
         return None
 
 
+class EnvFirstCredentialResolver(CredentialResolver):
+    """A resolver that builds its provider chain only when needed.
+
+    Credentials are first looked up through ``env_provider``.  The full
+    chain, which includes ``env_provider``, is created by calling
+    ``create_providers`` the first time the environment has no
+    credentials or the chain is accessed or modified.
+    """
+
+    def __init__(self, env_provider, create_providers):
+        self._env_provider = env_provider
+        self._create_providers = create_providers
+        self._providers = None
+
+    @property
+    def providers(self):
+        if self._providers is None:
+            self._providers = self._create_providers()
+        return self._providers
+
+    @providers.setter
+    def providers(self, value):
+        self._providers = value
+
+    def load_credentials(self):
+        if self._providers is None:
+            start_time = time.perf_counter()
+            creds = self._env_provider.load()
+            if creds is not None:
+                _log_credential_load_time(self._env_provider, start_time)
+                return creds
+        return super().load_credentials()
+
+
+def _log_credential_load_time(provider, start_time):
+    elapsed = time.perf_counter() - start_time
+    logger.debug(
+        "Loaded credentials via %s in %.2f ms",
+        provider.METHOD,
+        elapsed * 1000,
+    )
+
+
 class SSOCredentialFetcher(CachedCredentialFetcher):
     _UTC_DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
 
@@ -179,6 +179,27 @@ def document_paginate_method(
         ),
     )
 
+    input_members = getattr(operation_model.input_shape, 'members', {})
+    if 'Segment' in input_members and 'TotalSegments' in input_members:
+        pagination_config_members['ParallelSegments'] = DocumentedShape(
+            name='ParallelSegments',
+            type_name='integer',
+            documentation=(
+                '<p>The number of segments to paginate in parallel, on '
+                'up to 10 worker threads. Cannot be combined with '
+                '<code>MaxItems</code> or <code>StartingToken</code>.</p>'
+            ),
+        )
+
+    pagination_config_members['PrefetchPages'] = DocumentedShape(
+        name='PrefetchPages',
+        type_name='integer',
+        documentation=(
+            '<p>The number of pages to request ahead on a background '
+            'thread while the current page is being processed.</p>'
+        ),
+    )
+
     botocore_pagination_params = [
         DocumentedShape(
             name='PaginationConfig',
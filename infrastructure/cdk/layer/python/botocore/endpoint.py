@@ -118,6 +118,23 @@ class Endpoint:
         )
         return self._send_request(request_dict, operation_model)
 
+    async def make_request_async(self, operation_model, request_dict):
+        """Awaitable version of ``make_request``.
+
+        Retry delays are awaited rather than slept.  Creating the request
+        and emitting ``before-send`` run in the event loop's default
+        executor, as their handlers may block, e.g. to refresh credentials
+        or to wait for the adaptive retry mode's rate limiter.  The request
+        is sent with the HTTP session's ``send_async`` when it has one,
+        otherwise ``send`` runs in the executor as well.
+        """
+        logger.debug(
+            "Making request for %s with params: %s",
+            operation_model,
+            request_dict,
+        )
+        return await self._send_request_async(request_dict, operation_model)
+
     def create_request(self, params, operation_model=None):
         request = create_request_object(params)
         if operation_model:
@@ -207,17 +224,72 @@ class Endpoint:
             exception,
         ):
             attempts += 1
-            self._update_retries_context(context, attempts, success_response)
-            # If there is a stream associated with the request, we need
-            # to reset it before attempting to send the request again.
-            # This will ensure that we resend the entire contents of the
-            # body.
-            request.reset_stream()
-            # Create a new request when retried (including a new signature).
-            request = self.create_request(request_dict, operation_model)
+            request = self._prepare_retry(
+                request,
+                request_dict,
+                operation_model,
+                attempts,
+                success_response,
+            )
             success_response, exception = self._get_response(
                 request, operation_model, context
             )
+        return self._finish_send(attempts, success_response, exception)
+
+    async def _send_request_async(self, request_dict, operation_model):
+        # asyncio is only imported by the code that runs on an event loop,
+        # so that clients that never use one do not pay for importing it.
+        import asyncio
+
+        attempts = 1
+        context = request_dict['context']
+        self._update_retries_context(context, attempts)
+        request = await self._run_in_executor(
+            self.create_request, request_dict, operation_model
+        )
+        success_response, exception = await self._get_response_async(
+            request, operation_model, context
+        )
+        while True:
+            retry_delay = self._get_retry_delay(
+                attempts,
+                operation_model,
+                request_dict,
+                success_response,
+                exception,
+            )
+            if retry_delay is None:
+                break
+            await asyncio.sleep(retry_delay)
+            attempts += 1
+            request = await self._run_in_executor(
+                self._prepare_retry,
+                request,
+                request_dict,
+                operation_model,
+                attempts,
+                success_response,
+            )
+            success_response, exception = await self._get_response_async(
+                request, operation_model, context
+            )
+        return self._finish_send(attempts, success_response, exception)
+
+    def _prepare_retry(
+        self, request, request_dict, operation_model, attempts, response
+    ):
+        self._update_retries_context(
+            request_dict['context'], attempts, response
+        )
+        # If there is a stream associated with the request, we need
+        # to reset it before attempting to send the request again.
+        # This will ensure that we resend the entire contents of the
+        # body.
+        request.reset_stream()
+        # Create a new request when retried (including a new signature).
+        return self.create_request(request_dict, operation_model)
+
+    def _finish_send(self, attempts, success_response, exception):
         if (
             success_response is not None
             and 'ResponseMetadata' in success_response[1]
@@ -241,6 +313,23 @@ class Endpoint:
         success_response, exception = self._do_get_response(
             request, operation_model, context
         )
+        self._emit_response_received(
+            operation_model, context, success_response, exception
+        )
+        return success_response, exception
+
+    async def _get_response_async(self, request, operation_model, context):
+        success_response, exception = await self._do_get_response_async(
+            request, operation_model, context
+        )
+        self._emit_response_received(
+            operation_model, context, success_response, exception
+        )
+        return success_response, exception
+
+    def _emit_response_received(
+        self, operation_model, context, success_response, exception
+    ):
         kwargs_to_emit = {
             'response_dict': None,
             'parsed_response': None,
@@ -258,25 +347,10 @@ class Endpoint:
             f"response-received.{service_id}.{operation_model.name}",
             **kwargs_to_emit,
         )
-        return success_response, exception
 
     def _do_get_response(self, request, operation_model, context):
         try:
-            logger.debug("Sending http request: %s", request)
-            history_recorder.record(
-                'HTTP_REQUEST',
-                {
-                    'method': request.method,
-                    'headers': request.headers,
-                    'streaming': operation_model.has_streaming_input,
-                    'url': request.url,
-                    'body': request.body,
-                },
-            )
-            service_id = operation_model.service_model.service_id.hyphenize()
-            event_name = f"before-send.{service_id}.{operation_model.name}"
-            responses = self._event_emitter.emit(event_name, request=request)
-            http_response = first_non_none_response(responses)
+            http_response = self._emit_before_send(request, operation_model)
             if http_response is None:
                 http_response = self._send(request)
         except HTTPClientError as e:
@@ -286,6 +360,46 @@ class Endpoint:
                 "Exception received when sending HTTP request.", exc_info=True
             )
             return (None, e)
+        return self._parse_http_response(
+            http_response, operation_model, context
+        )
+
+    async def _do_get_response_async(self, request, operation_model, context):
+        try:
+            http_response = await self._run_in_executor(
+                self._emit_before_send, request, operation_model
+            )
+            if http_response is None:
+                http_response = await self._send_async(request)
+        except HTTPClientError as e:
+            return (None, e)
+        except Exception as e:
+            logger.debug(
+                "Exception received when sending HTTP request.", exc_info=True
+            )
+            return (None, e)
+        return self._parse_http_response(
+            http_response, operation_model, context
+        )
+
+    def _emit_before_send(self, request, operation_model):
+        logger.debug("Sending http request: %s", request)
+        history_recorder.record(
+            'HTTP_REQUEST',
+            {
+                'method': request.method,
+                'headers': request.headers,
+                'streaming': operation_model.has_streaming_input,
+                'url': request.url,
+                'body': request.body,
+            },
+        )
+        service_id = operation_model.service_model.service_id.hyphenize()
+        event_name = f"before-send.{service_id}.{operation_model.name}"
+        responses = self._event_emitter.emit(event_name, request=request)
+        return first_non_none_response(responses)
+
+    def _parse_http_response(self, http_response, operation_model, context):
         # This returns the http_response and the parsed_data.
         response_dict = convert_to_response_dict(
             http_response, operation_model
@@ -349,6 +463,29 @@ class Endpoint:
         response=None,
         caught_exception=None,
     ):
+        handler_response = self._get_retry_delay(
+            attempts,
+            operation_model,
+            request_dict,
+            response,
+            caught_exception,
+        )
+        if handler_response is None:
+            return False
+        else:
+            time.sleep(handler_response)
+            return True
+
+    def _get_retry_delay(
+        self,
+        attempts,
+        operation_model,
+        request_dict,
+        response=None,
+        caught_exception=None,
+    ):
+        # Returns the number of seconds to wait before retrying, or None if
+        # the request should not be retried.
         service_id = operation_model.service_model.service_id.hyphenize()
         event_name = f"needs-retry.{service_id}.{operation_model.name}"
         responses = self._event_emitter.emit(
@@ -361,21 +498,41 @@ class Endpoint:
             request_dict=request_dict,
         )
         handler_response = first_non_none_response(responses)
-        if handler_response is None:
-            return False
-        else:
+        if handler_response is not None:
             # Request needs to be retried, and we need to sleep
             # for the specified number of times.
             logger.debug(
                 "Response received to retry, sleeping for %s seconds",
                 handler_response,
             )
-            time.sleep(handler_response)
-            return True
+        return handler_response
+
+    def prewarm(self, count, url=None):
+        """Open up to ``count`` pooled connections to the endpoint.
+
+        ``url`` defaults to the endpoint's own URL.  Returns the number of
+        connections that were newly opened.
+        """
+        return self.http_session.prewarm(url or self.host, count)
+
+    def connection_stats(self):
+        return self.http_session.connection_stats()
 
     def _send(self, request):
         return self.http_session.send(request)
 
+    async def _send_async(self, request):
+        send_async = getattr(self.http_session, 'send_async', None)
+        if send_async is not None:
+            return await send_async(request)
+        return await self._run_in_executor(self._send, request)
+
+    async def _run_in_executor(self, func, *args):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
 
 class EndpointCreator:
     def __init__(self, event_emitter):
@@ -395,6 +552,7 @@ class EndpointCreator:
         socket_options=None,
         client_cert=None,
         proxies_config=None,
+        pool_metrics=None,
     ):
         if not is_valid_endpoint_url(
             endpoint_url
@@ -406,6 +564,9 @@ class EndpointCreator:
         endpoint_prefix = service_model.endpoint_prefix
 
         logger.debug('Setting %s timeout as %s', endpoint_prefix, timeout)
+        http_session_kwargs = {}
+        if pool_metrics is not None:
+            http_session_kwargs['pool_metrics'] = pool_metrics
         http_session = http_session_cls(
             timeout=timeout,
             proxies=proxies,
@@ -414,6 +575,7 @@ class EndpointCreator:
             socket_options=socket_options,
             client_cert=client_cert,
             proxies_config=proxies_config,
+            **http_session_kwargs,
         )
 
         return Endpoint(
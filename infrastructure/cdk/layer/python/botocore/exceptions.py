@@ -589,6 +589,15 @@ class InvalidS3AddressingStyleError(BotoCoreError):
     )
 
 
+class InvalidHTTPTransportError(BotoCoreError):
+    """Error when an invalid HTTP transport is specified"""
+
+    fmt = (
+        'Invalid value provided to "http_transport": "{provided_transport}" '
+        'must be one of: {valid_transports}'
+    )
+
+
 class UnsupportedS3ArnError(BotoCoreError):
     """Error when S3 ARN provided to Bucket parameter is not supported"""
 
@@ -677,6 +686,15 @@ class InvalidRetryModeError(InvalidRetryConfigurationError):
     )
 
 
+class InvalidRateLimiterScopeError(InvalidRetryConfigurationError):
+    """Error when an invalid rate limiter scope is specified"""
+
+    fmt = (
+        'Invalid value provided to "rate_limiter_scope": "{provided_scope}" '
+        'must be one of: {valid_scopes}'
+    )
+
+
 class InvalidS3UsEast1RegionalEndpointConfigError(BotoCoreError):
     """Error for invalid s3 us-east-1 regional endpoints configuration"""
 
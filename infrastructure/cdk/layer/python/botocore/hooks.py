@@ -168,6 +168,13 @@ class BaseEventHooks:
         """
         pass
 
+    def get_handlers(self, event_name):
+        """Return the handlers that emitting ``event_name`` would call.
+
+        Returns ``None`` if the emitter cannot tell in advance.
+        """
+        return None
+
     def _verify_is_callable(self, func):
         if not callable(func):
             raise ValueError("Event handler %s must be callable." % func)
@@ -242,6 +249,13 @@ class HierarchicalEmitter(BaseEventHooks):
                 return responses
         return responses
 
+    def get_handlers(self, event_name):
+        handlers = self._lookup_cache.get(event_name)
+        if handlers is None:
+            handlers = self._handlers.prefix_search(event_name)
+            self._lookup_cache[event_name] = handlers
+        return tuple(handlers)
+
     def emit(self, event_name, **kwargs):
         """
         Emit an event by name with arguments passed as keyword args.
@@ -415,6 +429,10 @@ class EventAliaser(BaseEventHooks):
         aliased_event_name = self._alias_event_name(event_name)
         return self._emitter.emit_until_response(aliased_event_name, **kwargs)
 
+    def get_handlers(self, event_name):
+        aliased_event_name = self._alias_event_name(event_name)
+        return self._emitter.get_handlers(aliased_event_name)
+
     def register(
         self, event_name, handler, unique_id=None, unique_id_uses_count=False
     ):
@@ -24,6 +24,7 @@ from urllib3.util.ssl_ import (
     PROTOCOL_TLS,
     OP_NO_SSLv2,
     OP_NO_SSLv3,
+    TLSSessionCache,
     is_ipaddress,
     ssl,
 )
@@ -293,6 +294,7 @@ class URLLib3Session:
         socket_options=None,
         client_cert=None,
         proxies_config=None,
+        pool_metrics=None,
     ):
         self._verify = verify
         self._proxy_config = ProxyConfiguration(
@@ -319,6 +321,10 @@ class URLLib3Session:
         self._socket_options = socket_options
         if socket_options is None:
             self._socket_options = []
+        self._pool_metrics = pool_metrics
+        # New connections resume the TLS session of an earlier connection
+        # to the same host instead of doing a full handshake.
+        self._tls_session_cache = TLSSessionCache()
         self._proxy_managers = {}
         self._manager = PoolManager(**self._get_pool_manager_kwargs())
         self._manager.pool_classes_by_scheme = self._pool_classes_by_scheme
@@ -341,7 +347,10 @@ class URLLib3Session:
             'socket_options': self._socket_options,
             'cert_file': self._cert_file,
             'key_file': self._key_file,
+            'tls_session_cache': self._tls_session_cache,
         }
+        if self._pool_metrics is not None:
+            pool_manager_kwargs['metrics'] = self._pool_metrics
         pool_manager_kwargs.update(**extra_kwargs)
         return pool_manager_kwargs
 
@@ -444,6 +453,35 @@ class URLLib3Session:
         for manager in self._proxy_managers.values():
             manager.clear()
 
+    def prewarm(self, url, count):
+        """Open up to ``count`` pooled connections to the host of ``url``.
+
+        Returns the number of connections that were newly opened.
+        """
+        proxy_url = self._proxy_config.proxy_url_for(url)
+        try:
+            manager = self._get_connection_manager(url, proxy_url)
+            conn = manager.connection_from_url(url)
+            self._setup_ssl_cert(conn, url, self._verify)
+            return conn.prewarm(count)
+        except URLLib3SSLError as e:
+            raise SSLError(endpoint_url=url, error=e)
+        except (NewConnectionError, socket.gaierror) as e:
+            raise EndpointConnectionError(endpoint_url=url, error=e)
+        except ProxyError as e:
+            raise ProxyConnectionError(
+                proxy_url=mask_proxy_url(proxy_url), error=e
+            )
+        except URLLib3ConnectTimeoutError as e:
+            raise ConnectTimeoutError(endpoint_url=url, error=e)
+
+    def connection_stats(self):
+        """Return connection reuse and age statistics of each pool."""
+        stats = self._manager.connection_stats()
+        for manager in self._proxy_managers.values():
+            stats.update(manager.connection_stats())
+        return stats
+
     def send(self, request):
         try:
             proxy_url = self._proxy_config.proxy_url_for(request.url)
@@ -14,6 +14,8 @@
 import base64
 import json
 import logging
+import queue
+import threading
 from itertools import tee
 
 import jmespath
@@ -203,6 +205,7 @@ class PageIterator:
         starting_token,
         page_size,
         op_kwargs,
+        prefetch_pages=None,
     ):
         self._method = method
         self._input_token = input_token
@@ -214,6 +217,7 @@ class PageIterator:
         self._starting_token = starting_token
         self._page_size = page_size
         self._op_kwargs = op_kwargs
+        self._prefetch_pages = prefetch_pages
         self._resume_token = None
         self._non_aggregate_key_exprs = non_aggregate_keys
         self._non_aggregate_part = {}
@@ -265,8 +269,12 @@ class PageIterator:
         primary_result_key = self.result_keys[0]
         starting_truncation = 0
         self._inject_starting_params(current_kwargs)
+        if self._prefetch_pages:
+            responses = self._iter_prefetched_responses(current_kwargs)
+        else:
+            responses = self._iter_responses(current_kwargs)
         while True:
-            response = self._make_request(current_kwargs)
+            response = next(responses)
             parsed = self._extract_parsed_response(response)
             if first_request:
                 # The first request is handled differently.  We could
@@ -356,6 +364,64 @@ class PageIterator:
     def _make_request(self, current_kwargs):
         return self._method(**current_kwargs)
 
+    def _iter_responses(self, current_kwargs):
+        # The caller injects the next token into current_kwargs before
+        # asking for the next response.
+        while True:
+            yield self._make_request(current_kwargs)
+
+    def _iter_prefetched_responses(self, current_kwargs):
+        # Requests pages on a background thread, staying at most
+        # ``prefetch_pages`` pages ahead of the caller.  The worker follows
+        # the same next tokens as __iter__, so the responses are identical
+        # to the ones _iter_responses would have returned.
+        responses = queue.Queue()
+        slots = threading.Semaphore(self._prefetch_pages + 1)
+        stopped = threading.Event()
+        worker = threading.Thread(
+            target=self._prefetch_requests,
+            args=(dict(current_kwargs), responses, slots, stopped),
+            daemon=True,
+        )
+        worker.start()
+        try:
+            while True:
+                error, response = responses.get()
+                if error is not None:
+                    raise error
+                yield response
+                # The caller is done with the previous page.
+                slots.release()
+        finally:
+            stopped.set()
+
+    def _prefetch_requests(self, op_kwargs, responses, slots, stopped):
+        previous_next_token = None
+        try:
+            while self._acquire_slot(slots, stopped):
+                response = self._make_request(op_kwargs)
+                # Work out the next token before handing the page over, as
+                # the caller is free to modify it.
+                next_token = self._get_next_token(
+                    self._extract_parsed_response(response)
+                )
+                responses.put((None, response))
+                if all(t is None for t in next_token.values()):
+                    return
+                if previous_next_token == next_token:
+                    # __iter__ raises a PaginationError on this page.
+                    return
+                self._inject_token_into_kwargs(op_kwargs, next_token)
+                previous_next_token = next_token
+        except Exception as e:
+            responses.put((e, None))
+
+    def _acquire_slot(self, slots, stopped):
+        while not stopped.is_set():
+            if slots.acquire(timeout=0.1):
+                return True
+        return False
+
     def _extract_parsed_response(self, response):
         return response
 
@@ -588,8 +654,122 @@ class PageIterator:
         return dict(zip(self._input_token, deprecated_token))
 
 
+class ParallelSegmentPageIterator(PageIterator):
+    """Pages through a segmented operation on a pool of worker threads.
+
+    Operations such as DynamoDB ``Scan`` can split their results into
+    ``TotalSegments`` independent segments.  This iterator paginates up to
+    ``MAX_WORKERS`` segments at once, each on its own thread, and yields
+    pages as they arrive, so pages of different segments are interleaved.
+    A worker that finishes a segment moves on to the next one that has not
+    been started.  Finished pages are handed over through a bounded queue,
+    which stops the workers from reading ahead while the caller is still
+    busy with earlier pages.
+    """
+
+    # The maximum number of segments paginated at once.
+    MAX_WORKERS = 10
+    # The number of pages each worker can have waiting in the queue.
+    PAGES_PER_SEGMENT = 2
+
+    def __init__(self, *args, total_segments, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._total_segments = total_segments
+
+    def _create_segment_iterator(self, segment):
+        op_kwargs = dict(
+            self._op_kwargs,
+            Segment=segment,
+            TotalSegments=self._total_segments,
+        )
+        return PageIterator(
+            self._method,
+            self._input_token,
+            self._output_token,
+            self._more_results,
+            self._result_keys,
+            self._non_aggregate_key_exprs,
+            self._limit_key,
+            None,
+            None,
+            self._page_size,
+            op_kwargs,
+            prefetch_pages=self._prefetch_pages,
+        )
+
+    def __iter__(self):
+        num_workers = min(self._total_segments, self.MAX_WORKERS)
+        segments = queue.Queue()
+        for segment in range(self._total_segments):
+            segments.put(segment)
+        pages = queue.Queue(maxsize=num_workers * self.PAGES_PER_SEGMENT)
+        stopped = threading.Event()
+        workers = [
+            threading.Thread(
+                target=self._paginate_segments,
+                args=(segments, pages, stopped),
+                daemon=True,
+            )
+            for _ in range(num_workers)
+        ]
+        for worker in workers:
+            worker.start()
+        remaining = self._total_segments
+        first_page = True
+        try:
+            while remaining:
+                error, page = pages.get()
+                if error is not None:
+                    raise error
+                if page is _SEGMENT_DONE:
+                    remaining -= 1
+                    continue
+                if first_page:
+                    self._record_non_aggregate_key_values(page)
+                    first_page = False
+                yield page
+        finally:
+            stopped.set()
+
+    def _paginate_segments(self, segments, pages, stopped):
+        while not stopped.is_set():
+            try:
+                segment = segments.get_nowait()
+            except queue.Empty:
+                return
+            if not self._paginate_segment(segment, pages, stopped):
+                return
+
+    def _paginate_segment(self, segment, pages, stopped):
+        # Returns whether the worker should go on with the next segment.
+        try:
+            for page in self._create_segment_iterator(segment):
+                if not self._put_page(pages, stopped, (None, page)):
+                    return False
+            return self._put_page(pages, stopped, (None, _SEGMENT_DONE))
+        except Exception as e:
+            self._put_page(pages, stopped, (e, None))
+            return False
+
+    def _put_page(self, pages, stopped, item):
+        # Blocks while the queue is full, but gives up once the consumer
+        # has stopped iterating so the worker thread can exit.
+        while not stopped.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+# Marks the end of a segment in the ParallelSegmentPageIterator queue.
+_SEGMENT_DONE = object()
+
+
 class Paginator:
     PAGE_ITERATOR_CLS = PageIterator
+    PARALLEL_PAGE_ITERATOR_CLS = ParallelSegmentPageIterator
 
     def __init__(self, method, pagination_config, model):
         self._model = model
@@ -654,7 +834,7 @@ class Paginator:
 
         """
         page_params = self._extract_paging_params(kwargs)
-        return self.PAGE_ITERATOR_CLS(
+        page_iterator_args = (
             self._method,
             self._input_token,
             self._output_token,
@@ -667,6 +847,20 @@ class Paginator:
             page_params['PageSize'],
             kwargs,
         )
+        page_iterator_kwargs = {}
+        if page_params['PrefetchPages'] is not None:
+            page_iterator_kwargs['prefetch_pages'] = page_params[
+                'PrefetchPages'
+            ]
+        if page_params['ParallelSegments'] is not None:
+            return self.PARALLEL_PAGE_ITERATOR_CLS(
+                *page_iterator_args,
+                total_segments=page_params['ParallelSegments'],
+                **page_iterator_kwargs,
+            )
+        return self.PAGE_ITERATOR_CLS(
+            *page_iterator_args, **page_iterator_kwargs
+        )
 
     def _extract_paging_params(self, kwargs):
         pagination_config = kwargs.pop('PaginationConfig', {})
@@ -687,12 +881,55 @@ class Paginator:
                     page_size = str(page_size)
             else:
                 page_size = int(page_size)
+        parallel_segments = self._get_parallel_segments(
+            pagination_config, kwargs
+        )
+        prefetch_pages = pagination_config.get('PrefetchPages', None)
+        if prefetch_pages is not None:
+            prefetch_pages = int(prefetch_pages)
+            if prefetch_pages < 0:
+                raise PaginationError(
+                    message="PrefetchPages must not be negative."
+                )
         return {
             'MaxItems': max_items,
             'StartingToken': pagination_config.get('StartingToken', None),
             'PageSize': page_size,
+            'ParallelSegments': parallel_segments,
+            'PrefetchPages': prefetch_pages,
         }
 
+    def _get_parallel_segments(self, pagination_config, kwargs):
+        parallel_segments = pagination_config.get('ParallelSegments', None)
+        if parallel_segments is None:
+            return None
+        input_shape = self._model.input_shape
+        members = input_shape.members if input_shape is not None else {}
+        if 'Segment' not in members or 'TotalSegments' not in members:
+            raise PaginationError(
+                message="ParallelSegments is not supported for the "
+                "pagination interface for this operation."
+            )
+        if 'Segment' in kwargs or 'TotalSegments' in kwargs:
+            raise PaginationError(
+                message="ParallelSegments cannot be combined with the "
+                "Segment or TotalSegments parameters."
+            )
+        if (
+            pagination_config.get('MaxItems') is not None
+            or pagination_config.get('StartingToken') is not None
+        ):
+            raise PaginationError(
+                message="ParallelSegments cannot be combined with "
+                "MaxItems or StartingToken."
+            )
+        parallel_segments = int(parallel_segments)
+        if parallel_segments < 1:
+            raise PaginationError(
+                message="ParallelSegments must be a positive integer."
+            )
+        return parallel_segments
+
 
 class ResultKeyIterator:
     """Iterates over the results of paginated responses.
@@ -133,6 +133,13 @@ LOG = logging.getLogger(__name__)
 
 DEFAULT_TIMESTAMP_PARSER = parse_timestamp
 
+# The members of the DynamoDB ``AttributeValue`` shape.  A structure with
+# exactly these members is handled by the raw attribute value fast path of
+# the JSON parser.
+DYNAMODB_ATTRIBUTE_VALUE_MEMBERS = frozenset(
+    ['S', 'N', 'B', 'SS', 'NS', 'BS', 'M', 'L', 'NULL', 'BOOL']
+)
+
 
 class ResponseParserFactory:
     def __init__(self):
@@ -146,6 +153,10 @@ class ResponseParserFactory:
 
             * timestamp_parser - A callable that can parse a timestamp string
             * blob_parser - A callable that can parse a blob type
+            * raw_attribute_values - If True, DynamoDB ``AttributeValue``
+              trees in JSON responses are returned as decoded from the
+              wire (with only binary values base64 decoded) instead of
+              being walked member by member.
 
         """
         self._defaults.update(kwargs)
@@ -201,13 +212,16 @@ class ResponseParser:
     DEFAULT_ENCODING = 'utf-8'
     EVENT_STREAM_PARSER_CLS = None
 
-    def __init__(self, timestamp_parser=None, blob_parser=None):
+    def __init__(
+        self, timestamp_parser=None, blob_parser=None, raw_attribute_values=False
+    ):
         if timestamp_parser is None:
             timestamp_parser = DEFAULT_TIMESTAMP_PARSER
         self._timestamp_parser = timestamp_parser
         if blob_parser is None:
             blob_parser = self._default_blob_parser
         self._blob_parser = blob_parser
+        self._raw_attribute_values = raw_attribute_values
         self._event_stream_parser = None
         if self.EVENT_STREAM_PARSER_CLS is not None:
             self._event_stream_parser = self.EVENT_STREAM_PARSER_CLS(
@@ -377,8 +391,10 @@ class ResponseParser:
 
 
 class BaseXMLResponseParser(ResponseParser):
-    def __init__(self, timestamp_parser=None, blob_parser=None):
-        super().__init__(timestamp_parser, blob_parser)
+    def __init__(
+        self, timestamp_parser=None, blob_parser=None, raw_attribute_values=False
+    ):
+        super().__init__(timestamp_parser, blob_parser, raw_attribute_values)
         self._namespace_re = re.compile('{.*}')
 
     def _handle_map(self, shape, node):
@@ -642,6 +658,139 @@ class EC2QueryParser(QueryParser):
 
 
 class BaseJSONParser(ResponseParser):
+    def _parse_compiled_shape(self, shape, value):
+        # Parses ``value`` with a parse function specialized for ``shape``.
+        # The function is generated once and cached on the shape object,
+        # so for operation output shapes (which are cached on the
+        # OperationModel) every subsequent response skips the per-member
+        # handler dispatch done by _parse_shape.
+        cache_key = ('json-parser', type(self), self._raw_attribute_values)
+        compiled = shape._cache.get(cache_key)
+        if compiled is None:
+            compiled = self._compile_shape(shape, {})
+            if compiled is None:
+                compiled = _identity_parse
+            shape._cache[cache_key] = compiled
+        return compiled(self, value)
+
+    def _compile_shape(self, shape, compiled):
+        # Returns a function of (parser, value), or None if the shape
+        # parses to the value unchanged.  ``compiled`` holds the container
+        # shapes compiled so far and is used to tie recursive shapes
+        # (e.g. AttributeValue -> MapAttributeValue -> AttributeValue)
+        # back onto themselves.  It is private to a single compilation so
+        # a partially compiled shape is never visible to other threads.
+        type_name = shape.type_name
+        if type_name not in ('structure', 'list', 'map'):
+            return self._compile_scalar(shape)
+        key = (shape.name, type_name)
+        if key in compiled:
+            return compiled[key]
+
+        def _deferred(parser, value):
+            return compiled[key](parser, value)
+
+        compiled[key] = _deferred
+        compile_method = getattr(self, f'_compile_{type_name}')
+        compiled[key] = compile_method(shape, compiled)
+        return compiled[key]
+
+    def _compile_scalar(self, shape):
+        type_name = shape.type_name
+        handler = getattr(type(self), f'_handle_{type_name}', None)
+        if handler is None:
+            return None
+        if handler is BaseJSONParser._handle_blob:
+            return _parse_blob
+        if handler is BaseJSONParser._handle_timestamp:
+            return _parse_timestamp
+
+        def _parse_scalar(parser, value):
+            return handler(parser, shape, value)
+
+        return _parse_scalar
+
+    def _compile_structure(self, shape, compiled):
+        if (
+            type(self)._handle_structure is not BaseJSONParser._handle_structure
+            or shape.is_tagged_union
+        ):
+            return _handler_parse(shape, '_handle_structure')
+        if shape.is_document_type:
+            return None
+        member_shapes = shape.members
+        if (
+            self._raw_attribute_values
+            and shape.name == 'AttributeValue'
+            and set(member_shapes) == DYNAMODB_ATTRIBUTE_VALUE_MEMBERS
+        ):
+            return _parse_raw_attribute_value
+        members = []
+        by_json_name = {}
+        for member_name, member_shape in member_shapes.items():
+            json_name = member_shape.serialization.get('name', member_name)
+            member_parse = self._compile_shape(member_shape, compiled)
+            members.append((member_name, json_name, member_parse))
+            by_json_name[json_name] = (member_name, member_parse)
+
+        def _parse_structure(parser, value):
+            if value is None:
+                return None
+            final_parsed = {}
+            if len(value) == 1:
+                # Sparse structures such as AttributeValue carry a single
+                # key, so look that up directly instead of probing for
+                # every modeled member.
+                for json_name, raw_value in value.items():
+                    member = by_json_name.get(json_name)
+                    if member is not None and raw_value is not None:
+                        member_name, member_parse = member
+                        if member_parse is not None:
+                            raw_value = member_parse(parser, raw_value)
+                        final_parsed[member_name] = raw_value
+                return final_parsed
+            for member_name, json_name, member_parse in members:
+                raw_value = value.get(json_name)
+                if raw_value is not None:
+                    if member_parse is not None:
+                        raw_value = member_parse(parser, raw_value)
+                    final_parsed[member_name] = raw_value
+            return final_parsed
+
+        return _parse_structure
+
+    def _compile_list(self, shape, compiled):
+        if type(self)._handle_list is not ResponseParser._handle_list:
+            return _handler_parse(shape, '_handle_list')
+        member_parse = self._compile_shape(shape.member, compiled)
+        if member_parse is None:
+            return _parse_identity_list
+
+        def _parse_list(parser, value):
+            return [member_parse(parser, item) for item in value]
+
+        return _parse_list
+
+    def _compile_map(self, shape, compiled):
+        if type(self)._handle_map is not BaseJSONParser._handle_map:
+            return _handler_parse(shape, '_handle_map')
+        key_parse = self._compile_shape(shape.key, compiled)
+        value_parse = self._compile_shape(shape.value, compiled)
+        if key_parse is None and value_parse is None:
+            return _parse_identity_map
+        if key_parse is None:
+            key_parse = _identity_parse
+        if value_parse is None:
+            value_parse = _identity_parse
+
+        def _parse_map(parser, value):
+            return {
+                key_parse(parser, k): value_parse(parser, v)
+                for k, v in value.items()
+            }
+
+        return _parse_map
+
     def _handle_structure(self, shape, value):
         final_parsed = {}
         if shape.is_document_type:
@@ -751,6 +900,55 @@ class BaseJSONParser(ResponseParser):
             return {'message': body}
 
 
+def _identity_parse(parser, value):
+    return value
+
+
+def _parse_identity_list(parser, value):
+    return list(value)
+
+
+def _parse_identity_map(parser, value):
+    return dict(value)
+
+
+def _parse_blob(parser, value):
+    return parser._blob_parser(value)
+
+
+def _parse_timestamp(parser, value):
+    return parser._timestamp_parser(value)
+
+
+def _handler_parse(shape, handler_name):
+    # Falls back to the regular (recursive) handler for shapes the
+    # compiler does not specialize.
+    def _parse_with_handler(parser, value):
+        return getattr(parser, handler_name)(shape, value)
+
+    return _parse_with_handler
+
+
+def _parse_raw_attribute_value(parser, value):
+    # DynamoDB AttributeValues are returned on the wire in exactly the
+    # form the model describes, so the decoded JSON is reused in place.
+    # The only values that need converting are binary ones.
+    if value is None:
+        return None
+    for tag, tagged_value in value.items():
+        if tag == 'M':
+            for item in tagged_value.values():
+                _parse_raw_attribute_value(parser, item)
+        elif tag == 'L':
+            for item in tagged_value:
+                _parse_raw_attribute_value(parser, item)
+        elif tag == 'B':
+            value['B'] = parser._blob_parser(tagged_value)
+        elif tag == 'BS':
+            value['BS'] = [parser._blob_parser(b) for b in tagged_value]
+    return value
+
+
 class BaseEventStreamParser(ResponseParser):
     def _do_parse(self, response, shape):
         final_parsed = {}
@@ -882,7 +1080,7 @@ class JSONParser(BaseJSONParser):
         # but we need to traverse the parsed JSON data to convert
         # to richer types (blobs, timestamps, etc.
         parsed_json = self._parse_body_as_json(raw_body)
-        return self._parse_shape(shape, parsed_json)
+        return self._parse_compiled_shape(shape, parsed_json)
 
 
 class BaseRestParser(ResponseParser):
@@ -7,7 +7,40 @@ from botocore.retries import bucket, standard, throttling
 logger = logging.getLogger(__name__)
 
 
-def register_retry_handler(client):
+# Rate limiters shared by every client of a service, region and endpoint
+# in the process, keyed by (service id, region name, endpoint url).
+_SHARED_RATE_LIMITERS = {}
+_shared_rate_limiters_lock = threading.Lock()
+
+
+def register_retry_handler(client, scope='client'):
+    """Register an adaptive rate limiter for ``client``.
+
+    With a ``scope`` of ``'client'`` the client gets a rate limiter of its
+    own.  With ``'process'`` it uses the limiter shared by all clients of
+    the same service, region and endpoint, so that they learn the allowed
+    send rate together instead of each backing off on its own.
+    """
+    if scope == 'process':
+        limiter = get_shared_rate_limiter(
+            client.meta.service_model.service_id,
+            client.meta.region_name,
+            client.meta.endpoint_url,
+        )
+    else:
+        limiter = create_rate_limiter()
+    client.meta.events.register(
+        'before-send',
+        limiter.on_sending_request,
+    )
+    client.meta.events.register(
+        'needs-retry',
+        limiter.on_receiving_response,
+    )
+    return limiter
+
+
+def create_rate_limiter(coalesce_throttles=False):
     clock = bucket.Clock()
     rate_adjustor = throttling.CubicCalculator(
         starting_max_rate=0, start_time=clock.current_time()
@@ -17,22 +50,28 @@ def register_retry_handler(client):
     throttling_detector = standard.ThrottlingErrorDetector(
         retry_event_adapter=standard.RetryEventAdapter(),
     )
-    limiter = ClientRateLimiter(
+    return ClientRateLimiter(
         rate_adjustor=rate_adjustor,
         rate_clocker=rate_clocker,
         token_bucket=token_bucket,
         throttling_detector=throttling_detector,
         clock=clock,
+        coalesce_throttles=coalesce_throttles,
     )
-    client.meta.events.register(
-        'before-send',
-        limiter.on_sending_request,
-    )
-    client.meta.events.register(
-        'needs-retry',
-        limiter.on_receiving_response,
-    )
-    return limiter
+
+
+def get_shared_rate_limiter(service_id, region_name, endpoint_url=None):
+    """Return the process-wide rate limiter for a service endpoint."""
+    key = (str(service_id), region_name, endpoint_url)
+    with _shared_rate_limiters_lock:
+        limiter = _SHARED_RATE_LIMITERS.get(key)
+        if limiter is None:
+            # Many clients have requests in flight when the service starts
+            # throttling, so only the first throttle of a burst lowers the
+            # shared rate.
+            limiter = create_rate_limiter(coalesce_throttles=True)
+            _SHARED_RATE_LIMITERS[key] = limiter
+        return limiter
 
 
 class ClientRateLimiter:
@@ -45,6 +84,7 @@ class ClientRateLimiter:
         token_bucket,
         throttling_detector,
         clock,
+        coalesce_throttles=False,
     ):
         self._rate_adjustor = rate_adjustor
         self._rate_clocker = rate_clocker
@@ -53,10 +93,24 @@ class ClientRateLimiter:
         self._clock = clock
         self._enabled = False
         self._lock = threading.Lock()
+        # When set, throttles of requests sent before the last rate
+        # decrease are ignored, as that decrease already accounted for them.
+        self._coalesce_throttles = coalesce_throttles
+        self._last_decrease_time = None
 
     def on_sending_request(self, request, **kwargs):
         if self._enabled:
             self._token_bucket.acquire()
+        if self._coalesce_throttles:
+            # Kept on the request, as its response may be handled on another
+            # thread or by another coroutine than the one that sent it.
+            request.context['adaptive_send_time'] = self._clock.current_time()
+
+    def _is_stale_throttle(self, request_dict):
+        if self._last_decrease_time is None or request_dict is None:
+            return False
+        send_time = request_dict['context'].get('adaptive_send_time')
+        return send_time is not None and send_time < self._last_decrease_time
 
     # Hooked up to needs-retry.
     def on_receiving_response(self, **kwargs):
@@ -65,6 +119,10 @@ class ClientRateLimiter:
         with self._lock:
             if not self._throttling_detector.is_throttling_error(**kwargs):
                 new_rate = self._rate_adjustor.success_received(timestamp)
+            elif self._coalesce_throttles and self._is_stale_throttle(
+                kwargs.get('request_dict')
+            ):
+                return
             else:
                 if not self._enabled:
                     rate_to_use = measured_rate
@@ -84,6 +142,7 @@ class ClientRateLimiter:
                     self._token_bucket.available_capacity,
                 )
                 self._enabled = True
+                self._last_decrease_time = timestamp
             self._token_bucket.max_rate = min(
                 new_rate, self._MAX_RATE_ADJUST_SCALE * measured_rate
             )
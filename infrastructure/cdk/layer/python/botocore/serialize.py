@@ -170,6 +170,39 @@ class Serializer:
             value = value.encode(self.DEFAULT_ENCODING)
         return base64.b64encode(value).strip().decode(self.DEFAULT_ENCODING)
 
+    def _get_compiled_serializer(self, shape):
+        # The serializer for a shape is generated once and cached on the
+        # shape object.  Input shapes are cached on the OperationModel, so
+        # this happens once per operation rather than once per request and
+        # removes the per-member handler dispatch of _serialize.
+        cache_key = ('serializer', type(self), self.MAP_TYPE)
+        compiled = shape._cache.get(cache_key)
+        if compiled is None:
+            compiled = self._compile_shape(shape, {})
+            shape._cache[cache_key] = compiled
+        return compiled
+
+    def _compile_shape(self, shape, compiled):
+        # ``compiled`` maps the container shapes compiled so far, which is
+        # how recursive shapes (e.g. AttributeValue -> MapAttributeValue ->
+        # AttributeValue) refer back to themselves.  It is local to a single
+        # compilation so other threads never see a partial result.
+        if shape.type_name not in ('structure', 'list', 'map'):
+            return self._compile_type(shape, compiled)
+        key = (shape.name, shape.type_name)
+        if key in compiled:
+            return compiled[key]
+
+        def _deferred(*args):
+            return compiled[key](*args)
+
+        compiled[key] = _deferred
+        compiled[key] = self._compile_type(shape, compiled)
+        return compiled[key]
+
+    def _compile_type(self, shape, compiled):
+        raise NotImplementedError('_compile_type')
+
     def _expand_host_prefix(self, parameters, operation_model):
         operation_endpoint = operation_model.endpoint
         if (
@@ -221,7 +254,8 @@ class QuerySerializer(Serializer):
         body_params['Action'] = operation_model.name
         body_params['Version'] = operation_model.metadata['apiVersion']
         if shape is not None:
-            self._serialize(body_params, parameters, shape)
+            compiled = self._get_compiled_serializer(shape)
+            compiled(self, body_params, parameters, '')
         serialized['body'] = body_params
 
         host_prefix = self._expand_host_prefix(parameters, operation_model)
@@ -310,6 +344,131 @@ class QuerySerializer(Serializer):
     def _is_shape_flattened(self, shape):
         return shape.serialization.get('flattened')
 
+    def _compile_type(self, shape, compiled):
+        # Returns a function of (serializer, serialized, value, prefix) that
+        # adds ``value`` to ``serialized`` the same way _serialize does.
+        type_name = shape.type_name
+        handler_name = f'_serialize_type_{type_name}'
+        handler = getattr(type(self), handler_name, None)
+        if handler is None:
+            return _query_default_serialize
+        if handler is not getattr(QuerySerializer, handler_name):
+            # A subclass customizes this type, so defer to its handler.
+            return _query_handler_serialize(shape, handler)
+        if type_name in ('structure', 'list', 'map'):
+            return getattr(self, f'_compile_{type_name}')(shape, compiled)
+        return getattr(self, f'_compile_{type_name}')(shape)
+
+    def _compile_structure(self, shape, compiled):
+        members = {}
+        for key, member_shape in shape.members.items():
+            member_name = self._get_serialized_name(member_shape, key)
+            member_serialize = self._compile_shape(member_shape, compiled)
+            members[key] = (member_name, member_serialize)
+
+        def _serialize_structure(serializer, serialized, value, prefix):
+            for key, member_value in value.items():
+                member_name, member_serialize = members[key]
+                if prefix:
+                    member_name = f'{prefix}.{member_name}'
+                member_serialize(
+                    serializer, serialized, member_value, member_name
+                )
+
+        return _serialize_structure
+
+    def _compile_list(self, shape, compiled):
+        member_shape = shape.member
+        member_serialize = self._compile_shape(member_shape, compiled)
+        flattened = self._is_shape_flattened(shape)
+        if flattened:
+            member_name = None
+            if member_shape.serialization.get('name'):
+                member_name = self._get_serialized_name(
+                    member_shape, default_name=''
+                )
+        else:
+            list_name = member_shape.serialization.get('name', 'member')
+
+        def _serialize_list(serializer, serialized, value, prefix):
+            if not value:
+                # The query protocol serializes empty lists.
+                serialized[prefix] = ''
+                return
+            if not flattened:
+                list_prefix = f'{prefix}.{list_name}'
+            elif member_name is not None:
+                # Replace '.Original' with '.{name}'.
+                list_prefix = '.'.join(prefix.split('.')[:-1] + [member_name])
+            else:
+                list_prefix = prefix
+            for i, element in enumerate(value, 1):
+                member_serialize(
+                    serializer, serialized, element, f'{list_prefix}.{i}'
+                )
+
+        return _serialize_list
+
+    def _compile_map(self, shape, compiled):
+        key_shape = shape.key
+        value_shape = shape.value
+        key_serialize = self._compile_shape(key_shape, compiled)
+        value_serialize = self._compile_shape(value_shape, compiled)
+        key_suffix = self._get_serialized_name(key_shape, default_name='key')
+        value_suffix = self._get_serialized_name(value_shape, 'value')
+        flattened = self._is_shape_flattened(shape)
+
+        def _serialize_map(serializer, serialized, value, prefix):
+            full_prefix = prefix if flattened else f'{prefix}.entry'
+            for i, key in enumerate(value, 1):
+                key_serialize(
+                    serializer, serialized, key, f'{full_prefix}.{i}.{key_suffix}'
+                )
+                value_serialize(
+                    serializer,
+                    serialized,
+                    value[key],
+                    f'{full_prefix}.{i}.{value_suffix}',
+                )
+
+        return _serialize_map
+
+    def _compile_blob(self, shape):
+        return _query_serialize_blob
+
+    def _compile_timestamp(self, shape):
+        timestamp_format = shape.serialization.get('timestampFormat')
+
+        def _serialize_timestamp(serializer, serialized, value, prefix):
+            serialized[prefix] = serializer._convert_timestamp_to_str(
+                value, timestamp_format
+            )
+
+        return _serialize_timestamp
+
+    def _compile_boolean(self, shape):
+        return _query_serialize_boolean
+
+
+def _query_default_serialize(serializer, serialized, value, prefix):
+    serialized[prefix] = value
+
+
+def _query_serialize_blob(serializer, serialized, value, prefix):
+    # Blob args must be base64 encoded.
+    serialized[prefix] = serializer._get_base64(value)
+
+
+def _query_serialize_boolean(serializer, serialized, value, prefix):
+    serialized[prefix] = 'true' if value else 'false'
+
+
+def _query_handler_serialize(shape, handler):
+    def _serialize_with_handler(serializer, serialized, value, prefix):
+        handler(serializer, serialized, value, shape, prefix=prefix)
+
+    return _serialize_with_handler
+
 
 class EC2Serializer(QuerySerializer):
     """EC2 specific customizations to the query protocol serializers.
@@ -361,7 +520,7 @@ class JSONSerializer(Serializer):
         body = self.MAP_TYPE()
         input_shape = operation_model.input_shape
         if input_shape is not None:
-            self._serialize(body, parameters, input_shape)
+            body = self._serialize_compiled(body, parameters, input_shape)
         serialized['body'] = json.dumps(body).encode(self.DEFAULT_ENCODING)
 
         host_prefix = self._expand_host_prefix(parameters, operation_model)
@@ -378,6 +537,94 @@ class JSONSerializer(Serializer):
         )
         method(serialized, value, shape, key)
 
+    def _serialize_compiled(self, serialized, value, shape):
+        # Serializes the top level structure ``value`` and returns the
+        # serialized body, using a function specialized for ``shape``.
+        if shape.type_name != 'structure' or shape.is_document_type:
+            self._serialize(serialized, value, shape)
+            return serialized
+        compiled = self._get_compiled_serializer(shape)
+        if serialized:
+            serialized.update(compiled(self, value))
+            return serialized
+        return compiled(self, value)
+
+    def _compile_type(self, shape, compiled):
+        # Returns a function of (serializer, value) that returns the
+        # serialized value, or None if the value is serialized unchanged.
+        type_name = shape.type_name
+        handler = getattr(type(self), f'_serialize_type_{type_name}', None)
+        if handler is None:
+            return None
+        if handler is not getattr(JSONSerializer, handler.__name__):
+            # A subclass customizes this type, so defer to its handler.
+            return _json_handler_serialize(shape, handler)
+        if type_name in ('structure', 'list', 'map'):
+            return getattr(self, f'_compile_{type_name}')(shape, compiled)
+        return getattr(self, f'_compile_{type_name}')(shape)
+
+    def _compile_structure(self, shape, compiled):
+        if shape.is_document_type:
+            return None
+        members = {}
+        for member_key, member_shape in shape.members.items():
+            serialized_key = member_shape.serialization.get('name', member_key)
+            member_serialize = self._compile_shape(member_shape, compiled)
+            members[member_key] = (serialized_key, member_serialize)
+        map_type = self.MAP_TYPE
+
+        def _serialize_structure(serializer, value):
+            serialized = map_type()
+            for member_key, member_value in value.items():
+                serialized_key, member_serialize = members[member_key]
+                if member_serialize is not None:
+                    member_value = member_serialize(serializer, member_value)
+                serialized[serialized_key] = member_value
+            return serialized
+
+        return _serialize_structure
+
+    def _compile_map(self, shape, compiled):
+        value_serialize = self._compile_shape(shape.value, compiled)
+        map_type = self.MAP_TYPE
+        if value_serialize is None:
+
+            def _serialize_map(serializer, value):
+                return map_type(value.items())
+
+        else:
+
+            def _serialize_map(serializer, value):
+                map_obj = map_type()
+                for sub_key, sub_value in value.items():
+                    map_obj[sub_key] = value_serialize(serializer, sub_value)
+                return map_obj
+
+        return _serialize_map
+
+    def _compile_list(self, shape, compiled):
+        member_serialize = self._compile_shape(shape.member, compiled)
+        if member_serialize is None:
+            return _serialize_identity_list
+
+        def _serialize_list(serializer, value):
+            return [member_serialize(serializer, item) for item in value]
+
+        return _serialize_list
+
+    def _compile_timestamp(self, shape):
+        timestamp_format = shape.serialization.get('timestampFormat')
+
+        def _serialize_timestamp(serializer, value):
+            return serializer._convert_timestamp_to_str(
+                value, timestamp_format
+            )
+
+        return _serialize_timestamp
+
+    def _compile_blob(self, shape):
+        return _serialize_blob
+
     def _serialize_type_structure(self, serialized, value, shape, key):
         if shape.is_document_type:
             serialized[key] = value
@@ -430,6 +677,23 @@ class JSONSerializer(Serializer):
         serialized[key] = self._get_base64(value)
 
 
+def _serialize_identity_list(serializer, value):
+    return list(value)
+
+
+def _serialize_blob(serializer, value):
+    return serializer._get_base64(value)
+
+
+def _json_handler_serialize(shape, handler):
+    def _serialize_with_handler(serializer, value):
+        wrapper = {}
+        handler(serializer, wrapper, value, shape, '__current__')
+        return wrapper['__current__']
+
+    return _serialize_with_handler
+
+
 class BaseRestSerializer(Serializer):
     """Base class for rest protocols.
 
@@ -696,7 +960,9 @@ class RestJSONSerializer(BaseRestSerializer, JSONSerializer):
 
     def _serialize_body_params(self, params, shape):
         serialized_body = self.MAP_TYPE()
-        self._serialize(serialized_body, params, shape)
+        serialized_body = self._serialize_compiled(
+            serialized_body, params, shape
+        )
         return json.dumps(serialized_body).encode(self.DEFAULT_ENCODING)
 
 
@@ -17,11 +17,14 @@ Session object.
 """
 
 import copy
+import hashlib
 import logging
 import os
 import platform
 import socket
+import threading
 import warnings
+from collections import OrderedDict
 
 import botocore.client
 import botocore.configloader
@@ -77,6 +80,10 @@ from botocore.compat import HAS_CRT  # noqa
 
 logger = logging.getLogger(__name__)
 
+# The number of clients kept by Session.get_cached_client.  The least
+# recently used client is dropped from the cache (not closed) beyond it.
+_CLIENT_CACHE_SIZE = 64
+
 
 class Session:
     """
@@ -150,6 +157,9 @@ class Session:
             self._session_instance_vars['profile'] = profile
         self._client_config = None
         self._last_client_region_used = None
+        self._client_cache = OrderedDict()
+        self._client_cache_lock = threading.Lock()
+        self._client_cache_stats = {'hits': 0, 'constructions': 0}
         self._components = ComponentLocator()
         self._internal_components = ComponentLocator()
         self._register_components()
@@ -513,6 +523,10 @@ class Session:
             self._credentials = self._components.get_component(
                 'credential_provider'
             ).load_credentials()
+            if isinstance(
+                self._credentials, botocore.credentials.RefreshableCredentials
+            ) and self.get_config_variable('credential_background_refresh'):
+                self._credentials.enable_background_refresh()
         return self._credentials
 
     def get_auth_token(self):
@@ -1011,6 +1025,99 @@ class Session:
             monitor.register(client.meta.events)
         return client
 
+    def get_cached_client(
+        self,
+        service_name,
+        region_name=None,
+        api_version=None,
+        use_ssl=True,
+        verify=None,
+        endpoint_url=None,
+        aws_access_key_id=None,
+        aws_secret_access_key=None,
+        aws_session_token=None,
+        config=None,
+    ):
+        """Return a shared botocore client, creating it on first use.
+
+        Takes the same arguments as :py:meth:`create_client`.  Calls with
+        the same service, region, endpoint, config and credentials return
+        the same client instance, which is safe to share between threads.
+        Because the client is shared, handlers registered on its
+        ``meta.events`` apply to every caller.  The session keeps the 64
+        most recently used clients and closes the clients it drops.
+
+        :return: A botocore client instance
+        """
+        if region_name is None:
+            region_name = self._resolve_region_name(region_name, config)
+        if aws_access_key_id is not None or aws_secret_access_key is not None:
+            credentials = None
+        elif config is not None and config.signature_version is UNSIGNED:
+            credentials = None
+        else:
+            credentials = self.get_credentials()
+        cache_key = (
+            service_name,
+            region_name,
+            api_version,
+            use_ssl,
+            verify,
+            endpoint_url,
+            _credentials_cache_key(
+                aws_access_key_id, aws_secret_access_key, aws_session_token
+            ),
+            _client_config_cache_key(config),
+            _client_config_cache_key(self._client_config),
+            credentials,
+        )
+        with self._client_cache_lock:
+            client = self._client_cache.get(cache_key)
+            if client is not None:
+                self._client_cache.move_to_end(cache_key)
+                self._client_cache_stats['hits'] += 1
+                return client
+        # Build the client outside of the lock so that loading a model
+        # does not hold up callers of other clients.  Concurrent first
+        # calls may each build one, but they all return the cached one.
+        client = self.create_client(
+            service_name,
+            region_name=region_name,
+            api_version=api_version,
+            use_ssl=use_ssl,
+            verify=verify,
+            endpoint_url=endpoint_url,
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            aws_session_token=aws_session_token,
+            config=config,
+        )
+        discarded = []
+        with self._client_cache_lock:
+            cached = self._client_cache.setdefault(cache_key, client)
+            if cached is client:
+                self._client_cache_stats['constructions'] += 1
+            else:
+                # Another caller built and cached the same client first.
+                discarded.append(client)
+            if len(self._client_cache) > _CLIENT_CACHE_SIZE:
+                discarded.append(self._client_cache.popitem(last=False)[1])
+        for unused in discarded:
+            unused.close()
+        return cached
+
+    def get_client_cache_stats(self):
+        """Return the hit and construction counts of the client cache.
+
+        :rtype: dict
+        :return: A dict with the number of ``hits`` and ``constructions``
+            made through :py:meth:`get_cached_client`.  Clients built by
+            concurrent first calls that lost to another caller's client
+            are not counted.
+        """
+        with self._client_cache_lock:
+            return dict(self._client_cache_stats)
+
     def _resolve_region_name(self, region_name, config):
         # Figure out the user-provided region based on the various
         # configuration options.
@@ -1127,6 +1234,26 @@ class Session:
         return results
 
 
+def _credentials_cache_key(access_key, secret_key, token):
+    # Explicit credentials are keyed by a digest so the cache does not
+    # hold on to secret keys and session tokens.
+    if access_key is None and secret_key is None and token is None:
+        return None
+    digest = hashlib.sha256()
+    for value in (access_key, secret_key, token):
+        digest.update(repr(value).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.digest()
+
+
+def _client_config_cache_key(config):
+    # Config objects are not hashable, so they are keyed by the options
+    # they were created with.
+    if config is None:
+        return None
+    return repr(sorted(config._user_provided_options.items()))
+
+
 class ComponentLocator:
     """Service locator for session components."""
 
@@ -87,6 +87,40 @@ def range_check(name, value, shape, error_type, errors):
         errors.report(name, error_type, param=value, min_allowed=min_allowed)
 
 
+def _get_min_allowed(shape):
+    # Mirrors the lower bound applied by range_check.
+    if 'min' in shape.metadata:
+        return shape.metadata['min']
+    elif hasattr(shape, 'serialization'):
+        if shape.serialization.get('hostLabel'):
+            return 1
+    return float('-inf')
+
+
+def _compile_range_type_check(valid_types, shape, measure=None):
+    min_allowed = _get_min_allowed(shape)
+
+    def _range_type_check(param):
+        if not isinstance(param, valid_types):
+            return False
+        value = param if measure is None else measure(param)
+        return not value < min_allowed
+
+    return _range_type_check
+
+
+def _always_revalidate(param):
+    return False
+
+
+def _is_boolean(param):
+    return isinstance(param, bool)
+
+
+def _is_blob(param):
+    return isinstance(param, (bytes, bytearray, str)) or hasattr(param, 'read')
+
+
 class ValidationErrors:
     def __init__(self):
         self._errors = []
@@ -196,9 +230,145 @@ class ParamValidator:
 
         """
         errors = ValidationErrors()
-        self._validate(params, shape, errors, name='')
+        if not self._get_compiled_check(shape)(params):
+            # Only walk the input and build the error report when the
+            # fast check finds something wrong.
+            self._validate(params, shape, errors, name='')
         return errors
 
+    def _get_compiled_check(self, shape):
+        # The check for a shape is generated once and cached on the shape
+        # object.  Input shapes are cached on the OperationModel, so each
+        # operation is compiled once and every later call only runs a
+        # specialized predicate that neither formats member names nor
+        # allocates a ValidationErrors entry per field.
+        cache_key = ('param-validator', type(self))
+        check = shape._cache.get(cache_key)
+        if check is None:
+            check = self._compile_check(shape, {})
+            shape._cache[cache_key] = check
+        return check
+
+    def _compile_check(self, shape, compiled):
+        # Returns a function of (params) that is True only if _validate
+        # would not report any errors for params.  ``compiled`` maps the
+        # container shapes compiled so far so recursive shapes can refer
+        # back to themselves.
+        type_name = shape.type_name
+        if type_name not in ('structure', 'list', 'map'):
+            return self._compile_type_check(shape, compiled)
+        key = (shape.name, type_name)
+        if key in compiled:
+            return compiled[key]
+
+        def _deferred(params):
+            return compiled[key](params)
+
+        compiled[key] = _deferred
+        compiled[key] = self._compile_type_check(shape, compiled)
+        return compiled[key]
+
+    def _compile_type_check(self, shape, compiled):
+        special_validator = self._check_special_validation_cases(shape)
+        if special_validator:
+            return self._compile_special_check(shape, special_validator)
+        method_name = '_validate_%s' % shape.type_name
+        method = getattr(type(self), method_name, None)
+        if method is None or method is not getattr(
+            ParamValidator, method_name, None
+        ):
+            # Unknown or customized types always take the full path.
+            return _always_revalidate
+        return getattr(self, '_compile_%s_check' % shape.type_name)(
+            shape, compiled
+        )
+
+    def _compile_special_check(self, shape, special_validator):
+        def _special_check(params):
+            errors = ValidationErrors()
+            special_validator(params, shape, errors, '')
+            return not errors.has_errors()
+
+        return _special_check
+
+    def _compile_structure_check(self, shape, compiled):
+        members = {
+            member_name: self._compile_check(member_shape, compiled)
+            for member_name, member_shape in shape.members.items()
+        }
+        required = shape.metadata.get('required', [])
+        is_tagged_union = shape.is_tagged_union
+
+        def _structure_check(params):
+            if not isinstance(params, dict):
+                return False
+            if is_tagged_union and len(params) != 1:
+                return False
+            for required_member in required:
+                if required_member not in params:
+                    return False
+            for param, value in params.items():
+                member_check = members.get(param)
+                if member_check is None or not member_check(value):
+                    return False
+            return True
+
+        return _structure_check
+
+    def _compile_list_check(self, shape, compiled):
+        member_check = self._compile_check(shape.member, compiled)
+        min_allowed = _get_min_allowed(shape)
+
+        def _list_check(param):
+            if not isinstance(param, (list, tuple)):
+                return False
+            if len(param) < min_allowed:
+                return False
+            for item in param:
+                if not member_check(item):
+                    return False
+            return True
+
+        return _list_check
+
+    def _compile_map_check(self, shape, compiled):
+        key_check = self._compile_check(shape.key, compiled)
+        value_check = self._compile_check(shape.value, compiled)
+
+        def _map_check(param):
+            if not isinstance(param, dict):
+                return False
+            for key, value in param.items():
+                if not key_check(key) or not value_check(value):
+                    return False
+            return True
+
+        return _map_check
+
+    def _compile_string_check(self, shape, compiled):
+        return _compile_range_type_check((str,), shape, len)
+
+    def _compile_integer_check(self, shape, compiled):
+        return _compile_range_type_check((int,), shape)
+
+    _compile_long_check = _compile_integer_check
+
+    def _compile_double_check(self, shape, compiled):
+        return _compile_range_type_check(
+            (float, decimal.Decimal) + (int,), shape
+        )
+
+    _compile_float_check = _compile_double_check
+
+    def _compile_boolean_check(self, shape, compiled):
+        return _is_boolean
+
+    def _compile_blob_check(self, shape, compiled):
+        return _is_blob
+
+    def _compile_timestamp_check(self, shape, compiled):
+        return self._type_check_datetime
+
     def _check_special_validation_cases(self, shape):
         if is_json_value_header(shape):
             return self._validate_jsonvalue_string
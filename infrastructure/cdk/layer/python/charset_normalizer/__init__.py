@@ -21,7 +21,7 @@ at <https://github.com/Ousret/charset_normalizer>.
 """
 import logging
 
-from .api import from_bytes, from_fp, from_path, is_binary
+from .api import IncrementalDetector, from_bytes, from_fp, from_path, is_binary
 from .legacy import detect
 from .models import CharsetMatch, CharsetMatches
 from .utils import set_logging_handler
@@ -32,6 +32,7 @@ __all__ = (
     "from_path",
     "from_bytes",
     "is_binary",
+    "IncrementalDetector",
     "detect",
     "CharsetMatch",
     "CharsetMatches",
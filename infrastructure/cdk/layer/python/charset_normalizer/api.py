@@ -1,6 +1,7 @@
 import logging
+from codecs import getincrementaldecoder
 from os import PathLike
-from typing import BinaryIO, List, Optional, Set, Union
+from typing import Any, BinaryIO, Dict, List, Optional, Set, Union
 
 from .cd import (
     coherence_ratio,
@@ -14,11 +15,14 @@ from .models import CharsetMatch, CharsetMatches
 from .utils import (
     any_specified_encoding,
     cut_sequence_chunks,
+    distinct_non_ascii_bytes,
     iana_name,
     identify_sig_or_bom,
+    is_ascii_bytes_defined,
     is_cp_similar,
     is_multi_byte_encoding,
     should_strip_sig_or_bom,
+    strip_incomplete_utf8_tail,
 )
 
 # Will most likely be controversial
@@ -159,6 +163,9 @@ def from_bytes(
 
     results: CharsetMatches = CharsetMatches()
 
+    # Computed on first need, shared by every single byte code page tested.
+    non_ascii_bytes: Optional[bytes] = None
+
     sig_encoding, sig_payload = identify_sig_or_bom(sequences)
 
     if sig_encoding is not None:
@@ -219,20 +226,36 @@ def from_bytes(
             continue
 
         try:
-            if is_too_large_sequence and is_multi_byte_decoder is False:
-                str(
-                    sequences[: int(50e4)]
-                    if strip_sig_or_bom is False
-                    else sequences[len(sig_payload) : int(50e4)],
-                    encoding=encoding_iana,
-                )
+            if (
+                is_multi_byte_decoder is False
+                and encoding_iana != "ascii"
+                and is_ascii_bytes_defined(encoding_iana)
+            ):
+                # Single byte code pages fail on given byte values, not
+                # sequences: decoding each distinct byte once tells whether
+                # the whole payload decodes. The full str is only built once
+                # the code page has passed the mess probing.
+                if non_ascii_bytes is None:
+                    non_ascii_bytes = distinct_non_ascii_bytes(sequences)
+                str(non_ascii_bytes, encoding=encoding_iana)
             else:
-                decoded_payload = str(
-                    sequences
-                    if strip_sig_or_bom is False
-                    else sequences[len(sig_payload) :],
-                    encoding=encoding_iana,
-                )
+                # Code pages that do not fit mostly fail within the first
+                # bytes, and failing on the whole payload copies all of it
+                # into the exception: try the beginning on its own first.
+                if length > int(64e3):
+                    getincrementaldecoder(encoding_iana)().decode(
+                        sequences[len(sig_payload) if strip_sig_or_bom else 0 : int(64e3)],
+                        False,
+                    )
+                if is_too_large_sequence and is_multi_byte_decoder is False:
+                    str(sequences, encoding=encoding_iana)
+                else:
+                    decoded_payload = str(
+                        sequences
+                        if strip_sig_or_bom is False
+                        else sequences[len(sig_payload) :],
+                        encoding=encoding_iana,
+                    )
         except (UnicodeDecodeError, LookupError) as e:
             if not isinstance(e, LookupError):
                 logger.log(
@@ -286,6 +309,10 @@ def from_bytes(
         early_stop_count: int = 0
         lazy_str_hard_failure = False
 
+        # Once the chunks measured so far add up to this much mess, the mean
+        # over every chunk is above the threshold whatever the rest contain.
+        max_mess_total: float = threshold * len(r_)
+
         md_chunks: List[str] = []
         md_ratios = []
 
@@ -314,8 +341,10 @@ def from_bytes(
                 if md_ratios[-1] >= threshold:
                     early_stop_count += 1
 
-                if (early_stop_count >= max_chunk_gave_up) or (
-                    bom_or_sig_available and strip_sig_or_bom is False
+                if (
+                    (early_stop_count >= max_chunk_gave_up)
+                    or (bom_or_sig_available and strip_sig_or_bom is False)
+                    or sum(md_ratios) >= max_mess_total
                 ):
                     break
         except (
@@ -330,25 +359,6 @@ def from_bytes(
             early_stop_count = max_chunk_gave_up
             lazy_str_hard_failure = True
 
-        # We might want to check the sequence again with the whole content
-        # Only if initial MD tests passes
-        if (
-            not lazy_str_hard_failure
-            and is_too_large_sequence
-            and not is_multi_byte_decoder
-        ):
-            try:
-                sequences[int(50e3) :].decode(encoding_iana, errors="strict")
-            except UnicodeDecodeError as e:
-                logger.log(
-                    TRACE,
-                    "LazyStr Loading: After final lookup, code page %s does not fit given bytes sequence at ALL. %s",
-                    encoding_iana,
-                    str(e),
-                )
-                tested_but_hard_failure.append(encoding_iana)
-                continue
-
         mean_mess_ratio: float = sum(md_ratios) / len(md_ratios) if md_ratios else 0.0
         if mean_mess_ratio >= threshold or early_stop_count >= max_chunk_gave_up:
             tested_but_soft_failure.append(encoding_iana)
@@ -384,6 +394,9 @@ def from_bytes(
             round(mean_mess_ratio * 100, ndigits=3),
         )
 
+        if decoded_payload is None and not is_too_large_sequence:
+            decoded_payload = str(sequences, encoding=encoding_iana)
+
         if not is_multi_byte_decoder:
             target_languages: List[str] = encoding_languages(encoding_iana)
         else:
@@ -624,3 +637,105 @@ def is_binary(
         )
 
     return not guesses
+
+
+class IncrementalDetector:
+    """
+    Detect the charset of a payload given chunk by chunk, e.g. while it is being downloaded, and stop as soon as
+    a code page is found with enough confidence rather than after reading all of it.
+
+       >>> detector = IncrementalDetector()
+       >>> for chunk in chunks:
+       ...     if detector.feed(chunk):
+       ...         break
+       >>> best_guess = detector.close().best()
+
+    The detection of from_bytes is run on the bytes fed so far once they reach sample_size, then each time they
+    have grown four times larger. It is over once the sample holds something else than ASCII and the best match
+    has a BOM/SIG or a confidence (1 - chaos) of at least confidence_threshold. The matches returned by close()
+    then only cover the bytes examined; otherwise close() runs the detection on everything that was fed.
+    Other keyword arguments are given to from_bytes.
+    """
+
+    def __init__(
+        self,
+        confidence_threshold: float = 0.9,
+        sample_size: int = 65536,
+        **kwargs: Any,
+    ):
+        self.confidence_threshold: float = confidence_threshold
+        self.done: bool = False
+
+        self._kwargs: Dict[str, Any] = kwargs
+        self._buffer: bytearray = bytearray()
+        self._next_probe_size: int = sample_size
+        self._results: Optional[CharsetMatches] = None
+        self._probed_size: int = 0
+
+    def feed(self, chunk: Union[bytes, bytearray]) -> bool:
+        """
+        Add a chunk of the payload. Return True once the detection is over, further chunks being ignored.
+        """
+        if self.done:
+            return True
+
+        self._buffer += chunk
+
+        if len(self._buffer) >= self._next_probe_size:
+            self._next_probe_size = len(self._buffer) * 4
+            self._probe()
+
+        return self.done
+
+    def _probe(self) -> None:
+        # An ASCII sample fits (nearly) every code page, wait for more.
+        if self._buffer.isascii():
+            return
+
+        sample: bytes = bytes(self._buffer)
+        sig_encoding, _ = identify_sig_or_bom(sample)
+
+        # Do not cut a character in two at the end of the sample.
+        if sig_encoding in {"utf_16", "utf_32"}:
+            sample = sample[: len(sample) - len(sample) % 4]
+        else:
+            line_end: int = sample.rfind(b"\n") + 1
+            if line_end and not sample[:line_end].isascii():
+                sample = sample[:line_end]
+            else:
+                # Minified JSON and the like have no line to end on, and the last, unfinished line may hold
+                # all of the non-ASCII bytes.
+                sample = strip_incomplete_utf8_tail(sample)
+
+            if sample.isascii():
+                return
+
+        results: CharsetMatches = from_bytes(sample, **self._kwargs)
+        best_guess: Optional[CharsetMatch] = results.best()
+
+        if len(sample) == len(self._buffer):
+            self._results = results
+            self._probed_size = len(sample)
+
+        if best_guess is not None and (
+            best_guess.bom or 1.0 - best_guess.chaos >= self.confidence_threshold
+        ):
+            logger.debug(
+                "Encoding detection: %s found with enough confidence after %i byte(s), stopping.",
+                best_guess.encoding,
+                len(sample),
+            )
+            self._results = results
+            self.done = True
+
+    def close(self) -> CharsetMatches:
+        """
+        End the detection and return its matches.
+        """
+        if not self.done and (
+            self._results is None or self._probed_size != len(self._buffer)
+        ):
+            self._results = from_bytes(bytes(self._buffer), **self._kwargs)
+        self.done = True
+        self._buffer = bytearray()
+        return self._results  # type: ignore
@@ -30,6 +30,7 @@ class CharsetMatch:
 
         self._output_payload: Optional[bytes] = None
         self._output_encoding: Optional[str] = None
+        self._fingerprint: Optional[str] = None
 
         self._string: Optional[str] = decoded_payload
 
@@ -219,7 +220,10 @@ class CharsetMatch:
         """
         Retrieve the unique SHA256 computed using the transformed (re-encoded) payload. Not the original one.
         """
-        return sha256(self.output()).hexdigest()
+        # Computed once, as matches get compared many times against each other.
+        if self._fingerprint is None:
+            self._fingerprint = sha256(self.output()).hexdigest()
+        return self._fingerprint
 
 
 class CharsetMatches:
@@ -268,7 +272,7 @@ class CharsetMatches:
         # We should disable the submatch factoring when the input file is too heavy (conserve RAM usage)
         if len(item.raw) <= TOO_BIG_SEQUENCE:
             for match in self._results:
-                if match.fingerprint == item.fingerprint and match.chaos == item.chaos:
+                if match.chaos == item.chaos and match.fingerprint == item.fingerprint:
                     match.add_submatch(item)
                     return
         self._results.append(item)
@@ -13,6 +13,7 @@ from .constant import (
     ENCODING_MARKS,
     IANA_SUPPORTED_SIMILAR,
     RE_POSSIBLE_ENCODING_INDICATION,
+    TOO_BIG_SEQUENCE,
     UNICODE_RANGES_COMBINED,
     UNICODE_SECONDARY_RANGE_KEYWORD,
     UTF8_MAXIMAL_ALLOCATION,
@@ -265,6 +266,44 @@ def is_multi_byte_encoding(name: str) -> bool:
     )
 
 
+@lru_cache(maxsize=128)
+def is_ascii_bytes_defined(name: str) -> bool:
+    """
+    Verify that a single byte encoding can decode every byte under 0x80 (some EBCDIC code pages, e.g. cp424, cannot).
+    """
+    try:
+        bytes(range(0x80)).decode(name, errors="strict")
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def distinct_non_ascii_bytes(sequence: bytes) -> bytes:
+    """
+    Extract every distinct byte above 0x7F found in sequence, once. Single byte encodings decode each byte
+    on its own, so the sequence decodes if those (and the ASCII bytes) do.
+    """
+    # Most of the distinct bytes show up early: collect those from the head, then only the bytes that are
+    # left once they are deleted from the tail need to be looked at one by one.
+    head: Set[int] = {byte for byte in sequence[:65536] if byte > 0x7F}
+    tail: bytes = sequence[65536:].translate(None, bytes(range(0x80)) + bytes(head))
+    return bytes(sorted(head.union(tail)))
+
+
+def strip_incomplete_utf8_tail(sequence: bytes) -> bytes:
+    """
+    Remove the start of a UTF-8 character cut short at the end of sequence, if it ends with one.
+    """
+    for length in range(1, min(4, len(sequence)) + 1):
+        byte: int = sequence[-length]
+        if byte < 0x80:
+            return sequence
+        if byte >= 0xC0:
+            expected: int = 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+            return sequence[:-length] if length < expected else sequence
+    return sequence
+
+
 def identify_sig_or_bom(sequence: bytes) -> Tuple[Optional[str], bytes]:
     """
     Identify and extract SIG/BOM in given sequence.
@@ -376,9 +415,16 @@ def cut_sequence_chunks(
     is_multi_byte_decoder: bool,
     decoded_payload: Optional[str] = None,
 ) -> Generator[str, None, None]:
-    if decoded_payload and is_multi_byte_decoder is False:
+    if is_multi_byte_decoder is False and (
+        decoded_payload or len(sequences) < TOO_BIG_SEQUENCE
+    ):
+        # Single byte code pages map each byte to one character, so the chunks
+        # can be cut from the payload before (or without) decoding all of it.
         for i in offsets:
-            chunk = decoded_payload[i : i + chunk_size]
+            if decoded_payload:
+                chunk = decoded_payload[i : i + chunk_size]
+            else:
+                chunk = sequences[i : i + chunk_size].decode(encoding_iana)
             if not chunk:
                 break
             yield chunk
@@ -566,6 +566,16 @@ class _ymd(list):
 
 
 class parser(object):
+    # Strict ISO-8601 date-times, e.g. "2023-03-26T01:30:00.5+01:00", which
+    # ``parse()`` converts without going through the tokenizer.
+    _iso_re = re.compile(r"(\d{4})-(\d{2})-(\d{2})"
+                         r"(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?"
+                         r"(Z|[+-]\d{2}(?::?\d{2})?)?)?")
+
+    # Time zones of the non-zero ISO-8601 offsets seen so far, keyed by the
+    # offset as written, e.g. "+01:00".
+    _iso_tzinfos = {}
+
     def __init__(self, info=None):
         self.info = info or parserinfo()
 
@@ -634,6 +644,11 @@ class parser(object):
         """
 
         if default is None:
+            if tzinfos is None and not kwargs:
+                ret = self._parse_iso(timestr, ignoretz)
+                if ret is not None:
+                    return ret
+
             default = datetime.datetime.now().replace(hour=0, minute=0,
                                                       second=0, microsecond=0)
 
@@ -658,6 +673,61 @@ class parser(object):
         else:
             return ret
 
+    def _parse_iso(self, timestr, ignoretz):
+        """
+        Fast path of ``parse()`` for strict ISO-8601 strings.
+
+        Returns the same :class:`datetime.datetime` as the tokenizer would, or
+        ``None`` if ``timestr`` is not in a format handled here or if the
+        parser's ``parserinfo`` could change the result.
+        """
+        if (not isinstance(timestr, text_type) or
+                type(self.info) is not parserinfo or
+                self.info.dayfirst or self.info.yearfirst):
+            return None
+
+        match = self._iso_re.match(timestr)
+        if match is None or match.end() != len(timestr):
+            return None
+
+        (year, month, day, hour, minute, second,
+         fraction, offset) = match.groups()
+        try:
+            ret = datetime.datetime(
+                int(year), int(month), int(day),
+                int(hour or 0), int(minute or 0), int(second or 0),
+                int(fraction.ljust(6, "0")) if fraction else 0)
+        except ValueError:
+            # Let the tokenizer raise its usual error.
+            return None
+
+        if offset is None or ignoretz:
+            return ret
+
+        tzinfo = self._iso_tzinfos.get(offset)
+        if tzinfo is None:
+            seconds = 0
+            if offset != "Z":
+                seconds = int(offset[1:3]) * 3600
+                if len(offset) > 3:
+                    seconds += int(offset[-2:]) * 60
+                if offset[0] == "-":
+                    seconds = -seconds
+
+            if seconds == 0:
+                if "UTC" not in time.tzname:
+                    return ret.replace(tzinfo=tz.UTC)
+
+                # Parsed as the local time zone, see _build_tzaware.
+                res = self._result()
+                res.tzname = "UTC"
+                res.tzoffset = 0
+                return self._build_tzaware(ret, res, None)
+
+            tzinfo = tz.tzoffset(None, seconds)
+            self._iso_tzinfos[offset] = tzinfo
+        return ret.replace(tzinfo=tzinfo)
+
     class _result(_resultbase):
         __slots__ = ["year", "month", "day", "weekday",
                      "hour", "minute", "second", "microsecond",
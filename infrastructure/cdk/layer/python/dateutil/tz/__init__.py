@@ -5,7 +5,8 @@ from .tz import __doc__
 __all__ = ["tzutc", "tzoffset", "tzlocal", "tzfile", "tzrange",
            "tzstr", "tzical", "tzwin", "tzwinlocal", "gettz",
            "enfold", "datetime_ambiguous", "datetime_exists",
-           "resolve_imaginary", "UTC", "DeprecatedTzFormatWarning"]
+           "localize_many", "resolve_imaginary", "UTC",
+           "DeprecatedTzFormatWarning"]
 
 
 class DeprecatedTzFormatWarning(Warning):
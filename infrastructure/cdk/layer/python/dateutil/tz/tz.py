@@ -34,6 +34,9 @@ except ImportError:
 from warnings import warn
 
 ZERO = datetime.timedelta(0)
+_NEG_INF = float('-inf')
+_POS_INF = float('inf')
+_NO_TTINFO_CACHE = (_POS_INF, _NEG_INF, None)
 EPOCH = datetime.datetime.utcfromtimestamp(0)
 EPOCHORDINAL = EPOCH.toordinal()
 
@@ -455,6 +458,10 @@ class tzfile(_tzinfo):
 
     """
 
+    # Set by _set_tzdata; instances unpickled from versions without the cache
+    # fall back to this.
+    _ttinfo_cache = _NO_TTINFO_CACHE
+
     def __init__(self, fileobj, filename=None):
         super(tzfile, self).__init__()
 
@@ -485,6 +492,8 @@ class tzfile(_tzinfo):
         for attr in _tzfile.attrs:
             setattr(self, '_' + attr, getattr(tzobj, attr))
 
+        self._ttinfo_cache = _NO_TTINFO_CACHE
+
     def _read_tzfile(self, fileobj):
         out = _tzfile()
 
@@ -736,10 +745,50 @@ class tzfile(_tzinfo):
         return self._trans_idx[idx]
 
     def _find_ttinfo(self, dt):
+        # Consecutive calls mostly fall between the same two transitions, so
+        # remember the last unambiguous range and its _ttinfo.
+        timestamp = _datetime_to_timestamp(dt)
+        start, end, tti = self._ttinfo_cache
+        if start <= timestamp < end:
+            return tti
+
+        start, end, tti = self._find_ttinfo_range(timestamp)
+        self._ttinfo_cache = (start, end, tti)
+        if start <= timestamp:
+            return tti
+
+        # In the ambiguous period after a transition, the fold decides.
         idx = self._resolve_ambiguous_time(dt)
 
         return self._get_ttinfo(idx)
 
+    def _find_ttinfo_range(self, timestamp):
+        """
+        Return the ``(start, end, ttinfo)`` of the wall times around
+        ``timestamp`` that have the same _ttinfo whatever their fold, i.e.
+        from the end of the ambiguous period after the previous transition up
+        to the next transition.
+        """
+        if not self._trans_list:
+            return (_NEG_INF, _POS_INF, self._get_ttinfo(None))
+
+        idx = bisect.bisect_right(self._trans_list, timestamp) - 1
+        tti = self._get_ttinfo(idx)
+
+        if idx < 0:
+            start = _NEG_INF
+        else:
+            start = self._trans_list[idx]
+            if idx > 0:
+                start += max(self._get_ttinfo(idx - 1).offset - tti.offset, 0)
+
+        if idx + 1 < len(self._trans_list):
+            end = self._trans_list[idx + 1]
+        else:
+            end = _POS_INF
+
+        return (start, end, tti)
+
     def fromutc(self, dt):
         """
         The ``tzfile`` implementation of :py:func:`datetime.tzinfo.fromutc`.
@@ -1760,6 +1809,49 @@ def datetime_ambiguous(dt, tz=None):
     return not (same_offset and same_dst)
 
 
+def localize_many(dts, tz):
+    """
+    Attach a time zone to a sequence of naive datetimes.
+
+    This is equivalent to ``[dt.replace(tzinfo=tz) for dt in dts]``, but checks
+    that every datetime is naive. It does no work ahead of time: the offsets of
+    aware datetimes are computed when they are used. A :class:`tzfile` looks
+    them up once per period between two transitions rather than once per
+    datetime as long as they are used in order, whether the datetimes come
+    from this function or from ``replace``:
+
+    .. doctest::
+
+        >>> from datetime import datetime, timedelta
+        >>> from dateutil.tz import gettz, localize_many, UTC
+        >>> LON = gettz('Europe/London')
+        >>> slots = [datetime(2023, 1, 1) + timedelta(minutes=30 * i)
+        ...          for i in range(17520)]
+        >>> utc_slots = [dt.astimezone(UTC) for dt in localize_many(slots, LON)]
+        >>> print(utc_slots[4200])
+        2023-03-29 11:00:00+00:00
+
+    :param dts:
+        An iterable of naive :class:`datetime.datetime` objects.
+
+    :param tz:
+        A :class:`datetime.tzinfo` to attach to them.
+
+    :raises ValueError:
+        Raised if one of the datetimes is not naive.
+
+    :return:
+        Returns a list of aware :class:`datetime.datetime` objects.
+    """
+    localized = []
+    for dt in dts:
+        if dt.tzinfo is not None:
+            raise ValueError('Not a naive datetime: {}'.format(dt))
+        localized.append(dt.replace(tzinfo=tz))
+
+    return localized
+
+
 def resolve_imaginary(dt):
     """
     Given a datetime that may be imaginary, return an existing datetime.
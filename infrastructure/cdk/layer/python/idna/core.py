@@ -1,7 +1,7 @@
-from . import idnadata
 import bisect
 import unicodedata
 import re
+from functools import lru_cache
 from typing import Union, Optional
 from .intranges import intranges_contain
 
@@ -37,6 +37,7 @@ def _combining_class(cp: int) -> int:
     return v
 
 def _is_script(cp: str, script: str) -> bool:
+    from . import idnadata
     return intranges_contain(ord(cp), idnadata.scripts[script])
 
 def _punycode(s: str) -> bytes:
@@ -137,6 +138,7 @@ def check_nfc(label: str) -> None:
 
 
 def valid_contextj(label: str, pos: int) -> bool:
+    from . import idnadata
     cp_value = ord(label[pos])
 
     if cp_value == 0x200c:
@@ -231,6 +233,7 @@ def check_label(label: Union[str, bytes, bytearray]) -> None:
     check_hyphen_ok(label)
     check_initial_combiner(label)
 
+    from . import idnadata
     for (pos, cp) in enumerate(label):
         cp_value = ord(cp)
         if intranges_contain(cp_value, idnadata.codepoint_classes['PVALID']):
@@ -307,18 +310,16 @@ def ulabel(label: Union[str, bytes, bytearray]) -> str:
 
 def uts46_remap(domain: str, std3_rules: bool = True, transitional: bool = False) -> str:
     """Re-map the characters in the string according to UTS46 processing."""
-    from .uts46data import uts46data
+    from .uts46compact import starts, statuses, replacements
     output = ''
 
     for pos, char in enumerate(domain):
         code_point = ord(char)
         try:
-            uts46row = uts46data[code_point if code_point < 256 else
-                bisect.bisect_left(uts46data, (code_point, 'Z')) - 1]
-            status = uts46row[1]
-            replacement = None  # type: Optional[str]
-            if len(uts46row) == 3:
-                replacement = uts46row[2]  # type: ignore
+            row = (code_point if code_point < 256 else
+                bisect.bisect_right(starts, code_point) - 1)
+            status = statuses[row]
+            replacement = replacements[row]
             if (status == 'V' or
                     (status == 'D' and not transitional) or
                     (status == '3' and not std3_rules and replacement is None)):
@@ -343,6 +344,12 @@ def encode(s: Union[str, bytes, bytearray], strict: bool = False, uts46: bool =
             s = s.decode('ascii')
         except UnicodeDecodeError:
             raise IDNAError('should pass a unicode string to the function rather than a byte string.')
+    return _encode(s, strict, uts46, std3_rules, transitional)
+
+
+# Clients encode the same few host names over and over; errors are not cached.
+@lru_cache(maxsize=1024)
+def _encode(s: str, strict: bool, uts46: bool, std3_rules: bool, transitional: bool) -> bytes:
     if uts46:
         s = uts46_remap(s, std3_rules, transitional)
     trailing_dot = False
@@ -357,17 +364,17 @@ def encode(s: Union[str, bytes, bytearray], strict: bool = False, uts46: bool =
         del labels[-1]
         trailing_dot = True
     for label in labels:
-        s = alabel(label)
-        if s:
-            result.append(s)
+        label_bytes = alabel(label)
+        if label_bytes:
+            result.append(label_bytes)
         else:
             raise IDNAError('Empty label')
     if trailing_dot:
         result.append(b'')
-    s = b'.'.join(result)
-    if not valid_string_length(s, trailing_dot):
+    encoded = b'.'.join(result)
+    if not valid_string_length(encoded, trailing_dot):
         raise IDNAError('Domain too long')
-    return s
+    return encoded
 
 
 def decode(s: Union[str, bytes, bytearray], strict: bool = False, uts46: bool = False, std3_rules: bool = False) -> str:
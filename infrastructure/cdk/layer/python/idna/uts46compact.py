@@ -0,0 +1,1664 @@
+# This file is automatically generated from uts46data.py by
+# tools/gen_uts46compact.py
+# vim: set fileencoding=utf-8 :
+
+"""IDNA Mapping Table from UTS46, in a compact form.
+
+The rows of uts46data as three parallel sequences: row i covers the code points
+from starts[i] up to starts[i + 1], with status statuses[i] and replacement
+replacements[i] (None when the row has none).
+"""
+
+from array import array
+import sys
+from typing import Optional, Tuple
+
+
+__version__ = '15.0.0'
+
+# Little-endian unsigned 32 bit integers.
+starts = array('I', bytes.fromhex(
+    '000000000100000002000000030000000400000005000000060000000700000008000000'
+    '090000000a0000000b0000000c0000000d0000000e0000000f0000001000000011000000'
+    '12000000130000001400000015000000160000001700000018000000190000001a000000'
+    '1b0000001c0000001d0000001e0000001f00000020000000210000002200000023000000'
+    '2400000025000000260000002700000028000000290000002a0000002b0000002c000000'
+    '2d0000002e0000002f000000300000003100000032000000330000003400000035000000'
+    '360000003700000038000000390000003a0000003b0000003c0000003d0000003e000000'
+    '3f0000004000000041000000420000004300000044000000450000004600000047000000'
+    '48000000490000004a0000004b0000004c0000004d0000004e0000004f00000050000000'
+    '510000005200000053000000540000005500000056000000570000005800000059000000'
+    '5a0000005b0000005c0000005d0000005e0000005f000000600000006100000062000000'
+    '630000006400000065000000660000006700000068000000690000006a0000006b000000'
+    '6c0000006d0000006e0000006f0000007000000071000000720000007300000074000000'
+    '75000000760000007700000078000000790000007a0000007b0000007c0000007d000000'
+    '7e0000007f00000080000000810000008200000083000000840000008500000086000000'
+    '8700000088000000890000008a0000008b0000008c0000008d0000008e0000008f000000'
+    '900000009100000092000000930000009400000095000000960000009700000098000000'
+    '990000009a0000009b0000009c0000009d0000009e0000009f000000a0000000a1000000'
+    'a2000000a3000000a4000000a5000000a6000000a7000000a8000000a9000000aa000000'
+    'ab000000ac000000ad000000ae000000af000000b0000000b1000000b2000000b3000000'
+    'b4000000b5000000b6000000b7000000b8000000b9000000ba000000bb000000bc000000'
+    'bd000000be000000bf000000c0000000c1000000c2000000c3000000c4000000c5000000'
+    'c6000000c7000000c8000000c9000000ca000000cb000000cc000000cd000000ce000000'
+    'cf000000d0000000d1000000d2000000d3000000d4000000d5000000d6000000d7000000'
+    'd8000000d9000000da000000db000000dc000000dd000000de000000df000000e0000000'
+    'e1000000e2000000e3000000e4000000e5000000e6000000e7000000e8000000e9000000'
+    'ea000000eb000000ec000000ed000000ee000000ef000000f0000000f1000000f2000000'
+    'f3000000f4000000f5000000f6000000f7000000f8000000f9000000fa000000fb000000'
+    'fc000000fd000000fe000000ff0000000001000001010000020100000301000004010000'
+    '05010000060100000701000008010000090100000a0100000b0100000c0100000d010000'
+    '0e0100000f01000010010000110100001201000013010000140100001501000016010000'
+    '1701000018010000190100001a0100001b0100001c0100001d0100001e0100001f010000'
+    '200100002101000022010000230100002401000025010000260100002701000028010000'
+    '290100002a0100002b0100002c0100002d0100002e0100002f0100003001000031010000'
+    '3201000034010000350100003601000037010000390100003a0100003b0100003c010000'
+    '3d0100003e0100003f010000410100004201000043010000440100004501000046010000'
+    '4701000048010000490100004a0100004b0100004c0100004d0100004e0100004f010000'
+    '500100005101000052010000530100005401000055010000560100005701000058010000'
+    '590100005a0100005b0100005c0100005d0100005e0100005f0100006001000061010000'
+    '62010000630100006401000065010000660100006701000068010000690100006a010000'
+    '6b0100006c0100006d0100006e0100006f01000070010000710100007201000073010000'
+    '7401000075010000760100007701000078010000790100007a0100007b0100007c010000'
+    '7d0100007e0100007f010000800100008101000082010000830100008401000085010000'
+    '860100008701000088010000890100008a0100008b0100008c0100008e0100008f010000'
+    '900100009101000092010000930100009401000095010000960100009701000098010000'
+    '990100009c0100009d0100009e0100009f010000a0010000a1010000a2010000a3010000'
+    'a4010000a5010000a6010000a7010000a8010000a9010000aa010000ac010000ad010000'
+    'ae010000af010000b0010000b1010000b2010000b3010000b4010000b5010000b6010000'
+    'b7010000b8010000b9010000bc010000bd010000c4010000c7010000ca010000cd010000'
+    'ce010000cf010000d0010000d1010000d2010000d3010000d4010000d5010000d6010000'
+    'd7010000d8010000d9010000da010000db010000dc010000de010000df010000e0010000'
+    'e1010000e2010000e3010000e4010000e5010000e6010000e7010000e8010000e9010000'
+    'ea010000eb010000ec010000ed010000ee010000ef010000f1010000f4010000f5010000'
+    'f6010000f7010000f8010000f9010000fa010000fb010000fc010000fd010000fe010000'
+    'ff0100000002000001020000020200000302000004020000050200000602000007020000'
+    '08020000090200000a0200000b0200000c0200000d0200000e0200000f02000010020000'
+    '110200001202000013020000140200001502000016020000170200001802000019020000'
+    '1a0200001b0200001c0200001d0200001e0200001f020000200200002102000022020000'
+    '230200002402000025020000260200002702000028020000290200002a0200002b020000'
+    '2c0200002d0200002e0200002f020000300200003102000032020000330200003a020000'
+    '3b0200003c0200003d0200003e0200003f02000041020000420200004302000044020000'
+    '45020000460200004702000048020000490200004a0200004b0200004c0200004d020000'
+    '4e0200004f020000b0020000b1020000b2020000b3020000b4020000b5020000b6020000'
+    'b7020000b8020000b9020000d8020000d9020000da020000db020000dc020000dd020000'
+    'de020000e0020000e1020000e2020000e3020000e4020000e50200004003000041030000'
+    '42030000430300004403000045030000460300004f030000500300007003000071030000'
+    '720300007303000074030000750300007603000077030000780300007a0300007b030000'
+    '7e0300007f03000080030000840300008503000086030000870300008803000089030000'
+    '8a0300008b0300008c0300008d0300008e0300008f030000900300009103000092030000'
+    '930300009403000095030000960300009703000098030000990300009a0300009b030000'
+    '9c0300009d0300009e0300009f030000a0030000a1030000a2030000a3030000a4030000'
+    'a5030000a6030000a7030000a8030000a9030000aa030000ab030000ac030000c2030000'
+    'c3030000cf030000d0030000d1030000d2030000d3030000d4030000d5030000d6030000'
+    'd7030000d8030000d9030000da030000db030000dc030000dd030000de030000df030000'
+    'e0030000e1030000e2030000e3030000e4030000e5030000e6030000e7030000e8030000'
+    'e9030000ea030000eb030000ec030000ed030000ee030000ef030000f0030000f1030000'
+    'f2030000f3030000f4030000f5030000f6030000f7030000f8030000f9030000fa030000'
+    'fb030000fd030000fe030000ff0300000004000001040000020400000304000004040000'
+    '05040000060400000704000008040000090400000a0400000b0400000c0400000d040000'
+    '0e0400000f04000010040000110400001204000013040000140400001504000016040000'
+    '1704000018040000190400001a0400001b0400001c0400001d0400001e0400001f040000'
+    '200400002104000022040000230400002404000025040000260400002704000028040000'
+    '290400002a0400002b0400002c0400002d0400002e0400002f0400003004000060040000'
+    '610400006204000063040000640400006504000066040000670400006804000069040000'
+    '6a0400006b0400006c0400006d0400006e0400006f040000700400007104000072040000'
+    '730400007404000075040000760400007704000078040000790400007a0400007b040000'
+    '7c0400007d0400007e0400007f04000080040000810400008a0400008b0400008c040000'
+    '8d0400008e0400008f040000900400009104000092040000930400009404000095040000'
+    '960400009704000098040000990400009a0400009b0400009c0400009d0400009e040000'
+    '9f040000a0040000a1040000a2040000a3040000a4040000a5040000a6040000a7040000'
+    'a8040000a9040000aa040000ab040000ac040000ad040000ae040000af040000b0040000'
+    'b1040000b2040000b3040000b4040000b5040000b6040000b7040000b8040000b9040000'
+    'ba040000bb040000bc040000bd040000be040000bf040000c0040000c1040000c2040000'
+    'c3040000c4040000c5040000c6040000c7040000c8040000c9040000ca040000cb040000'
+    'cc040000cd040000ce040000d0040000d1040000d2040000d3040000d4040000d5040000'
+    'd6040000d7040000d8040000d9040000da040000db040000dc040000dd040000de040000'
+    'df040000e0040000e1040000e2040000e3040000e4040000e5040000e6040000e7040000'
+    'e8040000e9040000ea040000eb040000ec040000ed040000ee040000ef040000f0040000'
+    'f1040000f2040000f3040000f4040000f5040000f6040000f7040000f8040000f9040000'
+    'fa040000fb040000fc040000fd040000fe040000ff040000000500000105000002050000'
+    '030500000405000005050000060500000705000008050000090500000a0500000b050000'
+    '0c0500000d0500000e0500000f0500001005000011050000120500001305000014050000'
+    '15050000160500001705000018050000190500001a0500001b0500001c0500001d050000'
+    '1e0500001f05000020050000210500002205000023050000240500002505000026050000'
+    '2705000028050000290500002a0500002b0500002c0500002d0500002e0500002f050000'
+    '300500003105000032050000330500003405000035050000360500003705000038050000'
+    '390500003a0500003b0500003c0500003d0500003e0500003f0500004005000041050000'
+    '42050000430500004405000045050000460500004705000048050000490500004a050000'
+    '4b0500004c0500004d0500004e0500004f05000050050000510500005205000053050000'
+    '540500005505000056050000570500005905000087050000880500008b0500008d050000'
+    '9005000091050000c8050000d0050000eb050000ef050000f5050000060600001c060000'
+    '1d0600007506000076060000770600007806000079060000dd060000de0600000e070000'
+    '100700004b0700004d070000b2070000c0070000fb070000fd0700002e08000030080000'
+    '3f080000400800005c0800005e0800005f080000600800006b080000700800008f080000'
+    '98080000e2080000e308000058090000590900005a0900005b0900005c0900005d090000'
+    '5e0900005f0900006009000084090000850900008d0900008f0900009109000093090000'
+    'a9090000aa090000b1090000b2090000b3090000b6090000ba090000bc090000c5090000'
+    'c7090000c9090000cb090000cf090000d7090000d8090000dc090000dd090000de090000'
+    'df090000e0090000e4090000e6090000ff090000010a0000040a0000050a00000b0a0000'
+    '0f0a0000110a0000130a0000290a00002a0a0000310a0000320a0000330a0000340a0000'
+    '350a0000360a0000370a0000380a00003a0a00003c0a00003d0a00003e0a0000430a0000'
+    '470a0000490a00004b0a00004e0a0000510a0000520a0000590a00005a0a00005b0a0000'
+    '5c0a00005d0a00005e0a00005f0a0000660a0000770a0000810a0000840a0000850a0000'
+    '8e0a00008f0a0000920a0000930a0000a90a0000aa0a0000b10a0000b20a0000b40a0000'
+    'b50a0000ba0a0000bc0a0000c60a0000c70a0000ca0a0000cb0a0000ce0a0000d00a0000'
+    'd10a0000e00a0000e40a0000e60a0000f20a0000f90a0000000b0000010b0000040b0000'
+    '050b00000d0b00000f0b0000110b0000130b0000290b00002a0b0000310b0000320b0000'
+    '340b0000350b00003a0b00003c0b0000450b0000470b0000490b00004b0b00004e0b0000'
+    '550b0000580b00005c0b00005d0b00005e0b00005f0b0000640b0000660b0000780b0000'
+    '820b0000840b0000850b00008b0b00008e0b0000910b0000920b0000960b0000990b0000'
+    '9b0b00009c0b00009d0b00009e0b0000a00b0000a30b0000a50b0000a80b0000ab0b0000'
+    'ae0b0000ba0b0000be0b0000c30b0000c60b0000c90b0000ca0b0000ce0b0000d00b0000'
+    'd10b0000d70b0000d80b0000e60b0000fb0b0000000c00000d0c00000e0c0000110c0000'
+    '120c0000290c00002a0c00003a0c00003c0c0000450c0000460c0000490c00004a0c0000'
+    '4e0c0000550c0000570c0000580c00005b0c00005d0c00005e0c0000600c0000640c0000'
+    '660c0000700c0000770c00008d0c00008e0c0000910c0000920c0000a90c0000aa0c0000'
+    'b40c0000b50c0000ba0c0000bc0c0000c50c0000c60c0000c90c0000ca0c0000ce0c0000'
+    'd50c0000d70c0000dd0c0000df0c0000e00c0000e40c0000e60c0000f00c0000f10c0000'
+    'f40c0000000d00000d0d00000e0d0000110d0000120d0000450d0000460d0000490d0000'
+    '4a0d0000500d0000540d0000640d0000660d0000800d0000810d0000840d0000850d0000'
+    '970d00009a0d0000b20d0000b30d0000bc0d0000bd0d0000be0d0000c00d0000c70d0000'
+    'ca0d0000cb0d0000cf0d0000d50d0000d60d0000d70d0000d80d0000e00d0000e60d0000'
+    'f00d0000f20d0000f50d0000010e0000330e0000340e00003b0e00003f0e00005c0e0000'
+    '810e0000830e0000840e0000850e0000860e00008b0e00008c0e0000a40e0000a50e0000'
+    'a60e0000a70e0000b30e0000b40e0000be0e0000c00e0000c50e0000c60e0000c70e0000'
+    'c80e0000cf0e0000d00e0000da0e0000dc0e0000dd0e0000de0e0000e00e0000000f0000'
+    '0c0f00000d0f0000430f0000440f0000480f0000490f00004d0f00004e0f0000520f0000'
+    '530f0000570f0000580f00005c0f00005d0f0000690f00006a0f00006d0f0000710f0000'
+    '730f0000740f0000750f0000760f0000770f0000780f0000790f00007a0f0000810f0000'
+    '820f0000930f0000940f0000980f0000990f00009d0f00009e0f0000a20f0000a30f0000'
+    'a70f0000a80f0000ac0f0000ad0f0000b90f0000ba0f0000bd0f0000be0f0000cd0f0000'
+    'ce0f0000db0f000000100000a0100000c7100000c8100000cd100000ce100000d0100000'
+    'fc100000fd1000005f11000061110000491200004a1200004e1200005012000057120000'
+    '58120000591200005a1200005e12000060120000891200008a1200008e12000090120000'
+    'b1120000b2120000b6120000b8120000bf120000c0120000c1120000c2120000c6120000'
+    'c8120000d7120000d8120000111300001213000016130000181300005b1300005d130000'
+    '7d130000801300009a130000a0130000f6130000f8130000f9130000fa130000fb130000'
+    'fc130000fd130000fe1300000014000080160000811600009d160000a0160000f9160000'
+    '00170000161700001f170000371700004017000054170000601700006d1700006e170000'
+    '71170000721700007417000080170000b4170000b6170000de170000e0170000ea170000'
+    'f0170000fa1700000018000006180000071800000b1800000e1800000f18000010180000'
+    '1a180000201800007918000080180000ab180000b0180000f6180000001900001f190000'
+    '201900002c190000301900003c1900004019000041190000441900006e19000070190000'
+    '7519000080190000ac190000b0190000ca190000d0190000db190000de1900001c1a0000'
+    '1e1a00005f1a0000601a00007d1a00007f1a00008a1a0000901a00009a1a0000a01a0000'
+    'ae1a0000b01a0000cf1a0000001b00004d1b0000501b00007f1b0000801b0000f41b0000'
+    'fc1b0000381c00003b1c00004a1c00004d1c0000801c0000811c0000821c0000831c0000'
+    '841c0000861c0000871c0000881c0000891c0000901c0000911c0000921c0000931c0000'
+    '941c0000951c0000961c0000971c0000981c0000991c00009a1c00009b1c00009c1c0000'
+    '9d1c00009e1c00009f1c0000a01c0000a11c0000a21c0000a31c0000a41c0000a51c0000'
+    'a61c0000a71c0000a81c0000a91c0000aa1c0000ab1c0000ac1c0000ad1c0000ae1c0000'
+    'af1c0000b01c0000b11c0000b21c0000b31c0000b41c0000b51c0000b61c0000b71c0000'
+    'b81c0000b91c0000ba1c0000bb1c0000bd1c0000be1c0000bf1c0000c01c0000c81c0000'
+    'd01c0000fb1c0000001d00002c1d00002d1d00002e1d00002f1d0000301d0000311d0000'
+    '321d0000331d0000341d0000351d0000361d0000371d0000381d0000391d00003a1d0000'
+    '3b1d00003c1d00003d1d00003e1d00003f1d0000401d0000411d0000421d0000431d0000'
+    '441d0000451d0000461d0000471d0000481d0000491d00004a1d00004b1d00004c1d0000'
+    '4d1d00004e1d00004f1d0000501d0000511d0000521d0000531d0000541d0000551d0000'
+    '561d0000571d0000581d0000591d00005a1d00005b1d00005c1d00005d1d00005e1d0000'
+    '5f1d0000601d0000611d0000621d0000631d0000641d0000651d0000661d0000671d0000'
+    '681d0000691d00006a1d00006b1d0000781d0000791d00009b1d00009c1d00009d1d0000'
+    '9e1d00009f1d0000a01d0000a11d0000a21d0000a31d0000a41d0000a51d0000a61d0000'
+    'a71d0000a81d0000a91d0000aa1d0000ab1d0000ac1d0000ad1d0000ae1d0000af1d0000'
+    'b01d0000b11d0000b21d0000b31d0000b41d0000b51d0000b61d0000b71d0000b81d0000'
+    'b91d0000ba1d0000bb1d0000bc1d0000bd1d0000be1d0000bf1d0000c01d0000001e0000'
+    '011e0000021e0000031e0000041e0000051e0000061e0000071e0000081e0000091e0000'
+    '0a1e00000b1e00000c1e00000d1e00000e1e00000f1e0000101e0000111e0000121e0000'
+    '131e0000141e0000151e0000161e0000171e0000181e0000191e00001a1e00001b1e0000'
+    '1c1e00001d1e00001e1e00001f1e0000201e0000211e0000221e0000231e0000241e0000'
+    '251e0000261e0000271e0000281e0000291e00002a1e00002b1e00002c1e00002d1e0000'
+    '2e1e00002f1e0000301e0000311e0000321e0000331e0000341e0000351e0000361e0000'
+    '371e0000381e0000391e00003a1e00003b1e00003c1e00003d1e00003e1e00003f1e0000'
+    '401e0000411e0000421e0000431e0000441e0000451e0000461e0000471e0000481e0000'
+    '491e00004a1e00004b1e00004c1e00004d1e00004e1e00004f1e0000501e0000511e0000'
+    '521e0000531e0000541e0000551e0000561e0000571e0000581e0000591e00005a1e0000'
+    '5b1e00005c1e00005d1e00005e1e00005f1e0000601e0000611e0000621e0000631e0000'
+    '641e0000651e0000661e0000671e0000681e0000691e00006a1e00006b1e00006c1e0000'
+    '6d1e00006e1e00006f1e0000701e0000711e0000721e0000731e0000741e0000751e0000'
+    '761e0000771e0000781e0000791e00007a1e00007b1e00007c1e00007d1e00007e1e0000'
+    '7f1e0000801e0000811e0000821e0000831e0000841e0000851e0000861e0000871e0000'
+    '881e0000891e00008a1e00008b1e00008c1e00008d1e00008e1e00008f1e0000901e0000'
+    '911e0000921e0000931e0000941e0000951e00009a1e00009b1e00009c1e00009e1e0000'
+    '9f1e0000a01e0000a11e0000a21e0000a31e0000a41e0000a51e0000a61e0000a71e0000'
+    'a81e0000a91e0000aa1e0000ab1e0000ac1e0000ad1e0000ae1e0000af1e0000b01e0000'
+    'b11e0000b21e0000b31e0000b41e0000b51e0000b61e0000b71e0000b81e0000b91e0000'
+    'ba1e0000bb1e0000bc1e0000bd1e0000be1e0000bf1e0000c01e0000c11e0000c21e0000'
+    'c31e0000c41e0000c51e0000c61e0000c71e0000c81e0000c91e0000ca1e0000cb1e0000'
+    'cc1e0000cd1e0000ce1e0000cf1e0000d01e0000d11e0000d21e0000d31e0000d41e0000'
+    'd51e0000d61e0000d71e0000d81e0000d91e0000da1e0000db1e0000dc1e0000dd1e0000'
+    'de1e0000df1e0000e01e0000e11e0000e21e0000e31e0000e41e0000e51e0000e61e0000'
+    'e71e0000e81e0000e91e0000ea1e0000eb1e0000ec1e0000ed1e0000ee1e0000ef1e0000'
+    'f01e0000f11e0000f21e0000f31e0000f41e0000f51e0000f61e0000f71e0000f81e0000'
+    'f91e0000fa1e0000fb1e0000fc1e0000fd1e0000fe1e0000ff1e0000081f0000091f0000'
+    '0a1f00000b1f00000c1f00000d1f00000e1f00000f1f0000101f0000161f0000181f0000'
+    '191f00001a1f00001b1f00001c1f00001d1f00001e1f0000201f0000281f0000291f0000'
+    '2a1f00002b1f00002c1f00002d1f00002e1f00002f1f0000301f0000381f0000391f0000'
+    '3a1f00003b1f00003c1f00003d1f00003e1f00003f1f0000401f0000461f0000481f0000'
+    '491f00004a1f00004b1f00004c1f00004d1f00004e1f0000501f0000581f0000591f0000'
+    '5a1f00005b1f00005c1f00005d1f00005e1f00005f1f0000601f0000681f0000691f0000'
+    '6a1f00006b1f00006c1f00006d1f00006e1f00006f1f0000701f0000711f0000721f0000'
+    '731f0000741f0000751f0000761f0000771f0000781f0000791f00007a1f00007b1f0000'
+    '7c1f00007d1f00007e1f0000801f0000811f0000821f0000831f0000841f0000851f0000'
+    '861f0000871f0000881f0000891f00008a1f00008b1f00008c1f00008d1f00008e1f0000'
+    '8f1f0000901f0000911f0000921f0000931f0000941f0000951f0000961f0000971f0000'
+    '981f0000991f00009a1f00009b1f00009c1f00009d1f00009e1f00009f1f0000a01f0000'
+    'a11f0000a21f0000a31f0000a41f0000a51f0000a61f0000a71f0000a81f0000a91f0000'
+    'aa1f0000ab1f0000ac1f0000ad1f0000ae1f0000af1f0000b01f0000b21f0000b31f0000'
+    'b41f0000b51f0000b61f0000b71f0000b81f0000b91f0000ba1f0000bb1f0000bc1f0000'
+    'bd1f0000be1f0000bf1f0000c01f0000c11f0000c21f0000c31f0000c41f0000c51f0000'
+    'c61f0000c71f0000c81f0000c91f0000ca1f0000cb1f0000cc1f0000cd1f0000ce1f0000'
+    'cf1f0000d01f0000d31f0000d41f0000d61f0000d81f0000d91f0000da1f0000db1f0000'
+    'dc1f0000dd1f0000de1f0000df1f0000e01f0000e31f0000e41f0000e81f0000e91f0000'
+    'ea1f0000eb1f0000ec1f0000ed1f0000ee1f0000ef1f0000f01f0000f21f0000f31f0000'
+    'f41f0000f51f0000f61f0000f71f0000f81f0000f91f0000fa1f0000fb1f0000fc1f0000'
+    'fd1f0000fe1f0000ff1f0000002000000b2000000c2000000e2000001020000011200000'
+    '1220000017200000182000002420000027200000282000002f2000003020000033200000'
+    '34200000352000003620000037200000382000003c2000003d2000003e2000003f200000'
+    '4720000048200000492000004a20000057200000582000005f2000006020000061200000'
+    '642000006520000070200000712000007220000074200000752000007620000077200000'
+    '78200000792000007a2000007b2000007c2000007d2000007e2000007f20000080200000'
+    '812000008220000083200000842000008520000086200000872000008820000089200000'
+    '8a2000008b2000008c2000008d2000008e2000008f200000902000009120000092200000'
+    '932000009420000095200000962000009720000098200000992000009a2000009b200000'
+    '9c2000009d200000a0200000a8200000a9200000c1200000d0200000f120000000210000'
+    '012100000221000003210000042100000521000006210000072100000821000009210000'
+    '0a2100000b2100000f210000102100001221000014210000152100001621000017210000'
+    '192100001a2100001b2100001e2100002021000021210000222100002321000024210000'
+    '25210000262100002721000028210000292100002a2100002b2100002c2100002d210000'
+    '2e2100002f21000031210000322100003321000034210000352100003621000037210000'
+    '38210000392100003a2100003b2100003c2100003d2100003f2100004021000041210000'
+    '452100004721000048210000492100004a21000050210000512100005221000053210000'
+    '5421000055210000562100005721000058210000592100005a2100005b2100005c210000'
+    '5d2100005e2100005f210000602100006121000062210000632100006421000065210000'
+    '662100006721000068210000692100006a2100006b2100006c2100006d2100006e210000'
+    '6f2100007021000071210000722100007321000074210000752100007621000077210000'
+    '78210000792100007a2100007b2100007c2100007d2100007e2100007f21000080210000'
+    '8321000084210000892100008a2100008c210000902100002c2200002d2200002e220000'
+    '2f220000302200003122000060220000612200006e22000070220000292300002a230000'
+    '2b23000027240000402400004b2400006024000061240000622400006324000064240000'
+    '65240000662400006724000068240000692400006a2400006b2400006c2400006d240000'
+    '6e2400006f24000070240000712400007224000073240000742400007524000076240000'
+    '7724000078240000792400007a2400007b2400007c2400007d2400007e2400007f240000'
+    '802400008124000082240000832400008424000085240000862400008724000088240000'
+    '9c2400009d2400009e2400009f240000a0240000a1240000a2240000a3240000a4240000'
+    'a5240000a6240000a7240000a8240000a9240000aa240000ab240000ac240000ad240000'
+    'ae240000af240000b0240000b1240000b2240000b3240000b4240000b5240000b6240000'
+    'b7240000b8240000b9240000ba240000bb240000bc240000bd240000be240000bf240000'
+    'c0240000c1240000c2240000c3240000c4240000c5240000c6240000c7240000c8240000'
+    'c9240000ca240000cb240000cc240000cd240000ce240000cf240000d0240000d1240000'
+    'd2240000d3240000d4240000d5240000d6240000d7240000d8240000d9240000da240000'
+    'db240000dc240000dd240000de240000df240000e0240000e1240000e2240000e3240000'
+    'e4240000e5240000e6240000e7240000e8240000e9240000ea240000eb2400000c2a0000'
+    '0d2a0000742a0000752a0000762a0000772a0000dc2a0000dd2a0000742b0000762b0000'
+    '962b0000972b0000002c0000012c0000022c0000032c0000042c0000052c0000062c0000'
+    '072c0000082c0000092c00000a2c00000b2c00000c2c00000d2c00000e2c00000f2c0000'
+    '102c0000112c0000122c0000132c0000142c0000152c0000162c0000172c0000182c0000'
+    '192c00001a2c00001b2c00001c2c00001d2c00001e2c00001f2c0000202c0000212c0000'
+    '222c0000232c0000242c0000252c0000262c0000272c0000282c0000292c00002a2c0000'
+    '2b2c00002c2c00002d2c00002e2c00002f2c0000302c0000602c0000612c0000622c0000'
+    '632c0000642c0000652c0000672c0000682c0000692c00006a2c00006b2c00006c2c0000'
+    '6d2c00006e2c00006f2c0000702c0000712c0000722c0000732c0000752c0000762c0000'
+    '7c2c00007d2c00007e2c00007f2c0000802c0000812c0000822c0000832c0000842c0000'
+    '852c0000862c0000872c0000882c0000892c00008a2c00008b2c00008c2c00008d2c0000'
+    '8e2c00008f2c0000902c0000912c0000922c0000932c0000942c0000952c0000962c0000'
+    '972c0000982c0000992c00009a2c00009b2c00009c2c00009d2c00009e2c00009f2c0000'
+    'a02c0000a12c0000a22c0000a32c0000a42c0000a52c0000a62c0000a72c0000a82c0000'
+    'a92c0000aa2c0000ab2c0000ac2c0000ad2c0000ae2c0000af2c0000b02c0000b12c0000'
+    'b22c0000b32c0000b42c0000b52c0000b62c0000b72c0000b82c0000b92c0000ba2c0000'
+    'bb2c0000bc2c0000bd2c0000be2c0000bf2c0000c02c0000c12c0000c22c0000c32c0000'
+    'c42c0000c52c0000c62c0000c72c0000c82c0000c92c0000ca2c0000cb2c0000cc2c0000'
+    'cd2c0000ce2c0000cf2c0000d02c0000d12c0000d22c0000d32c0000d42c0000d52c0000'
+    'd62c0000d72c0000d82c0000d92c0000da2c0000db2c0000dc2c0000dd2c0000de2c0000'
+    'df2c0000e02c0000e12c0000e22c0000e32c0000eb2c0000ec2c0000ed2c0000ee2c0000'
+    'f22c0000f32c0000f42c0000f92c0000262d0000272d0000282d00002d2d00002e2d0000'
+    '302d0000682d00006f2d0000702d0000712d00007f2d0000972d0000a02d0000a72d0000'
+    'a82d0000af2d0000b02d0000b72d0000b82d0000bf2d0000c02d0000c72d0000c82d0000'
+    'cf2d0000d02d0000d72d0000d82d0000df2d0000e02d00005e2e0000802e00009a2e0000'
+    '9b2e00009f2e0000a02e0000f32e0000f42e0000002f0000012f0000022f0000032f0000'
+    '042f0000052f0000062f0000072f0000082f0000092f00000a2f00000b2f00000c2f0000'
+    '0d2f00000e2f00000f2f0000102f0000112f0000122f0000132f0000142f0000152f0000'
+    '162f0000172f0000182f0000192f00001a2f00001b2f00001c2f00001d2f00001e2f0000'
+    '1f2f0000202f0000212f0000222f0000232f0000242f0000252f0000262f0000272f0000'
+    '282f0000292f00002a2f00002b2f00002c2f00002d2f00002e2f00002f2f0000302f0000'
+    '312f0000322f0000332f0000342f0000352f0000362f0000372f0000382f0000392f0000'
+    '3a2f00003b2f00003c2f00003d2f00003e2f00003f2f0000402f0000412f0000422f0000'
+    '432f0000442f0000452f0000462f0000472f0000482f0000492f00004a2f00004b2f0000'
+    '4c2f00004d2f00004e2f00004f2f0000502f0000512f0000522f0000532f0000542f0000'
+    '552f0000562f0000572f0000582f0000592f00005a2f00005b2f00005c2f00005d2f0000'
+    '5e2f00005f2f0000602f0000612f0000622f0000632f0000642f0000652f0000662f0000'
+    '672f0000682f0000692f00006a2f00006b2f00006c2f00006d2f00006e2f00006f2f0000'
+    '702f0000712f0000722f0000732f0000742f0000752f0000762f0000772f0000782f0000'
+    '792f00007a2f00007b2f00007c2f00007d2f00007e2f00007f2f0000802f0000812f0000'
+    '822f0000832f0000842f0000852f0000862f0000872f0000882f0000892f00008a2f0000'
+    '8b2f00008c2f00008d2f00008e2f00008f2f0000902f0000912f0000922f0000932f0000'
+    '942f0000952f0000962f0000972f0000982f0000992f00009a2f00009b2f00009c2f0000'
+    '9d2f00009e2f00009f2f0000a02f0000a12f0000a22f0000a32f0000a42f0000a52f0000'
+    'a62f0000a72f0000a82f0000a92f0000aa2f0000ab2f0000ac2f0000ad2f0000ae2f0000'
+    'af2f0000b02f0000b12f0000b22f0000b32f0000b42f0000b52f0000b62f0000b72f0000'
+    'b82f0000b92f0000ba2f0000bb2f0000bc2f0000bd2f0000be2f0000bf2f0000c02f0000'
+    'c12f0000c22f0000c32f0000c42f0000c52f0000c62f0000c72f0000c82f0000c92f0000'
+    'ca2f0000cb2f0000cc2f0000cd2f0000ce2f0000cf2f0000d02f0000d12f0000d22f0000'
+    'd32f0000d42f0000d52f0000d62f00000030000001300000023000000330000036300000'
+    '3730000038300000393000003a3000003b30000040300000413000009730000099300000'
+    '9b3000009c3000009d3000009f300000a0300000ff300000003100000531000030310000'
+    '313100003231000033310000343100003531000036310000373100003831000039310000'
+    '3a3100003b3100003c3100003d3100003e3100003f310000403100004131000042310000'
+    '433100004431000045310000463100004731000048310000493100004a3100004b310000'
+    '4c3100004d3100004e3100004f3100005031000051310000523100005331000054310000'
+    '55310000563100005731000058310000593100005a3100005b3100005c3100005d310000'
+    '5e3100005f31000060310000613100006231000063310000643100006531000066310000'
+    '6731000068310000693100006a3100006b3100006c3100006d3100006e3100006f310000'
+    '703100007131000072310000733100007431000075310000763100007731000078310000'
+    '793100007a3100007b3100007c3100007d3100007e3100007f3100008031000081310000'
+    '82310000833100008431000085310000863100008731000088310000893100008a310000'
+    '8b3100008c3100008d3100008e3100008f31000090310000923100009331000094310000'
+    '95310000963100009731000098310000993100009a3100009b3100009c3100009d310000'
+    '9e3100009f310000a0310000e4310000f031000000320000013200000232000003320000'
+    '0432000005320000063200000732000008320000093200000a3200000b3200000c320000'
+    '0d3200000e3200000f320000103200001132000012320000133200001432000015320000'
+    '163200001732000018320000193200001a3200001b3200001c3200001d3200001e320000'
+    '1f3200002032000021320000223200002332000024320000253200002632000027320000'
+    '28320000293200002a3200002b3200002c3200002d3200002e3200002f32000030320000'
+    '313200003232000033320000343200003532000036320000373200003832000039320000'
+    '3a3200003b3200003c3200003d3200003e3200003f320000403200004132000042320000'
+    '433200004432000045320000463200004732000048320000503200005132000052320000'
+    '533200005432000055320000563200005732000058320000593200005a3200005b320000'
+    '5c3200005d3200005e3200005f3200006032000061320000623200006332000064320000'
+    '65320000663200006732000068320000693200006a3200006b3200006c3200006d320000'
+    '6e3200006f32000070320000713200007232000073320000743200007532000076320000'
+    '7732000078320000793200007a3200007b3200007c3200007d3200007e3200007f320000'
+    '803200008132000082320000833200008432000085320000863200008732000088320000'
+    '893200008a3200008b3200008c3200008d3200008e3200008f3200009032000091320000'
+    '92320000933200009432000095320000963200009732000098320000993200009a320000'
+    '9b3200009c3200009d3200009e3200009f320000a0320000a1320000a2320000a3320000'
+    'a4320000a5320000a6320000a7320000a8320000a9320000aa320000ab320000ac320000'
+    'ad320000ae320000af320000b0320000b1320000b2320000b3320000b4320000b5320000'
+    'b6320000b7320000b8320000b9320000ba320000bb320000bc320000bd320000be320000'
+    'bf320000c0320000c1320000c2320000c3320000c4320000c5320000c6320000c7320000'
+    'c8320000c9320000ca320000cb320000cc320000cd320000ce320000cf320000d0320000'
+    'd1320000d2320000d3320000d4320000d5320000d6320000d7320000d8320000d9320000'
+    'da320000db320000dc320000dd320000de320000df320000e0320000e1320000e2320000'
+    'e3320000e4320000e5320000e6320000e7320000e8320000e9320000ea320000eb320000'
+    'ec320000ed320000ee320000ef320000f0320000f1320000f2320000f3320000f4320000'
+    'f5320000f6320000f7320000f8320000f9320000fa320000fb320000fc320000fd320000'
+    'fe320000ff32000000330000013300000233000003330000043300000533000006330000'
+    '0733000008330000093300000a3300000b3300000c3300000d3300000e3300000f330000'
+    '103300001133000012330000133300001433000015330000163300001733000018330000'
+    '193300001a3300001b3300001c3300001d3300001e3300001f3300002033000021330000'
+    '22330000233300002433000025330000263300002733000028330000293300002a330000'
+    '2b3300002c3300002d3300002e3300002f33000030330000313300003233000033330000'
+    '3433000035330000363300003733000038330000393300003a3300003b3300003c330000'
+    '3d3300003e3300003f330000403300004133000042330000433300004433000045330000'
+    '463300004733000048330000493300004a3300004b3300004c3300004d3300004e330000'
+    '4f3300005033000051330000523300005333000054330000553300005633000057330000'
+    '58330000593300005a3300005b3300005c3300005d3300005e3300005f33000060330000'
+    '613300006233000063330000643300006533000066330000673300006833000069330000'
+    '6a3300006b3300006c3300006d3300006e3300006f330000703300007133000072330000'
+    '733300007433000075330000763300007733000078330000793300007a3300007b330000'
+    '7c3300007d3300007e3300007f3300008033000081330000823300008333000084330000'
+    '85330000863300008733000088330000893300008a3300008b3300008c3300008d330000'
+    '8e3300008f33000090330000913300009233000093330000943300009533000096330000'
+    '9733000098330000993300009a3300009b3300009c3300009d3300009e3300009f330000'
+    'a0330000a1330000a2330000a3330000a4330000a5330000a6330000a7330000a8330000'
+    'a9330000aa330000ab330000ac330000ad330000ae330000af330000b0330000b1330000'
+    'b2330000b3330000b4330000b5330000b6330000b7330000b8330000b9330000ba330000'
+    'bb330000bc330000bd330000be330000bf330000c0330000c1330000c2330000c3330000'
+    'c4330000c5330000c6330000c7330000c8330000c9330000ca330000cb330000cc330000'
+    'cd330000ce330000cf330000d0330000d1330000d2330000d3330000d4330000d5330000'
+    'd6330000d7330000d8330000d9330000da330000db330000dc330000dd330000de330000'
+    'df330000e0330000e1330000e2330000e3330000e4330000e5330000e6330000e7330000'
+    'e8330000e9330000ea330000eb330000ec330000ed330000ee330000ef330000f0330000'
+    'f1330000f2330000f3330000f4330000f5330000f6330000f7330000f8330000f9330000'
+    'fa330000fb330000fc330000fd330000fe330000ff330000003400008da4000090a40000'
+    'c7a40000d0a400002ca6000040a6000041a6000042a6000043a6000044a6000045a60000'
+    '46a6000047a6000048a6000049a600004aa600004ba600004ca600004da600004ea60000'
+    '4fa6000050a6000051a6000052a6000053a6000054a6000055a6000056a6000057a60000'
+    '58a6000059a600005aa600005ba600005ca600005da600005ea600005fa6000060a60000'
+    '61a6000062a6000063a6000064a6000065a6000066a6000067a6000068a6000069a60000'
+    '6aa600006ba600006ca600006da6000080a6000081a6000082a6000083a6000084a60000'
+    '85a6000086a6000087a6000088a6000089a600008aa600008ba600008ca600008da60000'
+    '8ea600008fa6000090a6000091a6000092a6000093a6000094a6000095a6000096a60000'
+    '97a6000098a6000099a600009aa600009ba600009ca600009da600009ea60000f8a60000'
+    '00a7000022a7000023a7000024a7000025a7000026a7000027a7000028a7000029a70000'
+    '2aa700002ba700002ca700002da700002ea700002fa7000032a7000033a7000034a70000'
+    '35a7000036a7000037a7000038a7000039a700003aa700003ba700003ca700003da70000'
+    '3ea700003fa7000040a7000041a7000042a7000043a7000044a7000045a7000046a70000'
+    '47a7000048a7000049a700004aa700004ba700004ca700004da700004ea700004fa70000'
+    '50a7000051a7000052a7000053a7000054a7000055a7000056a7000057a7000058a70000'
+    '59a700005aa700005ba700005ca700005da700005ea700005fa7000060a7000061a70000'
+    '62a7000063a7000064a7000065a7000066a7000067a7000068a7000069a700006aa70000'
+    '6ba700006ca700006da700006ea700006fa7000070a7000071a7000079a700007aa70000'
+    '7ba700007ca700007da700007ea700007fa7000080a7000081a7000082a7000083a70000'
+    '84a7000085a7000086a7000087a700008ba700008ca700008da700008ea7000090a70000'
+    '91a7000092a7000093a7000096a7000097a7000098a7000099a700009aa700009ba70000'
+    '9ca700009da700009ea700009fa70000a0a70000a1a70000a2a70000a3a70000a4a70000'
+    'a5a70000a6a70000a7a70000a8a70000a9a70000aaa70000aba70000aca70000ada70000'
+    'aea70000afa70000b0a70000b1a70000b2a70000b3a70000b4a70000b5a70000b6a70000'
+    'b7a70000b8a70000b9a70000baa70000bba70000bca70000bda70000bea70000bfa70000'
+    'c0a70000c1a70000c2a70000c3a70000c4a70000c5a70000c6a70000c7a70000c8a70000'
+    'c9a70000caa70000cba70000d0a70000d1a70000d2a70000d3a70000d4a70000d5a70000'
+    'd6a70000d7a70000d8a70000d9a70000daa70000f2a70000f3a70000f4a70000f5a70000'
+    'f6a70000f8a70000f9a70000faa700002da8000030a800003aa8000040a8000078a80000'
+    '80a80000c6a80000cea80000daa80000e0a8000054a900005fa900007da9000080a90000'
+    'cea90000cfa90000daa90000dea90000ffa9000000aa000037aa000040aa00004eaa0000'
+    '50aa00005aaa00005caa0000c3aa0000dbaa0000f7aa000001ab000007ab000009ab0000'
+    '0fab000011ab000017ab000020ab000027ab000028ab00002fab000030ab00005cab0000'
+    '5dab00005eab00005fab000060ab000069ab00006aab00006cab000070ab000071ab0000'
+    '72ab000073ab000074ab000075ab000076ab000077ab000078ab000079ab00007aab0000'
+    '7bab00007cab00007dab00007eab00007fab000080ab000081ab000082ab000083ab0000'
+    '84ab000085ab000086ab000087ab000088ab000089ab00008aab00008bab00008cab0000'
+    '8dab00008eab00008fab000090ab000091ab000092ab000093ab000094ab000095ab0000'
+    '96ab000097ab000098ab000099ab00009aab00009bab00009cab00009dab00009eab0000'
+    '9fab0000a0ab0000a1ab0000a2ab0000a3ab0000a4ab0000a5ab0000a6ab0000a7ab0000'
+    'a8ab0000a9ab0000aaab0000abab0000acab0000adab0000aeab0000afab0000b0ab0000'
+    'b1ab0000b2ab0000b3ab0000b4ab0000b5ab0000b6ab0000b7ab0000b8ab0000b9ab0000'
+    'baab0000bbab0000bcab0000bdab0000beab0000bfab0000c0ab0000eeab0000f0ab0000'
+    'faab000000ac0000a4d70000b0d70000c7d70000cbd70000fcd7000000f9000001f90000'
+    '02f9000003f9000004f9000005f9000006f9000007f9000009f900000af900000bf90000'
+    '0cf900000df900000ef900000ff9000010f9000011f9000012f9000013f9000014f90000'
+    '15f9000016f9000017f9000018f9000019f900001af900001bf900001cf900001df90000'
+    '1ef900001ff9000020f9000021f9000022f9000023f9000024f9000025f9000026f90000'
+    '27f9000028f9000029f900002af900002bf900002cf900002df900002ef900002ff90000'
+    '30f9000031f9000032f9000033f9000034f9000035f9000036f9000037f9000038f90000'
+    '39f900003af900003bf900003cf900003df900003ef900003ff9000040f9000041f90000'
+    '42f9000043f9000044f9000045f9000046f9000047f9000048f9000049f900004af90000'
+    '4bf900004cf900004df900004ef900004ff9000050f9000051f9000052f9000053f90000'
+    '54f9000055f9000056f9000057f9000058f9000059f900005af900005bf900005cf90000'
+    '5df900005ef900005ff9000060f9000061f9000062f9000063f9000064f9000065f90000'
+    '66f9000067f9000068f9000069f900006af900006bf900006cf900006df900006ef90000'
+    '6ff9000070f9000071f9000072f9000073f9000074f9000075f9000076f9000077f90000'
+    '78f9000079f900007af900007bf900007cf900007df900007ef900007ff9000080f90000'
+    '81f9000082f9000083f9000084f9000085f9000086f9000087f9000088f9000089f90000'
+    '8af900008bf900008cf900008df900008ef900008ff9000090f9000091f9000092f90000'
+    '93f9000094f9000095f9000096f9000097f9000098f9000099f900009af900009bf90000'
+    '9cf900009df900009ef900009ff90000a0f90000a1f90000a2f90000a3f90000a4f90000'
+    'a5f90000a6f90000a7f90000a8f90000a9f90000aaf90000abf90000acf90000adf90000'
+    'aef90000aff90000b0f90000b1f90000b2f90000b3f90000b4f90000b5f90000b6f90000'
+    'b7f90000b8f90000b9f90000baf90000bbf90000bcf90000bdf90000bef90000bff90000'
+    'c0f90000c1f90000c2f90000c3f90000c4f90000c5f90000c6f90000c7f90000c8f90000'
+    'c9f90000caf90000cbf90000ccf90000cdf90000cef90000cff90000d0f90000d1f90000'
+    'd2f90000d3f90000d4f90000d5f90000d6f90000d7f90000d8f90000d9f90000daf90000'
+    'dbf90000dcf90000ddf90000def90000dff90000e0f90000e1f90000e2f90000e3f90000'
+    'e4f90000e5f90000e6f90000e7f90000e8f90000e9f90000eaf90000ebf90000ecf90000'
+    'edf90000eef90000eff90000f0f90000f1f90000f2f90000f3f90000f4f90000f5f90000'
+    'f6f90000f7f90000f8f90000f9f90000faf90000fbf90000fcf90000fdf90000fef90000'
+    'fff9000000fa000001fa000002fa000003fa000004fa000005fa000006fa000007fa0000'
+    '08fa000009fa00000afa00000bfa00000cfa00000dfa00000efa000010fa000011fa0000'
+    '12fa000013fa000015fa000016fa000017fa000018fa000019fa00001afa00001bfa0000'
+    '1cfa00001dfa00001efa00001ffa000020fa000021fa000022fa000023fa000025fa0000'
+    '26fa000027fa00002afa00002bfa00002cfa00002dfa00002efa00002ffa000030fa0000'
+    '31fa000032fa000033fa000034fa000035fa000036fa000037fa000038fa000039fa0000'
+    '3afa00003bfa00003cfa00003dfa00003efa00003ffa000040fa000041fa000042fa0000'
+    '43fa000044fa000045fa000046fa000047fa000048fa000049fa00004afa00004bfa0000'
+    '4cfa00004dfa00004efa00004ffa000050fa000051fa000052fa000053fa000054fa0000'
+    '55fa000056fa000057fa000058fa000059fa00005afa00005bfa00005cfa00005dfa0000'
+    '5ffa000060fa000061fa000062fa000063fa000064fa000065fa000066fa000067fa0000'
+    '68fa000069fa00006afa00006bfa00006cfa00006dfa00006efa000070fa000071fa0000'
+    '72fa000073fa000074fa000075fa000076fa000077fa000078fa000079fa00007afa0000'
+    '7bfa00007cfa00007dfa00007efa00007ffa000080fa000081fa000082fa000083fa0000'
+    '84fa000085fa000086fa000087fa000088fa000089fa00008afa00008bfa00008cfa0000'
+    '8dfa00008efa00008ffa000090fa000091fa000092fa000093fa000094fa000095fa0000'
+    '96fa000097fa000098fa000099fa00009afa00009bfa00009cfa00009dfa00009efa0000'
+    '9ffa0000a0fa0000a1fa0000a2fa0000a3fa0000a4fa0000a5fa0000a6fa0000a7fa0000'
+    'a8fa0000a9fa0000aafa0000abfa0000acfa0000adfa0000aefa0000affa0000b0fa0000'
+    'b1fa0000b2fa0000b3fa0000b4fa0000b5fa0000b6fa0000b7fa0000b8fa0000b9fa0000'
+    'bafa0000bbfa0000bcfa0000bdfa0000befa0000bffa0000c0fa0000c1fa0000c2fa0000'
+    'c3fa0000c4fa0000c5fa0000c6fa0000c7fa0000c8fa0000c9fa0000cafa0000cbfa0000'
+    'ccfa0000cdfa0000cefa0000cffa0000d0fa0000d1fa0000d2fa0000d3fa0000d4fa0000'
+    'd5fa0000d6fa0000d7fa0000d8fa0000d9fa0000dafa000000fb000001fb000002fb0000'
+    '03fb000004fb000005fb000007fb000013fb000014fb000015fb000016fb000017fb0000'
+    '18fb00001dfb00001efb00001ffb000020fb000021fb000022fb000023fb000024fb0000'
+    '25fb000026fb000027fb000028fb000029fb00002afb00002bfb00002cfb00002dfb0000'
+    '2efb00002ffb000030fb000031fb000032fb000033fb000034fb000035fb000036fb0000'
+    '37fb000038fb000039fb00003afb00003bfb00003cfb00003dfb00003efb00003ffb0000'
+    '40fb000041fb000042fb000043fb000044fb000045fb000046fb000047fb000048fb0000'
+    '49fb00004afb00004bfb00004cfb00004dfb00004efb00004ffb000050fb000052fb0000'
+    '56fb00005afb00005efb000062fb000066fb00006afb00006efb000072fb000076fb0000'
+    '7afb00007efb000082fb000084fb000086fb000088fb00008afb00008cfb00008efb0000'
+    '92fb000096fb00009afb00009efb0000a0fb0000a4fb0000a6fb0000aafb0000aefb0000'
+    'b0fb0000b2fb0000c3fb0000d3fb0000d7fb0000d9fb0000dbfb0000ddfb0000defb0000'
+    'e0fb0000e2fb0000e4fb0000e8fb0000eafb0000ecfb0000eefb0000f0fb0000f2fb0000'
+    'f4fb0000f6fb0000f9fb0000fcfb000000fc000001fc000002fc000003fc000004fc0000'
+    '05fc000006fc000007fc000008fc000009fc00000afc00000bfc00000cfc00000dfc0000'
+    '0efc00000ffc000010fc000011fc000012fc000013fc000014fc000015fc000016fc0000'
+    '17fc000018fc000019fc00001afc00001bfc00001cfc00001dfc00001efc00001ffc0000'
+    '20fc000021fc000022fc000023fc000024fc000025fc000026fc000027fc000028fc0000'
+    '29fc00002afc00002bfc00002cfc00002dfc00002efc00002ffc000030fc000031fc0000'
+    '32fc000033fc000034fc000035fc000036fc000037fc000038fc000039fc00003afc0000'
+    '3bfc00003cfc00003dfc00003efc00003ffc000040fc000041fc000042fc000043fc0000'
+    '44fc000045fc000046fc000047fc000048fc000049fc00004afc00004bfc00004cfc0000'
+    '4dfc00004efc00004ffc000050fc000051fc000052fc000053fc000054fc000055fc0000'
+    '56fc000057fc000058fc000059fc00005afc00005bfc00005cfc00005dfc00005efc0000'
+    '5ffc000060fc000061fc000062fc000063fc000064fc000065fc000066fc000067fc0000'
+    '68fc000069fc00006afc00006bfc00006cfc00006dfc00006efc00006ffc000070fc0000'
+    '71fc000072fc000073fc000074fc000075fc000076fc000077fc000078fc000079fc0000'
+    '7afc00007bfc00007cfc00007dfc00007efc00007ffc000080fc000081fc000082fc0000'
+    '83fc000084fc000085fc000086fc000087fc000088fc000089fc00008afc00008bfc0000'
+    '8cfc00008dfc00008efc00008ffc000090fc000091fc000092fc000093fc000094fc0000'
+    '95fc000096fc000097fc000098fc000099fc00009afc00009bfc00009cfc00009dfc0000'
+    '9efc00009ffc0000a0fc0000a1fc0000a2fc0000a3fc0000a4fc0000a5fc0000a6fc0000'
+    'a7fc0000a8fc0000a9fc0000aafc0000abfc0000acfc0000adfc0000aefc0000affc0000'
+    'b0fc0000b1fc0000b2fc0000b3fc0000b4fc0000b5fc0000b6fc0000b7fc0000b8fc0000'
+    'b9fc0000bafc0000bbfc0000bcfc0000bdfc0000befc0000bffc0000c0fc0000c1fc0000'
+    'c2fc0000c3fc0000c4fc0000c5fc0000c6fc0000c7fc0000c8fc0000c9fc0000cafc0000'
+    'cbfc0000ccfc0000cdfc0000cefc0000cffc0000d0fc0000d1fc0000d2fc0000d3fc0000'
+    'd4fc0000d5fc0000d6fc0000d7fc0000d8fc0000d9fc0000dafc0000dbfc0000dcfc0000'
+    'ddfc0000defc0000dffc0000e0fc0000e1fc0000e2fc0000e3fc0000e4fc0000e5fc0000'
+    'e6fc0000e7fc0000e8fc0000e9fc0000eafc0000ebfc0000ecfc0000edfc0000eefc0000'
+    'effc0000f0fc0000f1fc0000f2fc0000f3fc0000f4fc0000f5fc0000f6fc0000f7fc0000'
+    'f8fc0000f9fc0000fafc0000fbfc0000fcfc0000fdfc0000fefc0000fffc000000fd0000'
+    '01fd000002fd000003fd000004fd000005fd000006fd000007fd000008fd000009fd0000'
+    '0afd00000bfd00000cfd00000dfd00000efd00000ffd000010fd000011fd000012fd0000'
+    '13fd000014fd000015fd000016fd000017fd000018fd000019fd00001afd00001bfd0000'
+    '1cfd00001dfd00001efd00001ffd000020fd000021fd000022fd000023fd000024fd0000'
+    '25fd000026fd000027fd000028fd000029fd00002afd00002bfd00002cfd00002dfd0000'
+    '2efd00002ffd000030fd000031fd000032fd000033fd000034fd000035fd000036fd0000'
+    '37fd000038fd000039fd00003afd00003bfd00003cfd00003efd000050fd000051fd0000'
+    '53fd000054fd000055fd000056fd000057fd000058fd00005afd00005bfd00005cfd0000'
+    '5dfd00005efd00005ffd000061fd000062fd000064fd000066fd000067fd000069fd0000'
+    '6afd00006cfd00006efd00006ffd000071fd000073fd000074fd000075fd000076fd0000'
+    '78fd000079fd00007afd00007bfd00007cfd00007efd00007ffd000080fd000081fd0000'
+    '82fd000083fd000085fd000087fd000089fd00008afd00008bfd00008cfd00008dfd0000'
+    '8efd00008ffd000090fd000092fd000093fd000094fd000095fd000096fd000097fd0000'
+    '99fd00009afd00009bfd00009cfd00009efd00009ffd0000a0fd0000a1fd0000a2fd0000'
+    'a3fd0000a4fd0000a5fd0000a6fd0000a7fd0000a8fd0000a9fd0000aafd0000abfd0000'
+    'acfd0000adfd0000aefd0000affd0000b0fd0000b1fd0000b2fd0000b3fd0000b4fd0000'
+    'b5fd0000b6fd0000b7fd0000b8fd0000b9fd0000bafd0000bbfd0000bcfd0000bdfd0000'
+    'befd0000bffd0000c0fd0000c1fd0000c2fd0000c3fd0000c4fd0000c5fd0000c6fd0000'
+    'c7fd0000c8fd0000cffd0000d0fd0000f0fd0000f1fd0000f2fd0000f3fd0000f4fd0000'
+    'f5fd0000f6fd0000f7fd0000f8fd0000f9fd0000fafd0000fbfd0000fcfd0000fdfd0000'
+    '00fe000010fe000011fe000012fe000013fe000014fe000015fe000016fe000017fe0000'
+    '18fe000019fe000020fe000030fe000031fe000032fe000033fe000035fe000036fe0000'
+    '37fe000038fe000039fe00003afe00003bfe00003cfe00003dfe00003efe00003ffe0000'
+    '40fe000041fe000042fe000043fe000044fe000045fe000047fe000048fe000049fe0000'
+    '4dfe000050fe000051fe000052fe000054fe000055fe000056fe000057fe000058fe0000'
+    '59fe00005afe00005bfe00005cfe00005dfe00005efe00005ffe000060fe000061fe0000'
+    '62fe000063fe000064fe000065fe000066fe000067fe000068fe000069fe00006afe0000'
+    '6bfe00006cfe000070fe000071fe000072fe000073fe000074fe000075fe000076fe0000'
+    '77fe000078fe000079fe00007afe00007bfe00007cfe00007dfe00007efe00007ffe0000'
+    '80fe000081fe000083fe000085fe000087fe000089fe00008dfe00008ffe000093fe0000'
+    '95fe000099fe00009dfe0000a1fe0000a5fe0000a9fe0000abfe0000adfe0000affe0000'
+    'b1fe0000b5fe0000b9fe0000bdfe0000c1fe0000c5fe0000c9fe0000cdfe0000d1fe0000'
+    'd5fe0000d9fe0000ddfe0000e1fe0000e5fe0000e9fe0000edfe0000effe0000f1fe0000'
+    'f5fe0000f7fe0000f9fe0000fbfe0000fdfe0000fffe000000ff000001ff000002ff0000'
+    '03ff000004ff000005ff000006ff000007ff000008ff000009ff00000aff00000bff0000'
+    '0cff00000dff00000eff00000fff000010ff000011ff000012ff000013ff000014ff0000'
+    '15ff000016ff000017ff000018ff000019ff00001aff00001bff00001cff00001dff0000'
+    '1eff00001fff000020ff000021ff000022ff000023ff000024ff000025ff000026ff0000'
+    '27ff000028ff000029ff00002aff00002bff00002cff00002dff00002eff00002fff0000'
+    '30ff000031ff000032ff000033ff000034ff000035ff000036ff000037ff000038ff0000'
+    '39ff00003aff00003bff00003cff00003dff00003eff00003fff000040ff000041ff0000'
+    '42ff000043ff000044ff000045ff000046ff000047ff000048ff000049ff00004aff0000'
+    '4bff00004cff00004dff00004eff00004fff000050ff000051ff000052ff000053ff0000'
+    '54ff000055ff000056ff000057ff000058ff000059ff00005aff00005bff00005cff0000'
+    '5dff00005eff00005fff000060ff000061ff000062ff000063ff000064ff000065ff0000'
+    '66ff000067ff000068ff000069ff00006aff00006bff00006cff00006dff00006eff0000'
+    '6fff000070ff000071ff000072ff000073ff000074ff000075ff000076ff000077ff0000'
+    '78ff000079ff00007aff00007bff00007cff00007dff00007eff00007fff000080ff0000'
+    '81ff000082ff000083ff000084ff000085ff000086ff000087ff000088ff000089ff0000'
+    '8aff00008bff00008cff00008dff00008eff00008fff000090ff000091ff000092ff0000'
+    '93ff000094ff000095ff000096ff000097ff000098ff000099ff00009aff00009bff0000'
+    '9cff00009dff00009eff00009fff0000a0ff0000a1ff0000a2ff0000a3ff0000a4ff0000'
+    'a5ff0000a6ff0000a7ff0000a8ff0000a9ff0000aaff0000abff0000acff0000adff0000'
+    'aeff0000afff0000b0ff0000b1ff0000b2ff0000b3ff0000b4ff0000b5ff0000b6ff0000'
+    'b7ff0000b8ff0000b9ff0000baff0000bbff0000bcff0000bdff0000beff0000bfff0000'
+    'c2ff0000c3ff0000c4ff0000c5ff0000c6ff0000c7ff0000c8ff0000caff0000cbff0000'
+    'ccff0000cdff0000ceff0000cfff0000d0ff0000d2ff0000d3ff0000d4ff0000d5ff0000'
+    'd6ff0000d7ff0000d8ff0000daff0000dbff0000dcff0000ddff0000e0ff0000e1ff0000'
+    'e2ff0000e3ff0000e4ff0000e5ff0000e6ff0000e7ff0000e8ff0000e9ff0000eaff0000'
+    'ebff0000ecff0000edff0000eeff0000efff0000000001000c0001000d00010027000100'
+    '280001003b0001003c0001003e0001003f0001004e000100500001005e00010080000100'
+    'fb00010000010100030101000701010034010100370101008f010100900101009d010100'
+    'a0010100a1010100d0010100fe010100800201009d020100a0020100d1020100e0020100'
+    'fc02010000030100240301002d0301004b030100500301007b030100800301009e030100'
+    '9f030100c4030100c8030100d60301000004010001040100020401000304010004040100'
+    '05040100060401000704010008040100090401000a0401000b0401000c0401000d040100'
+    '0e0401000f04010010040100110401001204010013040100140401001504010016040100'
+    '1704010018040100190401001a0401001b0401001c0401001d0401001e0401001f040100'
+    '200401002104010022040100230401002404010025040100260401002704010028040100'
+    '9e040100a0040100aa040100b0040100b1040100b2040100b3040100b4040100b5040100'
+    'b6040100b7040100b8040100b9040100ba040100bb040100bc040100bd040100be040100'
+    'bf040100c0040100c1040100c2040100c3040100c4040100c5040100c6040100c7040100'
+    'c8040100c9040100ca040100cb040100cc040100cd040100ce040100cf040100d0040100'
+    'd1040100d2040100d3040100d4040100d8040100fc040100000501002805010030050100'
+    '640501006f05010070050100710501007205010073050100740501007505010076050100'
+    '7705010078050100790501007a0501007b0501007c0501007d0501007e0501007f050100'
+    '800501008105010082050100830501008405010085050100860501008705010088050100'
+    '890501008a0501008b0501008c0501008d0501008e0501008f0501009005010091050100'
+    '920501009305010094050100950501009605010097050100a2050100a3050100b2050100'
+    'b3050100ba050100bb050100bd0501000006010037070100400701005607010060070100'
+    '680701008007010081070100820701008307010084070100850701008607010087070100'
+    '88070100890701008a0701008b0701008c0701008d0701008e0701008f07010090070100'
+    '910701009207010093070100940701009507010096070100970701009807010099070100'
+    '9a0701009b0701009c0701009d0701009e0701009f070100a0070100a1070100a2070100'
+    'a3070100a4070100a5070100a6070100a7070100a8070100a9070100aa070100ab070100'
+    'ac070100ad070100ae070100af070100b0070100b1070100b2070100b3070100b4070100'
+    'b5070100b6070100b7070100b8070100b9070100ba070100bb0701000008010006080100'
+    '08080100090801000a0801003608010037080100390801003c0801003d0801003f080100'
+    '56080100570801009f080100a7080100b0080100e0080100f3080100f4080100f6080100'
+    'fb0801001c0901001f0901003a0901003f0901004009010080090100b8090100bc090100'
+    'd0090100d2090100040a0100050a0100070a01000c0a0100140a0100150a0100180a0100'
+    '190a0100360a0100380a01003b0a01003f0a0100490a0100500a0100590a0100600a0100'
+    'a00a0100c00a0100e70a0100eb0a0100f70a0100000b0100360b0100390b0100560b0100'
+    '580b0100730b0100780b0100920b0100990b01009d0b0100a90b0100b00b0100000c0100'
+    '490c0100800c0100810c0100820c0100830c0100840c0100850c0100860c0100870c0100'
+    '880c0100890c01008a0c01008b0c01008c0c01008d0c01008e0c01008f0c0100900c0100'
+    '910c0100920c0100930c0100940c0100950c0100960c0100970c0100980c0100990c0100'
+    '9a0c01009b0c01009c0c01009d0c01009e0c01009f0c0100a00c0100a10c0100a20c0100'
+    'a30c0100a40c0100a50c0100a60c0100a70c0100a80c0100a90c0100aa0c0100ab0c0100'
+    'ac0c0100ad0c0100ae0c0100af0c0100b00c0100b10c0100b20c0100b30c0100c00c0100'
+    'f30c0100fa0c0100280d0100300d01003a0d0100600e01007f0e0100800e0100aa0e0100'
+    'ab0e0100ae0e0100b00e0100b20e0100fd0e0100280f0100300f01005a0f0100700f0100'
+    '8a0f0100b00f0100cc0f0100e00f0100f70f0100001001004e1001005210010076100100'
+    '7f100100bd100100be100100c3100100d0100100e9100100f0100100fa10010000110100'
+    '351101003611010048110100501101007711010080110100e0110100e1110100f5110100'
+    '00120100121201001312010042120100801201008712010088120100891201008a120100'
+    '8e1201008f1201009e1201009f120100aa120100b0120100eb120100f0120100fa120100'
+    '0013010004130100051301000d1301000f1301001113010013130100291301002a130100'
+    '311301003213010034130100351301003a1301003b130100451301004713010049130100'
+    '4b1301004e130100501301005113010057130100581301005d1301006413010066130100'
+    '6d1301007013010075130100001401005c1401005d1401006214010080140100c8140100'
+    'd0140100da14010080150100b6150100b8150100de150100001601004516010050160100'
+    '5a160100601601006d16010080160100ba160100c0160100ca160100001701001b170100'
+    '1d1701002c1701003017010047170100001801003c180100a0180100a1180100a2180100'
+    'a3180100a4180100a5180100a6180100a7180100a8180100a9180100aa180100ab180100'
+    'ac180100ad180100ae180100af180100b0180100b1180100b2180100b3180100b4180100'
+    'b5180100b6180100b7180100b8180100b9180100ba180100bb180100bc180100bd180100'
+    'be180100bf180100c0180100f3180100ff18010007190100091901000a1901000c190100'
+    '141901001519010017190100181901003619010037190100391901003b19010047190100'
+    '501901005a190100a0190100a8190100aa190100d8190100da190100e5190100001a0100'
+    '481a0100501a0100a31a0100b01a0100f91a0100001b01000a1b0100001c0100091c0100'
+    '0a1c0100371c0100381c0100461c0100501c01006d1c0100701c0100901c0100921c0100'
+    'a81c0100a91c0100b71c0100001d0100071d0100081d01000a1d01000b1d0100371d0100'
+    '3a1d01003b1d01003c1d01003e1d01003f1d0100481d0100501d01005a1d0100601d0100'
+    '661d0100671d0100691d01006a1d01008f1d0100901d0100921d0100931d0100991d0100'
+    'a01d0100aa1d0100e01e0100f91e0100001f0100111f0100121f01003b1f01003e1f0100'
+    '5a1f0100b01f0100b11f0100c01f0100f21f0100ff1f01009a230100002401006f240100'
+    '70240100752401008024010044250100902f0100f32f0100003001003034010040340100'
+    '56340100004401004746010000680100396a0100406a01005f6a0100606a01006a6a0100'
+    '6e6a0100bf6a0100c06a0100ca6a0100d06a0100ee6a0100f06a0100f66a0100006b0100'
+    '466b0100506b01005a6b01005b6b0100626b0100636b0100786b01007d6b0100906b0100'
+    '406e0100416e0100426e0100436e0100446e0100456e0100466e0100476e0100486e0100'
+    '496e01004a6e01004b6e01004c6e01004d6e01004e6e01004f6e0100506e0100516e0100'
+    '526e0100536e0100546e0100556e0100566e0100576e0100586e0100596e01005a6e0100'
+    '5b6e01005c6e01005d6e01005e6e01005f6e0100606e01009b6e0100006f01004b6f0100'
+    '4f6f0100886f01008f6f0100a06f0100e06f0100e56f0100f06f0100f26f010000700100'
+    'f887010000880100d68c0100008d0100098d0100f0af0100f4af0100f5af0100fcaf0100'
+    'fdaf0100ffaf010000b0010023b1010032b1010033b1010050b1010053b1010055b10100'
+    '56b1010064b1010068b1010070b10100fcb2010000bc01006bbc010070bc01007dbc0100'
+    '80bc010089bc010090bc01009abc01009cbc0100a0bc0100a4bc010000cf01002ecf0100'
+    '30cf010047cf010050cf0100c4cf010000d00100f6d0010000d1010027d1010029d10100'
+    '5ed101005fd1010060d1010061d1010062d1010063d1010064d1010065d1010073d10100'
+    '7bd10100bbd10100bcd10100bdd10100bed10100bfd10100c0d10100c1d10100ebd10100'
+    '00d2010046d20100c0d20100d4d20100e0d20100f4d2010000d3010057d3010060d30100'
+    '79d3010000d4010001d4010002d4010003d4010004d4010005d4010006d4010007d40100'
+    '08d4010009d401000ad401000bd401000cd401000dd401000ed401000fd4010010d40100'
+    '11d4010012d4010013d4010014d4010015d4010016d4010017d4010018d4010019d40100'
+    '1ad401001bd401001cd401001dd401001ed401001fd4010020d4010021d4010022d40100'
+    '23d4010024d4010025d4010026d4010027d4010028d4010029d401002ad401002bd40100'
+    '2cd401002dd401002ed401002fd4010030d4010031d4010032d4010033d4010034d40100'
+    '35d4010036d4010037d4010038d4010039d401003ad401003bd401003cd401003dd40100'
+    '3ed401003fd4010040d4010041d4010042d4010043d4010044d4010045d4010046d40100'
+    '47d4010048d4010049d401004ad401004bd401004cd401004dd401004ed401004fd40100'
+    '50d4010051d4010052d4010053d4010054d4010055d4010056d4010057d4010058d40100'
+    '59d401005ad401005bd401005cd401005dd401005ed401005fd4010060d4010061d40100'
+    '62d4010063d4010064d4010065d4010066d4010067d4010068d4010069d401006ad40100'
+    '6bd401006cd401006dd401006ed401006fd4010070d4010071d4010072d4010073d40100'
+    '74d4010075d4010076d4010077d4010078d4010079d401007ad401007bd401007cd40100'
+    '7dd401007ed401007fd4010080d4010081d4010082d4010083d4010084d4010085d40100'
+    '86d4010087d4010088d4010089d401008ad401008bd401008cd401008dd401008ed40100'
+    '8fd4010090d4010091d4010092d4010093d4010094d4010095d4010096d4010097d40100'
+    '98d4010099d401009ad401009bd401009cd401009dd401009ed401009fd40100a0d40100'
+    'a2d40100a3d40100a5d40100a6d40100a7d40100a9d40100aad40100abd40100acd40100'
+    'add40100aed40100afd40100b0d40100b1d40100b2d40100b3d40100b4d40100b5d40100'
+    'b6d40100b7d40100b8d40100b9d40100bad40100bbd40100bcd40100bdd40100bed40100'
+    'bfd40100c0d40100c1d40100c2d40100c3d40100c4d40100c5d40100c6d40100c7d40100'
+    'c8d40100c9d40100cad40100cbd40100ccd40100cdd40100ced40100cfd40100d0d40100'
+    'd1d40100d2d40100d3d40100d4d40100d5d40100d6d40100d7d40100d8d40100d9d40100'
+    'dad40100dbd40100dcd40100ddd40100ded40100dfd40100e0d40100e1d40100e2d40100'
+    'e3d40100e4d40100e5d40100e6d40100e7d40100e8d40100e9d40100ead40100ebd40100'
+    'ecd40100edd40100eed40100efd40100f0d40100f1d40100f2d40100f3d40100f4d40100'
+    'f5d40100f6d40100f7d40100f8d40100f9d40100fad40100fbd40100fcd40100fdd40100'
+    'fed40100ffd4010000d5010001d5010002d5010003d5010004d5010005d5010006d50100'
+    '07d5010008d5010009d501000ad501000bd501000dd501000ed501000fd5010010d50100'
+    '11d5010012d5010013d5010014d5010015d5010016d5010017d5010018d5010019d50100'
+    '1ad501001bd501001cd501001dd501001ed501001fd5010020d5010021d5010022d50100'
+    '23d5010024d5010025d5010026d5010027d5010028d5010029d501002ad501002bd50100'
+    '2cd501002dd501002ed501002fd5010030d5010031d5010032d5010033d5010034d50100'
+    '35d5010036d5010037d5010038d5010039d501003ad501003bd501003cd501003dd50100'
+    '3ed501003fd5010040d5010041d5010042d5010043d5010044d5010045d5010046d50100'
+    '47d501004ad501004bd501004cd501004dd501004ed501004fd5010050d5010051d50100'
+    '52d5010053d5010054d5010055d5010056d5010057d5010058d5010059d501005ad50100'
+    '5bd501005cd501005dd501005ed501005fd5010060d5010061d5010062d5010063d50100'
+    '64d5010065d5010066d5010067d5010068d5010069d501006ad501006bd501006cd50100'
+    '6dd501006ed501006fd5010070d5010071d5010072d5010073d5010074d5010075d50100'
+    '76d5010077d5010078d5010079d501007ad501007bd501007cd501007dd501007ed50100'
+    '7fd5010080d5010081d5010082d5010083d5010084d5010085d5010086d5010087d50100'
+    '88d5010089d501008ad501008bd501008cd501008dd501008ed501008fd5010090d50100'
+    '91d5010092d5010093d5010094d5010095d5010096d5010097d5010098d5010099d50100'
+    '9ad501009bd501009cd501009dd501009ed501009fd50100a0d50100a1d50100a2d50100'
+    'a3d50100a4d50100a5d50100a6d50100a7d50100a8d50100a9d50100aad50100abd50100'
+    'acd50100add50100aed50100afd50100b0d50100b1d50100b2d50100b3d50100b4d50100'
+    'b5d50100b6d50100b7d50100b8d50100b9d50100bad50100bbd50100bcd50100bdd50100'
+    'bed50100bfd50100c0d50100c1d50100c2d50100c3d50100c4d50100c5d50100c6d50100'
+    'c7d50100c8d50100c9d50100cad50100cbd50100ccd50100cdd50100ced50100cfd50100'
+    'd0d50100d1d50100d2d50100d3d50100d4d50100d5d50100d6d50100d7d50100d8d50100'
+    'd9d50100dad50100dbd50100dcd50100ddd50100ded50100dfd50100e0d50100e1d50100'
+    'e2d50100e3d50100e4d50100e5d50100e6d50100e7d50100e8d50100e9d50100ead50100'
+    'ebd50100ecd50100edd50100eed50100efd50100f0d50100f1d50100f2d50100f3d50100'
+    'f4d50100f5d50100f6d50100f7d50100f8d50100f9d50100fad50100fbd50100fcd50100'
+    'fdd50100fed50100ffd5010000d6010001d6010002d6010003d6010004d6010005d60100'
+    '06d6010007d6010008d6010009d601000ad601000bd601000cd601000dd601000ed60100'
+    '0fd6010010d6010011d6010012d6010013d6010014d6010015d6010016d6010017d60100'
+    '18d6010019d601001ad601001bd601001cd601001dd601001ed601001fd6010020d60100'
+    '21d6010022d6010023d6010024d6010025d6010026d6010027d6010028d6010029d60100'
+    '2ad601002bd601002cd601002dd601002ed601002fd6010030d6010031d6010032d60100'
+    '33d6010034d6010035d6010036d6010037d6010038d6010039d601003ad601003bd60100'
+    '3cd601003dd601003ed601003fd6010040d6010041d6010042d6010043d6010044d60100'
+    '45d6010046d6010047d6010048d6010049d601004ad601004bd601004cd601004dd60100'
+    '4ed601004fd6010050d6010051d6010052d6010053d6010054d6010055d6010056d60100'
+    '57d6010058d6010059d601005ad601005bd601005cd601005dd601005ed601005fd60100'
+    '60d6010061d6010062d6010063d6010064d6010065d6010066d6010067d6010068d60100'
+    '69d601006ad601006bd601006cd601006dd601006ed601006fd6010070d6010071d60100'
+    '72d6010073d6010074d6010075d6010076d6010077d6010078d6010079d601007ad60100'
+    '7bd601007cd601007dd601007ed601007fd6010080d6010081d6010082d6010083d60100'
+    '84d6010085d6010086d6010087d6010088d6010089d601008ad601008bd601008cd60100'
+    '8dd601008ed601008fd6010090d6010091d6010092d6010093d6010094d6010095d60100'
+    '96d6010097d6010098d6010099d601009ad601009bd601009cd601009dd601009ed60100'
+    '9fd60100a0d60100a1d60100a2d60100a3d60100a4d60100a5d60100a6d60100a8d60100'
+    'a9d60100aad60100abd60100acd60100add60100aed60100afd60100b0d60100b1d60100'
+    'b2d60100b3d60100b4d60100b5d60100b6d60100b7d60100b8d60100b9d60100bad60100'
+    'bbd60100bcd60100bdd60100bed60100bfd60100c0d60100c1d60100c2d60100c3d60100'
+    'c4d60100c5d60100c6d60100c7d60100c8d60100c9d60100cad60100cbd60100ccd60100'
+    'cdd60100ced60100cfd60100d0d60100d1d60100d2d60100d3d60100d5d60100d6d60100'
+    'd7d60100d8d60100d9d60100dad60100dbd60100dcd60100ddd60100ded60100dfd60100'
+    'e0d60100e1d60100e2d60100e3d60100e4d60100e5d60100e6d60100e7d60100e8d60100'
+    'e9d60100ead60100ebd60100ecd60100edd60100eed60100efd60100f0d60100f1d60100'
+    'f2d60100f3d60100f4d60100f5d60100f6d60100f7d60100f8d60100f9d60100fad60100'
+    'fbd60100fcd60100fdd60100fed60100ffd6010000d7010001d7010002d7010003d70100'
+    '04d7010005d7010006d7010007d7010008d7010009d701000ad701000bd701000cd70100'
+    '0dd701000fd7010010d7010011d7010012d7010013d7010014d7010015d7010016d70100'
+    '17d7010018d7010019d701001ad701001bd701001cd701001dd701001ed701001fd70100'
+    '20d7010021d7010022d7010023d7010024d7010025d7010026d7010027d7010028d70100'
+    '29d701002ad701002bd701002cd701002dd701002ed701002fd7010030d7010031d70100'
+    '32d7010033d7010034d7010035d7010036d7010037d7010038d7010039d701003ad70100'
+    '3bd701003cd701003dd701003ed701003fd7010040d7010041d7010042d7010043d70100'
+    '44d7010045d7010046d7010047d7010049d701004ad701004bd701004cd701004dd70100'
+    '4ed701004fd7010050d7010051d7010052d7010053d7010054d7010055d7010056d70100'
+    '57d7010058d7010059d701005ad701005bd701005cd701005dd701005ed701005fd70100'
+    '60d7010061d7010062d7010063d7010064d7010065d7010066d7010067d7010068d70100'
+    '69d701006ad701006bd701006cd701006dd701006ed701006fd7010070d7010071d70100'
+    '72d7010073d7010074d7010075d7010076d7010077d7010078d7010079d701007ad70100'
+    '7bd701007cd701007dd701007ed701007fd7010080d7010081d7010083d7010084d70100'
+    '85d7010086d7010087d7010088d7010089d701008ad701008bd701008cd701008dd70100'
+    '8ed701008fd7010090d7010091d7010092d7010093d7010094d7010095d7010096d70100'
+    '97d7010098d7010099d701009ad701009bd701009cd701009dd701009ed701009fd70100'
+    'a0d70100a1d70100a2d70100a3d70100a4d70100a5d70100a6d70100a7d70100a8d70100'
+    'a9d70100aad70100abd70100acd70100add70100aed70100afd70100b0d70100b1d70100'
+    'b2d70100b3d70100b4d70100b5d70100b6d70100b7d70100b8d70100b9d70100bad70100'
+    'bbd70100bdd70100bed70100bfd70100c0d70100c1d70100c2d70100c3d70100c4d70100'
+    'c5d70100c6d70100c7d70100c8d70100c9d70100cad70100ccd70100ced70100cfd70100'
+    'd0d70100d1d70100d2d70100d3d70100d4d70100d5d70100d6d70100d7d70100d8d70100'
+    'd9d70100dad70100dbd70100dcd70100ddd70100ded70100dfd70100e0d70100e1d70100'
+    'e2d70100e3d70100e4d70100e5d70100e6d70100e7d70100e8d70100e9d70100ead70100'
+    'ebd70100ecd70100edd70100eed70100efd70100f0d70100f1d70100f2d70100f3d70100'
+    'f4d70100f5d70100f6d70100f7d70100f8d70100f9d70100fad70100fbd70100fcd70100'
+    'fdd70100fed70100ffd7010000d801008cda01009bda0100a0da0100a1da0100b0da0100'
+    '00df01001fdf010025df01002bdf010000e0010007e0010008e0010019e001001be00100'
+    '22e0010023e0010025e0010026e001002be0010030e0010031e0010032e0010033e00100'
+    '34e0010035e0010036e0010037e0010038e0010039e001003ae001003be001003ce00100'
+    '3de001003ee001003fe0010040e0010041e0010042e0010043e0010044e0010045e00100'
+    '46e0010047e0010048e0010049e001004ae001004be001004ce001004de001004ee00100'
+    '4fe0010050e0010051e0010052e0010053e0010054e0010055e0010056e0010057e00100'
+    '58e0010059e001005ae001005be001005ce001005de001005ee001005fe0010060e00100'
+    '61e0010062e0010063e0010064e0010065e0010066e0010067e0010068e0010069e00100'
+    '6ae001006be001006ce001006de001006ee001008fe0010090e0010000e101002de10100'
+    '30e101003ee1010040e101004ae101004ee1010050e1010090e20100afe20100c0e20100'
+    'fae20100ffe2010000e30100d0e40100fae40100e0e70100e7e70100e8e70100ece70100'
+    'ede70100efe70100f0e70100ffe7010000e80100c5e80100c7e80100d7e8010000e90100'
+    '01e9010002e9010003e9010004e9010005e9010006e9010007e9010008e9010009e90100'
+    '0ae901000be901000ce901000de901000ee901000fe9010010e9010011e9010012e90100'
+    '13e9010014e9010015e9010016e9010017e9010018e9010019e901001ae901001be90100'
+    '1ce901001de901001ee901001fe9010020e9010021e9010022e901004ce9010050e90100'
+    '5ae901005ee9010060e9010071ec0100b5ec010001ed01003eed010000ee010001ee0100'
+    '02ee010003ee010004ee010005ee010006ee010007ee010008ee010009ee01000aee0100'
+    '0bee01000cee01000dee01000eee01000fee010010ee010011ee010012ee010013ee0100'
+    '14ee010015ee010016ee010017ee010018ee010019ee01001aee01001bee01001cee0100'
+    '1dee01001eee01001fee010020ee010021ee010022ee010023ee010024ee010025ee0100'
+    '27ee010028ee010029ee01002aee01002bee01002cee01002dee01002eee01002fee0100'
+    '30ee010031ee010032ee010033ee010034ee010035ee010036ee010037ee010038ee0100'
+    '39ee01003aee01003bee01003cee010042ee010043ee010047ee010048ee010049ee0100'
+    '4aee01004bee01004cee01004dee01004eee01004fee010050ee010051ee010052ee0100'
+    '53ee010054ee010055ee010057ee010058ee010059ee01005aee01005bee01005cee0100'
+    '5dee01005eee01005fee010060ee010061ee010062ee010063ee010064ee010065ee0100'
+    '67ee010068ee010069ee01006aee01006bee01006cee01006dee01006eee01006fee0100'
+    '70ee010071ee010072ee010073ee010074ee010075ee010076ee010077ee010078ee0100'
+    '79ee01007aee01007bee01007cee01007dee01007eee01007fee010080ee010081ee0100'
+    '82ee010083ee010084ee010085ee010086ee010087ee010088ee010089ee01008aee0100'
+    '8bee01008cee01008dee01008eee01008fee010090ee010091ee010092ee010093ee0100'
+    '94ee010095ee010096ee010097ee010098ee010099ee01009aee01009bee01009cee0100'
+    'a1ee0100a2ee0100a3ee0100a4ee0100a5ee0100a6ee0100a7ee0100a8ee0100a9ee0100'
+    'aaee0100abee0100acee0100adee0100aeee0100afee0100b0ee0100b1ee0100b2ee0100'
+    'b3ee0100b4ee0100b5ee0100b6ee0100b7ee0100b8ee0100b9ee0100baee0100bbee0100'
+    'bcee0100f0ee0100f2ee010000f001002cf0010030f0010094f00100a0f00100aff00100'
+    'b1f00100c0f00100c1f00100d0f00100d1f00100f6f0010001f1010002f1010003f10100'
+    '04f1010005f1010006f1010007f1010008f1010009f101000af101000bf1010010f10100'
+    '11f1010012f1010013f1010014f1010015f1010016f1010017f1010018f1010019f10100'
+    '1af101001bf101001cf101001df101001ef101001ff1010020f1010021f1010022f10100'
+    '23f1010024f1010025f1010026f1010027f1010028f1010029f101002af101002bf10100'
+    '2cf101002df101002ef101002ff1010030f1010031f1010032f1010033f1010034f10100'
+    '35f1010036f1010037f1010038f1010039f101003af101003bf101003cf101003df10100'
+    '3ef101003ff1010040f1010041f1010042f1010043f1010044f1010045f1010046f10100'
+    '47f1010048f1010049f101004af101004bf101004cf101004df101004ef101004ff10100'
+    '50f101006af101006bf101006cf101006df1010090f1010091f10100aef10100e6f10100'
+    '00f2010001f2010002f2010003f2010010f2010011f2010012f2010013f2010014f20100'
+    '15f2010016f2010017f2010018f2010019f201001af201001bf201001cf201001df20100'
+    '1ef201001ff2010020f2010021f2010022f2010023f2010024f2010025f2010026f20100'
+    '27f2010028f2010029f201002af201002bf201002cf201002df201002ef201002ff20100'
+    '30f2010031f2010032f2010033f2010034f2010035f2010036f2010037f2010038f20100'
+    '39f201003af201003bf201003cf2010040f2010041f2010042f2010043f2010044f20100'
+    '45f2010046f2010047f2010048f2010049f2010050f2010051f2010052f2010060f20100'
+    '66f2010000f30100d8f60100dcf60100edf60100f0f60100fdf6010000f7010077f70100'
+    '7bf70100daf70100e0f70100ecf70100f0f70100f1f7010000f801000cf8010010f80100'
+    '48f8010050f801005af8010060f8010088f8010090f80100aef80100b0f80100b2f80100'
+    '00f9010054fa010060fa01006efa010070fa01007dfa010080fa010089fa010090fa0100'
+    'befa0100bffa0100c6fa0100cefa0100dcfa0100e0fa0100e9fa0100f0fa0100f9fa0100'
+    '00fb010093fb010094fb0100cbfb0100f0fb0100f1fb0100f2fb0100f3fb0100f4fb0100'
+    'f5fb0100f6fb0100f7fb0100f8fb0100f9fb0100fafb010000000200e0a6020000a70200'
+    '3ab7020040b702001eb8020020b80200a2ce0200b0ce0200e1eb020000f8020001f80200'
+    '02f8020003f8020004f8020005f8020006f8020007f8020008f8020009f802000af80200'
+    '0bf802000cf802000df802000ef802000ff8020010f8020011f8020012f8020013f80200'
+    '14f8020015f8020016f8020017f8020018f8020019f802001af802001bf802001cf80200'
+    '1df802001ef802001ff8020020f8020021f8020022f8020023f8020024f8020025f80200'
+    '26f8020027f8020028f8020029f802002af802002bf802002cf802002df802002ef80200'
+    '2ff8020030f8020031f8020034f8020035f8020036f8020037f8020038f8020039f80200'
+    '3af802003bf802003cf802003df802003ef802003ff8020040f8020041f8020042f80200'
+    '43f8020044f8020045f8020047f8020048f8020049f802004af802004bf802004cf80200'
+    '4df802004ef802004ff8020050f8020051f8020052f8020053f8020054f8020055f80200'
+    '56f8020057f8020058f8020059f802005af802005bf802005cf802005df802005ef80200'
+    '5ff8020060f8020061f8020062f8020063f8020064f8020065f8020066f8020067f80200'
+    '68f8020069f802006af802006cf802006df802006ef802006ff8020070f8020071f80200'
+    '72f8020073f8020074f8020075f8020076f8020077f8020078f8020079f802007af80200'
+    '7bf802007cf802007df802007ef802007ff8020080f8020081f8020082f8020083f80200'
+    '84f8020085f8020086f8020087f8020088f8020089f802008af802008bf802008cf80200'
+    '8df802008ef802008ff8020090f8020091f8020093f8020094f8020096f8020097f80200'
+    '98f8020099f802009af802009bf802009cf802009df802009ef802009ff80200a0f80200'
+    'a1f80200a2f80200a3f80200a4f80200a5f80200a6f80200a7f80200a8f80200a9f80200'
+    'aaf80200abf80200acf80200adf80200aef80200aff80200b0f80200b1f80200b2f80200'
+    'b3f80200b4f80200b5f80200b6f80200b7f80200b8f80200b9f80200baf80200bbf80200'
+    'bcf80200bdf80200bef80200bff80200c0f80200c1f80200c2f80200c3f80200c4f80200'
+    'c5f80200c6f80200c7f80200c8f80200c9f80200caf80200cbf80200ccf80200cdf80200'
+    'cef80200cff80200d0f80200d1f80200d2f80200d3f80200d4f80200d5f80200d6f80200'
+    'd7f80200d8f80200d9f80200daf80200dbf80200dcf80200ddf80200def80200dff80200'
+    'e0f80200e1f80200e2f80200e3f80200e4f80200e5f80200e6f80200e7f80200e8f80200'
+    'e9f80200eaf80200ebf80200ecf80200edf80200eef80200eff80200f0f80200f1f80200'
+    'f2f80200f3f80200f4f80200f5f80200f6f80200f7f80200f8f80200f9f80200faf80200'
+    'fbf80200fcf80200fdf80200fef80200fff8020000f9020001f9020002f9020003f90200'
+    '04f9020005f9020006f9020007f9020008f9020009f902000af902000bf902000cf90200'
+    '0df902000ef902000ff9020010f9020011f9020012f9020013f9020014f9020015f90200'
+    '16f9020017f9020018f9020019f902001af902001bf902001cf902001df902001ef90200'
+    '1ff9020020f9020021f9020022f9020023f9020024f9020025f9020026f9020027f90200'
+    '28f9020029f902002af902002bf902002cf902002ef902002ff9020030f9020031f90200'
+    '32f9020033f9020034f9020035f9020036f9020037f9020038f9020039f902003af90200'
+    '3bf902003cf902003df902003ef902003ff9020040f9020041f9020042f9020043f90200'
+    '44f9020045f9020046f9020048f9020049f902004af902004bf902004cf902004df90200'
+    '4ef902004ff9020050f9020051f9020052f9020053f9020054f9020055f9020056f90200'
+    '57f9020058f9020059f902005af902005bf902005cf902005df902005ff9020060f90200'
+    '61f9020062f9020063f9020064f9020065f9020066f9020067f9020068f9020069f90200'
+    '6af902006bf902006cf902006df902006ef902006ff9020070f9020071f9020072f90200'
+    '73f9020074f9020075f9020076f9020077f9020078f9020079f902007af902007bf90200'
+    '7cf902007df902007ef902007ff9020080f9020081f9020082f9020083f9020084f90200'
+    '85f9020086f9020087f9020088f9020089f902008af902008bf902008cf902008df90200'
+    '8ef902008ff9020090f9020091f9020092f9020093f9020094f9020095f9020096f90200'
+    '97f9020098f9020099f902009af902009bf902009cf902009df902009ef902009ff90200'
+    'a0f90200a1f90200a2f90200a3f90200a4f90200a5f90200a6f90200a7f90200a8f90200'
+    'a9f90200aaf90200abf90200acf90200adf90200aef90200aff90200b0f90200b1f90200'
+    'b2f90200b3f90200b4f90200b5f90200b6f90200b7f90200b8f90200b9f90200baf90200'
+    'bbf90200bcf90200bdf90200bef90200bff90200c0f90200c1f90200c2f90200c3f90200'
+    'c4f90200c5f90200c6f90200c7f90200c8f90200c9f90200caf90200cbf90200ccf90200'
+    'cdf90200cef90200cff90200d0f90200d1f90200d2f90200d3f90200d4f90200d5f90200'
+    'd6f90200d7f90200d8f90200d9f90200daf90200dbf90200dcf90200ddf90200def90200'
+    'dff90200e0f90200e1f90200e2f90200e3f90200e4f90200e5f90200e6f90200e7f90200'
+    'e8f90200e9f90200eaf90200ebf90200ecf90200edf90200eef90200eff90200f0f90200'
+    'f1f90200f2f90200f3f90200f4f90200f5f90200f6f90200f7f90200f8f90200f9f90200'
+    'faf90200fbf90200fcf90200fdf90200fef9020000fa020001fa020002fa020003fa0200'
+    '04fa020005fa020006fa020007fa020008fa020009fa02000afa02000bfa02000cfa0200'
+    '0dfa02000efa02000ffa020010fa020011fa020012fa020013fa020014fa020015fa0200'
+    '16fa020017fa020018fa020019fa02001afa02001bfa02001cfa02001dfa02001efa0200'
+    '000003004b13030050130300b023030000010e00f0010e00'
+))
+if sys.byteorder == 'big':
+    starts.byteswap()
+
+statuses = (
+    '333333333333333333333333333333333333333333333VV3VVVVVVVVVV3333333MMMMMMM'
+    'MMMMMMMMMMMMMMMMMMM333333VVVVVVVVVVVVVVVVVVVVVVVVVV33333XXXXXXXXXXXXXXXX'
+    'XXXXXXXXXXXXXXXX3VVVVVVV3VMVVIV3VVMM3MVV3MMVMMMVMMMMMMMMMMMMMMMMMMMMMMMV'
+    'MMMMMMMDVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMV'
+    'MVMVMVMVMVMVMVMVMVMMVMVMVMVMVMMVMVMVMVMMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVM'
+    'VMVMVMVMVMVMVMMVMVMVMVMMVMVMMVMMMVMMMMVMMVMMMVMMVMMVMVMVMMVMVMVMMVMMMVMV'
+    'MMVMVMMMMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMMVMMMVMVMVMVMVMVMVMVMVMVMVMVM'
+    'VMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMMVMMVMVMMMMVMVMVMVMVMMMMMMMMMV333333'
+    'VMMMMMVMMVMMMVIVMVMVMVMVX3V3MX33MMMMMXMXMMVMMMMMMMMMMMMMMMMMXMMMMMMMMMVD'
+    'VMMMMMMMMVMVMVMVMVMVMVMVMVMVMVMVMVMMMVMMVMVMMVMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMV'
+    'MVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVXMVMVMVMVMVMVMVMVMVMVMVMVMVMVM'
+    'VMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVM'
+    'VMVMVMVMVXMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXVMVXVXVXVXVXVXVMMMMVXVX'
+    'VXVXVXVXVXVXVXVXVXVXVMMMMMMMMVXVXVXVXVXVXVXVXVXVXVXMMXMVXVXVXVXVXVXVXVMX'
+    'VMXVXVXVXVXVXVXMMMVXMXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVX'
+    'VXMMXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXV'
+    'XVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVMVXVXVXVXVXVXV'
+    'XVMVXVXVXVXVXMMVXVMVMVXVMVMVMVMVMVXVMVMMMMMVMVMVXVMVMVMVMVMVXVXVXVXMXMXV'
+    'MVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXMMMMMMXVXVXVXVXVXVXVXVXVXVXVXVX'
+    'VXVXVIXIVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVMMMMMMMMXMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXMMMVXVXVMMMVMMMMMMMMMMMVMMMMMMMM'
+    'MMMMMMMMMMVMMMMMMMMMMMMMMMMMMMMMMMMMMMMVMVMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMV'
+    'MVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMV'
+    'MVMVMVMVMVMVMVMMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVM'
+    'VMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMMMMMMMMVXMMMMMMXVMMMMMMMMVMM'
+    'MMMMMMVXMMMMMMXVXMXMXMXMVMMMMMMMMVMVMVMVMVMVMVMXMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMVMMMXVMMMMMM3M333MMMXVMMMMMM333VMXVMMMMX333VMVMM'
+    'MMM333XMMMXVMMMMMM33X3IDXVMV3VXVX3VMMVMMV3V3V333VMV3IXIXMMXMMMMMM3M333MM'
+    'MMMMMMMMM3M333XMMMMMMMMMMMMMXVMVXVX33MMV33MVMMMMMMVMMVMMMVMMMVMVMVMVMMMM'
+    'VMMXMMMMMMMVMMMMMVMMMMVMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMV'
+    'XVMVXVMMVMMV3V3VMMVXVXMMMMMMMMMMMMMMMMMMMM33333333333333333333X333333333'
+    '33333333333333333MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMVM'
+    'V333VMVXVXVMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMVMVMMMVMVMVMV'
+    'MMMMVMVMVMMMMMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVM'
+    'VMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVXVXVXVXVXMVXVXVXVXVXVXVXV'
+    'XVXVXVXVXVMVMXMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMX3VMVMVMMMVXVXV33VMVMXVXMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMXMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXVMMMMMMMMMMMM'
+    'MMVXV3333333333333333333333333333333X33333333333333333333333333333333333'
+    '3MMMMVMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMVMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMXMMMMXMMMMMMMMMMMMMMMMXMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMVXVXVXMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMV'
+    'MVMVMVMVMVMVMVMMVXVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVM'
+    'VMVMVMVMVMVMVMVMVMVMVMVMVMVMVMMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMVMMMM'
+    'MVMMMMMVMVMVMVMVMVMVMVMMMMVMVXMVXVXVMVMVXMMMMVMMVXVXVXVXVXVXVXVXVXVXVXVX'
+    'VXVXVXVXVXVXVXVXVMMMMVMVXMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMVXVXVXVXVXMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMVMVMVMMMMMMMMMMVMVMVMMVMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMXMMMMMMXMMMMMXMVMMMMMMMMMM3MMMMMMMMMMMMMXMMMMMXMXMMXMMXMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMVXMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM3'
+    '33333MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMVMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXVXMMMMMMMMMM33MVI3MX3333MMXVXMM333'
+    '33MMMMMMMMMMMMV33333MX3333M3333MM3333M333X3333X3M3V3X3M3M3M3M3MMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXIX333333333333MM3MMMMMMMMMM3333333MMMMMM'
+    'MMMMMMMMMMMMMMMMMMMM333333MMMMMMMMMMMMMMMMMMMMMMMMMM3333MMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMXMMMMMMXMMMMMMXMMMMMMXMMMXMMM3MMMXMMMMMMMXVXVXVXVXVXVXVXVXVXVXVX'
+    'VXVXVXVXVXVXVXVXVXVXVXMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMVXVXMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXVXVXVXVMMMMMMMMMMMXMMMMMMMMMMMMMMMXMMMMMM'
+    'MXMMXVXVXVXVXVXVXVXVMMMMMXMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXMMM'
+    'MMMMMMXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXV'
+    'XMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXVXVXVXVXVXVXVXVXVXV'
+    'XVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXV'
+    'XVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMVXVXVXV'
+    'XVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXV'
+    'XVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVIXVXVXVXVXVXVMMMMMMMVX'
+    'VMMMMMMVXVXVXVXVXVXMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXMMXMXMMXMMMMXMMMMMMMMMMMMXMXMMMMMMMXMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXMMMMXMMMM'
+    'MMMMXMMMMMMMXMMMMMMMMMMMMMMMMMMMMMMMMMMMMXMMMMXMMMMMXMXMMMMMMMXMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMVXVXVXVXVXVXVXVXVXVXMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMVXVXVXVXVXMMMMXMMMMMMMMMMMMMMMMMMMMMMMMMMMXMMXMX'
+    'MXMMMMMMMMMMXMMMMXMXMXMXMXMXMXMMMXMMXMXMXMXMXMXMXMMXMXMMMMXMMMMMMMXMMMMX'
+    'MMMMXMXMMMMMMMMMMXMMMMMMMMMMMMMMMMMXMMMXMMMMMXMMMMMMMMMMMMMMMMMXVXVXVXVX'
+    'VXVXVX3333333333V33333333333333333333333333MMMMMVMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMVMMMVMVXVMMMXMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXMMMMM'
+    'MMMMXMMXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXVXMMMMMMMMMMXVXV'
+    'XVXVXVXMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXMMMMMMMMMMXMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'XMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMXMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMM'
+    'MMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMMXVXVXIX'
+)
+
+replacements = (
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i',
+    'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x',
+    'y', 'z', None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, ' ', None,
+    None, None, None, None, None, None, ' ̈', None, 'a', None, None, None,
+    None, ' ̄', None, None, '2', '3', ' ́', 'μ', None, None, ' ̧', '1', 'o',
+    None, '1⁄4', '1⁄2', '3⁄4', None, 'à', 'á', 'â', 'ã', 'ä', 'å', 'æ', 'ç',
+    'è', 'é', 'ê', 'ë', 'ì', 'í', 'î', 'ï', 'ð', 'ñ', 'ò', 'ó', 'ô', 'õ', 'ö',
+    None, 'ø', 'ù', 'ú', 'û', 'ü', 'ý', 'þ', 'ss', None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, 'ā', None, 'ă', None, 'ą', None, 'ć', None, 'ĉ',
+    None, 'ċ', None, 'č', None, 'ď', None, 'đ', None, 'ē', None, 'ĕ', None,
+    'ė', None, 'ę', None, 'ě', None, 'ĝ', None, 'ğ', None, 'ġ', None, 'ģ',
+    None, 'ĥ', None, 'ħ', None, 'ĩ', None, 'ī', None, 'ĭ', None, 'į', None,
+    'i̇', None, 'ij', 'ĵ', None, 'ķ', None, 'ĺ', None, 'ļ', None, 'ľ', None,
+    'l·', 'ł', None, 'ń', None, 'ņ', None, 'ň', None, 'ʼn', 'ŋ', None, 'ō',
+    None, 'ŏ', None, 'ő', None, 'œ', None, 'ŕ', None, 'ŗ', None, 'ř', None,
+    'ś', None, 'ŝ', None, 'ş', None, 'š', None, 'ţ', None, 'ť', None, 'ŧ',
+    None, 'ũ', None, 'ū', None, 'ŭ', None, 'ů', None, 'ű', None, 'ų', None,
+    'ŵ', None, 'ŷ', None, 'ÿ', 'ź', None, 'ż', None, 'ž', None, 's', None, 'ɓ',
+    'ƃ', None, 'ƅ', None, 'ɔ', 'ƈ', None, 'ɖ', 'ɗ', 'ƌ', None, 'ǝ', 'ə', 'ɛ',
+    'ƒ', None, 'ɠ', 'ɣ', None, 'ɩ', 'ɨ', 'ƙ', None, 'ɯ', 'ɲ', None, 'ɵ', 'ơ',
+    None, 'ƣ', None, 'ƥ', None, 'ʀ', 'ƨ', None, 'ʃ', None, 'ƭ', None, 'ʈ', 'ư',
+    None, 'ʊ', 'ʋ', 'ƴ', None, 'ƶ', None, 'ʒ', 'ƹ', None, 'ƽ', None, 'dž',
+    'lj', 'nj', 'ǎ', None, 'ǐ', None, 'ǒ', None, 'ǔ', None, 'ǖ', None, 'ǘ',
+    None, 'ǚ', None, 'ǜ', None, 'ǟ', None, 'ǡ', None, 'ǣ', None, 'ǥ', None,
+    'ǧ', None, 'ǩ', None, 'ǫ', None, 'ǭ', None, 'ǯ', None, 'dz', 'ǵ', None,
+    'ƕ', 'ƿ', 'ǹ', None, 'ǻ', None, 'ǽ', None, 'ǿ', None, 'ȁ', None, 'ȃ', None,
+    'ȅ', None, 'ȇ', None, 'ȉ', None, 'ȋ', None, 'ȍ', None, 'ȏ', None, 'ȑ',
+    None, 'ȓ', None, 'ȕ', None, 'ȗ', None, 'ș', None, 'ț', None, 'ȝ', None,
+    'ȟ', None, 'ƞ', None, 'ȣ', None, 'ȥ', None, 'ȧ', None, 'ȩ', None, 'ȫ',
+    None, 'ȭ', None, 'ȯ', None, 'ȱ', None, 'ȳ', None, 'ⱥ', 'ȼ', None, 'ƚ', 'ⱦ',
+    None, 'ɂ', None, 'ƀ', 'ʉ', 'ʌ', 'ɇ', None, 'ɉ', None, 'ɋ', None, 'ɍ', None,
+    'ɏ', None, 'h', 'ɦ', 'j', 'r', 'ɹ', 'ɻ', 'ʁ', 'w', 'y', None, ' ̆', ' ̇',
+    ' ̊', ' ̨', ' ̃', ' ̋', None, 'ɣ', 'l', 's', 'x', 'ʕ', None, '̀', '́',
+    None, '̓', '̈́', 'ι', None, None, None, 'ͱ', None, 'ͳ', None, 'ʹ', None,
+    'ͷ', None, None, ' ι', None, ';', 'ϳ', None, ' ́', ' ̈́', 'ά', '·', 'έ',
+    'ή', 'ί', None, 'ό', None, 'ύ', 'ώ', None, 'α', 'β', 'γ', 'δ', 'ε', 'ζ',
+    'η', 'θ', 'ι', 'κ', 'λ', 'μ', 'ν', 'ξ', 'ο', 'π', 'ρ', None, 'σ', 'τ', 'υ',
+    'φ', 'χ', 'ψ', 'ω', 'ϊ', 'ϋ', None, 'σ', None, 'ϗ', 'β', 'θ', 'υ', 'ύ',
+    'ϋ', 'φ', 'π', None, 'ϙ', None, 'ϛ', None, 'ϝ', None, 'ϟ', None, 'ϡ', None,
+    'ϣ', None, 'ϥ', None, 'ϧ', None, 'ϩ', None, 'ϫ', None, 'ϭ', None, 'ϯ',
+    None, 'κ', 'ρ', 'σ', None, 'θ', 'ε', None, 'ϸ', None, 'σ', 'ϻ', None, 'ͻ',
+    'ͼ', 'ͽ', 'ѐ', 'ё', 'ђ', 'ѓ', 'є', 'ѕ', 'і', 'ї', 'ј', 'љ', 'њ', 'ћ', 'ќ',
+    'ѝ', 'ў', 'џ', 'а', 'б', 'в', 'г', 'д', 'е', 'ж', 'з', 'и', 'й', 'к', 'л',
+    'м', 'н', 'о', 'п', 'р', 'с', 'т', 'у', 'ф', 'х', 'ц', 'ч', 'ш', 'щ', 'ъ',
+    'ы', 'ь', 'э', 'ю', 'я', None, 'ѡ', None, 'ѣ', None, 'ѥ', None, 'ѧ', None,
+    'ѩ', None, 'ѫ', None, 'ѭ', None, 'ѯ', None, 'ѱ', None, 'ѳ', None, 'ѵ',
+    None, 'ѷ', None, 'ѹ', None, 'ѻ', None, 'ѽ', None, 'ѿ', None, 'ҁ', None,
+    'ҋ', None, 'ҍ', None, 'ҏ', None, 'ґ', None, 'ғ', None, 'ҕ', None, 'җ',
+    None, 'ҙ', None, 'қ', None, 'ҝ', None, 'ҟ', None, 'ҡ', None, 'ң', None,
+    'ҥ', None, 'ҧ', None, 'ҩ', None, 'ҫ', None, 'ҭ', None, 'ү', None, 'ұ',
+    None, 'ҳ', None, 'ҵ', None, 'ҷ', None, 'ҹ', None, 'һ', None, 'ҽ', None,
+    'ҿ', None, None, 'ӂ', None, 'ӄ', None, 'ӆ', None, 'ӈ', None, 'ӊ', None,
+    'ӌ', None, 'ӎ', None, 'ӑ', None, 'ӓ', None, 'ӕ', None, 'ӗ', None, 'ә',
+    None, 'ӛ', None, 'ӝ', None, 'ӟ', None, 'ӡ', None, 'ӣ', None, 'ӥ', None,
+    'ӧ', None, 'ө', None, 'ӫ', None, 'ӭ', None, 'ӯ', None, 'ӱ', None, 'ӳ',
+    None, 'ӵ', None, 'ӷ', None, 'ӹ', None, 'ӻ', None, 'ӽ', None, 'ӿ', None,
+    'ԁ', None, 'ԃ', None, 'ԅ', None, 'ԇ', None, 'ԉ', None, 'ԋ', None, 'ԍ',
+    None, 'ԏ', None, 'ԑ', None, 'ԓ', None, 'ԕ', None, 'ԗ', None, 'ԙ', None,
+    'ԛ', None, 'ԝ', None, 'ԟ', None, 'ԡ', None, 'ԣ', None, 'ԥ', None, 'ԧ',
+    None, 'ԩ', None, 'ԫ', None, 'ԭ', None, 'ԯ', None, None, 'ա', 'բ', 'գ', 'դ',
+    'ե', 'զ', 'է', 'ը', 'թ', 'ժ', 'ի', 'լ', 'խ', 'ծ', 'կ', 'հ', 'ձ', 'ղ', 'ճ',
+    'մ', 'յ', 'ն', 'շ', 'ո', 'չ', 'պ', 'ջ', 'ռ', 'ս', 'վ', 'տ', 'ր', 'ց', 'ւ',
+    'փ', 'ք', 'օ', 'ֆ', None, None, 'եւ', None, None, None, None, None, None,
+    None, None, None, None, None, None, None, 'اٴ', 'وٴ', 'ۇٴ', 'يٴ', None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    'क़', 'ख़', 'ग़', 'ज़', 'ड़', 'ढ़', 'फ़', 'य़', None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, 'ড়', 'ঢ়', None, 'য়', None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, 'ਲ਼', None, None, 'ਸ਼', None, None, None, None, None, None, None,
+    None, None, None, None, None, None, 'ਖ਼', 'ਗ਼', 'ਜ਼', None, None, 'ਫ਼',
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, 'ଡ଼', 'ଢ଼', None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, 'ํา', None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, 'ໍາ', None, None, None, None, None, None,
+    None, None, None, None, 'ຫນ', 'ຫມ', None, None, None, '་', None, 'གྷ',
+    None, None, None, 'ཌྷ', None, 'དྷ', None, 'བྷ', None, 'ཛྷ', None, 'ཀྵ',
+    None, None, None, 'ཱི', None, 'ཱུ', 'ྲྀ', 'ྲཱྀ', 'ླྀ', 'ླཱྀ', None, 'ཱྀ',
+    None, 'ྒྷ', None, None, None, 'ྜྷ', None, 'ྡྷ', None, 'ྦྷ', None, 'ྫྷ',
+    None, 'ྐྵ', None, None, None, None, None, None, None, None, 'ⴧ', None, 'ⴭ',
+    None, None, 'ნ', None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, 'Ᏸ', 'Ᏹ', 'Ᏺ', 'Ᏻ', 'Ᏼ', 'Ᏽ',
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    'в', 'д', 'о', 'с', 'т', 'ъ', 'ѣ', 'ꙋ', None, 'ა', 'ბ', 'გ', 'დ', 'ე', 'ვ',
+    'ზ', 'თ', 'ი', 'კ', 'ლ', 'მ', 'ნ', 'ო', 'პ', 'ჟ', 'რ', 'ს', 'ტ', 'უ', 'ფ',
+    'ქ', 'ღ', 'ყ', 'შ', 'ჩ', 'ც', 'ძ', 'წ', 'ჭ', 'ხ', 'ჯ', 'ჰ', 'ჱ', 'ჲ', 'ჳ',
+    'ჴ', 'ჵ', 'ჶ', 'ჷ', 'ჸ', 'ჹ', 'ჺ', None, 'ჽ', 'ჾ', 'ჿ', None, None, None,
+    None, None, 'a', 'æ', 'b', None, 'd', 'e', 'ǝ', 'g', 'h', 'i', 'j', 'k',
+    'l', 'm', 'n', None, 'o', 'ȣ', 'p', 'r', 't', 'u', 'w', 'a', 'ɐ', 'ɑ', 'ᴂ',
+    'b', 'd', 'e', 'ə', 'ɛ', 'ɜ', 'g', None, 'k', 'm', 'ŋ', 'o', 'ɔ', 'ᴖ', 'ᴗ',
+    'p', 't', 'u', 'ᴝ', 'ɯ', 'v', 'ᴥ', 'β', 'γ', 'δ', 'φ', 'χ', 'i', 'r', 'u',
+    'v', 'β', 'γ', 'ρ', 'φ', 'χ', None, 'н', None, 'ɒ', 'c', 'ɕ', 'ð', 'ɜ',
+    'f', 'ɟ', 'ɡ', 'ɥ', 'ɨ', 'ɩ', 'ɪ', 'ᵻ', 'ʝ', 'ɭ', 'ᶅ', 'ʟ', 'ɱ', 'ɰ', 'ɲ',
+    'ɳ', 'ɴ', 'ɵ', 'ɸ', 'ʂ', 'ʃ', 'ƫ', 'ʉ', 'ʊ', 'ᴜ', 'ʋ', 'ʌ', 'z', 'ʐ', 'ʑ',
+    'ʒ', 'θ', None, 'ḁ', None, 'ḃ', None, 'ḅ', None, 'ḇ', None, 'ḉ', None, 'ḋ',
+    None, 'ḍ', None, 'ḏ', None, 'ḑ', None, 'ḓ', None, 'ḕ', None, 'ḗ', None,
+    'ḙ', None, 'ḛ', None, 'ḝ', None, 'ḟ', None, 'ḡ', None, 'ḣ', None, 'ḥ',
+    None, 'ḧ', None, 'ḩ', None, 'ḫ', None, 'ḭ', None, 'ḯ', None, 'ḱ', None,
+    'ḳ', None, 'ḵ', None, 'ḷ', None, 'ḹ', None, 'ḻ', None, 'ḽ', None, 'ḿ',
+    None, 'ṁ', None, 'ṃ', None, 'ṅ', None, 'ṇ', None, 'ṉ', None, 'ṋ', None,
+    'ṍ', None, 'ṏ', None, 'ṑ', None, 'ṓ', None, 'ṕ', None, 'ṗ', None, 'ṙ',
+    None, 'ṛ', None, 'ṝ', None, 'ṟ', None, 'ṡ', None, 'ṣ', None, 'ṥ', None,
+    'ṧ', None, 'ṩ', None, 'ṫ', None, 'ṭ', None, 'ṯ', None, 'ṱ', None, 'ṳ',
+    None, 'ṵ', None, 'ṷ', None, 'ṹ', None, 'ṻ', None, 'ṽ', None, 'ṿ', None,
+    'ẁ', None, 'ẃ', None, 'ẅ', None, 'ẇ', None, 'ẉ', None, 'ẋ', None, 'ẍ',
+    None, 'ẏ', None, 'ẑ', None, 'ẓ', None, 'ẕ', None, 'aʾ', 'ṡ', None, 'ss',
+    None, 'ạ', None, 'ả', None, 'ấ', None, 'ầ', None, 'ẩ', None, 'ẫ', None,
+    'ậ', None, 'ắ', None, 'ằ', None, 'ẳ', None, 'ẵ', None, 'ặ', None, 'ẹ',
+    None, 'ẻ', None, 'ẽ', None, 'ế', None, 'ề', None, 'ể', None, 'ễ', None,
+    'ệ', None, 'ỉ', None, 'ị', None, 'ọ', None, 'ỏ', None, 'ố', None, 'ồ',
+    None, 'ổ', None, 'ỗ', None, 'ộ', None, 'ớ', None, 'ờ', None, 'ở', None,
+    'ỡ', None, 'ợ', None, 'ụ', None, 'ủ', None, 'ứ', None, 'ừ', None, 'ử',
+    None, 'ữ', None, 'ự', None, 'ỳ', None, 'ỵ', None, 'ỷ', None, 'ỹ', None,
+    'ỻ', None, 'ỽ', None, 'ỿ', None, 'ἀ', 'ἁ', 'ἂ', 'ἃ', 'ἄ', 'ἅ', 'ἆ', 'ἇ',
+    None, None, 'ἐ', 'ἑ', 'ἒ', 'ἓ', 'ἔ', 'ἕ', None, None, 'ἠ', 'ἡ', 'ἢ', 'ἣ',
+    'ἤ', 'ἥ', 'ἦ', 'ἧ', None, 'ἰ', 'ἱ', 'ἲ', 'ἳ', 'ἴ', 'ἵ', 'ἶ', 'ἷ', None,
+    None, 'ὀ', 'ὁ', 'ὂ', 'ὃ', 'ὄ', 'ὅ', None, None, None, 'ὑ', None, 'ὓ', None,
+    'ὕ', None, 'ὗ', None, 'ὠ', 'ὡ', 'ὢ', 'ὣ', 'ὤ', 'ὥ', 'ὦ', 'ὧ', None, 'ά',
+    None, 'έ', None, 'ή', None, 'ί', None, 'ό', None, 'ύ', None, 'ώ', None,
+    'ἀι', 'ἁι', 'ἂι', 'ἃι', 'ἄι', 'ἅι', 'ἆι', 'ἇι', 'ἀι', 'ἁι', 'ἂι', 'ἃι',
+    'ἄι', 'ἅι', 'ἆι', 'ἇι', 'ἠι', 'ἡι', 'ἢι', 'ἣι', 'ἤι', 'ἥι', 'ἦι', 'ἧι',
+    'ἠι', 'ἡι', 'ἢι', 'ἣι', 'ἤι', 'ἥι', 'ἦι', 'ἧι', 'ὠι', 'ὡι', 'ὢι', 'ὣι',
+    'ὤι', 'ὥι', 'ὦι', 'ὧι', 'ὠι', 'ὡι', 'ὢι', 'ὣι', 'ὤι', 'ὥι', 'ὦι', 'ὧι',
+    None, 'ὰι', 'αι', 'άι', None, None, 'ᾶι', 'ᾰ', 'ᾱ', 'ὰ', 'ά', 'αι', ' ̓',
+    'ι', ' ̓', ' ͂', ' ̈͂', 'ὴι', 'ηι', 'ήι', None, None, 'ῆι', 'ὲ', 'έ', 'ὴ',
+    'ή', 'ηι', ' ̓̀', ' ̓́', ' ̓͂', None, 'ΐ', None, None, 'ῐ', 'ῑ', 'ὶ', 'ί',
+    None, ' ̔̀', ' ̔́', ' ̔͂', None, 'ΰ', None, 'ῠ', 'ῡ', 'ὺ', 'ύ', 'ῥ', ' ̈̀',
+    ' ̈́', '`', None, 'ὼι', 'ωι', 'ώι', None, None, 'ῶι', 'ὸ', 'ό', 'ὼ', 'ώ',
+    'ωι', ' ́', ' ̔', None, ' ', None, '', None, None, '‐', None, ' ̳', None,
+    None, None, None, ' ', None, '′′', '′′′', None, '‵‵', '‵‵‵', None, '!!',
+    None, ' ̅', None, '??', '?!', '!?', None, '′′′′', None, ' ', None, None,
+    None, None, '0', 'i', None, '4', '5', '6', '7', '8', '9', '+', '−', '=',
+    '(', ')', 'n', '0', '1', '2', '3', '4', '5', '6', '7', '8', '9', '+', '−',
+    '=', '(', ')', None, 'a', 'e', 'o', 'x', 'ə', 'h', 'k', 'l', 'm', 'n', 'p',
+    's', 't', None, None, 'rs', None, None, None, None, 'a/c', 'a/s', 'c',
+    '°c', None, 'c/o', 'c/u', 'ɛ', None, '°f', 'g', 'h', 'ħ', 'i', 'l', None,
+    'n', 'no', None, 'p', 'q', 'r', None, 'sm', 'tel', 'tm', None, 'z', None,
+    'ω', None, 'z', None, 'k', 'å', 'b', 'c', None, 'e', 'f', None, 'm', 'o',
+    'א', 'ב', 'ג', 'ד', 'i', None, 'fax', 'π', 'γ', 'π', '∑', None, 'd', 'e',
+    'i', 'j', None, '1⁄7', '1⁄9', '1⁄10', '1⁄3', '2⁄3', '1⁄5', '2⁄5', '3⁄5',
+    '4⁄5', '1⁄6', '5⁄6', '1⁄8', '3⁄8', '5⁄8', '7⁄8', '1⁄', 'i', 'ii', 'iii',
+    'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x', 'xi', 'xii', 'l', 'c', 'd', 'm',
+    'i', 'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x', 'xi', 'xii',
+    'l', 'c', 'd', 'm', None, None, None, '0⁄3', None, None, None, '∫∫', '∫∫∫',
+    None, '∮∮', '∮∮∮', None, None, None, None, None, '〈', '〉', None, None,
+    None, None, '1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12',
+    '13', '14', '15', '16', '17', '18', '19', '20', '(1)', '(2)', '(3)', '(4)',
+    '(5)', '(6)', '(7)', '(8)', '(9)', '(10)', '(11)', '(12)', '(13)', '(14)',
+    '(15)', '(16)', '(17)', '(18)', '(19)', '(20)', None, '(a)', '(b)', '(c)',
+    '(d)', '(e)', '(f)', '(g)', '(h)', '(i)', '(j)', '(k)', '(l)', '(m)',
+    '(n)', '(o)', '(p)', '(q)', '(r)', '(s)', '(t)', '(u)', '(v)', '(w)',
+    '(x)', '(y)', '(z)', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k',
+    'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z',
+    'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o',
+    'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z', '0', None, '∫∫∫∫',
+    None, '::=', '==', '===', None, '⫝̸', None, None, None, None, None, 'ⰰ',
+    'ⰱ', 'ⰲ', 'ⰳ', 'ⰴ', 'ⰵ', 'ⰶ', 'ⰷ', 'ⰸ', 'ⰹ', 'ⰺ', 'ⰻ', 'ⰼ', 'ⰽ', 'ⰾ', 'ⰿ',
+    'ⱀ', 'ⱁ', 'ⱂ', 'ⱃ', 'ⱄ', 'ⱅ', 'ⱆ', 'ⱇ', 'ⱈ', 'ⱉ', 'ⱊ', 'ⱋ', 'ⱌ', 'ⱍ', 'ⱎ',
+    'ⱏ', 'ⱐ', 'ⱑ', 'ⱒ', 'ⱓ', 'ⱔ', 'ⱕ', 'ⱖ', 'ⱗ', 'ⱘ', 'ⱙ', 'ⱚ', 'ⱛ', 'ⱜ', 'ⱝ',
+    'ⱞ', 'ⱟ', None, 'ⱡ', None, 'ɫ', 'ᵽ', 'ɽ', None, 'ⱨ', None, 'ⱪ', None, 'ⱬ',
+    None, 'ɑ', 'ɱ', 'ɐ', 'ɒ', None, 'ⱳ', None, 'ⱶ', None, 'j', 'v', 'ȿ', 'ɀ',
+    'ⲁ', None, 'ⲃ', None, 'ⲅ', None, 'ⲇ', None, 'ⲉ', None, 'ⲋ', None, 'ⲍ',
+    None, 'ⲏ', None, 'ⲑ', None, 'ⲓ', None, 'ⲕ', None, 'ⲗ', None, 'ⲙ', None,
+    'ⲛ', None, 'ⲝ', None, 'ⲟ', None, 'ⲡ', None, 'ⲣ', None, 'ⲥ', None, 'ⲧ',
+    None, 'ⲩ', None, 'ⲫ', None, 'ⲭ', None, 'ⲯ', None, 'ⲱ', None, 'ⲳ', None,
+    'ⲵ', None, 'ⲷ', None, 'ⲹ', None, 'ⲻ', None, 'ⲽ', None, 'ⲿ', None, 'ⳁ',
+    None, 'ⳃ', None, 'ⳅ', None, 'ⳇ', None, 'ⳉ', None, 'ⳋ', None, 'ⳍ', None,
+    'ⳏ', None, 'ⳑ', None, 'ⳓ', None, 'ⳕ', None, 'ⳗ', None, 'ⳙ', None, 'ⳛ',
+    None, 'ⳝ', None, 'ⳟ', None, 'ⳡ', None, 'ⳣ', None, 'ⳬ', None, 'ⳮ', None,
+    'ⳳ', None, None, None, None, None, None, None, None, None, None, 'ⵡ', None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    '母', None, '龟', None, '一', '丨', '丶', '丿', '乙', '亅', '二', '亠', '人', '儿',
+    '入', '八', '冂', '冖', '冫', '几', '凵', '刀', '力', '勹', '匕', '匚', '匸', '十', '卜',
+    '卩', '厂', '厶', '又', '口', '囗', '土', '士', '夂', '夊', '夕', '大', '女', '子', '宀',
+    '寸', '小', '尢', '尸', '屮', '山', '巛', '工', '己', '巾', '干', '幺', '广', '廴', '廾',
+    '弋', '弓', '彐', '彡', '彳', '心', '戈', '戶', '手', '支', '攴', '文', '斗', '斤', '方',
+    '无', '日', '曰', '月', '木', '欠', '止', '歹', '殳', '毋', '比', '毛', '氏', '气', '水',
+    '火', '爪', '父', '爻', '爿', '片', '牙', '牛', '犬', '玄', '玉', '瓜', '瓦', '甘', '生',
+    '用', '田', '疋', '疒', '癶', '白', '皮', '皿', '目', '矛', '矢', '石', '示', '禸', '禾',
+    '穴', '立', '竹', '米', '糸', '缶', '网', '羊', '羽', '老', '而', '耒', '耳', '聿', '肉',
+    '臣', '自', '至', '臼', '舌', '舛', '舟', '艮', '色', '艸', '虍', '虫', '血', '行', '衣',
+    '襾', '見', '角', '言', '谷', '豆', '豕', '豸', '貝', '赤', '走', '足', '身', '車', '辛',
+    '辰', '辵', '邑', '酉', '釆', '里', '金', '長', '門', '阜', '隶', '隹', '雨', '靑', '非',
+    '面', '革', '韋', '韭', '音', '頁', '風', '飛', '食', '首', '香', '馬', '骨', '高', '髟',
+    '鬥', '鬯', '鬲', '鬼', '魚', '鳥', '鹵', '鹿', '麥', '麻', '黃', '黍', '黑', '黹', '黽',
+    '鼎', '鼓', '鼠', '鼻', '齊', '齒', '龍', '龜', '龠', None, ' ', None, '.', None,
+    '〒', None, '十', '卄', '卅', None, None, None, None, None, ' ゙', ' ゚', None,
+    'より', None, 'コト', None, None, None, 'ᄀ', 'ᄁ', 'ᆪ', 'ᄂ', 'ᆬ', 'ᆭ', 'ᄃ', 'ᄄ',
+    'ᄅ', 'ᆰ', 'ᆱ', 'ᆲ', 'ᆳ', 'ᆴ', 'ᆵ', 'ᄚ', 'ᄆ', 'ᄇ', 'ᄈ', 'ᄡ', 'ᄉ', 'ᄊ', 'ᄋ',
+    'ᄌ', 'ᄍ', 'ᄎ', 'ᄏ', 'ᄐ', 'ᄑ', 'ᄒ', 'ᅡ', 'ᅢ', 'ᅣ', 'ᅤ', 'ᅥ', 'ᅦ', 'ᅧ', 'ᅨ',
+    'ᅩ', 'ᅪ', 'ᅫ', 'ᅬ', 'ᅭ', 'ᅮ', 'ᅯ', 'ᅰ', 'ᅱ', 'ᅲ', 'ᅳ', 'ᅴ', 'ᅵ', None, 'ᄔ',
+    'ᄕ', 'ᇇ', 'ᇈ', 'ᇌ', 'ᇎ', 'ᇓ', 'ᇗ', 'ᇙ', 'ᄜ', 'ᇝ', 'ᇟ', 'ᄝ', 'ᄞ', 'ᄠ', 'ᄢ',
+    'ᄣ', 'ᄧ', 'ᄩ', 'ᄫ', 'ᄬ', 'ᄭ', 'ᄮ', 'ᄯ', 'ᄲ', 'ᄶ', 'ᅀ', 'ᅇ', 'ᅌ', 'ᇱ', 'ᇲ',
+    'ᅗ', 'ᅘ', 'ᅙ', 'ᆄ', 'ᆅ', 'ᆈ', 'ᆑ', 'ᆒ', 'ᆔ', 'ᆞ', 'ᆡ', None, None, '一',
+    '二', '三', '四', '上', '中', '下', '甲', '乙', '丙', '丁', '天', '地', '人', None,
+    None, None, '(ᄀ)', '(ᄂ)', '(ᄃ)', '(ᄅ)', '(ᄆ)', '(ᄇ)', '(ᄉ)', '(ᄋ)', '(ᄌ)',
+    '(ᄎ)', '(ᄏ)', '(ᄐ)', '(ᄑ)', '(ᄒ)', '(가)', '(나)', '(다)', '(라)', '(마)',
+    '(바)', '(사)', '(아)', '(자)', '(차)', '(카)', '(타)', '(파)', '(하)', '(주)',
+    '(오전)', '(오후)', None, '(一)', '(二)', '(三)', '(四)', '(五)', '(六)', '(七)',
+    '(八)', '(九)', '(十)', '(月)', '(火)', '(水)', '(木)', '(金)', '(土)', '(日)',
+    '(株)', '(有)', '(社)', '(名)', '(特)', '(財)', '(祝)', '(労)', '(代)', '(呼)',
+    '(学)', '(監)', '(企)', '(資)', '(協)', '(祭)', '(休)', '(自)', '(至)', '問', '幼',
+    '文', '箏', None, 'pte', '21', '22', '23', '24', '25', '26', '27', '28',
+    '29', '30', '31', '32', '33', '34', '35', 'ᄀ', 'ᄂ', 'ᄃ', 'ᄅ', 'ᄆ', 'ᄇ',
+    'ᄉ', 'ᄋ', 'ᄌ', 'ᄎ', 'ᄏ', 'ᄐ', 'ᄑ', 'ᄒ', '가', '나', '다', '라', '마', '바', '사',
+    '아', '자', '차', '카', '타', '파', '하', '참고', '주의', '우', None, '一', '二', '三',
+    '四', '五', '六', '七', '八', '九', '十', '月', '火', '水', '木', '金', '土', '日', '株',
+    '有', '社', '名', '特', '財', '祝', '労', '秘', '男', '女', '適', '優', '印', '注', '項',
+    '休', '写', '正', '上', '中', '下', '左', '右', '医', '宗', '学', '監', '企', '資', '協',
+    '夜', '36', '37', '38', '39', '40', '41', '42', '43', '44', '45', '46',
+    '47', '48', '49', '50', '1月', '2月', '3月', '4月', '5月', '6月', '7月', '8月',
+    '9月', '10月', '11月', '12月', 'hg', 'erg', 'ev', 'ltd', 'ア', 'イ', 'ウ', 'エ',
+    'オ', 'カ', 'キ', 'ク', 'ケ', 'コ', 'サ', 'シ', 'ス', 'セ', 'ソ', 'タ', 'チ', 'ツ', 'テ',
+    'ト', 'ナ', 'ニ', 'ヌ', 'ネ', 'ノ', 'ハ', 'ヒ', 'フ', 'ヘ', 'ホ', 'マ', 'ミ', 'ム', 'メ',
+    'モ', 'ヤ', 'ユ', 'ヨ', 'ラ', 'リ', 'ル', 'レ', 'ロ', 'ワ', 'ヰ', 'ヱ', 'ヲ', '令和',
+    'アパート', 'アルファ', 'アンペア', 'アール', 'イニング', 'インチ', 'ウォン', 'エスクード', 'エーカー',
+    'オンス', 'オーム', 'カイリ', 'カラット', 'カロリー', 'ガロン', 'ガンマ', 'ギガ', 'ギニー', 'キュリー',
+    'ギルダー', 'キロ', 'キログラム', 'キロメートル', 'キロワット', 'グラム', 'グラムトン', 'クルゼイロ', 'クローネ',
+    'ケース', 'コルナ', 'コーポ', 'サイクル', 'サンチーム', 'シリング', 'センチ', 'セント', 'ダース', 'デシ',
+    'ドル', 'トン', 'ナノ', 'ノット', 'ハイツ', 'パーセント', 'パーツ', 'バーレル', 'ピアストル', 'ピクル',
+    'ピコ', 'ビル', 'ファラッド', 'フィート', 'ブッシェル', 'フラン', 'ヘクタール', 'ペソ', 'ペニヒ', 'ヘルツ',
+    'ペンス', 'ページ', 'ベータ', 'ポイント', 'ボルト', 'ホン', 'ポンド', 'ホール', 'ホーン', 'マイクロ',
+    'マイル', 'マッハ', 'マルク', 'マンション', 'ミクロン', 'ミリ', 'ミリバール', 'メガ', 'メガトン', 'メートル',
+    'ヤード', 'ヤール', 'ユアン', 'リットル', 'リラ', 'ルピー', 'ルーブル', 'レム', 'レントゲン', 'ワット',
+    '0点', '1点', '2点', '3点', '4点', '5点', '6点', '7点', '8点', '9点', '10点', '11点',
+    '12点', '13点', '14点', '15点', '16点', '17点', '18点', '19点', '20点', '21点',
+    '22点', '23点', '24点', 'hpa', 'da', 'au', 'bar', 'ov', 'pc', 'dm', 'dm2',
+    'dm3', 'iu', '平成', '昭和', '大正', '明治', '株式会社', 'pa', 'na', 'μa', 'ma', 'ka',
+    'kb', 'mb', 'gb', 'cal', 'kcal', 'pf', 'nf', 'μf', 'μg', 'mg', 'kg', 'hz',
+    'khz', 'mhz', 'ghz', 'thz', 'μl', 'ml', 'dl', 'kl', 'fm', 'nm', 'μm', 'mm',
+    'cm', 'km', 'mm2', 'cm2', 'm2', 'km2', 'mm3', 'cm3', 'm3', 'km3', 'm∕s',
+    'm∕s2', 'pa', 'kpa', 'mpa', 'gpa', 'rad', 'rad∕s', 'rad∕s2', 'ps', 'ns',
+    'μs', 'ms', 'pv', 'nv', 'μv', 'mv', 'kv', 'mv', 'pw', 'nw', 'μw', 'mw',
+    'kw', 'mw', 'kω', 'mω', None, 'bq', 'cc', 'cd', 'c∕kg', None, 'db', 'gy',
+    'ha', 'hp', 'in', 'kk', 'km', 'kt', 'lm', 'ln', 'log', 'lx', 'mb', 'mil',
+    'mol', 'ph', None, 'ppm', 'pr', 'sr', 'sv', 'wb', 'v∕m', 'a∕m', '1日', '2日',
+    '3日', '4日', '5日', '6日', '7日', '8日', '9日', '10日', '11日', '12日', '13日',
+    '14日', '15日', '16日', '17日', '18日', '19日', '20日', '21日', '22日', '23日',
+    '24日', '25日', '26日', '27日', '28日', '29日', '30日', '31日', 'gal', None, None,
+    None, None, None, None, 'ꙁ', None, 'ꙃ', None, 'ꙅ', None, 'ꙇ', None, 'ꙉ',
+    None, 'ꙋ', None, 'ꙍ', None, 'ꙏ', None, 'ꙑ', None, 'ꙓ', None, 'ꙕ', None,
+    'ꙗ', None, 'ꙙ', None, 'ꙛ', None, 'ꙝ', None, 'ꙟ', None, 'ꙡ', None, 'ꙣ',
+    None, 'ꙥ', None, 'ꙧ', None, 'ꙩ', None, 'ꙫ', None, 'ꙭ', None, 'ꚁ', None,
+    'ꚃ', None, 'ꚅ', None, 'ꚇ', None, 'ꚉ', None, 'ꚋ', None, 'ꚍ', None, 'ꚏ',
+    None, 'ꚑ', None, 'ꚓ', None, 'ꚕ', None, 'ꚗ', None, 'ꚙ', None, 'ꚛ', None,
+    'ъ', 'ь', None, None, None, 'ꜣ', None, 'ꜥ', None, 'ꜧ', None, 'ꜩ', None,
+    'ꜫ', None, 'ꜭ', None, 'ꜯ', None, 'ꜳ', None, 'ꜵ', None, 'ꜷ', None, 'ꜹ',
+    None, 'ꜻ', None, 'ꜽ', None, 'ꜿ', None, 'ꝁ', None, 'ꝃ', None, 'ꝅ', None,
+    'ꝇ', None, 'ꝉ', None, 'ꝋ', None, 'ꝍ', None, 'ꝏ', None, 'ꝑ', None, 'ꝓ',
+    None, 'ꝕ', None, 'ꝗ', None, 'ꝙ', None, 'ꝛ', None, 'ꝝ', None, 'ꝟ', None,
+    'ꝡ', None, 'ꝣ', None, 'ꝥ', None, 'ꝧ', None, 'ꝩ', None, 'ꝫ', None, 'ꝭ',
+    None, 'ꝯ', None, 'ꝯ', None, 'ꝺ', None, 'ꝼ', None, 'ᵹ', 'ꝿ', None, 'ꞁ',
+    None, 'ꞃ', None, 'ꞅ', None, 'ꞇ', None, 'ꞌ', None, 'ɥ', None, 'ꞑ', None,
+    'ꞓ', None, 'ꞗ', None, 'ꞙ', None, 'ꞛ', None, 'ꞝ', None, 'ꞟ', None, 'ꞡ',
+    None, 'ꞣ', None, 'ꞥ', None, 'ꞧ', None, 'ꞩ', None, 'ɦ', 'ɜ', 'ɡ', 'ɬ', 'ɪ',
+    None, 'ʞ', 'ʇ', 'ʝ', 'ꭓ', 'ꞵ', None, 'ꞷ', None, 'ꞹ', None, 'ꞻ', None, 'ꞽ',
+    None, 'ꞿ', None, 'ꟁ', None, 'ꟃ', None, 'ꞔ', 'ʂ', 'ᶎ', 'ꟈ', None, 'ꟊ', None,
+    None, 'ꟑ', None, None, None, None, None, 'ꟗ', None, 'ꟙ', None, None, 'c',
+    'f', 'q', 'ꟶ', None, 'ħ', 'œ', None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, 'ꜧ', 'ꬷ', 'ɫ',
+    'ꭒ', None, 'ʍ', None, None, 'Ꭰ', 'Ꭱ', 'Ꭲ', 'Ꭳ', 'Ꭴ', 'Ꭵ', 'Ꭶ', 'Ꭷ', 'Ꭸ',
+    'Ꭹ', 'Ꭺ', 'Ꭻ', 'Ꭼ', 'Ꭽ', 'Ꭾ', 'Ꭿ', 'Ꮀ', 'Ꮁ', 'Ꮂ', 'Ꮃ', 'Ꮄ', 'Ꮅ', 'Ꮆ', 'Ꮇ',
+    'Ꮈ', 'Ꮉ', 'Ꮊ', 'Ꮋ', 'Ꮌ', 'Ꮍ', 'Ꮎ', 'Ꮏ', 'Ꮐ', 'Ꮑ', 'Ꮒ', 'Ꮓ', 'Ꮔ', 'Ꮕ', 'Ꮖ',
+    'Ꮗ', 'Ꮘ', 'Ꮙ', 'Ꮚ', 'Ꮛ', 'Ꮜ', 'Ꮝ', 'Ꮞ', 'Ꮟ', 'Ꮠ', 'Ꮡ', 'Ꮢ', 'Ꮣ', 'Ꮤ', 'Ꮥ',
+    'Ꮦ', 'Ꮧ', 'Ꮨ', 'Ꮩ', 'Ꮪ', 'Ꮫ', 'Ꮬ', 'Ꮭ', 'Ꮮ', 'Ꮯ', 'Ꮰ', 'Ꮱ', 'Ꮲ', 'Ꮳ', 'Ꮴ',
+    'Ꮵ', 'Ꮶ', 'Ꮷ', 'Ꮸ', 'Ꮹ', 'Ꮺ', 'Ꮻ', 'Ꮼ', 'Ꮽ', 'Ꮾ', 'Ꮿ', None, None, None,
+    None, None, None, None, None, None, None, '豈', '更', '車', '賈', '滑', '串',
+    '句', '龜', '契', '金', '喇', '奈', '懶', '癩', '羅', '蘿', '螺', '裸', '邏', '樂', '洛',
+    '烙', '珞', '落', '酪', '駱', '亂', '卵', '欄', '爛', '蘭', '鸞', '嵐', '濫', '藍', '襤',
+    '拉', '臘', '蠟', '廊', '朗', '浪', '狼', '郎', '來', '冷', '勞', '擄', '櫓', '爐', '盧',
+    '老', '蘆', '虜', '路', '露', '魯', '鷺', '碌', '祿', '綠', '菉', '錄', '鹿', '論', '壟',
+    '弄', '籠', '聾', '牢', '磊', '賂', '雷', '壘', '屢', '樓', '淚', '漏', '累', '縷', '陋',
+    '勒', '肋', '凜', '凌', '稜', '綾', '菱', '陵', '讀', '拏', '樂', '諾', '丹', '寧', '怒',
+    '率', '異', '北', '磻', '便', '復', '不', '泌', '數', '索', '參', '塞', '省', '葉', '說',
+    '殺', '辰', '沈', '拾', '若', '掠', '略', '亮', '兩', '凉', '梁', '糧', '良', '諒', '量',
+    '勵', '呂', '女', '廬', '旅', '濾', '礪', '閭', '驪', '麗', '黎', '力', '曆', '歷', '轢',
+    '年', '憐', '戀', '撚', '漣', '煉', '璉', '秊', '練', '聯', '輦', '蓮', '連', '鍊', '列',
+    '劣', '咽', '烈', '裂', '說', '廉', '念', '捻', '殮', '簾', '獵', '令', '囹', '寧', '嶺',
+    '怜', '玲', '瑩', '羚', '聆', '鈴', '零', '靈', '領', '例', '禮', '醴', '隸', '惡', '了',
+    '僚', '寮', '尿', '料', '樂', '燎', '療', '蓼', '遼', '龍', '暈', '阮', '劉', '杻', '柳',
+    '流', '溜', '琉', '留', '硫', '紐', '類', '六', '戮', '陸', '倫', '崙', '淪', '輪', '律',
+    '慄', '栗', '率', '隆', '利', '吏', '履', '易', '李', '梨', '泥', '理', '痢', '罹', '裏',
+    '裡', '里', '離', '匿', '溺', '吝', '燐', '璘', '藺', '隣', '鱗', '麟', '林', '淋', '臨',
+    '立', '笠', '粒', '狀', '炙', '識', '什', '茶', '刺', '切', '度', '拓', '糖', '宅', '洞',
+    '暴', '輻', '行', '降', '見', '廓', '兀', '嗀', None, '塚', None, '晴', None, '凞',
+    '猪', '益', '礼', '神', '祥', '福', '靖', '精', '羽', None, '蘒', None, '諸', None,
+    '逸', '都', None, '飯', '飼', '館', '鶴', '郞', '隷', '侮', '僧', '免', '勉', '勤', '卑',
+    '喝', '嘆', '器', '塀', '墨', '層', '屮', '悔', '慨', '憎', '懲', '敏', '既', '暑', '梅',
+    '海', '渚', '漢', '煮', '爫', '琢', '碑', '社', '祉', '祈', '祐', '祖', '祝', '禍', '禎',
+    '穀', '突', '節', '練', '縉', '繁', '署', '者', '臭', '艹', '著', '褐', '視', '謁', '謹',
+    '賓', '贈', '辶', '逸', '難', '響', '頻', '恵', '𤋮', '舘', None, '並', '况', '全', '侀',
+    '充', '冀', '勇', '勺', '喝', '啕', '喙', '嗢', '塚', '墳', '奄', '奔', '婢', '嬨', '廒',
+    '廙', '彩', '徭', '惘', '慎', '愈', '憎', '慠', '懲', '戴', '揄', '搜', '摒', '敖', '晴',
+    '朗', '望', '杖', '歹', '殺', '流', '滛', '滋', '漢', '瀞', '煮', '瞧', '爵', '犯', '猪',
+    '瑱', '甆', '画', '瘝', '瘟', '益', '盛', '直', '睊', '着', '磌', '窱', '節', '类', '絛',
+    '練', '缾', '者', '荒', '華', '蝹', '襁', '覆', '視', '調', '諸', '請', '謁', '諾', '諭',
+    '謹', '變', '贈', '輸', '遲', '醙', '鉶', '陼', '難', '靖', '韛', '響', '頋', '頻', '鬒',
+    '龜', '𢡊', '𢡄', '𣏕', '㮝', '䀘', '䀹', '𥉉', '𥳐', '𧻓', '齃', '龎', None, 'ff',
+    'fi', 'fl', 'ffi', 'ffl', 'st', None, 'մն', 'մե', 'մի', 'վն', 'մխ', None,
+    'יִ', None, 'ײַ', 'ע', 'א', 'ד', 'ה', 'כ', 'ל', 'ם', 'ר', 'ת', '+', 'שׁ',
+    'שׂ', 'שּׁ', 'שּׂ', 'אַ', 'אָ', 'אּ', 'בּ', 'גּ', 'דּ', 'הּ', 'וּ', 'זּ',
+    None, 'טּ', 'יּ', 'ךּ', 'כּ', 'לּ', None, 'מּ', None, 'נּ', 'סּ', None,
+    'ףּ', 'פּ', None, 'צּ', 'קּ', 'רּ', 'שּ', 'תּ', 'וֹ', 'בֿ', 'כֿ', 'פֿ',
+    'אל', 'ٱ', 'ٻ', 'پ', 'ڀ', 'ٺ', 'ٿ', 'ٹ', 'ڤ', 'ڦ', 'ڄ', 'ڃ', 'چ', 'ڇ', 'ڍ',
+    'ڌ', 'ڎ', 'ڈ', 'ژ', 'ڑ', 'ک', 'گ', 'ڳ', 'ڱ', 'ں', 'ڻ', 'ۀ', 'ہ', 'ھ', 'ے',
+    'ۓ', None, None, 'ڭ', 'ۇ', 'ۆ', 'ۈ', 'ۇٴ', 'ۋ', 'ۅ', 'ۉ', 'ې', 'ى', 'ئا',
+    'ئە', 'ئو', 'ئۇ', 'ئۆ', 'ئۈ', 'ئې', 'ئى', 'ی', 'ئج', 'ئح', 'ئم', 'ئى',
+    'ئي', 'بج', 'بح', 'بخ', 'بم', 'بى', 'بي', 'تج', 'تح', 'تخ', 'تم', 'تى',
+    'تي', 'ثج', 'ثم', 'ثى', 'ثي', 'جح', 'جم', 'حج', 'حم', 'خج', 'خح', 'خم',
+    'سج', 'سح', 'سخ', 'سم', 'صح', 'صم', 'ضج', 'ضح', 'ضخ', 'ضم', 'طح', 'طم',
+    'ظم', 'عج', 'عم', 'غج', 'غم', 'فج', 'فح', 'فخ', 'فم', 'فى', 'في', 'قح',
+    'قم', 'قى', 'قي', 'كا', 'كج', 'كح', 'كخ', 'كل', 'كم', 'كى', 'كي', 'لج',
+    'لح', 'لخ', 'لم', 'لى', 'لي', 'مج', 'مح', 'مخ', 'مم', 'مى', 'مي', 'نج',
+    'نح', 'نخ', 'نم', 'نى', 'ني', 'هج', 'هم', 'هى', 'هي', 'يج', 'يح', 'يخ',
+    'يم', 'يى', 'يي', 'ذٰ', 'رٰ', 'ىٰ', ' ٌّ', ' ٍّ', ' َّ', ' ُّ', ' ِّ',
+    ' ّٰ', 'ئر', 'ئز', 'ئم', 'ئن', 'ئى', 'ئي', 'بر', 'بز', 'بم', 'بن', 'بى',
+    'بي', 'تر', 'تز', 'تم', 'تن', 'تى', 'تي', 'ثر', 'ثز', 'ثم', 'ثن', 'ثى',
+    'ثي', 'فى', 'في', 'قى', 'قي', 'كا', 'كل', 'كم', 'كى', 'كي', 'لم', 'لى',
+    'لي', 'ما', 'مم', 'نر', 'نز', 'نم', 'نن', 'نى', 'ني', 'ىٰ', 'ير', 'يز',
+    'يم', 'ين', 'يى', 'يي', 'ئج', 'ئح', 'ئخ', 'ئم', 'ئه', 'بج', 'بح', 'بخ',
+    'بم', 'به', 'تج', 'تح', 'تخ', 'تم', 'ته', 'ثم', 'جح', 'جم', 'حج', 'حم',
+    'خج', 'خم', 'سج', 'سح', 'سخ', 'سم', 'صح', 'صخ', 'صم', 'ضج', 'ضح', 'ضخ',
+    'ضم', 'طح', 'ظم', 'عج', 'عم', 'غج', 'غم', 'فج', 'فح', 'فخ', 'فم', 'قح',
+    'قم', 'كج', 'كح', 'كخ', 'كل', 'كم', 'لج', 'لح', 'لخ', 'لم', 'له', 'مج',
+    'مح', 'مخ', 'مم', 'نج', 'نح', 'نخ', 'نم', 'نه', 'هج', 'هم', 'هٰ', 'يج',
+    'يح', 'يخ', 'يم', 'يه', 'ئم', 'ئه', 'بم', 'به', 'تم', 'ته', 'ثم', 'ثه',
+    'سم', 'سه', 'شم', 'شه', 'كل', 'كم', 'لم', 'نم', 'نه', 'يم', 'يه', 'ـَّ',
+    'ـُّ', 'ـِّ', 'طى', 'طي', 'عى', 'عي', 'غى', 'غي', 'سى', 'سي', 'شى', 'شي',
+    'حى', 'حي', 'جى', 'جي', 'خى', 'خي', 'صى', 'صي', 'ضى', 'ضي', 'شج', 'شح',
+    'شخ', 'شم', 'شر', 'سر', 'صر', 'ضر', 'طى', 'طي', 'عى', 'عي', 'غى', 'غي',
+    'سى', 'سي', 'شى', 'شي', 'حى', 'حي', 'جى', 'جي', 'خى', 'خي', 'صى', 'صي',
+    'ضى', 'ضي', 'شج', 'شح', 'شخ', 'شم', 'شر', 'سر', 'صر', 'ضر', 'شج', 'شح',
+    'شخ', 'شم', 'سه', 'شه', 'طم', 'سج', 'سح', 'سخ', 'شج', 'شح', 'شخ', 'طم',
+    'ظم', 'اً', None, 'تجم', 'تحج', 'تحم', 'تخم', 'تمج', 'تمح', 'تمخ', 'جمح',
+    'حمي', 'حمى', 'سحج', 'سجح', 'سجى', 'سمح', 'سمج', 'سمم', 'صحح', 'صمم',
+    'شحم', 'شجي', 'شمخ', 'شمم', 'ضحى', 'ضخم', 'طمح', 'طمم', 'طمي', 'عجم',
+    'عمم', 'عمى', 'غمم', 'غمي', 'غمى', 'فخم', 'قمح', 'قمم', 'لحم', 'لحي',
+    'لحى', 'لجج', 'لخم', 'لمح', 'محج', 'محم', 'محي', 'مجح', 'مجم', 'مخج',
+    'مخم', None, 'مجخ', 'همج', 'همم', 'نحم', 'نحى', 'نجم', 'نجى', 'نمي', 'نمى',
+    'يمم', 'بخي', 'تجي', 'تجى', 'تخي', 'تخى', 'تمي', 'تمى', 'جمي', 'جحى',
+    'جمى', 'سخى', 'صحي', 'شحي', 'ضحي', 'لجي', 'لمي', 'يحي', 'يجي', 'يمي',
+    'ممي', 'قمي', 'نحي', 'قمح', 'لحم', 'عمي', 'كمي', 'نجح', 'مخي', 'لجم',
+    'كمم', 'لجم', 'نجح', 'جحي', 'حجي', 'مجي', 'فمي', 'بحي', 'كمم', 'عجم',
+    'صمم', 'سخي', 'نجي', None, None, None, 'صلے', 'قلے', 'الله', 'اكبر',
+    'محمد', 'صلعم', 'رسول', 'عليه', 'وسلم', 'صلى', 'صلى الله عليه وسلم',
+    'جل جلاله', 'ریال', None, None, ',', '、', None, ':', ';', '!', '?', '〖',
+    '〗', None, None, None, '—', '–', '_', '(', ')', '{', '}', '〔', '〕', '【',
+    '】', '《', '》', '〈', '〉', '「', '」', '『', '』', None, '[', ']', ' ̅', '_',
+    ',', '、', None, ';', ':', '?', '!', '—', '(', ')', '{', '}', '〔', '〕', '#',
+    '&', '*', '+', '-', '<', '>', '=', None, '\\', '$', '%', '@', None, ' ً',
+    'ـً', ' ٌ', None, ' ٍ', None, ' َ', 'ـَ', ' ُ', 'ـُ', ' ِ', 'ـِ', ' ّ',
+    'ـّ', ' ْ', 'ـْ', 'ء', 'آ', 'أ', 'ؤ', 'إ', 'ئ', 'ا', 'ب', 'ة', 'ت', 'ث',
+    'ج', 'ح', 'خ', 'د', 'ذ', 'ر', 'ز', 'س', 'ش', 'ص', 'ض', 'ط', 'ظ', 'ع', 'غ',
+    'ف', 'ق', 'ك', 'ل', 'م', 'ن', 'ه', 'و', 'ى', 'ي', 'لآ', 'لأ', 'لإ', 'لا',
+    None, None, None, '!', '"', '#', '$', '%', '&', "'", '(', ')', '*', '+',
+    ',', '-', '.', '/', '0', '1', '2', '3', '4', '5', '6', '7', '8', '9', ':',
+    ';', '<', '=', '>', '?', '@', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i',
+    'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x',
+    'y', 'z', '[', '\\', ']', '^', '_', '`', 'a', 'b', 'c', 'd', 'e', 'f', 'g',
+    'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v',
+    'w', 'x', 'y', 'z', '{', '|', '}', '~', '⦅', '⦆', '.', '「', '」', '、', '・',
+    'ヲ', 'ァ', 'ィ', 'ゥ', 'ェ', 'ォ', 'ャ', 'ュ', 'ョ', 'ッ', 'ー', 'ア', 'イ', 'ウ', 'エ',
+    'オ', 'カ', 'キ', 'ク', 'ケ', 'コ', 'サ', 'シ', 'ス', 'セ', 'ソ', 'タ', 'チ', 'ツ', 'テ',
+    'ト', 'ナ', 'ニ', 'ヌ', 'ネ', 'ノ', 'ハ', 'ヒ', 'フ', 'ヘ', 'ホ', 'マ', 'ミ', 'ム', 'メ',
+    'モ', 'ヤ', 'ユ', 'ヨ', 'ラ', 'リ', 'ル', 'レ', 'ロ', 'ワ', 'ン', '゙', '゚', None, 'ᄀ',
+    'ᄁ', 'ᆪ', 'ᄂ', 'ᆬ', 'ᆭ', 'ᄃ', 'ᄄ', 'ᄅ', 'ᆰ', 'ᆱ', 'ᆲ', 'ᆳ', 'ᆴ', 'ᆵ', 'ᄚ',
+    'ᄆ', 'ᄇ', 'ᄈ', 'ᄡ', 'ᄉ', 'ᄊ', 'ᄋ', 'ᄌ', 'ᄍ', 'ᄎ', 'ᄏ', 'ᄐ', 'ᄑ', 'ᄒ', None,
+    'ᅡ', 'ᅢ', 'ᅣ', 'ᅤ', 'ᅥ', 'ᅦ', None, 'ᅧ', 'ᅨ', 'ᅩ', 'ᅪ', 'ᅫ', 'ᅬ', None,
+    'ᅭ', 'ᅮ', 'ᅯ', 'ᅰ', 'ᅱ', 'ᅲ', None, 'ᅳ', 'ᅴ', 'ᅵ', None, '¢', '£', '¬',
+    ' ̄', '¦', '¥', '₩', None, '│', '←', '↑', '→', '↓', '■', '○', None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, '𐐨', '𐐩', '𐐪', '𐐫', '𐐬', '𐐭',
+    '𐐮', '𐐯', '𐐰', '𐐱', '𐐲', '𐐳', '𐐴', '𐐵', '𐐶', '𐐷', '𐐸', '𐐹', '𐐺', '𐐻', '𐐼',
+    '𐐽', '𐐾', '𐐿', '𐑀', '𐑁', '𐑂', '𐑃', '𐑄', '𐑅', '𐑆', '𐑇', '𐑈', '𐑉', '𐑊', '𐑋',
+    '𐑌', '𐑍', '𐑎', '𐑏', None, None, None, None, '𐓘', '𐓙', '𐓚', '𐓛', '𐓜', '𐓝',
+    '𐓞', '𐓟', '𐓠', '𐓡', '𐓢', '𐓣', '𐓤', '𐓥', '𐓦', '𐓧', '𐓨', '𐓩', '𐓪', '𐓫', '𐓬',
+    '𐓭', '𐓮', '𐓯', '𐓰', '𐓱', '𐓲', '𐓳', '𐓴', '𐓵', '𐓶', '𐓷', '𐓸', '𐓹', '𐓺', '𐓻',
+    None, None, None, None, None, None, None, None, '𐖗', '𐖘', '𐖙', '𐖚', '𐖛',
+    '𐖜', '𐖝', '𐖞', '𐖟', '𐖠', '𐖡', None, '𐖣', '𐖤', '𐖥', '𐖦', '𐖧', '𐖨', '𐖩', '𐖪',
+    '𐖫', '𐖬', '𐖭', '𐖮', '𐖯', '𐖰', '𐖱', None, '𐖳', '𐖴', '𐖵', '𐖶', '𐖷', '𐖸', '𐖹',
+    None, '𐖻', '𐖼', None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, 'ː', 'ˑ', 'æ', 'ʙ', 'ɓ', None, 'ʣ',
+    'ꭦ', 'ʥ', 'ʤ', 'ɖ', 'ɗ', 'ᶑ', 'ɘ', 'ɞ', 'ʩ', 'ɤ', 'ɢ', 'ɠ', 'ʛ', 'ħ', 'ʜ',
+    'ɧ', 'ʄ', 'ʪ', 'ʫ', 'ɬ', '𝼄', 'ꞎ', 'ɮ', '𝼅', 'ʎ', '𝼆', 'ø', 'ɶ', 'ɷ', 'q',
+    'ɺ', '𝼈', 'ɽ', 'ɾ', 'ʀ', 'ʨ', 'ʦ', 'ꭧ', 'ʧ', 'ʈ', 'ⱱ', None, 'ʏ', 'ʡ', 'ʢ',
+    'ʘ', 'ǀ', 'ǁ', 'ǂ', '𝼊', '𝼞', None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    '𐳀', '𐳁', '𐳂', '𐳃', '𐳄', '𐳅', '𐳆', '𐳇', '𐳈', '𐳉', '𐳊', '𐳋', '𐳌', '𐳍', '𐳎',
+    '𐳏', '𐳐', '𐳑', '𐳒', '𐳓', '𐳔', '𐳕', '𐳖', '𐳗', '𐳘', '𐳙', '𐳚', '𐳛', '𐳜', '𐳝',
+    '𐳞', '𐳟', '𐳠', '𐳡', '𐳢', '𐳣', '𐳤', '𐳥', '𐳦', '𐳧', '𐳨', '𐳩', '𐳪', '𐳫', '𐳬',
+    '𐳭', '𐳮', '𐳯', '𐳰', '𐳱', '𐳲', None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, '𑣀', '𑣁', '𑣂',
+    '𑣃', '𑣄', '𑣅', '𑣆', '𑣇', '𑣈', '𑣉', '𑣊', '𑣋', '𑣌', '𑣍', '𑣎', '𑣏', '𑣐', '𑣑',
+    '𑣒', '𑣓', '𑣔', '𑣕', '𑣖', '𑣗', '𑣘', '𑣙', '𑣚', '𑣛', '𑣜', '𑣝', '𑣞', '𑣟', None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, '𖹠', '𖹡', '𖹢', '𖹣', '𖹤', '𖹥', '𖹦', '𖹧', '𖹨', '𖹩', '𖹪',
+    '𖹫', '𖹬', '𖹭', '𖹮', '𖹯', '𖹰', '𖹱', '𖹲', '𖹳', '𖹴', '𖹵', '𖹶', '𖹷', '𖹸', '𖹹',
+    '𖹺', '𖹻', '𖹼', '𖹽', '𖹾', '𖹿', None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, '𝅗𝅥', '𝅘𝅥', '𝅘𝅥𝅮', '𝅘𝅥𝅯', '𝅘𝅥𝅰', '𝅘𝅥𝅱', '𝅘𝅥𝅲', None,
+    None, None, '𝆹𝅥', '𝆺𝅥', '𝆹𝅥𝅮', '𝆺𝅥𝅮', '𝆹𝅥𝅯', '𝆺𝅥𝅯', None, None, None, None,
+    None, None, None, None, None, None, None, None, 'a', 'b', 'c', 'd', 'e',
+    'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't',
+    'u', 'v', 'w', 'x', 'y', 'z', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i',
+    'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x',
+    'y', 'z', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm',
+    'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z', 'a', 'b',
+    'c', 'd', 'e', 'f', 'g', None, 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q',
+    'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z', 'a', 'b', 'c', 'd', 'e', 'f',
+    'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u',
+    'v', 'w', 'x', 'y', 'z', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j',
+    'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y',
+    'z', 'a', None, 'c', 'd', None, 'g', None, 'j', 'k', None, 'n', 'o', 'p',
+    'q', None, 's', 't', 'u', 'v', 'w', 'x', 'y', 'z', 'a', 'b', 'c', 'd',
+    None, 'f', None, 'h', 'i', 'j', 'k', 'l', 'm', 'n', None, 'p', 'q', 'r',
+    's', 't', 'u', 'v', 'w', 'x', 'y', 'z', 'a', 'b', 'c', 'd', 'e', 'f', 'g',
+    'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v',
+    'w', 'x', 'y', 'z', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k',
+    'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z',
+    'a', 'b', None, 'd', 'e', 'f', 'g', None, 'j', 'k', 'l', 'm', 'n', 'o',
+    'p', 'q', None, 's', 't', 'u', 'v', 'w', 'x', 'y', None, 'a', 'b', 'c',
+    'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r',
+    's', 't', 'u', 'v', 'w', 'x', 'y', 'z', 'a', 'b', None, 'd', 'e', 'f', 'g',
+    None, 'i', 'j', 'k', 'l', 'm', None, 'o', None, 's', 't', 'u', 'v', 'w',
+    'x', 'y', None, 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l',
+    'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z', 'a',
+    'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p',
+    'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z', 'a', 'b', 'c', 'd', 'e',
+    'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't',
+    'u', 'v', 'w', 'x', 'y', 'z', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i',
+    'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x',
+    'y', 'z', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm',
+    'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z', 'a', 'b',
+    'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q',
+    'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z', 'a', 'b', 'c', 'd', 'e', 'f',
+    'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u',
+    'v', 'w', 'x', 'y', 'z', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j',
+    'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y',
+    'z', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n',
+    'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z', 'a', 'b', 'c',
+    'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r',
+    's', 't', 'u', 'v', 'w', 'x', 'y', 'z', 'a', 'b', 'c', 'd', 'e', 'f', 'g',
+    'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v',
+    'w', 'x', 'y', 'z', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k',
+    'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z',
+    'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o',
+    'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z', 'ı', 'ȷ', None, 'α',
+    'β', 'γ', 'δ', 'ε', 'ζ', 'η', 'θ', 'ι', 'κ', 'λ', 'μ', 'ν', 'ξ', 'ο', 'π',
+    'ρ', 'θ', 'σ', 'τ', 'υ', 'φ', 'χ', 'ψ', 'ω', '∇', 'α', 'β', 'γ', 'δ', 'ε',
+    'ζ', 'η', 'θ', 'ι', 'κ', 'λ', 'μ', 'ν', 'ξ', 'ο', 'π', 'ρ', 'σ', 'τ', 'υ',
+    'φ', 'χ', 'ψ', 'ω', '∂', 'ε', 'θ', 'κ', 'φ', 'ρ', 'π', 'α', 'β', 'γ', 'δ',
+    'ε', 'ζ', 'η', 'θ', 'ι', 'κ', 'λ', 'μ', 'ν', 'ξ', 'ο', 'π', 'ρ', 'θ', 'σ',
+    'τ', 'υ', 'φ', 'χ', 'ψ', 'ω', '∇', 'α', 'β', 'γ', 'δ', 'ε', 'ζ', 'η', 'θ',
+    'ι', 'κ', 'λ', 'μ', 'ν', 'ξ', 'ο', 'π', 'ρ', 'σ', 'τ', 'υ', 'φ', 'χ', 'ψ',
+    'ω', '∂', 'ε', 'θ', 'κ', 'φ', 'ρ', 'π', 'α', 'β', 'γ', 'δ', 'ε', 'ζ', 'η',
+    'θ', 'ι', 'κ', 'λ', 'μ', 'ν', 'ξ', 'ο', 'π', 'ρ', 'θ', 'σ', 'τ', 'υ', 'φ',
+    'χ', 'ψ', 'ω', '∇', 'α', 'β', 'γ', 'δ', 'ε', 'ζ', 'η', 'θ', 'ι', 'κ', 'λ',
+    'μ', 'ν', 'ξ', 'ο', 'π', 'ρ', 'σ', 'τ', 'υ', 'φ', 'χ', 'ψ', 'ω', '∂', 'ε',
+    'θ', 'κ', 'φ', 'ρ', 'π', 'α', 'β', 'γ', 'δ', 'ε', 'ζ', 'η', 'θ', 'ι', 'κ',
+    'λ', 'μ', 'ν', 'ξ', 'ο', 'π', 'ρ', 'θ', 'σ', 'τ', 'υ', 'φ', 'χ', 'ψ', 'ω',
+    '∇', 'α', 'β', 'γ', 'δ', 'ε', 'ζ', 'η', 'θ', 'ι', 'κ', 'λ', 'μ', 'ν', 'ξ',
+    'ο', 'π', 'ρ', 'σ', 'τ', 'υ', 'φ', 'χ', 'ψ', 'ω', '∂', 'ε', 'θ', 'κ', 'φ',
+    'ρ', 'π', 'α', 'β', 'γ', 'δ', 'ε', 'ζ', 'η', 'θ', 'ι', 'κ', 'λ', 'μ', 'ν',
+    'ξ', 'ο', 'π', 'ρ', 'θ', 'σ', 'τ', 'υ', 'φ', 'χ', 'ψ', 'ω', '∇', 'α', 'β',
+    'γ', 'δ', 'ε', 'ζ', 'η', 'θ', 'ι', 'κ', 'λ', 'μ', 'ν', 'ξ', 'ο', 'π', 'ρ',
+    'σ', 'τ', 'υ', 'φ', 'χ', 'ψ', 'ω', '∂', 'ε', 'θ', 'κ', 'φ', 'ρ', 'π', 'ϝ',
+    None, '0', '1', '2', '3', '4', '5', '6', '7', '8', '9', '0', '1', '2', '3',
+    '4', '5', '6', '7', '8', '9', '0', '1', '2', '3', '4', '5', '6', '7', '8',
+    '9', '0', '1', '2', '3', '4', '5', '6', '7', '8', '9', '0', '1', '2', '3',
+    '4', '5', '6', '7', '8', '9', None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, 'а', 'б', 'в', 'г', 'д', 'е', 'ж', 'з', 'и', 'к', 'л', 'м', 'о', 'п',
+    'р', 'с', 'т', 'у', 'ф', 'х', 'ц', 'ч', 'ш', 'ы', 'э', 'ю', 'ꚉ', 'ә', 'і',
+    'ј', 'ө', 'ү', 'ӏ', 'а', 'б', 'в', 'г', 'д', 'е', 'ж', 'з', 'и', 'к', 'л',
+    'о', 'п', 'с', 'у', 'ф', 'х', 'ц', 'ч', 'ш', 'ъ', 'ы', 'ґ', 'і', 'ѕ', 'џ',
+    'ҫ', 'ꙑ', 'ұ', None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, '𞤢', '𞤣', '𞤤', '𞤥',
+    '𞤦', '𞤧', '𞤨', '𞤩', '𞤪', '𞤫', '𞤬', '𞤭', '𞤮', '𞤯', '𞤰', '𞤱', '𞤲', '𞤳', '𞤴',
+    '𞤵', '𞤶', '𞤷', '𞤸', '𞤹', '𞤺', '𞤻', '𞤼', '𞤽', '𞤾', '𞤿', '𞥀', '𞥁', '𞥂', '𞥃',
+    None, None, None, None, None, None, None, None, None, None, 'ا', 'ب', 'ج',
+    'د', None, 'و', 'ز', 'ح', 'ط', 'ي', 'ك', 'ل', 'م', 'ن', 'س', 'ع', 'ف', 'ص',
+    'ق', 'ر', 'ش', 'ت', 'ث', 'خ', 'ذ', 'ض', 'ظ', 'غ', 'ٮ', 'ں', 'ڡ', 'ٯ', None,
+    'ب', 'ج', None, 'ه', None, 'ح', None, 'ي', 'ك', 'ل', 'م', 'ن', 'س', 'ع',
+    'ف', 'ص', 'ق', None, 'ش', 'ت', 'ث', 'خ', None, 'ض', None, 'غ', None, 'ج',
+    None, 'ح', None, 'ي', None, 'ل', None, 'ن', 'س', 'ع', None, 'ص', 'ق', None,
+    'ش', None, 'خ', None, 'ض', None, 'غ', None, 'ں', None, 'ٯ', None, 'ب', 'ج',
+    None, 'ه', None, 'ح', 'ط', 'ي', 'ك', None, 'م', 'ن', 'س', 'ع', 'ف', 'ص',
+    'ق', None, 'ش', 'ت', 'ث', 'خ', None, 'ض', 'ظ', 'غ', 'ٮ', None, 'ڡ', None,
+    'ا', 'ب', 'ج', 'د', 'ه', 'و', 'ز', 'ح', 'ط', 'ي', None, 'ل', 'م', 'ن', 'س',
+    'ع', 'ف', 'ص', 'ق', 'ر', 'ش', 'ت', 'ث', 'خ', 'ذ', 'ض', 'ظ', 'غ', None, 'ب',
+    'ج', 'د', None, 'و', 'ز', 'ح', 'ط', 'ي', None, 'ل', 'م', 'ن', 'س', 'ع',
+    'ف', 'ص', 'ق', 'ر', 'ش', 'ت', 'ث', 'خ', 'ذ', 'ض', 'ظ', 'غ', None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, '0,', '1,', '2,', '3,', '4,', '5,', '6,', '7,', '8,', '9,', None,
+    '(a)', '(b)', '(c)', '(d)', '(e)', '(f)', '(g)', '(h)', '(i)', '(j)',
+    '(k)', '(l)', '(m)', '(n)', '(o)', '(p)', '(q)', '(r)', '(s)', '(t)',
+    '(u)', '(v)', '(w)', '(x)', '(y)', '(z)', '〔s〕', 'c', 'r', 'cd', 'wz',
+    None, 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n',
+    'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z', 'hv', 'mv',
+    'sd', 'ss', 'ppv', 'wc', None, 'mc', 'md', 'mr', None, 'dj', None, None,
+    None, 'ほか', 'ココ', 'サ', None, '手', '字', '双', 'デ', '二', '多', '解', '天', '交',
+    '映', '無', '料', '前', '後', '再', '新', '初', '終', '生', '販', '声', '吹', '演', '投',
+    '捕', '一', '三', '遊', '左', '中', '右', '指', '走', '打', '禁', '空', '合', '満', '有',
+    '月', '申', '割', '営', '配', None, '〔本〕', '〔三〕', '〔二〕', '〔安〕', '〔点〕', '〔打〕',
+    '〔盗〕', '〔勝〕', '〔敗〕', None, '得', '可', None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, None, None, None,
+    None, None, None, None, None, None, None, None, None, '0', '1', '2', '3',
+    '4', '5', '6', '7', '8', '9', None, None, None, None, None, None, None,
+    None, None, None, None, '丽', '丸', '乁', '𠄢', '你', '侮', '侻', '倂', '偺', '備',
+    '僧', '像', '㒞', '𠘺', '免', '兔', '兤', '具', '𠔜', '㒹', '內', '再', '𠕋', '冗', '冤',
+    '仌', '冬', '况', '𩇟', '凵', '刃', '㓟', '刻', '剆', '割', '剷', '㔕', '勇', '勉', '勤',
+    '勺', '包', '匆', '北', '卉', '卑', '博', '即', '卽', '卿', '𠨬', '灰', '及', '叟', '𠭣',
+    '叫', '叱', '吆', '咞', '吸', '呈', '周', '咢', '哶', '唐', '啓', '啣', '善', '喙', '喫',
+    '喳', '嗂', '圖', '嘆', '圗', '噑', '噴', '切', '壮', '城', '埴', '堍', '型', '堲', '報',
+    '墬', '𡓤', '売', '壷', '夆', '多', '夢', '奢', '𡚨', '𡛪', '姬', '娛', '娧', '姘', '婦',
+    '㛮', None, '嬈', '嬾', '𡧈', '寃', '寘', '寧', '寳', '𡬘', '寿', '将', None, '尢',
+    '㞁', '屠', '屮', '峀', '岍', '𡷤', '嵃', '𡷦', '嵮', '嵫', '嵼', '巡', '巢', '㠯', '巽',
+    '帨', '帽', '幩', '㡢', '𢆃', '㡼', '庰', '庳', '庶', '廊', '𪎒', '廾', '𢌱', '舁', '弢',
+    '㣇', '𣊸', '𦇚', '形', '彫', '㣣', '徚', '忍', '志', '忹', '悁', '㤺', '㤜', '悔', '𢛔',
+    '惇', '慈', '慌', '慎', '慌', '慺', '憎', '憲', '憤', '憯', '懞', '懲', '懶', '成', '戛',
+    '扝', '抱', '拔', '捐', '𢬌', '挽', '拼', '捨', '掃', '揤', '𢯱', '搢', '揅', '掩', '㨮',
+    '摩', '摾', '撝', '摷', '㩬', '敏', '敬', '𣀊', '旣', '書', '晉', '㬙', '暑', '㬈', '㫤',
+    '冒', '冕', '最', '暜', '肭', '䏙', '朗', '望', '朡', '杞', '杓', '𣏃', '㭉', '柺', '枅',
+    '桒', '梅', '𣑭', '梎', '栟', '椔', '㮝', '楂', '榣', '槪', '檨', '𣚣', '櫛', '㰘', '次',
+    '𣢧', '歔', '㱎', '歲', '殟', '殺', '殻', '𣪍', '𡴋', '𣫺', '汎', '𣲼', '沿', '泍', '汧',
+    '洖', '派', '海', '流', '浩', '浸', '涅', '𣴞', '洴', '港', '湮', '㴳', '滋', '滇', '𣻑',
+    '淹', '潮', '𣽞', '𣾎', '濆', '瀹', '瀞', '瀛', '㶖', '灊', '災', '灷', '炭', '𠔥', '煅',
+    '𤉣', '熜', None, '爨', '爵', '牐', '𤘈', '犀', '犕', '𤜵', '𤠔', '獺', '王', '㺬', '玥',
+    '㺸', '瑇', '瑜', '瑱', '璅', '瓊', '㼛', '甤', '𤰶', '甾', '𤲒', '異', '𢆟', '瘐', '𤾡',
+    '𤾸', '𥁄', '㿼', '䀈', '直', '𥃳', '𥃲', '𥄙', '𥄳', '眞', '真', '睊', '䀹', '瞋', '䁆',
+    '䂖', '𥐝', '硎', '碌', '磌', '䃣', '𥘦', '祖', '𥚚', '𥛅', '福', '秫', '䄯', '穀', '穊',
+    '穏', '𥥼', '𥪧', None, '䈂', '𥮫', '篆', '築', '䈧', '𥲀', '糒', '䊠', '糨', '糣', '紀',
+    '𥾆', '絣', '䌁', '緇', '縂', '繅', '䌴', '𦈨', '𦉇', '䍙', '𦋙', '罺', '𦌾', '羕', '翺',
+    '者', '𦓚', '𦔣', '聠', '𦖨', '聰', '𣍟', '䏕', '育', '脃', '䐋', '脾', '媵', '𦞧', '𦞵',
+    '𣎓', '𣎜', '舁', '舄', '辞', '䑫', '芑', '芋', '芝', '劳', '花', '芳', '芽', '苦', '𦬼',
+    '若', '茝', '荣', '莭', '茣', '莽', '菧', '著', '荓', '菊', '菌', '菜', '𦰶', '𦵫', '𦳕',
+    '䔫', '蓱', '蓳', '蔖', '𧏊', '蕤', '𦼬', '䕝', '䕡', '𦾱', '𧃒', '䕫', '虐', '虜', '虧',
+    '虩', '蚩', '蚈', '蜎', '蛢', '蝹', '蜨', '蝫', '螆', None, '蟡', '蠁', '䗹', '衠', '衣',
+    '𧙧', '裗', '裞', '䘵', '裺', '㒻', '𧢮', '𧥦', '䚾', '䛇', '誠', '諭', '變', '豕', '𧲨',
+    '貫', '賁', '贛', '起', '𧼯', '𠠄', '跋', '趼', '跰', '𠣞', '軔', '輸', '𨗒', '𨗭', '邔',
+    '郱', '鄑', '𨜮', '鄛', '鈸', '鋗', '鋘', '鉼', '鏹', '鐕', '𨯺', '開', '䦕', '閷', '𨵷',
+    '䧦', '雃', '嶲', '霣', '𩅅', '𩈚', '䩮', '䩶', '韠', '𩐊', '䪲', '𩒖', '頋', '頩', '𩖶',
+    '飢', '䬳', '餩', '馧', '駂', '駾', '䯎', '𩬰', '鬒', '鱀', '鳽', '䳎', '䳭', '鵧', '𪃎',
+    '䳸', '𪄅', '𪈎', '𪊑', '麻', '䵖', '黹', '黾', '鼅', '鼏', '鼖', '鼻', '𪘀', None,
+    None, None, None, None, None, None,
+)  # type: Tuple[Optional[str], ...]
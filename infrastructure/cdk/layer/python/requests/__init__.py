@@ -44,18 +44,13 @@ import urllib3
 
 from .exceptions import RequestsDependencyWarning
 
-try:
-    from charset_normalizer import __version__ as charset_normalizer_version
-except ImportError:
-    charset_normalizer_version = None
 
-try:
-    from chardet import __version__ as chardet_version
-except ImportError:
-    chardet_version = None
+def check_compatibility(urllib3_version, chardet_version, charset_normalizer_version):
+    _check_urllib3_compatibility(urllib3_version)
+    _check_char_detection_version(chardet_version, charset_normalizer_version)
 
 
-def check_compatibility(urllib3_version, chardet_version, charset_normalizer_version):
+def _check_urllib3_compatibility(urllib3_version):
     urllib3_version = urllib3_version.split(".")
     assert urllib3_version != ["dev"]  # Verify urllib3 isn't installed from git.
 
@@ -71,6 +66,8 @@ def check_compatibility(urllib3_version, chardet_version, charset_normalizer_ver
     if major == 1:
         assert minor >= 21
 
+
+def _check_char_detection_version(chardet_version, charset_normalizer_version):
     # Check charset_normalizer for compatibility.
     if chardet_version:
         major, minor, patch = chardet_version.split(".")[:3]
@@ -100,17 +97,30 @@ def _check_cryptography(cryptography_version):
         warnings.warn(warning, RequestsDependencyWarning)
 
 
+def _check_char_detection_compatibility(chardet):
+    # chardet or charset_normalizer is imported on first use by
+    # requests.compat, so it is checked then rather than at import time.
+    chardet_version = charset_normalizer_version = None
+    if chardet.__name__ == "chardet":
+        chardet_version = chardet.__version__
+    else:
+        charset_normalizer_version = chardet.__version__
+    try:
+        _check_char_detection_version(chardet_version, charset_normalizer_version)
+    except (AssertionError, ValueError):
+        warnings.warn(
+            "chardet ({})/charset_normalizer ({}) doesn't match a supported "
+            "version!".format(chardet_version, charset_normalizer_version),
+            RequestsDependencyWarning,
+        )
+
+
 # Check imported dependencies for compatibility.
 try:
-    check_compatibility(
-        urllib3.__version__, chardet_version, charset_normalizer_version
-    )
+    _check_urllib3_compatibility(urllib3.__version__)
 except (AssertionError, ValueError):
     warnings.warn(
-        "urllib3 ({}) or chardet ({})/charset_normalizer ({}) doesn't match a supported "
-        "version!".format(
-            urllib3.__version__, chardet_version, charset_normalizer_version
-        ),
+        "urllib3 ({}) doesn't match a supported version!".format(urllib3.__version__),
         RequestsDependencyWarning,
     )
 
@@ -7,13 +7,55 @@ between Python 2 and Python 3. It remains for backwards
 compatibility until the next major version.
 """
 
-try:
-    import chardet
-except ImportError:
-    import charset_normalizer as chardet
-
+import importlib
+import importlib.util
 import sys
 
+# -------------------
+# Character Detection
+# -------------------
+
+
+def _resolve_char_detection():
+    """Find the name of the installed character detection library."""
+    for lib in ("chardet", "charset_normalizer"):
+        if importlib.util.find_spec(lib) is not None:
+            return lib
+    return None
+
+
+# The library is only imported when an encoding has to be guessed, as its
+# tables take a large share of the time spent importing requests.
+_chardet_name = _resolve_char_detection()
+_chardet = None
+
+
+def _get_chardet():
+    """Import the character detection library on first use and return it."""
+    global _chardet
+    if _chardet is None:
+        if _chardet_name is None:
+            raise ImportError(
+                "You need either charset_normalizer or chardet installed"
+            )
+        module = importlib.import_module(_chardet_name)
+
+        from . import _check_char_detection_compatibility
+        from .packages import _alias_char_detection
+
+        _check_char_detection_compatibility(module)
+        _alias_char_detection(module)
+        _chardet = module
+    return _chardet
+
+
+def __getattr__(name):
+    # Keep ``requests.compat.chardet`` working without importing it eagerly.
+    if name == "chardet":
+        return _get_chardet()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # -------
 # Pythons
 # -------
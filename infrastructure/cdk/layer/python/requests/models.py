@@ -32,9 +32,9 @@ from .compat import (
     Mapping,
     basestring,
     builtin_str,
-    chardet,
     cookielib,
 )
+from .compat import _get_chardet
 from .compat import json as complexjson
 from .compat import urlencode, urlsplit, urlunparse
 from .cookies import _copy_cookie_jar, cookiejar_from_dict, get_cookie_header
@@ -656,6 +656,16 @@ class Response:
         "request",
     ]
 
+    #: Function used by :meth:`json` to parse the body when it is called
+    #: without arguments, in place of ``json.loads``. Set from
+    #: :attr:`Session.json_loads <requests.Session.json_loads>`.
+    json_loads = None
+
+    #: Whether :attr:`apparent_encoding` may guess the encoding of the body
+    #: with chardet or charset_normalizer. Set from
+    #: :attr:`Session.detect_encoding <requests.Session.detect_encoding>`.
+    detect_encoding = True
+
     def __init__(self):
         self._content = False
         self._content_consumed = False
@@ -789,8 +799,13 @@ class Response:
 
     @property
     def apparent_encoding(self):
-        """The apparent encoding, provided by the charset_normalizer or chardet libraries."""
-        return chardet.detect(self.content)["encoding"]
+        """The apparent encoding, provided by the charset_normalizer or chardet libraries.
+
+        ``None`` if :attr:`detect_encoding` is false.
+        """
+        if not self.detect_encoding:
+            return None
+        return _get_chardet().detect(self.content)["encoding"]
 
     def iter_content(self, chunk_size=1, decode_unicode=False):
         """Iterates over the response data.  When stream=True is set on the
@@ -908,7 +923,8 @@ class Response:
         """Content of the response, in unicode.
 
         If Response.encoding is None, encoding will be guessed using
-        ``charset_normalizer`` or ``chardet``.
+        ``charset_normalizer`` or ``chardet``, or UTF-8 will be assumed if
+        :attr:`detect_encoding` is false.
 
         The encoding of the response content is determined based solely on HTTP
         headers, following RFC 2616 to the letter. If you can take advantage of
@@ -944,11 +960,36 @@ class Response:
     def json(self, **kwargs):
         r"""Returns the json-encoded content of a response, if any.
 
+        If :attr:`json_loads` is set and no ``kwargs`` are given, it is used
+        to parse the body instead of ``json.loads``.
+
         :param \*\*kwargs: Optional arguments that ``json.loads`` takes.
         :raises requests.exceptions.JSONDecodeError: If the response body does not
             contain valid json.
         """
 
+        loads = complexjson.loads
+        if self.json_loads is not None and not kwargs:
+            loads = self.json_loads
+
+        content = self.content
+        if (
+            self._is_utf8_json()
+            and content
+            and content[:1] < b"\x80"
+            and b"\x00" not in content[:4]
+        ):
+            # A body starting like UTF-8 JSON, without a BOM or the NULs of
+            # UTF-16/32, can be parsed from bytes without decoding it to
+            # text first.
+            try:
+                return loads(content, **kwargs)
+            except (UnicodeDecodeError, JSONDecodeError):
+                # Not actually UTF-8 (some parsers report that as a
+                # JSONDecodeError) or invalid; the slow way below decodes it
+                # as before and raises the same error for invalid JSON.
+                pass
+
         if not self.encoding and self.content and len(self.content) > 3:
             # No encoding set. JSON RFC 4627 section 3 states we should expect
             # UTF-8, -16 or -32. Detect which one to use; If the detection or
@@ -957,7 +998,7 @@ class Response:
             encoding = guess_json_utf(self.content)
             if encoding is not None:
                 try:
-                    return complexjson.loads(self.content.decode(encoding), **kwargs)
+                    return loads(self.content.decode(encoding), **kwargs)
                 except UnicodeDecodeError:
                     # Wrong UTF codec detected; usually because it's not UTF-8
                     # but some other 8-bit codec.  This is an RFC violation,
@@ -968,12 +1009,24 @@ class Response:
                     raise RequestsJSONDecodeError(e.msg, e.doc, e.pos)
 
         try:
-            return complexjson.loads(self.text, **kwargs)
+            return loads(self.text, **kwargs)
         except JSONDecodeError as e:
             # Catch JSON-related errors and raise as requests.JSONDecodeError
             # This aliases json.JSONDecodeError and simplejson.JSONDecodeError
             raise RequestsJSONDecodeError(e.msg, e.doc, e.pos)
 
+    def _is_utf8_json(self):
+        """Whether the response is declared as JSON in UTF-8 or without a
+        charset, which RFC 8259 says means UTF-8."""
+        content_type = self.headers.get("content-type")
+        if not content_type:
+            return False
+        mimetype = content_type.split(";", 1)[0].strip().lower()
+        if mimetype != "application/json" and not mimetype.endswith("+json"):
+            return False
+        encoding = self.encoding
+        return encoding is None or encoding.lower() in ("utf-8", "utf8")
+
     @property
     def links(self):
         """Returns the parsed header links of the response, if any."""
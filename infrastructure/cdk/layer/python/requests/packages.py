@@ -1,12 +1,9 @@
 import sys
+import warnings
 
-try:
-    import chardet
-except ImportError:
-    import warnings
-
-    import charset_normalizer as chardet
+from .compat import _chardet_name
 
+if _chardet_name == "charset_normalizer":
     warnings.filterwarnings("ignore", "Trying to detect", module="charset_normalizer")
 
 # This code exists for backwards compatibility reasons.
@@ -20,9 +17,25 @@ for package in ("urllib3", "idna"):
         if mod == package or mod.startswith(f"{package}."):
             sys.modules[f"requests.packages.{mod}"] = sys.modules[mod]
 
-target = chardet.__name__
-for mod in list(sys.modules):
-    if mod == target or mod.startswith(f"{target}."):
-        target = target.replace(target, "chardet")
-        sys.modules[f"requests.packages.{target}"] = sys.modules[mod]
+
+def _alias_char_detection(chardet):
+    # Called by requests.compat once it has imported chardet (or
+    # charset_normalizer), which it only does on first use.
+    target = chardet.__name__
+    for mod in list(sys.modules):
+        if mod == target or mod.startswith(f"{target}."):
+            imported_mod = mod.replace(target, "chardet")
+            sys.modules[f"requests.packages.{imported_mod}"] = sys.modules[mod]
+
+
+def __getattr__(name):
+    # ``requests.packages.chardet`` is only aliased on first use; import it
+    # on access until then.
+    if name == "chardet":
+        from .compat import _get_chardet
+
+        return _get_chardet()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Kinda cool, though, right?
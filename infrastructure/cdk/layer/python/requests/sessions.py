@@ -386,6 +386,8 @@ class Session(SessionRedirectMixin):
         "stream",
         "trust_env",
         "max_redirects",
+        "json_loads",
+        "detect_encoding",
     ]
 
     def __init__(self):
@@ -439,6 +441,17 @@ class Session(SessionRedirectMixin):
         #: authentication and similar.
         self.trust_env = True
 
+        #: Function used by :meth:`Response.json() <requests.Response.json>`
+        #: to parse response bodies, such as ``orjson.loads``. It is given
+        #: the body as bytes or str and must raise ``json.JSONDecodeError``
+        #: on invalid input. Defaults to ``json.loads``.
+        self.json_loads = None
+
+        #: Whether responses may guess the encoding of bodies that do not
+        #: declare one with chardet or charset_normalizer. When false the
+        #: library is never imported and such bodies are decoded as UTF-8.
+        self.detect_encoding = True
+
         #: A CookieJar containing all currently outstanding cookies set on this
         #: session. By default it is a
         #: :class:`RequestsCookieJar <requests.cookies.RequestsCookieJar>`, but
@@ -701,6 +714,10 @@ class Session(SessionRedirectMixin):
 
         # Send the request
         r = adapter.send(request, **kwargs)
+        if self.json_loads is not None:
+            r.json_loads = self.json_loads
+        if not self.detect_encoding:
+            r.detect_encoding = False
 
         # Total elapsed time of the request (approximately)
         elapsed = preferred_clock() - start
@@ -6,6 +6,7 @@ import os
 import re
 import socket
 import sys
+import time
 import typing
 import warnings
 from http.client import HTTPConnection as _HTTPConnection
@@ -17,7 +18,7 @@ if typing.TYPE_CHECKING:
     from typing_extensions import Literal
 
     from .response import HTTPResponse
-    from .util.ssl_ import _TYPE_PEER_CERT_RET_DICT
+    from .util.ssl_ import _TYPE_PEER_CERT_RET_DICT, TLSSessionCache
     from .util.ssltransport import SSLTransport
 
 from ._collections import HTTPHeaderDict
@@ -156,6 +157,8 @@ class HTTPConnection(_HTTPConnection):
 
         self._has_connected_to_proxy = False
         self._response_options = None
+        # time.monotonic() of when the current socket was connected.
+        self.connected_at: float | None = None
         self._tunnel_host: str | None = None
         self._tunnel_port: int | None = None
         self._tunnel_scheme: str | None = None
@@ -252,6 +255,7 @@ class HTTPConnection(_HTTPConnection):
         # This is set twice (once above and here) due to forwarding proxies
         # not using tunnelling.
         self._has_connected_to_proxy = bool(self.proxy)
+        self.connected_at = time.monotonic()
 
     @property
     def is_closed(self) -> bool:
@@ -278,6 +282,7 @@ class HTTPConnection(_HTTPConnection):
             self.proxy_is_verified = None
             self._has_connected_to_proxy = False
             self._response_options = None
+            self.connected_at = None
             self._tunnel_host = None
             self._tunnel_port = None
             self._tunnel_scheme = None
@@ -531,6 +536,7 @@ class HTTPSConnection(HTTPConnection):
         cert_file: str | None = None,
         key_file: str | None = None,
         key_password: str | None = None,
+        tls_session_cache: TLSSessionCache | None = None,
     ) -> None:
         super().__init__(
             host,
@@ -564,6 +570,12 @@ class HTTPSConnection(HTTPConnection):
             else:
                 cert_reqs = resolve_cert_reqs(None)
         self.cert_reqs = cert_reqs
+        # Seconds the TLS handshake of the current socket took.
+        self.tls_handshake_duration: float | None = None
+        self.tls_session_cache = tls_session_cache
+        # Whether the current socket resumed a cached TLS session.
+        self.tls_session_reused = False
+        self._tls_session_key: typing.Hashable | None = None
 
     def set_cert(
         self,
@@ -629,6 +641,18 @@ class HTTPSConnection(HTTPConnection):
         if self.server_hostname is not None:
             server_hostname = self.server_hostname
 
+        # Sessions can only be resumed with the context that created them.
+        self._tls_session_key = None
+        tls_session = None
+        if (
+            self.tls_session_cache is not None
+            and self.ssl_context is not None
+            and not tls_in_tls
+        ):
+            port = self._tunnel_port if self._tunnel_host else self.port
+            self._tls_session_key = (server_hostname, port, self.ssl_context)
+            tls_session = self.tls_session_cache.get(self._tls_session_key)
+
         is_time_off = datetime.date.today() < RECENT_DATE
         if is_time_off:
             warnings.warn(
@@ -639,6 +663,7 @@ class HTTPSConnection(HTTPConnection):
                 SystemTimeWarning,
             )
 
+        handshake_start = time.monotonic()
         sock_and_verified = _ssl_wrap_socket_and_match_hostname(
             sock=sock,
             cert_reqs=self.cert_reqs,
@@ -656,6 +681,11 @@ class HTTPSConnection(HTTPConnection):
             tls_in_tls=tls_in_tls,
             assert_hostname=self.assert_hostname,
             assert_fingerprint=self.assert_fingerprint,
+            tls_session=tls_session,
+        )
+        self.tls_handshake_duration = time.monotonic() - handshake_start
+        self.tls_session_reused = bool(
+            getattr(sock_and_verified.socket, "session_reused", False)
         )
         self.sock = sock_and_verified.socket
         self.is_verified = sock_and_verified.is_verified
@@ -664,6 +694,52 @@ class HTTPSConnection(HTTPConnection):
         # This is set twice (once above and here) due to forwarding proxies
         # not using tunnelling.
         self._has_connected_to_proxy = bool(self.proxy)
+        self.connected_at = time.monotonic()
+
+    @property
+    def is_connected(self) -> bool:
+        if self.sock is None:
+            return False
+        if not wait_for_read(self.sock, timeout=0.0):
+            return True
+        # TLS 1.3 servers send session tickets after the handshake, which
+        # makes a connection that was opened but never used readable. Read
+        # them to tell such a connection apart from one that was closed.
+        return self._read_post_handshake_messages()
+
+    def save_tls_session(self) -> None:
+        """Store the current TLS session for resumption by new connections."""
+        if (
+            self._tls_session_key is not None
+            and self.tls_session_cache is not None
+            and ssl is not None
+            and isinstance(self.sock, ssl.SSLSocket)
+        ):
+            self.tls_session_cache.save(self._tls_session_key, self.sock)
+
+    def close(self) -> None:
+        # Connections closed after a response, e.g. to "Connection: close",
+        # never return to the pool, so save their session here.
+        self.save_tls_session()
+        super().close()
+
+    def _read_post_handshake_messages(self) -> bool:
+        sock = self.sock
+        if ssl is None or not isinstance(sock, ssl.SSLSocket):
+            return False
+        timeout = sock.gettimeout()
+        sock.settimeout(0.0)
+        try:
+            # Application data or EOF on an idle connection means it can't
+            # be used for a new request either way.
+            sock.recv(1)
+        except ssl.SSLWantReadError:
+            return True
+        except OSError:
+            pass
+        finally:
+            sock.settimeout(timeout)
+        return False
 
     def _connect_tls_proxy(self, hostname: str, sock: socket.socket) -> ssl.SSLSocket:
         """
@@ -723,6 +799,7 @@ def _ssl_wrap_socket_and_match_hostname(
     server_hostname: str | None,
     ssl_context: ssl.SSLContext | None,
     tls_in_tls: bool = False,
+    tls_session: ssl.SSLSession | None = None,
 ) -> _WrappedAndVerifiedSocket:
     """Logic for constructing an SSLContext from all TLS parameters, passing
     that down into ssl_wrap_socket, and then doing certificate verification
@@ -791,6 +868,7 @@ def _ssl_wrap_socket_and_match_hostname(
         server_hostname=server_hostname,
         ssl_context=context,
         tls_in_tls=tls_in_tls,
+        tls_session=tls_session,
     )
 
     try:
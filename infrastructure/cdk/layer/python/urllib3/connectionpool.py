@@ -4,6 +4,7 @@ import errno
 import logging
 import queue
 import sys
+import time
 import typing
 import warnings
 import weakref
@@ -57,6 +58,7 @@ if typing.TYPE_CHECKING:
     from typing_extensions import Literal
 
     from ._base_connection import BaseHTTPConnection, BaseHTTPSConnection
+    from .util.metrics import PoolMetrics
 
 log = logging.getLogger(__name__)
 
@@ -166,6 +168,10 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         A dictionary with proxy headers, should not be used directly,
         instead, see :class:`urllib3.ProxyManager`
 
+    :param metrics:
+        A :class:`urllib3.util.PoolMetrics` told about connection checkouts,
+        new connections, discards and TLS handshakes of this pool.
+
     :param \\**conn_kw:
         Additional parameters are used to create fresh :class:`urllib3.connection.HTTPConnection`,
         :class:`urllib3.connection.HTTPSConnection` instances.
@@ -188,6 +194,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         _proxy: Url | None = None,
         _proxy_headers: typing.Mapping[str, str] | None = None,
         _proxy_config: ProxyConfig | None = None,
+        metrics: PoolMetrics | None = None,
         **conn_kw: typing.Any,
     ):
         ConnectionPool.__init__(self, host, port)
@@ -216,6 +223,8 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         # These are mostly for testing and debugging purposes.
         self.num_connections = 0
         self.num_requests = 0
+        self.num_connection_reuses = 0
+        self.metrics = metrics
         self.conn_kw = conn_kw
 
         if self.proxy:
@@ -274,6 +283,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         if self.pool is None:
             raise ClosedPoolError(self, "Pool is closed.")
 
+        wait_start = time.monotonic()
         try:
             conn = self.pool.get(block=self.block, timeout=timeout)
 
@@ -288,12 +298,37 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 ) from None
             pass  # Oh well, we'll create a new connection then
 
+        finally:
+            if self.metrics is not None:
+                self.metrics.on_pool_wait(self, time.monotonic() - wait_start)
+
         # If this is a persistent connection, check if it got disconnected
         if conn and is_connection_dropped(conn):
             log.debug("Resetting dropped connection: %s", self.host)
             conn.close()
 
-        return conn or self._new_conn()
+        if conn is None:
+            return self._new_pooled_conn()
+        self._record_reconnection(conn)
+        return conn
+
+    def _new_pooled_conn(self) -> BaseHTTPConnection:
+        conn = self._new_conn()
+        if self.metrics is not None:
+            self.metrics.on_new_connection(self)
+        return conn
+
+    def _record_reconnection(self, conn: BaseHTTPConnection) -> None:
+        # A closed pooled connection is connected again before its next use.
+        if self.metrics is not None and conn.is_closed:
+            self.metrics.on_reconnection(self)
+
+    def _record_tls_handshake(self, conn: BaseHTTPConnection) -> None:
+        duration = getattr(conn, "tls_handshake_duration", None)
+        if self.metrics is not None and duration is not None:
+            self.metrics.on_tls_handshake(self, duration)
+            if getattr(conn, "tls_session_reused", False):
+                self.metrics.on_tls_session_resumed(self)
 
     def _put_conn(self, conn: BaseHTTPConnection | None) -> None:
         """
@@ -320,6 +355,8 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 # Connection never got put back into the pool, close it.
                 if conn:
                     conn.close()
+                if self.metrics is not None:
+                    self.metrics.on_connection_discarded(self)
 
                 if self.block:
                     # This should never happen if you got the conn from self._get_conn
@@ -338,6 +375,97 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         if conn:
             conn.close()
 
+    def prewarm(self, count: int) -> int:
+        """
+        Open connections ahead of the first requests and keep them in the pool.
+
+        Up to ``count`` pooled connections (and never more than the pool's
+        ``maxsize``) are made sure to be connected, so that the requests that
+        later pick them up skip DNS resolution and the TCP and TLS handshakes.
+
+        :param count:
+            Number of connections the pool should hold open.
+
+        :return:
+            Number of connections that were newly opened.
+        """
+        if self.pool is None:
+            raise ClosedPoolError(self, "Pool is closed.")
+
+        http_tunnel_required = connection_requires_http_tunnel(
+            self.proxy, self.proxy_config, self.scheme
+        )
+        conns = []
+        opened = 0
+        try:
+            while len(conns) < count:
+                try:
+                    conn = self.pool.get(block=False)
+                except queue.Empty:
+                    break
+                if conn is None:
+                    conn = self._new_pooled_conn()
+                else:
+                    if is_connection_dropped(conn):
+                        conn.close()
+                    self._record_reconnection(conn)
+                conns.append(conn)
+                if not conn.is_closed:
+                    continue
+                conn.timeout = self.timeout.connect_timeout  # type: ignore[assignment]
+                try:
+                    if self.proxy is not None and http_tunnel_required:
+                        self._prepare_proxy(conn)
+                    else:
+                        conn.connect()
+                        self._record_tls_handshake(conn)
+                    self._validate_conn(conn)
+                except (BaseSSLError, CertificateError) as e:
+                    conn.close()
+                    raise SSLError(e) from e
+                except Exception:
+                    conn.close()
+                    raise
+                opened += 1
+        finally:
+            for conn in conns:
+                self._put_conn(conn)
+
+        log.debug(
+            "Prewarmed %d new connection(s) to %s:%s", opened, self.host, self.port
+        )
+        return opened
+
+    def connection_stats(self) -> dict[str, typing.Any]:
+        """
+        Return connection reuse and age statistics for this pool.
+
+        ``idle_connection_ages`` lists how many seconds ago each connection
+        currently waiting in the pool was connected, oldest first.
+        """
+        now = time.monotonic()
+        idle_ages = []
+        if self.pool is not None:
+            with self.pool.mutex:
+                idle = list(self.pool.queue)
+            for conn in idle:
+                connected_at = getattr(conn, "connected_at", None)
+                if connected_at is not None and not conn.is_closed:
+                    idle_ages.append(now - connected_at)
+        idle_ages.sort(reverse=True)
+        return {
+            "num_connections": self.num_connections,
+            "num_requests": self.num_requests,
+            "num_connection_reuses": self.num_connection_reuses,
+            "reuse_ratio": (
+                self.num_connection_reuses / self.num_requests
+                if self.num_requests
+                else 0.0
+            ),
+            "idle_connections": len(idle_ages),
+            "idle_connection_ages": idle_ages,
+        }
+
     def _validate_conn(self, conn: BaseHTTPConnection) -> None:
         """
         Called right before a request is made, after the socket is created.
@@ -768,6 +896,11 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
             # Request a connection from the queue.
             timeout_obj = self._get_timeout(timeout)
             conn = self._get_conn(timeout=pool_timeout)
+            reused = not conn.is_closed
+            if reused:
+                self.num_connection_reuses += 1
+            if self.metrics is not None:
+                self.metrics.on_request(self, reused)
 
             conn.timeout = timeout_obj.connect_timeout  # type: ignore[assignment]
 
@@ -1044,6 +1177,7 @@ class HTTPSConnectionPool(HTTPConnectionPool):
             headers=self.proxy_headers,
         )
         conn.connect()
+        self._record_tls_handshake(conn)
 
     def _new_conn(self) -> BaseHTTPSConnection:
         """
@@ -1086,6 +1220,14 @@ class HTTPSConnectionPool(HTTPConnectionPool):
             **self.conn_kw,
         )
 
+    def _put_conn(self, conn: BaseHTTPConnection | None) -> None:
+        # The session is saved once a response was read, as TLS 1.3 servers
+        # send the tickets that make it resumable after the handshake.
+        save_tls_session = getattr(conn, "save_tls_session", None)
+        if save_tls_session is not None:
+            save_tls_session()
+        super()._put_conn(conn)
+
     def _validate_conn(self, conn: BaseHTTPConnection) -> None:
         """
         Called right before a request is made, after the socket is created.
@@ -1095,6 +1237,7 @@ class HTTPSConnectionPool(HTTPConnectionPool):
         # Force connect early to allow us to validate the connection.
         if conn.is_closed:
             conn.connect()
+            self._record_tls_handshake(conn)
 
         if not conn.is_verified:
             warnings.warn(
@@ -29,6 +29,9 @@ if typing.TYPE_CHECKING:
 
     from typing_extensions import Literal
 
+    from .util.metrics import PoolMetrics
+    from .util.ssl_ import TLSSessionCache
+
 __all__ = ["PoolManager", "ProxyManager", "proxy_from_url"]
 
 
@@ -46,6 +49,7 @@ SSL_KEYWORDS = (
     "ssl_context",
     "key_password",
     "server_hostname",
+    "tls_session_cache",
 )
 # Default value for `blocksize` - a new parameter introduced to
 # http.client.HTTPConnection & http.client.HTTPSConnection in Python 3.7
@@ -90,6 +94,8 @@ class PoolKey(typing.NamedTuple):
     key_assert_fingerprint: str | None
     key_server_hostname: str | None
     key_blocksize: int | None
+    key_metrics: PoolMetrics | None
+    key_tls_session_cache: TLSSessionCache | None
 
 
 def _default_key_normalizer(
@@ -176,6 +182,12 @@ class PoolManager(RequestMethods):
         Additional parameters are used to create fresh
         :class:`urllib3.connectionpool.ConnectionPool` instances.
 
+        When ``tls_session_cache`` is a :class:`urllib3.util.TLSSessionCache`
+        and the pools are also given an ``ssl_context``, new connections of
+        the manager's HTTPS pools resume the TLS session of an earlier
+        connection to the same host. Without it every connection does a
+        full handshake.
+
     Example:
 
     .. code-block:: python
@@ -273,6 +285,16 @@ class PoolManager(RequestMethods):
         """
         self.pools.clear()
 
+    def connection_stats(self) -> dict[str, dict[str, typing.Any]]:
+        """
+        Return :meth:`urllib3.connectionpool.HTTPConnectionPool.connection_stats`
+        of every pool, keyed by the pool's ``scheme://host:port``.
+        """
+        return {
+            f"{pool.scheme}://{pool.host}:{pool.port}": pool.connection_stats()
+            for pool in self.pools.values()
+        }
+
     def connection_from_host(
         self,
         host: str | None,
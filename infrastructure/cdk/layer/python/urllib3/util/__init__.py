@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from .connection import is_connection_dropped
+from .metrics import Histogram, PoolMetrics, PoolStatistics
 from .request import SKIP_HEADER, SKIPPABLE_HEADERS, make_headers
 from .response import is_fp_closed
 from .retry import Retry
@@ -10,6 +11,7 @@ from .ssl_ import (
     IS_PYOPENSSL,
     IS_SECURETRANSPORT,
     SSLContext,
+    TLSSessionCache,
     assert_fingerprint,
     create_urllib3_context,
     resolve_cert_reqs,
@@ -25,6 +27,10 @@ __all__ = (
     "IS_SECURETRANSPORT",
     "SSLContext",
     "ALPN_PROTOCOLS",
+    "TLSSessionCache",
+    "Histogram",
+    "PoolMetrics",
+    "PoolStatistics",
     "Retry",
     "Timeout",
     "Url",
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import typing
+
+if typing.TYPE_CHECKING:
+    from ..connectionpool import ConnectionPool
+
+
+class PoolMetrics:
+    """Receiver of connection pool events.
+
+    Pass an instance as ``metrics`` to a connection pool or a
+    :class:`~urllib3.PoolManager` to be told about every connection checkout,
+    connection, reconnection, TLS handshake and discard of its pools. The
+    methods do nothing; override the ones of interest to export the events
+    to a monitoring system, or use :class:`PoolStatistics` to aggregate them
+    in memory.
+
+    The methods are called on the thread using the pool, while it is
+    sending a request, so they should return quickly.
+    """
+
+    def on_pool_wait(self, pool: ConnectionPool, duration: float) -> None:
+        """Called with the seconds spent waiting to take a connection out of
+        the pool's queue."""
+
+    def on_new_connection(self, pool: ConnectionPool) -> None:
+        """Called when the pool creates a connection because none was idle."""
+
+    def on_reconnection(self, pool: ConnectionPool) -> None:
+        """Called when a pooled connection that is closed, e.g. because the
+        server dropped it while it was idle, is taken out of the pool to be
+        connected again."""
+
+    def on_connection_discarded(self, pool: ConnectionPool) -> None:
+        """Called when a connection is closed instead of being returned to a
+        pool that is already full. Frequent discards mean ``maxsize`` is too
+        small for the pool's concurrency."""
+
+    def on_tls_handshake(self, pool: ConnectionPool, duration: float) -> None:
+        """Called with the seconds a new connection's TLS handshake took."""
+
+    def on_tls_session_resumed(self, pool: ConnectionPool) -> None:
+        """Called after :meth:`on_tls_handshake` when the handshake resumed
+        an earlier connection's TLS session."""
+
+    def on_request(self, pool: ConnectionPool, reused: bool) -> None:
+        """Called for every request, with whether it was sent on a connection
+        that was already open."""
+
+
+class Histogram:
+    """A thread-safe histogram with fixed bucket upper bounds, in seconds."""
+
+    DEFAULT_BOUNDS = (
+        0.0001,
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    )
+
+    def __init__(self, bounds: typing.Sequence[float] = DEFAULT_BOUNDS) -> None:
+        self.bounds = tuple(bounds)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            # The last bucket counts the values above the highest bound.
+            self._buckets = [0] * (len(self.bounds) + 1)
+            self._count = 0
+            self._sum = 0.0
+            self._max = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self._buckets[index] += 1
+            self._count += 1
+            self._sum += value
+            if value > self._max:
+                self._max = value
+
+    def snapshot(self) -> dict[str, typing.Any]:
+        with self._lock:
+            return {
+                "count": self._count,
+                "sum": self._sum,
+                "max": self._max,
+                "mean": self._sum / self._count if self._count else 0.0,
+                "buckets": dict(
+                    zip(self.bounds + (float("inf"),), self._buckets)
+                ),
+            }
+
+
+class PoolStatistics(PoolMetrics):
+    """Aggregates the events of all the pools it is given to in memory.
+
+    .. code-block:: python
+
+        import urllib3
+
+        stats = urllib3.util.PoolStatistics()
+        http = urllib3.PoolManager(maxsize=10, metrics=stats)
+        ...
+        print(stats.snapshot()["reuse_ratio"])
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.pool_wait = Histogram()
+        self.tls_handshake = Histogram()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters = {
+                "requests": 0,
+                "reused_requests": 0,
+                "new_connections": 0,
+                "reconnections": 0,
+                "discarded_connections": 0,
+                "resumed_tls_sessions": 0,
+            }
+        self.pool_wait.reset()
+        self.tls_handshake.reset()
+
+    def _increment(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def on_pool_wait(self, pool: ConnectionPool, duration: float) -> None:
+        self.pool_wait.observe(duration)
+
+    def on_new_connection(self, pool: ConnectionPool) -> None:
+        self._increment("new_connections")
+
+    def on_reconnection(self, pool: ConnectionPool) -> None:
+        self._increment("reconnections")
+
+    def on_connection_discarded(self, pool: ConnectionPool) -> None:
+        self._increment("discarded_connections")
+
+    def on_tls_handshake(self, pool: ConnectionPool, duration: float) -> None:
+        self.tls_handshake.observe(duration)
+
+    def on_tls_session_resumed(self, pool: ConnectionPool) -> None:
+        self._increment("resumed_tls_sessions")
+
+    def on_request(self, pool: ConnectionPool, reused: bool) -> None:
+        with self._lock:
+            self._counters["requests"] += 1
+            if reused:
+                self._counters["reused_requests"] += 1
+
+    def snapshot(self) -> dict[str, typing.Any]:
+        """Return the counters, the reuse ratio and the histograms."""
+        with self._lock:
+            snapshot: dict[str, typing.Any] = dict(self._counters)
+        requests = snapshot["requests"]
+        snapshot["reuse_ratio"] = (
+            snapshot["reused_requests"] / requests if requests else 0.0
+        )
+        snapshot["pool_wait"] = self.pool_wait.snapshot()
+        snapshot["tls_handshake"] = self.tls_handshake.snapshot()
+        return snapshot
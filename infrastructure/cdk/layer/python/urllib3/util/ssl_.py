@@ -4,9 +4,11 @@ import hmac
 import os
 import socket
 import sys
+import threading
 import typing
 import warnings
 from binascii import unhexlify
+from collections import OrderedDict
 from hashlib import md5, sha1, sha256
 
 from ..exceptions import ProxySchemeUnsupported, SSLError
@@ -372,6 +374,7 @@ def ssl_wrap_socket(
     key_password: str | None = ...,
     ca_cert_data: None | str | bytes = ...,
     tls_in_tls: Literal[False] = ...,
+    tls_session: ssl.SSLSession | None = ...,
 ) -> ssl.SSLSocket:
     ...
 
@@ -391,6 +394,7 @@ def ssl_wrap_socket(
     key_password: str | None = ...,
     ca_cert_data: None | str | bytes = ...,
     tls_in_tls: bool = ...,
+    tls_session: ssl.SSLSession | None = ...,
 ) -> ssl.SSLSocket | SSLTransportType:
     ...
 
@@ -409,6 +413,7 @@ def ssl_wrap_socket(
     key_password: str | None = None,
     ca_cert_data: None | str | bytes = None,
     tls_in_tls: bool = False,
+    tls_session: ssl.SSLSession | None = None,
 ) -> ssl.SSLSocket | SSLTransportType:
     """
     All arguments except for server_hostname, ssl_context, tls_in_tls, ca_cert_data and
@@ -434,6 +439,10 @@ def ssl_wrap_socket(
         passing as the cadata parameter to SSLContext.load_verify_locations()
     :param tls_in_tls:
         Use SSLTransport to wrap the existing socket.
+    :param tls_session:
+        A session of an earlier connection made with the same ``ssl_context``
+        to resume instead of doing a full handshake. Ignored with
+        ``tls_in_tls``.
     """
     context = ssl_context
     if context is None:
@@ -468,7 +477,9 @@ def ssl_wrap_socket(
     except NotImplementedError:  # Defensive: in CI, we always have set_alpn_protocols
         pass
 
-    ssl_sock = _ssl_wrap_socket_impl(sock, context, tls_in_tls, server_hostname)
+    ssl_sock = _ssl_wrap_socket_impl(
+        sock, context, tls_in_tls, server_hostname, tls_session
+    )
     return ssl_sock
 
 
@@ -501,6 +512,7 @@ def _ssl_wrap_socket_impl(
     ssl_context: ssl.SSLContext,
     tls_in_tls: bool,
     server_hostname: str | None = None,
+    tls_session: ssl.SSLSession | None = None,
 ) -> ssl.SSLSocket | SSLTransportType:
     if tls_in_tls:
         if not SSLTransport:
@@ -512,4 +524,55 @@ def _ssl_wrap_socket_impl(
         SSLTransport._validate_ssl_context_for_tls_in_tls(ssl_context)
         return SSLTransport(sock, ssl_context, server_hostname)
 
+    if tls_session is not None:
+        return ssl_context.wrap_socket(
+            sock, server_hostname=server_hostname, session=tls_session
+        )
     return ssl_context.wrap_socket(sock, server_hostname=server_hostname)
+
+
+class TLSSessionCache:
+    """
+    A thread-safe cache of the most recent TLS session of each host, used to
+    resume sessions on new connections instead of doing full handshakes.
+
+    Sessions can only be resumed with the :class:`ssl.SSLContext` that
+    created them, so connections only use the cache when they are given an
+    ``ssl_context`` to share.
+
+    :param maxsize:
+        Maximum number of hosts to keep a session for, evicting the least
+        recently used ones beyond that.
+    """
+
+    def __init__(self, maxsize: int = 100) -> None:
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._sessions: OrderedDict[typing.Hashable, ssl.SSLSession]
+        self._sessions = OrderedDict()
+
+    def get(self, key: typing.Hashable) -> ssl.SSLSession | None:
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions.move_to_end(key)
+            return session
+
+    def save(self, key: typing.Hashable, sock: ssl.SSLSocket) -> None:
+        """Store the session of ``sock`` if it can be resumed."""
+        session = sock.session
+        # A TLS 1.3 session only becomes resumable once the server's
+        # session ticket has been read, after the handshake.
+        if session is None or (
+            not session.has_ticket and sock.version() == "TLSv1.3"
+        ):
+            return
+        with self._lock:
+            self._sessions[key] = session
+            self._sessions.move_to_end(key)
+            while len(self._sessions) > self.maxsize:
+                self._sessions.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
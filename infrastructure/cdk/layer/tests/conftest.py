@@ -0,0 +1,135 @@
+"""Tests for the changes made to the packages vendored in this layer.
+
+They import the packages from ``../python`` rather than from the running
+interpreter, so run them with ``python -m pytest infrastructure/cdk/layer/tests``.
+"""
+import http.server
+import os
+import shutil
+import subprocess
+import sys
+import threading
+
+import pytest
+
+LAYER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'python'
+)
+sys.path.insert(0, LAYER_PATH)
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self._respond(b'ok')
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self._respond(b'{}')
+
+    def _respond(self, body):
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        if self.path == '/close':
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalServer(http.server.ThreadingHTTPServer):
+    """Answers GET requests with ``ok`` and POST requests with ``{}``.
+
+    It counts the connections it accepts, serves them over TLS if given a
+    context and closes them after a response to ``/close`` or once they are
+    idle for ``idle_timeout`` seconds.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, ssl_context=None, idle_timeout=None):
+        super().__init__(('127.0.0.1', 0), _Handler)
+        self.idle_timeout = idle_timeout
+        self._connections = 0
+        self._accepted = threading.Condition()
+        self.port = self.server_address[1]
+        if ssl_context is not None:
+            self.socket = ssl_context.wrap_socket(
+                self.socket, server_side=True
+            )
+
+    def get_request(self):
+        request = super().get_request()
+        request[0].settimeout(self.idle_timeout)
+        with self._accepted:
+            self._connections += 1
+            self._accepted.notify_all()
+        return request
+
+    def connections(self, expected=None, timeout=5):
+        """Return the number of accepted connections.
+
+        Connecting clients don't wait for the server to accept them, so
+        first wait up to ``timeout`` seconds for ``expected`` of them.
+        """
+        with self._accepted:
+            if expected is not None:
+                self._accepted.wait_for(
+                    lambda: self._connections >= expected, timeout
+                )
+            return self._connections
+
+
+@pytest.fixture
+def serve():
+    """Start a :class:`LocalServer` until the end of the test."""
+    servers = []
+
+    def serve(ssl_context=None, idle_timeout=None):
+        server = LocalServer(ssl_context, idle_timeout)
+        threading.Thread(
+            target=server.serve_forever, args=(0.05,), daemon=True
+        ).start()
+        servers.append(server)
+        return server
+
+    yield serve
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(scope='session')
+def tls_cert(tmp_path_factory):
+    """A self-signed certificate and key for ``localhost`` and 127.0.0.1."""
+    if shutil.which('openssl') is None:
+        pytest.skip('openssl is needed to create a test certificate')
+    directory = tmp_path_factory.mktemp('tls')
+    cert = str(directory / 'cert.pem')
+    key = str(directory / 'key.pem')
+    subprocess.run(
+        [
+            'openssl',
+            'req',
+            '-x509',
+            '-newkey',
+            'rsa:2048',
+            '-nodes',
+            '-days',
+            '1',
+            '-subj',
+            '/CN=localhost',
+            '-addext',
+            'subjectAltName=DNS:localhost,IP:127.0.0.1',
+            '-keyout',
+            key,
+            '-out',
+            cert,
+        ],
+        capture_output=True,
+        check=True,
+    )
+    return cert, key
@@ -0,0 +1,124 @@
+"""BatchReader chunks keys, resends unprocessed keys and stops early."""
+import threading
+
+import pytest
+
+from boto3.dynamodb import table
+from boto3.dynamodb.table import BatchReader
+
+
+def _keys(count):
+    return [{'pk': str(i)} for i in range(count)]
+
+
+class FakeClient:
+    def __init__(self, unprocessed=(), fail_on=None):
+        self.calls = []
+        self._lock = threading.Lock()
+        # Number of leading keys returned as unprocessed by each request.
+        self._unprocessed = list(unprocessed)
+        self._fail_on = fail_on
+
+    def batch_get_item(self, RequestItems):
+        request = RequestItems['table']
+        keys = request['Keys']
+        with self._lock:
+            self.calls.append(request)
+            count = self._unprocessed.pop(0) if self._unprocessed else 0
+            unprocessed = keys[:count]
+        if self._fail_on in keys:
+            raise RuntimeError('throttled')
+        items = [dict(key) for key in keys[len(unprocessed) :]]
+        response = {'Responses': {'table': items}}
+        if unprocessed:
+            response['UnprocessedKeys'] = {
+                'table': dict(request, Keys=unprocessed)
+            }
+        return response
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+
+    class FakeTime:
+        @staticmethod
+        def sleep(delay):
+            delays.append(delay)
+
+    monkeypatch.setattr(table, 'time', FakeTime)
+    monkeypatch.setattr(table.random, 'uniform', lambda low, high: high)
+    return delays
+
+
+def test_keys_are_split_into_batches_of_100(sleeps):
+    client = FakeClient()
+    keys = _keys(250)
+
+    items = list(BatchReader('table', client, keys))
+
+    assert sorted(len(call['Keys']) for call in client.calls) == [50, 100, 100]
+    assert sorted(item['pk'] for item in items) == sorted(
+        key['pk'] for key in keys
+    )
+    assert not sleeps
+
+
+def test_unprocessed_keys_are_resent_with_backoff(sleeps):
+    client = FakeClient(unprocessed=[40, 20, 10])
+    keys = _keys(100)
+
+    items = list(BatchReader('table', client, keys))
+
+    assert [len(call['Keys']) for call in client.calls] == [100, 40, 20, 10]
+    assert [call['Keys'] for call in client.calls[1:]] == [
+        keys[:40],
+        keys[:20],
+        keys[:10],
+    ]
+    assert sorted(item['pk'] for item in items) == sorted(
+        key['pk'] for key in keys
+    )
+    base = table.UNPROCESSED_BACKOFF_BASE
+    assert sleeps == [base * 2, base * 4, base * 8]
+
+
+def test_request_parameters_are_passed_through(sleeps):
+    client = FakeClient(unprocessed=[5])
+
+    list(
+        BatchReader(
+            'table',
+            client,
+            _keys(150),
+            max_concurrency=1,
+            ConsistentRead=True,
+            ProjectionExpression='#pk',
+            ExpressionAttributeNames={'#pk': 'pk'},
+        )
+    )
+
+    assert len(client.calls) == 3
+    for call in client.calls:
+        assert call['ConsistentRead'] is True
+        assert call['ProjectionExpression'] == '#pk'
+        assert call['ExpressionAttributeNames'] == {'#pk': 'pk'}
+
+
+def test_early_break_sends_no_more_requests(sleeps):
+    client = FakeClient()
+
+    for _ in BatchReader('table', client, _keys(1000), max_concurrency=2):
+        break
+
+    # Requests not yet sent when the caller stops are cancelled.
+    assert len(client.calls) <= 2
+
+
+def test_batch_error_propagates(sleeps):
+    client = FakeClient(fail_on={'pk': '250'})
+
+    with pytest.raises(RuntimeError, match='throttled'):
+        list(BatchReader('table', client, _keys(1000), max_concurrency=1))
+
+    assert len(client.calls) == 3
@@ -0,0 +1,165 @@
+"""Concurrent BatchWriter flushes requeue unprocessed items correctly."""
+from concurrent.futures import Future
+
+import pytest
+
+from boto3.dynamodb import table
+from boto3.dynamodb.table import BatchWriter
+
+
+class DeferredExecutor:
+    """Runs submitted batches only once ``run`` is called, then at once."""
+
+    def __init__(self, max_workers):
+        self.pending = []
+        self.immediate = False
+
+    def submit(self, func, *args):
+        future = Future()
+        self.pending.append((future, func, args))
+        if self.immediate:
+            self.run()
+        return future
+
+    def run(self):
+        self.immediate = True
+        while self.pending:
+            future, func, args = self.pending.pop(0)
+            try:
+                future.set_result(func(*args))
+            except Exception as e:
+                future.set_exception(e)
+
+    def shutdown(self, wait=True):
+        self.run()
+
+
+@pytest.fixture
+def executors(monkeypatch):
+    created = []
+
+    def _executor(max_workers):
+        executor = DeferredExecutor(max_workers)
+        created.append(executor)
+        return executor
+
+    monkeypatch.setattr(table, 'ThreadPoolExecutor', _executor)
+    monkeypatch.setattr(BatchWriter, '_backoff', lambda self, attempt: None)
+    return created
+
+
+def _put(pk):
+    return _item({'pk': pk})
+
+
+def _item(item):
+    return {'PutRequest': {'Item': dict(item)}}
+
+
+class FakeClient:
+    def __init__(self, unprocessed=None):
+        self.calls = []
+        self.unprocessed = unprocessed or []
+
+    def batch_write_item(self, RequestItems):
+        self.calls.append(RequestItems)
+        if self.unprocessed:
+            unprocessed = self.unprocessed.pop(0)
+            if isinstance(unprocessed, Exception):
+                raise unprocessed
+            return {'UnprocessedItems': {'table': unprocessed}}
+        return {'UnprocessedItems': {}}
+
+    def sent(self):
+        return [
+            request['PutRequest']['Item']
+            for call in self.calls
+            for request in call['table']
+        ]
+
+
+def test_failed_batch_does_not_drop_other_unprocessed_items(executors):
+    client = FakeClient(
+        unprocessed=[
+            [_put('a')],
+            RuntimeError('throttled'),
+            [_put('b'), _put('c')],
+        ]
+    )
+    writer = BatchWriter('table', client, flush_amount=1, max_concurrency=4)
+    for pk in 'axb':
+        writer.put_item(Item={'pk': pk})
+    # All three batches finish before the writer looks at any of them.
+    executors[0].run()
+
+    with pytest.raises(RuntimeError, match='throttled'):
+        writer.__exit__(None, None, None)
+    writer.__exit__(None, None, None)
+
+    assert sorted(item['pk'] for item in client.sent()[3:]) == ['a', 'b', 'c']
+
+
+def test_unprocessed_write_superseded_by_sent_write_is_dropped(executors):
+    old = {'pk': 'a', 'value': 'old'}
+    new = {'pk': 'a', 'value': 'new'}
+    other = {'pk': 'b', 'value': 'old'}
+    client = FakeClient(unprocessed=[[_item(old), _item(other)]])
+    writer = BatchWriter(
+        'table',
+        client,
+        flush_amount=2,
+        overwrite_by_pkeys=['pk'],
+        max_concurrency=2,
+    )
+    with writer:
+        writer.put_item(Item=old)
+        writer.put_item(Item=other)
+        writer.put_item(Item=new)
+        writer.put_item(Item={'pk': 'c'})
+        # The newer write for 'a' is sent before the first batch returns
+        # the older one as unprocessed.
+        executors[0].run()
+
+    assert client.sent() == [old, other, new, {'pk': 'c'}, other]
+
+
+def test_unprocessed_write_superseded_by_buffered_write_is_dropped(
+    executors,
+):
+    old = {'pk': 'a', 'value': 'old'}
+    new = {'pk': 'a', 'value': 'new'}
+    client = FakeClient(unprocessed=[[_item(old)]])
+    writer = BatchWriter(
+        'table',
+        client,
+        flush_amount=2,
+        overwrite_by_pkeys=['pk'],
+        max_concurrency=2,
+    )
+    with writer:
+        writer.put_item(Item=old)
+        writer.put_item(Item={'pk': 'b'})
+        executors[0].run()
+        # The first batch returns the older write while the newer one is
+        # still buffered.
+        writer.put_item(Item=new)
+
+    assert client.sent() == [old, {'pk': 'b'}, new]
+
+
+def test_requeued_items_are_resent(monkeypatch):
+    client = FakeClient(unprocessed=[[_put('1')]])
+    monkeypatch.setattr(BatchWriter, '_backoff', lambda self, attempt: None)
+
+    with BatchWriter(
+        'table', client, flush_amount=2, max_concurrency=2
+    ) as writer:
+        for pk in '0123':
+            writer.put_item(Item={'pk': pk})
+
+    sent = [
+        request['PutRequest']['Item']['pk']
+        for call in client.calls
+        for request in call['table']
+    ]
+    assert sorted(sent) == ['0', '1', '1', '2', '3']
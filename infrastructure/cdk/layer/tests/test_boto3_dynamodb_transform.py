@@ -0,0 +1,152 @@
+"""The planned DynamoDB parameter transforms match the recursive walk."""
+import copy
+from collections import abc
+
+import pytest
+
+import botocore.session
+from boto3.dynamodb.transform import ParameterTransformer
+
+# The shapes boto3 transforms, plus shapes found only inside the recursive
+# AttributeValue shape.
+TARGETS = {
+    'input': [
+        'AttributeValue',
+        'ConditionExpression',
+        'KeyExpression',
+        'NumberAttributeValue',
+        'MapAttributeValue',
+    ],
+    'output': ['AttributeValue', 'StringAttributeValue', 'ListAttributeValue'],
+}
+
+
+def _walk(model, params, transformation, target_shape):
+    # The per-call walk ParameterTransformer used before it planned one.
+    type_name = model.type_name
+    if type_name == 'structure':
+        if not isinstance(params, abc.Mapping):
+            return
+        for param in params:
+            if param in model.members:
+                member_model = model.members[param]
+                if member_model.name == target_shape:
+                    params[param] = transformation(params[param])
+                else:
+                    _walk(
+                        member_model,
+                        params[param],
+                        transformation,
+                        target_shape,
+                    )
+    elif type_name == 'map':
+        if not isinstance(params, abc.Mapping):
+            return
+        for key, value in params.items():
+            if model.value.name == target_shape:
+                params[key] = transformation(value)
+            else:
+                _walk(model.value, params[key], transformation, target_shape)
+    elif type_name == 'list':
+        if not isinstance(params, abc.MutableSequence):
+            return
+        for i, item in enumerate(params):
+            if model.member.name == target_shape:
+                params[i] = transformation(item)
+            else:
+                _walk(model.member, params[i], transformation, target_shape)
+
+
+def _sample(shape, depth=0):
+    # A value for every member of ``shape``, several levels into recursive
+    # shapes such as AttributeValue.
+    type_name = shape.type_name
+    if type_name == 'structure':
+        if depth > 5:
+            return {}
+        value = {
+            name: _sample(member, depth + 1)
+            for name, member in shape.members.items()
+        }
+        value['NotAMember'] = {'S': 'ignored'}
+        return value
+    if type_name == 'list':
+        return [_sample(shape.member, depth + 1) for _ in range(2)]
+    if type_name == 'map':
+        return {f'k{i}': _sample(shape.value, depth + 1) for i in range(2)}
+    return f'{shape.name}@{depth}'
+
+
+def _mangle(value):
+    # The same value with some containers of the wrong type, which both
+    # walks must leave alone.
+    if isinstance(value, dict):
+        items = list(value.items())
+        return {
+            k: (tuple(v) if isinstance(v, list) and i % 3 == 0 else _mangle(v))
+            for i, (k, v) in enumerate(items)
+        }
+    if isinstance(value, list):
+        return [
+            _mangle(v) if i else 'not a mapping' for i, v in enumerate(value)
+        ]
+    return value
+
+
+def _operations():
+    session = botocore.session.get_session()
+    for service_name in ('dynamodb', 'dynamodbstreams'):
+        service_model = session.get_service_model(service_name)
+        for name in service_model.operation_names:
+            yield service_model.operation_model(name)
+
+
+@pytest.mark.parametrize(
+    'operation_model', list(_operations()), ids=lambda op: op.name
+)
+def test_plan_matches_walk(operation_model):
+    transformer = ParameterTransformer()
+    for direction, target_shapes in TARGETS.items():
+        shape = getattr(operation_model, f'{direction}_shape')
+        if shape is None:
+            continue
+        for target_shape in target_shapes:
+            for params in (_sample(shape), _mangle(_sample(shape)), {}):
+                planned, walked = copy.deepcopy(params), copy.deepcopy(params)
+                planned_calls, walked_calls = [], []
+
+                def transformation(calls):
+                    def transform(value):
+                        calls.append(value)
+                        return ('transformed', len(calls))
+
+                    return transform
+
+                transformer.transform(
+                    planned,
+                    shape,
+                    transformation(planned_calls),
+                    target_shape,
+                )
+                _walk(
+                    shape, walked, transformation(walked_calls), target_shape
+                )
+
+                assert planned == walked
+                assert planned_calls == walked_calls
+
+
+def test_recursive_attribute_values_are_transformed_at_every_level():
+    session = botocore.session.get_session()
+    operation_model = session.get_service_model('dynamodb').operation_model(
+        'PutItem'
+    )
+    params = {'TableName': 't', 'Item': {'a': 1, 'b': [2, {'c': 3}]}}
+    ParameterTransformer().transform(
+        params,
+        operation_model.input_shape,
+        lambda v: ('av', v),
+        'AttributeValue',
+    )
+
+    assert params['Item'] == {'a': ('av', 1), 'b': ('av', [2, {'c': 3}])}
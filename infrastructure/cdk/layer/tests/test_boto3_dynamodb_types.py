@@ -0,0 +1,193 @@
+"""TypeSerializer and TypeDeserializer match their per-value dispatch."""
+import collections
+import decimal
+import enum
+import types
+
+import pytest
+
+from boto3.dynamodb.types import (
+    DYNAMODB_CONTEXT,
+    Binary,
+    TypeDeserializer,
+    TypeSerializer,
+)
+
+
+class ReferenceSerializer(TypeSerializer):
+    # TypeSerializer without the type table, cached handlers and int path.
+    def serialize(self, value):
+        dynamodb_type = self._reference_dynamodb_type(value)
+        serializer = getattr(self, f'_serialize_{dynamodb_type}'.lower())
+        return {dynamodb_type: serializer(value)}
+
+    def _reference_dynamodb_type(self, value):
+        if self._is_null(value):
+            return 'NULL'
+        elif self._is_boolean(value):
+            return 'BOOL'
+        elif self._is_number(value):
+            return 'N'
+        elif self._is_string(value):
+            return 'S'
+        elif self._is_binary(value):
+            return 'B'
+        elif self._is_type_set(value, self._is_number):
+            return 'NS'
+        elif self._is_type_set(value, self._is_string):
+            return 'SS'
+        elif self._is_type_set(value, self._is_binary):
+            return 'BS'
+        elif self._is_map(value):
+            return 'M'
+        elif self._is_listlike(value):
+            return 'L'
+        raise TypeError(f'Unsupported type "{type(value)}"')
+
+    def _serialize_n(self, value):
+        number = str(DYNAMODB_CONTEXT.create_decimal(value))
+        if number in ['Infinity', 'NaN']:
+            raise TypeError('Infinity and NaN not supported')
+        return number
+
+
+class ReferenceDeserializer(TypeDeserializer):
+    def deserialize(self, value):
+        if not value:
+            raise TypeError('empty')
+        dynamodb_type = list(value.keys())[0]
+        try:
+            deserializer = getattr(
+                self, f'_deserialize_{dynamodb_type}'.lower()
+            )
+        except AttributeError:
+            raise TypeError(f'Dynamodb type {dynamodb_type} is not supported')
+        return deserializer(value[dynamodb_type])
+
+    def _deserialize_n(self, value):
+        return DYNAMODB_CONTEXT.create_decimal(value)
+
+
+class MyInt(int):
+    pass
+
+
+class Color(enum.IntEnum):
+    RED = 1
+
+
+class MyStr(str):
+    pass
+
+
+class MyDict(dict):
+    pass
+
+
+class MyList(list):
+    pass
+
+
+Point = collections.namedtuple('Point', 'x y')
+
+VALUES = [
+    None,
+    True,
+    False,
+    0,
+    -1,
+    10**38 - 1,
+    -(10**38 - 1),
+    10**38,
+    -(10**38),
+    10**100,
+    MyInt(5),
+    MyInt(10**38),
+    Color.RED,
+    decimal.Decimal('1.5'),
+    decimal.Decimal('1E-130'),
+    decimal.Decimal('1E+126'),
+    decimal.Decimal('1.23456789012345678901234567890123456789'),
+    decimal.Decimal('Infinity'),
+    decimal.Decimal('NaN'),
+    1.5,
+    '',
+    'text',
+    MyStr('sub'),
+    b'\x00bytes',
+    bytearray(b'array'),
+    Binary(b'binary'),
+    {1, 2, decimal.Decimal('3.5')},
+    {'a', 'b'},
+    {b'a', Binary(b'b')},
+    frozenset({1}),
+    set(),
+    {1, 'a'},
+    {1.5},
+    [],
+    [1, 'a', None, [True, {'k': b'v'}]],
+    (1, 2),
+    MyList([1]),
+    Point(1, 2),
+    {'k': {'nested': [{'deep': {1, 2}}]}},
+    MyDict(a=1),
+    collections.OrderedDict(b=2),
+    types.MappingProxyType({'c': 3}),
+    object(),
+    [object()],
+]
+
+
+def _outcome(func, value):
+    # repr() also tells Decimal('1.0') from Decimal('1'), and NaN from NaN.
+    try:
+        return repr(func(value))
+    except Exception as e:
+        return type(e)
+
+
+@pytest.mark.parametrize('value', VALUES, ids=repr)
+def test_serialize_matches_reference(value):
+    assert _outcome(TypeSerializer().serialize, value) == _outcome(
+        ReferenceSerializer().serialize, value
+    )
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        {'NULL': True},
+        {'BOOL': False},
+        {'N': '10'},
+        {'N': '-1.5E-10'},
+        {'N': '1' * 39},
+        {'N': 'not a number'},
+        {'S': 'text'},
+        {'B': b'bytes'},
+        {'NS': ['1', '2.5']},
+        {'SS': ['a']},
+        {'BS': [b'a']},
+        {'L': [{'S': 'a'}, {'M': {'k': {'N': '1'}}}]},
+        {'M': {'k': {'L': [{'NULL': True}]}}},
+        {'X': 'unknown'},
+        {},
+    ],
+    ids=repr,
+)
+def test_deserialize_matches_reference(value):
+    assert _outcome(TypeDeserializer().deserialize, value) == _outcome(
+        ReferenceDeserializer().deserialize, value
+    )
+
+
+def test_subclass_overrides_are_used():
+    class UpperSerializer(TypeSerializer):
+        def _serialize_s(self, value):
+            return value.upper()
+
+    class FloatDeserializer(TypeDeserializer):
+        def _deserialize_n(self, value):
+            return float(value)
+
+    assert UpperSerializer().serialize(['a']) == {'L': [{'S': 'A'}]}
+    assert FloatDeserializer().deserialize({'L': [{'N': '1.5'}]}) == [1.5]
@@ -0,0 +1,79 @@
+"""Stale throttles are detected per request, whichever thread handles them."""
+from unittest import mock
+
+from botocore.awsrequest import create_request_object, prepare_request_dict
+from botocore.retries import adaptive
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def current_time(self):
+        return self.now
+
+
+class FakeThrottlingDetector:
+    def is_throttling_error(self, throttled, **kwargs):
+        return throttled
+
+
+def _limiter(clock):
+    rate_adjustor = mock.Mock()
+    rate_adjustor.error_received.return_value = 10
+    rate_adjustor.success_received.return_value = 10
+    limiter = adaptive.ClientRateLimiter(
+        rate_adjustor=rate_adjustor,
+        rate_clocker=adaptive.RateClocker(clock),
+        token_bucket=mock.Mock(max_rate=10),
+        throttling_detector=FakeThrottlingDetector(),
+        clock=clock,
+        coalesce_throttles=True,
+    )
+    return limiter, rate_adjustor
+
+
+def _request_dict():
+    request_dict = {
+        'url_path': '/',
+        'query_string': '',
+        'method': 'POST',
+        'headers': {},
+        'body': b'{}',
+    }
+    prepare_request_dict(request_dict, 'https://example.amazonaws.com')
+    return request_dict
+
+
+def _send(limiter, request_dict):
+    request = create_request_object(request_dict).prepare()
+    limiter.on_sending_request(request=request)
+
+
+def test_prepared_request_shares_the_request_dict_context():
+    request_dict = _request_dict()
+    request = create_request_object(request_dict).prepare()
+
+    assert request.context is request_dict['context']
+
+
+def test_interleaved_sends_do_not_double_count_throttles():
+    # Coroutines sharing one thread: a and b are in flight when a is
+    # throttled, then c is sent before b's throttle comes back.
+    clock = FakeClock()
+    limiter, rate_adjustor = _limiter(clock)
+    first, second, third = _request_dict(), _request_dict(), _request_dict()
+    _send(limiter, first)
+    _send(limiter, second)
+    clock.now = 1.0
+    limiter.on_receiving_response(throttled=True, request_dict=first)
+    clock.now = 2.0
+    _send(limiter, third)
+    clock.now = 3.0
+    limiter.on_receiving_response(throttled=True, request_dict=second)
+
+    assert rate_adjustor.error_received.call_count == 1
+
+    limiter.on_receiving_response(throttled=True, request_dict=third)
+
+    assert rate_adjustor.error_received.call_count == 2
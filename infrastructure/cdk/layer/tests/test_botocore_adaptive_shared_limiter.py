@@ -0,0 +1,171 @@
+"""Clients with a process scoped rate limiter back off together."""
+import json
+import threading
+import time
+
+import pytest
+
+import botocore.session
+from botocore.awsrequest import AWSResponse
+from botocore.config import Config
+from botocore.retries import adaptive, standard, throttling
+
+CLIENTS = 4
+THREADS_PER_CLIENT = 2
+# The rate clocker measures the send rate over half second buckets, so the
+# service only starts throttling once a rate has been measured.
+WARM_UP_SECONDS = 0.6
+LOAD_SECONDS = 1.0
+
+
+class RawBody:
+    def __init__(self, body):
+        self._body = body
+
+    def stream(self, **kwargs):
+        yield self._body
+
+
+class ThrottlingService:
+    """Throttles ``throttles`` requests once under load for ``warm_up``."""
+
+    def __init__(self, throttles=8, warm_up=WARM_UP_SECONDS):
+        self.successes = 0
+        self.throttles = 0
+        self._max_throttles = throttles
+        self._warm_up = warm_up
+        self._lock = threading.Lock()
+        self._throttle_from = None
+
+    def __call__(self, request, **kwargs):
+        with self._lock:
+            now = time.monotonic()
+            if self._throttle_from is None:
+                self._throttle_from = now + self._warm_up
+            throttled = (
+                now >= self._throttle_from
+                and self.throttles < self._max_throttles
+            )
+            if throttled:
+                self.throttles += 1
+            else:
+                self.successes += 1
+        if throttled:
+            status = 400
+            body = {
+                '__type': 'com.amazonaws.dynamodb.v20120810#'
+                'ThrottlingException',
+                'message': 'Rate exceeded',
+            }
+        else:
+            status = 200
+            body = {'TableNames': []}
+        return AWSResponse(
+            request.url,
+            status,
+            {'x-amzn-requestid': 'id'},
+            RawBody(json.dumps(body).encode()),
+        )
+
+
+@pytest.fixture
+def limiters(monkeypatch):
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'access')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'secret')
+    monkeypatch.setattr(adaptive, '_SHARED_RATE_LIMITERS', {})
+    # Retry throttled requests right away; the rate limiter paces them.
+    monkeypatch.setattr(
+        standard.ExponentialBackoff, 'delay_amount', lambda self, ctx: 0
+    )
+    registered = {}
+    register_retry_handler = adaptive.register_retry_handler
+
+    def recording_register_retry_handler(client, scope='client'):
+        limiter = register_retry_handler(client, scope=scope)
+        registered[client] = limiter
+        return limiter
+
+    monkeypatch.setattr(
+        adaptive, 'register_retry_handler', recording_register_retry_handler
+    )
+    return registered
+
+
+def _client(scope, endpoint_url=None, service=None):
+    client = botocore.session.get_session().create_client(
+        'dynamodb',
+        region_name='us-east-1',
+        endpoint_url=endpoint_url,
+        config=Config(
+            retries={
+                'mode': 'adaptive',
+                'max_attempts': 50,
+                'rate_limiter_scope': scope,
+            }
+        ),
+    )
+    if service is not None:
+        client.meta.events.register('before-send.dynamodb', service)
+    return client
+
+
+def test_process_scope_shares_a_limiter_per_endpoint(limiters):
+    first = _client('process')
+    second = _client('process')
+    local = _client('process', endpoint_url='http://localhost:8000')
+    other_local = _client('process', endpoint_url='http://localhost:8000')
+    own = _client('client')
+
+    assert limiters[first] is limiters[second]
+    assert limiters[local] is limiters[other_local]
+    assert limiters[local] is not limiters[first]
+    assert limiters[own] not in (limiters[first], limiters[local])
+
+
+def _run_load(clients):
+    deadline = time.monotonic() + LOAD_SECONDS
+    errors = []
+
+    def load(client):
+        try:
+            while time.monotonic() < deadline:
+                client.list_tables()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=load, args=(client,))
+        for client in clients
+        for _ in range(THREADS_PER_CLIENT)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def test_clients_under_load_back_off_together(limiters, monkeypatch):
+    adjusted = set()
+    error_received = throttling.CubicCalculator.error_received
+
+    def recording_error_received(self, *args, **kwargs):
+        adjusted.add(self)
+        return error_received(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        throttling.CubicCalculator,
+        'error_received',
+        recording_error_received,
+    )
+    service = ThrottlingService()
+    clients = [_client('process', service=service) for _ in range(CLIENTS)]
+
+    errors = _run_load(clients)
+
+    assert not errors
+    assert service.throttles == 8
+    # Every client's throttles lower the one shared send rate.
+    (limiter,) = {limiters[client] for client in clients}
+    assert adjusted == {limiter._rate_adjustor}
+    assert limiter._enabled
@@ -0,0 +1,102 @@
+"""The cached SigV4 signing paths produce the same signatures as before."""
+import datetime
+import types
+
+import pytest
+
+from botocore import auth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
+
+SECRET = 'wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY'
+
+
+class _FrozenDatetime(datetime.datetime):
+    @classmethod
+    def utcnow(cls):
+        return cls(2015, 8, 30, 12, 36, 0)
+
+
+@pytest.fixture(autouse=True)
+def frozen_time(monkeypatch):
+    monkeypatch.setattr(
+        auth,
+        'datetime',
+        types.SimpleNamespace(
+            datetime=_FrozenDatetime, timedelta=datetime.timedelta
+        ),
+    )
+
+
+class UncachedSigV4Auth(auth.SigV4Auth):
+    # Overriding these hooks makes SigV4Auth take its original code paths.
+    def _sign(self, key, msg, hex=False):
+        return super()._sign(key, msg, hex)
+
+    def _header_value(self, value):
+        return super()._header_value(value)
+
+
+def _sign(signer_cls, request, secret=SECRET, token=None):
+    credentials = Credentials('AKIDEXAMPLE', secret, token)
+    signer_cls(credentials, 'service', 'us-east-1').add_auth(request)
+    return request.headers['Authorization']
+
+
+def test_matches_the_sigv4_test_suite():
+    request = AWSRequest(method='GET', url='https://example.amazonaws.com/')
+
+    authorization = _sign(auth.SigV4Auth, request)
+
+    assert authorization == (
+        'AWS4-HMAC-SHA256 '
+        'Credential=AKIDEXAMPLE/20150830/us-east-1/service/aws4_request, '
+        'SignedHeaders=host;x-amz-date, '
+        'Signature='
+        '5fa00fa31553b73ebf1942676e86291e8372ff2a2260956d9b8aae1d763fbf31'
+    )
+
+
+def _requests():
+    yield AWSRequest(
+        method='POST',
+        url='https://dynamodb.us-east-1.amazonaws.com/',
+        data=b'{"TableName": "t"}',
+        headers={
+            'X-Amz-Target': 'DynamoDB_20120810.UpdateItem',
+            'Content-Type': 'application/x-amz-json-1.0',
+            'X-Custom': '  spaced   out  value ',
+        },
+    )
+    request = AWSRequest(
+        method='GET',
+        url='https://example.amazonaws.com/path?b=2&a=1',
+    )
+    request.headers.add_header('X-Multi', 'one')
+    request.headers.add_header('x-multi', 'two  words')
+    yield request
+
+
+@pytest.mark.parametrize('token', [None, 'session-token'])
+@pytest.mark.parametrize('secret', [SECRET, 'another/secret+key'])
+def test_matches_the_uncached_signer(secret, token):
+    for cached, uncached in zip(_requests(), _requests()):
+        assert _sign(auth.SigV4Auth, cached, secret, token) == _sign(
+            UncachedSigV4Auth, uncached, secret, token
+        )
+
+
+def test_signing_key_cache_does_not_hold_secrets():
+    request = AWSRequest(method='GET', url='https://example.amazonaws.com/')
+    _sign(auth.SigV4Auth, request)
+
+    for cache_key in auth._SIGNING_KEY_CACHE:
+        assert SECRET not in cache_key
+        assert SECRET.encode() not in cache_key
+
+
+def test_signing_key_cache_is_bounded():
+    for i in range(auth._SIGNING_KEY_CACHE_SIZE + 10):
+        auth._derive_signing_key('secret-%d' % i, '20150830', 'r', 's')
+
+    assert len(auth._SIGNING_KEY_CACHE) == auth._SIGNING_KEY_CACHE_SIZE
@@ -0,0 +1,113 @@
+"""Generated client classes are shared only when they would be identical."""
+import copy
+
+import pytest
+
+import botocore.session
+from botocore import client as client_module
+
+
+def _session(monkeypatch):
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'access')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'secret')
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+    return botocore.session.get_session()
+
+
+def _serve_model(monkeypatch, session, change):
+    loader = session.get_component('data_loader')
+    load_service_model = loader.load_service_model
+    models = {}
+
+    def changed_model(service_name, type_name, api_version=None):
+        model = load_service_model(service_name, type_name, api_version)
+        if type_name != 'service-2':
+            return model
+        if service_name not in models:
+            models[service_name] = copy.deepcopy(model)
+            change(models[service_name])
+        return models[service_name]
+
+    monkeypatch.setattr(loader, 'load_service_model', changed_model)
+
+
+def test_clients_of_different_sessions_share_a_class(monkeypatch):
+    first = _session(monkeypatch).create_client('dynamodb')
+    second = _session(monkeypatch).create_client('dynamodb')
+
+    assert type(first) is type(second)
+
+
+def test_models_with_the_same_operations_do_not_share_a_class(monkeypatch):
+    def change_docs(model):
+        model['operations']['GetItem']['documentation'] = '<p>Changed.</p>'
+
+    session = _session(monkeypatch)
+    _serve_model(monkeypatch, session, change_docs)
+    changed = session.create_client('dynamodb')
+    original = _session(monkeypatch).create_client('dynamodb')
+
+    assert type(changed) is not type(original)
+    assert 'Changed.' in str(changed.get_item.__doc__)
+    assert 'Changed.' not in str(original.get_item.__doc__)
+
+
+def test_creating_client_class_is_emitted_for_every_client(monkeypatch):
+    calls = []
+
+    def record(class_attributes, base_classes, **kwargs):
+        calls.append(kwargs)
+
+    clients = []
+    for _ in range(3):
+        session = _session(monkeypatch)
+        session.register('creating-client-class.dynamodb', record)
+        clients.append(session.create_client('dynamodb'))
+
+    assert len(calls) == 3
+
+
+def test_handlers_changing_the_class_get_a_new_class(monkeypatch):
+    counter = []
+
+    def add_attribute(class_attributes, **kwargs):
+        counter.append(None)
+        class_attributes['creation'] = len(counter)
+
+    clients = []
+    for _ in range(2):
+        session = _session(monkeypatch)
+        session.register('creating-client-class.dynamodb', add_attribute)
+        clients.append(session.create_client('dynamodb'))
+
+    assert [c.creation for c in clients] == [1, 2]
+    assert type(clients[0]) is not type(clients[1])
+
+
+def test_model_fingerprint_is_computed_once_per_loaded_model(monkeypatch):
+    session = _session(monkeypatch)
+    session.create_client('dynamodb')
+    dumps = []
+    real_dumps = client_module.json.dumps
+
+    def counting_dumps(*args, **kwargs):
+        dumps.append(None)
+        return real_dumps(*args, **kwargs)
+
+    monkeypatch.setattr(client_module.json, 'dumps', counting_dumps)
+    session.create_client('dynamodb')
+
+    assert dumps == []
+
+
+@pytest.mark.parametrize('service_name', ['s3', 'iotsitewise'])
+def test_boto3_customizations_survive_sharing(monkeypatch, service_name):
+    import boto3
+
+    _session(monkeypatch)
+    first = boto3.Session().client(service_name)
+    second = boto3.Session().client(service_name)
+
+    assert type(first) is type(second)
+    if service_name == 's3':
+        assert hasattr(second, 'upload_file')
@@ -0,0 +1,240 @@
+"""RefreshableCredentials refresh on a background thread when enabled."""
+import datetime
+import gc
+import threading
+
+import pytest
+
+import botocore.session
+from botocore import credentials
+from botocore.credentials import RefreshableCredentials
+
+TIMEOUT = 5
+ADVISORY = RefreshableCredentials._advisory_refresh_timeout
+MANDATORY = RefreshableCredentials._mandatory_refresh_timeout
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+    def __call__(self):
+        return self.now
+
+    def later(self, seconds):
+        return self.now + datetime.timedelta(seconds=seconds)
+
+
+class FakeRefresher:
+    """Returns credentials valid for ``lifetime`` seconds on every call."""
+
+    def __init__(self, clock, lifetime=3600, failures=0):
+        self.clock = clock
+        self.lifetime = lifetime
+        self.failures = failures
+        self.calls = 0
+        self.refreshed = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError('refresh failed')
+        self.refreshed.set()
+        return {
+            'access_key': 'access-%d' % self.calls,
+            'secret_key': 'secret',
+            'token': 'token',
+            'expiry_time': self.clock.later(self.lifetime).isoformat(),
+        }
+
+
+def _credentials(clock, refresher, expires_in):
+    return RefreshableCredentials(
+        'access-0',
+        'secret',
+        'token',
+        clock.later(expires_in),
+        refresher,
+        'assume-role',
+        time_fetcher=clock,
+    )
+
+
+def _refresh_threads():
+    return {
+        thread
+        for thread in threading.enumerate()
+        if thread.name == 'botocore-credential-refresh'
+    }
+
+
+def _start(creds):
+    before = _refresh_threads()
+    creds.enable_background_refresh()
+    (thread,) = _refresh_threads() - before
+    return thread
+
+
+def test_refreshes_in_advisory_window_before_callers_block():
+    clock = FakeClock()
+    refresher = FakeRefresher(clock)
+    # Inside the advisory window, but callers would not refresh yet.
+    creds = _credentials(clock, refresher, (ADVISORY + MANDATORY) / 2)
+    thread = _start(creds)
+    try:
+        assert refresher.refreshed.wait(TIMEOUT)
+    finally:
+        creds.disable_background_refresh()
+    thread.join(TIMEOUT)
+
+    assert creds.get_frozen_credentials().access_key == 'access-1'
+    assert creds.refresh_metrics == {
+        'background_refreshes': 1,
+        'background_refresh_failures': 0,
+        'blocking_refreshes': 0,
+    }
+
+
+def test_waits_for_advisory_window():
+    clock = FakeClock()
+    refresher = FakeRefresher(clock)
+    creds = _credentials(clock, refresher, ADVISORY + 3600)
+    try:
+        _start(creds)
+        assert not refresher.refreshed.wait(0.1)
+    finally:
+        creds.disable_background_refresh()
+
+    assert refresher.calls == 0
+
+
+def test_retries_after_failed_refresh(monkeypatch):
+    monkeypatch.setattr(credentials, '_BACKGROUND_REFRESH_RETRY_INTERVAL', 0)
+    clock = FakeClock()
+    refresher = FakeRefresher(clock, failures=2)
+    creds = _credentials(clock, refresher, (ADVISORY + MANDATORY) / 2)
+    thread = _start(creds)
+    try:
+        assert refresher.refreshed.wait(TIMEOUT)
+    finally:
+        creds.disable_background_refresh()
+    thread.join(TIMEOUT)
+
+    assert refresher.calls == 3
+    metrics = creds.refresh_metrics
+    assert metrics['background_refreshes'] == 3
+    assert metrics['background_refresh_failures'] == 2
+
+
+def test_caller_blocks_only_in_mandatory_window():
+    clock = FakeClock()
+    refresher = FakeRefresher(clock)
+    creds = _credentials(clock, refresher, ADVISORY + 3600)
+    try:
+        _start(creds)
+        clock.now = clock.later(3600 + (ADVISORY - MANDATORY) / 2)
+        assert creds.get_frozen_credentials().access_key == 'access-0'
+        clock.now = clock.later(ADVISORY)
+        assert creds.get_frozen_credentials().access_key == 'access-1'
+    finally:
+        creds.disable_background_refresh()
+
+    assert creds.refresh_metrics['blocking_refreshes'] == 1
+
+
+def test_callers_waiting_on_a_refresh_do_not_count_as_blocking():
+    clock = FakeClock()
+    entered = threading.Event()
+    release = threading.Event()
+    refresher = FakeRefresher(clock)
+
+    def slow_refresh():
+        entered.set()
+        release.wait(TIMEOUT)
+        return refresher()
+
+    creds = _credentials(clock, slow_refresh, ADVISORY + 3600)
+    _start(creds)
+    clock.now = clock.later(3600 + ADVISORY)
+    callers = [
+        threading.Thread(target=creds.get_frozen_credentials)
+        for _ in range(2)
+    ]
+    try:
+        callers[0].start()
+        assert entered.wait(TIMEOUT)
+        # The second caller waits for the first caller's refresh.
+        callers[1].start()
+        callers[1].join(0.1)
+        release.set()
+        for caller in callers:
+            caller.join(TIMEOUT)
+    finally:
+        release.set()
+        creds.disable_background_refresh()
+
+    assert refresher.calls == 1
+    assert creds.refresh_metrics['blocking_refreshes'] == 1
+
+
+def test_thread_exits_when_disabled():
+    clock = FakeClock()
+    creds = _credentials(clock, FakeRefresher(clock), ADVISORY + 3600)
+    thread = _start(creds)
+
+    creds.disable_background_refresh()
+
+    thread.join(TIMEOUT)
+    assert not thread.is_alive()
+
+
+def test_thread_exits_when_credentials_are_collected():
+    clock = FakeClock()
+    creds = _credentials(clock, FakeRefresher(clock), ADVISORY + 3600)
+    thread = _start(creds)
+
+    del creds
+    gc.collect()
+
+    thread.join(TIMEOUT)
+    assert not thread.is_alive()
+
+
+class FakeResolver:
+    def __init__(self, creds):
+        self.creds = creds
+
+    def load_credentials(self):
+        return self.creds
+
+
+@pytest.mark.parametrize('value, enabled', [('true', True), ('false', False)])
+def test_session_enables_background_refresh(monkeypatch, value, enabled):
+    monkeypatch.setenv('AWS_CREDENTIAL_BACKGROUND_REFRESH', value)
+    clock = FakeClock()
+    creds = _credentials(clock, FakeRefresher(clock), ADVISORY + 3600)
+    session = botocore.session.Session()
+    session.register_component('credential_provider', FakeResolver(creds))
+    before = _refresh_threads()
+    try:
+        assert session.get_credentials() is creds
+        started = _refresh_threads() - before
+    finally:
+        creds.disable_background_refresh()
+
+    assert len(started) == int(enabled)
+
+
+def test_session_leaves_static_credentials_alone(monkeypatch):
+    monkeypatch.setenv('AWS_CREDENTIAL_BACKGROUND_REFRESH', 'true')
+    session = botocore.session.Session()
+    session.register_component(
+        'credential_provider',
+        FakeResolver(credentials.Credentials('access', 'secret')),
+    )
+    before = _refresh_threads()
+
+    session.get_credentials()
+
+    assert _refresh_threads() == before
@@ -0,0 +1,173 @@
+"""The default resolver checks the environment before building the chain."""
+import pytest
+
+import botocore.session
+from botocore import credentials
+from botocore.credentials import (
+    CredentialResolver,
+    Credentials,
+    EnvFirstCredentialResolver,
+)
+from botocore.exceptions import UnknownCredentialError
+
+DEFAULT_CHAIN = [
+    'env',
+    'assume-role',
+    'assume-role-with-web-identity',
+    'sso',
+    'shared-credentials-file',
+    'custom-process',
+    'config-file',
+    'ec2-credentials-file',
+    'boto-config',
+    'container-role',
+    'iam-role',
+]
+
+
+class FakeProvider:
+    def __init__(self, method, creds=None):
+        self.METHOD = method
+        self.creds = creds
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        return self.creds
+
+
+def _creds(method):
+    return Credentials('access-' + method, 'secret', method=method)
+
+
+class FakeChain:
+    def __init__(self, env_provider, *providers):
+        self.providers = [env_provider] + list(providers)
+        self.builds = 0
+
+    def __call__(self):
+        self.builds += 1
+        return list(self.providers)
+
+
+def test_env_credentials_do_not_build_the_chain():
+    env = FakeProvider('env', _creds('env'))
+    chain = FakeChain(env, FakeProvider('iam-role', _creds('iam-role')))
+    resolver = EnvFirstCredentialResolver(env, chain)
+
+    assert resolver.load_credentials().method == 'env'
+    assert resolver.load_credentials().method == 'env'
+    assert chain.builds == 0
+
+
+def test_chain_is_built_once_without_env_credentials():
+    env = FakeProvider('env')
+    config_file = FakeProvider('config-file')
+    iam_role = FakeProvider('iam-role', _creds('iam-role'))
+    chain = FakeChain(env, config_file, iam_role)
+    resolver = EnvFirstCredentialResolver(env, chain)
+
+    assert resolver.load_credentials().method == 'iam-role'
+    assert resolver.load_credentials().method == 'iam-role'
+    assert chain.builds == 1
+    assert config_file.loads == 2
+
+
+def test_chain_is_used_in_order_once_built():
+    env = FakeProvider('env')
+    chain = FakeChain(
+        env,
+        FakeProvider('config-file', _creds('config-file')),
+        FakeProvider('iam-role', _creds('iam-role')),
+    )
+    resolver = EnvFirstCredentialResolver(env, chain)
+
+    assert resolver.load_credentials().method == 'config-file'
+    # Credentials showing up in the environment later still win.
+    env.creds = _creds('env')
+    assert resolver.load_credentials().method == 'env'
+    assert chain.builds == 1
+
+
+def test_chain_changes_apply_to_env_credentials():
+    env = FakeProvider('env', _creds('env'))
+    iam_role = FakeProvider('iam-role')
+    chain = FakeChain(env, iam_role)
+    resolver = EnvFirstCredentialResolver(env, chain)
+
+    custom = FakeProvider('custom', _creds('custom'))
+    resolver.insert_before('env', custom)
+
+    assert chain.builds == 1
+    assert resolver.get_provider('iam-role') is iam_role
+    assert [p.METHOD for p in resolver.providers] == [
+        'custom',
+        'env',
+        'iam-role',
+    ]
+    assert resolver.load_credentials().method == 'custom'
+
+    resolver.remove('custom')
+    assert resolver.load_credentials().method == 'env'
+    with pytest.raises(UnknownCredentialError):
+        resolver.get_provider('custom')
+
+
+def test_removing_env_provider_disables_env_credentials():
+    env = FakeProvider('env', _creds('env'))
+    chain = FakeChain(env, FakeProvider('iam-role', _creds('iam-role')))
+    resolver = EnvFirstCredentialResolver(env, chain)
+
+    resolver.remove('env')
+
+    assert resolver.load_credentials().method == 'iam-role'
+
+
+@pytest.fixture
+def session(monkeypatch, tmp_path):
+    for name in (
+        'AWS_ACCESS_KEY_ID',
+        'AWS_SECRET_ACCESS_KEY',
+        'AWS_SESSION_TOKEN',
+        'AWS_PROFILE',
+        'AWS_DEFAULT_PROFILE',
+    ):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv('AWS_CONFIG_FILE', str(tmp_path / 'config'))
+    monkeypatch.setenv(
+        'AWS_SHARED_CREDENTIALS_FILE', str(tmp_path / 'credentials')
+    )
+    return botocore.session.Session()
+
+
+def test_default_resolver_short_circuits_env_credentials(
+    session, monkeypatch
+):
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'access')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'secret')
+
+    def fail(*args, **kwargs):
+        raise AssertionError('the provider chain was built')
+
+    monkeypatch.setattr(credentials, '_create_credential_providers', fail)
+    resolver = credentials.create_credential_resolver(session)
+
+    creds = resolver.load_credentials()
+    assert (creds.access_key, creds.method) == ('access', 'env')
+
+
+def test_default_resolver_builds_the_full_chain(session):
+    resolver = credentials.create_credential_resolver(session)
+
+    assert isinstance(resolver, EnvFirstCredentialResolver)
+    assert [p.METHOD for p in resolver.providers] == DEFAULT_CHAIN
+
+
+def test_explicit_profile_skips_env_provider(session, tmp_path):
+    (tmp_path / 'config').write_text('[profile dev]\nregion = us-east-1\n')
+    session.set_config_variable('profile', 'dev')
+
+    resolver = credentials.create_credential_resolver(session)
+
+    assert type(resolver) is CredentialResolver
+    assert [p.METHOD for p in resolver.providers] == DEFAULT_CHAIN[1:]
@@ -0,0 +1,463 @@
+"""The asyncio HTTP transport and the ``client.aio`` event loop path."""
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+import botocore.session
+from botocore.asynchttpsession import AsyncioHTTPSession
+from botocore.awsrequest import AWSRequest, AWSResponse
+from botocore.exceptions import (
+    ConnectionClosedError,
+    EndpointConnectionError,
+    HTTPClientError,
+    ProxyConnectionError,
+    ReadTimeoutError,
+    SSLError,
+)
+
+BLOCK_SECONDS = 0.2
+
+
+class RawBody:
+    def __init__(self, body):
+        self._body = body
+
+    def stream(self, **kwargs):
+        yield self._body
+
+
+def _client(monkeypatch):
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'access')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'secret')
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+    return botocore.session.get_session().create_client('dynamodb')
+
+
+def _block(**kwargs):
+    # Stands in for a credential refresh or the adaptive rate limiter.
+    time.sleep(BLOCK_SECONDS)
+
+
+def _respond(request, **kwargs):
+    time.sleep(BLOCK_SECONDS)
+    return AWSResponse(
+        request.url, 200, {'x-amzn-requestid': 'id'}, RawBody(b'{}')
+    )
+
+
+async def _longest_stall(call):
+    stalls = []
+
+    async def tick():
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0.01)
+            now = time.perf_counter()
+            stalls.append(now - last)
+            last = now
+
+    ticker = asyncio.ensure_future(tick())
+    try:
+        result = await call
+    finally:
+        ticker.cancel()
+    return result, max(stalls)
+
+
+def test_request_created_and_before_send_run_off_the_loop(monkeypatch):
+    client = _client(monkeypatch)
+    client.meta.events.register('request-created.dynamodb', _block)
+    client.meta.events.register('before-send.dynamodb', _respond)
+
+    response, stall = asyncio.run(
+        _longest_stall(client.aio.describe_limits())
+    )
+
+    assert response['ResponseMetadata']['HTTPStatusCode'] == 200
+    assert stall < BLOCK_SECONDS / 2
+
+
+def test_asyncio_is_imported_only_for_the_asyncio_transport():
+    layer = os.path.dirname(os.path.dirname(botocore.__file__))
+    code = (
+        'import sys\n'
+        f'sys.path.insert(0, {layer!r})\n'
+        'import botocore.session\n'
+        'from botocore.config import Config\n'
+        'session = botocore.session.get_session()\n'
+        'def create(**kwargs):\n'
+        '    session.create_client(\n'
+        '        "dynamodb", region_name="us-east-1",\n'
+        '        aws_access_key_id="a", aws_secret_access_key="s", **kwargs\n'
+        '    )\n'
+        '    print("asyncio" in sys.modules)\n'
+        'create()\n'
+        'create(config=Config(http_transport="asyncio"))\n'
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    assert output.split() == ['False', 'True']
+
+
+OK = b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok'
+
+
+class LocalServer:
+    """Answers the requests it receives with the scripted ``responses``.
+
+    Each response is the raw bytes to send back, or a ``(bytes, close)``
+    pair to close the connection after sending them.  Responses without
+    ``Content-Length`` or chunked framing also close the connection, and a
+    response of None is never sent.  ``greeting`` is sent as soon as a
+    connection is accepted.
+    """
+
+    def __init__(self, responses=(), greeting=None):
+        self.responses = list(responses)
+        self.greeting = greeting
+        self.requests = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._sock = socket.socket()
+        self._sock.bind(('127.0.0.1', 0))
+        self._sock.listen(16)
+        self.port = self._sock.getsockname()[1]
+        self.url = 'http://127.0.0.1:%d' % self.port
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            with self._lock:
+                self.connections += 1
+            threading.Thread(
+                target=self._handle, args=(conn,), daemon=True
+            ).start()
+
+    def _handle(self, conn):
+        with conn, conn.makefile('rb') as reader:
+            if self.greeting is not None:
+                conn.sendall(self.greeting)
+            while True:
+                head = self._read_head(reader)
+                if head is None:
+                    return
+                length = 0
+                for line in head.split(b'\r\n'):
+                    name, _, value = line.partition(b':')
+                    if name.strip().lower() == b'content-length':
+                        length = int(value)
+                request = head + reader.read(length)
+                with self._lock:
+                    self.requests.append(request)
+                    response = self.responses.pop(0) if self.responses else OK
+                if response is None:
+                    # Hold the connection open until the client gives up.
+                    reader.read()
+                    return
+                close = False
+                if isinstance(response, tuple):
+                    response, close = response
+                if response:
+                    conn.sendall(response)
+                framed = (
+                    b'content-length:' in response.lower()
+                    or b'transfer-encoding: chunked' in response.lower()
+                )
+                if close or not framed:
+                    conn.shutdown(socket.SHUT_RDWR)
+                    return
+
+    def _read_head(self, reader):
+        lines = []
+        while True:
+            line = reader.readline()
+            if not line:
+                return None
+            lines.append(line)
+            if line == b'\r\n':
+                return b''.join(lines)
+
+    def close(self):
+        self._sock.close()
+
+
+@pytest.fixture
+def server():
+    server = LocalServer()
+    yield server
+    server.close()
+
+
+def _request(url, method='GET', headers=None, data=None):
+    return AWSRequest(
+        method=method, url=url, headers=headers, data=data
+    ).prepare()
+
+
+@pytest.mark.parametrize(
+    'method, path, headers',
+    [
+        ('GET', '/', {'X-Test': 'a\r\nX-Injected: 1'}),
+        ('GET', '/', {'X-Test': 'a\nX-Injected: 1'}),
+        ('GET', '/', {'X-Test': 'a\x00'}),
+        ('GET', '/', {'X-Test\r\nX-Injected': '1'}),
+        ('GET', '/', {'X-Test:': '1'}),
+        ('GET', '/a b', {}),
+        ('GET', '/a\x00', {}),
+        ('GET\r\nX-Injected: 1\r\n', '/', {}),
+    ],
+)
+def test_control_characters_are_rejected(server, method, path, headers):
+    session = AsyncioHTTPSession()
+    request = _request(server.url + path, method=method, headers=headers)
+
+    with pytest.raises(HTTPClientError) as e:
+        session.send(request)
+
+    assert isinstance(e.value.kwargs['error'], ValueError)
+    assert not server.requests
+
+
+def test_folded_header_values_are_sent(server):
+    session = AsyncioHTTPSession()
+
+    response = session.send(
+        _request(server.url, headers={'X-Test': 'a\r\n b'})
+    )
+
+    assert response.status_code == 200
+    assert b'X-Test: a\r\n b\r\n' in server.requests[0]
+
+
+class RecordingPoolMetrics:
+    def __init__(self):
+        self.events = []
+
+    def on_new_connection(self, pool):
+        self.events.append('new')
+
+    def on_request(self, pool, reused):
+        self.events.append('reused' if reused else 'fresh')
+
+    def on_connection_discarded(self, pool):
+        self.events.append('discarded')
+
+
+def _stats(session, server):
+    return session.connection_stats()['http://127.0.0.1:%d' % server.port]
+
+
+def test_content_length_response(server):
+    server.responses = [
+        b'HTTP/1.1 201 Created\r\nContent-Length: 5\r\n'
+        b'X-Test: a\r\nX-Test: b\r\n\r\nhello'
+    ]
+    session = AsyncioHTTPSession()
+
+    response = session.send(
+        _request(server.url + '/path?q=1', method='PUT', data=b'body')
+    )
+
+    assert response.status_code == 201
+    assert response.content == b'hello'
+    assert response.headers['x-test'] == 'a, b'
+    request = server.requests[0]
+    assert request.startswith(b'PUT /path?q=1 HTTP/1.1\r\n')
+    assert b'Content-Length: 4\r\n' in request
+    assert request.endswith(b'\r\n\r\nbody')
+
+
+def test_chunked_response(server):
+    server.responses = [
+        b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n'
+        b'5;ext=1\r\nhello\r\n6\r\n world\r\n0\r\nX-Trailer: 1\r\n\r\n',
+        OK,
+    ]
+    session = AsyncioHTTPSession()
+
+    response = session.send(_request(server.url))
+    assert response.content == b'hello world'
+    # The connection is reused, so the whole chunked body was consumed.
+    assert session.send(_request(server.url)).content == b'ok'
+    assert server.connections == 1
+
+
+def test_response_read_until_close(server):
+    server.responses = [b'HTTP/1.1 200 OK\r\n\r\nuntil close', OK]
+    session = AsyncioHTTPSession()
+
+    assert session.send(_request(server.url)).content == b'until close'
+    assert session.send(_request(server.url)).content == b'ok'
+    assert server.connections == 2
+
+
+def test_connection_close_is_not_pooled(server):
+    server.responses = [
+        b'HTTP/1.1 200 OK\r\nConnection: close\r\n'
+        b'Content-Length: 2\r\n\r\nok',
+        OK,
+    ]
+    session = AsyncioHTTPSession()
+
+    session.send(_request(server.url))
+    session.send(_request(server.url))
+
+    assert server.connections == 2
+
+
+def test_keep_alive_connections_are_reused(server):
+    metrics = RecordingPoolMetrics()
+    session = AsyncioHTTPSession(pool_metrics=metrics)
+
+    for _ in range(3):
+        assert session.send(_request(server.url)).content == b'ok'
+
+    assert server.connections == 1
+    assert metrics.events == ['new', 'fresh', 'reused', 'reused']
+    stats = _stats(session, server)
+    assert stats['num_connections'] == 1
+    assert stats['num_requests'] == 3
+    assert stats['num_connection_reuses'] == 2
+    assert stats['idle_connections'] == 1
+
+
+def test_connections_beyond_the_pool_size_are_discarded(server):
+    metrics = RecordingPoolMetrics()
+    session = AsyncioHTTPSession(max_pool_connections=1, pool_metrics=metrics)
+
+    async def send_concurrently():
+        return await asyncio.gather(
+            *[session.send_async(_request(server.url)) for _ in range(3)]
+        )
+
+    responses = asyncio.run(send_concurrently())
+
+    assert [response.content for response in responses] == [b'ok'] * 3
+    assert server.connections == 3
+    assert metrics.events.count('discarded') == 2
+    assert _stats(session, server)['idle_connections'] == 1
+
+
+def test_stale_pooled_connection_is_retried_once(server):
+    # The server drops the idle connection when the second request comes.
+    server.responses = [OK, (b'', True), OK]
+    session = AsyncioHTTPSession()
+    session.send(_request(server.url))
+
+    response = session.send(_request(server.url, method='POST', data=b'x'))
+
+    assert response.content == b'ok'
+    assert server.connections == 2
+    assert server.requests[1] == server.requests[2]
+    stats = _stats(session, server)
+    assert stats['num_requests'] == 2
+    assert stats['num_connection_reuses'] == 0
+
+
+def test_new_connection_closed_early_is_not_retried(server):
+    server.responses = [OK, (b'', True), (b'', True)]
+    session = AsyncioHTTPSession()
+    session.send(_request(server.url))
+
+    with pytest.raises(ConnectionClosedError):
+        session.send(_request(server.url))
+
+    assert len(server.requests) == 3
+
+
+def test_connection_closed_mid_body(server):
+    server.responses = [
+        (b'HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nabc', True)
+    ]
+
+    with pytest.raises(ConnectionClosedError):
+        AsyncioHTTPSession().send(_request(server.url))
+
+
+def test_read_timeout(server):
+    server.responses = [None]
+    session = AsyncioHTTPSession(timeout=(1, 0.1))
+
+    with pytest.raises(ReadTimeoutError):
+        session.send(_request(server.url))
+
+
+def test_connection_refused():
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+
+    with pytest.raises(EndpointConnectionError):
+        AsyncioHTTPSession().send(_request('http://127.0.0.1:%d/' % port))
+
+
+def test_tls_to_a_plain_http_server():
+    server = LocalServer(greeting=b'HTTP/1.1 400 Bad Request\r\n\r\n')
+    try:
+        with pytest.raises(SSLError):
+            AsyncioHTTPSession(verify=False, timeout=1).send(
+                _request('https://127.0.0.1:%d/' % server.port)
+            )
+    finally:
+        server.close()
+
+
+def test_requests_through_a_proxy_use_urllib3(server):
+    session = AsyncioHTTPSession(proxies={'http': server.url})
+
+    response = session.send(_request('http://example.invalid/path'))
+
+    assert response.content == b'ok'
+    assert server.requests[0].startswith(
+        b'GET http://example.invalid/path HTTP/1.1\r\n'
+    )
+
+
+def test_https_requests_tunnel_through_the_proxy(server):
+    server.responses = [
+        b'HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\n\r\n'
+    ]
+    session = AsyncioHTTPSession(proxies={'https': server.url})
+
+    with pytest.raises(ProxyConnectionError):
+        session.send(_request('https://example.invalid/'))
+
+    assert server.requests[0].startswith(b'CONNECT example.invalid:443 ')
+
+
+def test_sends_from_many_loops_are_all_counted(server):
+    session = AsyncioHTTPSession()
+
+    async def send_many():
+        for _ in range(10):
+            await session.send_async(_request(server.url))
+
+    threads = [
+        threading.Thread(target=asyncio.run, args=(send_many(),))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = _stats(session, server)
+    assert stats['num_requests'] == 40
+    assert stats['num_connections'] == server.connections
+    assert stats['num_connection_reuses'] == 40 - server.connections
@@ -0,0 +1,190 @@
+"""ParallelSegments pages through every segment on a bounded pool."""
+import threading
+import time
+
+import pytest
+
+import botocore.session
+from botocore.exceptions import PaginationError
+from botocore.paginate import ParallelSegmentPageIterator
+
+TIMEOUT = 5
+
+
+class FakeScan:
+    """Returns ``pages`` pages of one item for every segment."""
+
+    def __init__(self, pages=3, fail_segment=None, delay=0):
+        self.calls = []
+        self.pages = pages
+        self.fail_segment = fail_segment
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self._hooks = {}
+
+    def on_call(self, segment, page, hook):
+        self._hooks[segment, page] = hook
+
+    def __call__(self, **kwargs):
+        segment = kwargs['Segment']
+        page = kwargs.get('ExclusiveStartKey', {}).get('page', 0)
+        with self._lock:
+            self.calls.append((segment, page, kwargs['TotalSegments']))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            hook = self._hooks.get((segment, page))
+            if hook is not None:
+                hook()
+            time.sleep(self.delay)
+            if segment == self.fail_segment:
+                raise RuntimeError('segment failed')
+        finally:
+            with self._lock:
+                self.active -= 1
+        response = {
+            'Items': [{'segment': segment, 'page': page}],
+            'Count': 1,
+            'ScannedCount': 1,
+        }
+        if self.pages is None or page + 1 < self.pages:
+            response['LastEvaluatedKey'] = {'page': page + 1}
+        return response
+
+
+@pytest.fixture(scope='module')
+def client():
+    session = botocore.session.get_session()
+    return session.create_client(
+        'dynamodb',
+        region_name='us-east-1',
+        aws_access_key_id='access',
+        aws_secret_access_key='secret',
+    )
+
+
+def _paginate(client, method, operation='scan', **kwargs):
+    paginator = client.get_paginator(operation)
+    paginator._method = method
+    return paginator.paginate(**kwargs)
+
+
+def _scan(client, method, segments, **config):
+    return _paginate(
+        client,
+        method,
+        TableName='table',
+        PaginationConfig=dict(config, ParallelSegments=segments),
+    )
+
+
+def _items(pages):
+    return [item for page in pages for item in page['Items']]
+
+
+def test_pages_of_all_segments_are_yielded_in_segment_order(client):
+    scan = FakeScan(pages=3)
+
+    items = _items(_scan(client, scan, 4))
+
+    assert sorted(
+        (item['segment'], item['page']) for item in items
+    ) == [(segment, page) for segment in range(4) for page in range(3)]
+    for segment in range(4):
+        pages = [item['page'] for item in items if item['segment'] == segment]
+        assert pages == [0, 1, 2]
+    assert {total for _, _, total in scan.calls} == {4}
+
+
+def test_pages_of_different_segments_are_interleaved(client):
+    scan = FakeScan(pages=2)
+    second_page_requested = threading.Event()
+    scan.on_call(1, 1, second_page_requested.set)
+    # Segment 0 only finishes once segment 1 has handed over its first
+    # page and moved on to the next one.
+    scan.on_call(0, 1, lambda: second_page_requested.wait(TIMEOUT))
+
+    items = _items(_scan(client, scan, 2))
+
+    order = [(item['segment'], item['page']) for item in items]
+    assert order.index((1, 0)) < order.index((0, 1))
+
+
+def test_worker_threads_are_bounded(client):
+    scan = FakeScan(pages=2, delay=0.01)
+    segments = ParallelSegmentPageIterator.MAX_WORKERS * 3
+
+    items = _items(_scan(client, scan, segments))
+
+    assert len(items) == segments * 2
+    assert 1 < scan.max_active <= ParallelSegmentPageIterator.MAX_WORKERS
+
+
+def _wait_for_threads(count):
+    deadline = time.monotonic() + TIMEOUT
+    while threading.active_count() > count:
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_early_break_stops_the_workers(client):
+    threads = threading.active_count()
+    scan = FakeScan(pages=None, delay=0.001)
+
+    for _ in _scan(client, scan, 4):
+        break
+
+    assert _wait_for_threads(threads)
+    calls = len(scan.calls)
+    time.sleep(0.05)
+    assert len(scan.calls) == calls
+
+
+def test_segment_error_propagates(client):
+    threads = threading.active_count()
+    scan = FakeScan(pages=3, fail_segment=2)
+
+    with pytest.raises(RuntimeError, match='segment failed'):
+        list(_scan(client, scan, 4))
+
+    assert _wait_for_threads(threads)
+
+
+@pytest.mark.parametrize(
+    'config, kwargs',
+    [
+        ({'MaxItems': 10}, {}),
+        ({'StartingToken': 'token'}, {}),
+        ({}, {'Segment': 0}),
+        ({}, {'TotalSegments': 4}),
+    ],
+)
+def test_conflicting_parameters_are_rejected(client, config, kwargs):
+    with pytest.raises(PaginationError):
+        _paginate(
+            client,
+            FakeScan(),
+            TableName='table',
+            PaginationConfig=dict(config, ParallelSegments=4),
+            **kwargs,
+        )
+
+
+@pytest.mark.parametrize('segments', [0, -1])
+def test_segments_must_be_positive(client, segments):
+    with pytest.raises(PaginationError, match='positive'):
+        _scan(client, FakeScan(), segments)
+
+
+def test_unsegmented_operation_is_rejected(client):
+    with pytest.raises(PaginationError, match='not supported'):
+        _paginate(
+            client,
+            FakeScan(),
+            operation='list_tables',
+            PaginationConfig={'ParallelSegments': 2},
+        )
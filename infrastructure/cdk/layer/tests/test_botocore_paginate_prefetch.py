@@ -0,0 +1,113 @@
+"""PrefetchPages yields the same pages and tokens as the serial iterator."""
+import threading
+import time
+
+import pytest
+
+import botocore.session
+from botocore.exceptions import PaginationError
+
+PAGES = 20
+
+
+class FakeListTables:
+    def __init__(self, pages=PAGES, fail_at=None, repeat_at=None):
+        self.calls = []
+        self.pages = pages
+        self.fail_at = fail_at
+        self.repeat_at = repeat_at
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs.get('ExclusiveStartTableName'))
+        n = int(kwargs.get('ExclusiveStartTableName', 't-1')[1:]) + 1
+        if n == self.fail_at:
+            raise RuntimeError('request failed')
+        if n == self.repeat_at:
+            n -= 1
+        response = {'TableNames': ['t%d' % n]}
+        if n + 1 < self.pages:
+            response['LastEvaluatedTableName'] = 't%d' % n
+        return response
+
+
+@pytest.fixture(scope='module')
+def client():
+    session = botocore.session.get_session()
+    return session.create_client(
+        'dynamodb',
+        region_name='us-east-1',
+        aws_access_key_id='access',
+        aws_secret_access_key='secret',
+    )
+
+
+def _paginate(client, method, **config):
+    paginator = client.get_paginator('list_tables')
+    paginator._method = method
+    iterator = paginator.paginate(PaginationConfig=config)
+    pages = list(iterator)
+    return pages, iterator.resume_token
+
+
+@pytest.mark.parametrize('prefetch', [0, 1, 2, 5])
+def test_prefetched_pages_match_serial_pages(client, prefetch):
+    expected = _paginate(client, FakeListTables())
+
+    assert _paginate(client, FakeListTables(), PrefetchPages=prefetch) == (
+        expected
+    )
+
+
+@pytest.mark.parametrize('max_items', [1, 7, PAGES])
+def test_max_items_and_resume_token_match(client, max_items):
+    expected = _paginate(client, FakeListTables(), MaxItems=max_items)
+    pages, token = _paginate(
+        client, FakeListTables(), MaxItems=max_items, PrefetchPages=3
+    )
+    assert (pages, token) == expected
+
+    resumed = _paginate(
+        client, FakeListTables(), MaxItems=5, StartingToken=token
+    )
+    assert (
+        _paginate(
+            client,
+            FakeListTables(),
+            MaxItems=5,
+            StartingToken=token,
+            PrefetchPages=3,
+        )
+        == resumed
+    )
+
+
+def test_request_error_is_raised_to_the_caller(client):
+    with pytest.raises(RuntimeError, match='request failed'):
+        _paginate(client, FakeListTables(fail_at=4), PrefetchPages=2)
+
+
+def test_repeated_token_still_raises_pagination_error(client):
+    with pytest.raises(PaginationError):
+        _paginate(client, FakeListTables(repeat_at=3), PrefetchPages=2)
+
+
+def test_prefetch_stays_bounded_and_stops_when_closed(client):
+    method = FakeListTables()
+    paginator = client.get_paginator('list_tables')
+    paginator._method = method
+    pages = iter(paginator.paginate(PaginationConfig={'PrefetchPages': 2}))
+    next(pages)
+    time.sleep(0.2)
+
+    # The page being processed plus at most two pages ahead.
+    assert len(method.calls) <= 3
+
+    threads = threading.active_count()
+    pages.close()
+    time.sleep(0.3)
+    assert threading.active_count() < threads
+
+
+def test_negative_prefetch_is_rejected(client):
+    with pytest.raises(PaginationError):
+        _paginate(client, FakeListTables(), PrefetchPages=-1)
@@ -0,0 +1,125 @@
+"""The compiled JSON response parsers match the generic shape walker."""
+import base64
+import datetime
+import json
+
+import pytest
+
+import botocore.session
+from botocore import parsers
+
+
+@pytest.fixture(scope='module')
+def session():
+    return botocore.session.get_session()
+
+
+def _attribute_values():
+    blob = base64.b64encode(b'\x00\x01binary').decode()
+    return {
+        'pk': {'S': 'home#1'},
+        'charge': {'N': '0.55'},
+        'bin': {'B': blob},
+        'tags': {'SS': ['a', 'b']},
+        'slots': {'NS': ['1', '2']},
+        'blobs': {'BS': [blob, blob]},
+        'nothing': {'NULL': True},
+        'flag': {'BOOL': False},
+        'schedule': {
+            'L': [
+                {'M': {'time': {'S': '00:30'}, 'on': {'BOOL': True}}},
+                {'L': [{'N': '1'}, {'M': {}}, {'L': []}]},
+            ]
+        },
+    }
+
+
+def _query_response(items):
+    return {
+        'Items': items,
+        'Count': len(items),
+        'ScannedCount': len(items),
+        'LastEvaluatedKey': {'pk': {'S': 'home#1'}},
+        'ConsumedCapacity': {'TableName': 't', 'CapacityUnits': 0.5},
+    }
+
+
+def _parse(parser, operation_model, body):
+    response = {
+        'body': json.dumps(body).encode(),
+        'headers': {'x-amzn-requestid': 'request-id'},
+        'status_code': 200,
+        'context': {},
+    }
+    return parser.parse(response, operation_model.output_shape)
+
+
+def test_compiled_parser_matches_shape_walk(session):
+    model = session.get_service_model('dynamodb')
+    shape = model.operation_model('Query').output_shape
+    parser = parsers.create_parser('json')
+    body = _query_response([_attribute_values() for _ in range(3)])
+
+    expected = parser._parse_shape(shape, json.loads(json.dumps(body)))
+    compiled = parser._parse_compiled_shape(shape, json.loads(json.dumps(body)))
+
+    assert compiled == expected
+    assert compiled['Items'][0]['bin']['B'] == b'\x00\x01binary'
+
+
+def test_compiled_parser_handles_timestamps_and_missing_members(session):
+    model = session.get_service_model('kinesis')
+    shape = model.operation_model('DescribeStreamSummary').output_shape
+    parser = parsers.create_parser('json')
+    body = {
+        'StreamDescriptionSummary': {
+            'StreamName': 'stream',
+            'StreamARN': 'arn:aws:kinesis:us-east-1:123456789012:stream/s',
+            'StreamStatus': 'ACTIVE',
+            'RetentionPeriodHours': 24,
+            'StreamCreationTimestamp': 1700000000.5,
+            'EnhancedMonitoring': [{'ShardLevelMetrics': ['IncomingBytes']}],
+            'OpenShardCount': 1,
+            'Unmodeled': 'ignored',
+        }
+    }
+
+    expected = parser._parse_shape(shape, json.loads(json.dumps(body)))
+    compiled = parser._parse_compiled_shape(shape, json.loads(json.dumps(body)))
+
+    assert compiled == expected
+    summary = compiled['StreamDescriptionSummary']
+    assert isinstance(summary['StreamCreationTimestamp'], datetime.datetime)
+    assert 'Unmodeled' not in summary
+
+
+def test_raw_attribute_values_match_parsed_values(session):
+    operation_model = session.get_service_model('dynamodb').operation_model(
+        'Query'
+    )
+    body = _query_response([_attribute_values() for _ in range(3)])
+    factory = parsers.ResponseParserFactory()
+    factory.set_parser_defaults(raw_attribute_values=True)
+
+    expected = _parse(parsers.create_parser('json'), operation_model, body)
+    raw = _parse(factory.create_parser('json'), operation_model, body)
+
+    assert raw == expected
+    assert raw['Items'][0]['blobs']['BS'] == [b'\x00\x01binary'] * 2
+    assert raw['ResponseMetadata']['RequestId'] == 'request-id'
+
+
+def test_compiled_parser_is_cached_on_the_shape(session):
+    shape = (
+        session.get_service_model('dynamodb')
+        .operation_model('GetItem')
+        .output_shape
+    )
+    parser = parsers.create_parser('json')
+    parser._parse_compiled_shape(shape, {'Item': {'pk': {'S': 'a'}}})
+    cached = dict(shape._cache)
+
+    parser._parse_compiled_shape(shape, {'Item': {'pk': {'S': 'b'}}})
+
+    assert shape._cache == cached
+    assert ('json-parser', parsers.JSONParser, False) in cached
@@ -0,0 +1,298 @@
+"""The compiled request serializers match the generic shape walk."""
+import datetime
+
+import pytest
+
+import botocore.session
+from botocore import model, serialize
+
+SERVICES = [
+    'dynamodb',
+    'kinesis',
+    'logs',
+    'iotsitewise',
+    'lambda',
+    'lex-runtime',
+    'iot-data',
+    'cloudwatch',
+    'sqs',
+    'sns',
+    'ec2',
+]
+TIMESTAMP = datetime.datetime(
+    2023, 1, 2, 3, 4, 5, 678000, tzinfo=datetime.timezone.utc
+)
+
+
+def _walk_serializer(protocol):
+    # The serializer of ``protocol`` with the per-shape functions replaced
+    # by the _serialize walk they were compiled from.
+    base = serialize.SERIALIZERS[protocol]
+    if issubclass(base, serialize.QuerySerializer):
+
+        def _get_compiled_serializer(self, shape):
+            def walk(serializer, serialized, value, prefix):
+                serializer._serialize(serialized, value, shape, prefix)
+
+            return walk
+
+    else:
+
+        def _get_compiled_serializer(self, shape):
+            def walk(serializer, value):
+                serialized = serializer.MAP_TYPE()
+                serializer._serialize(serialized, value, shape)
+                return serialized
+
+            return walk
+
+    walk_class = type(
+        f'Walk{base.__name__}',
+        (base,),
+        {'_get_compiled_serializer': _get_compiled_serializer},
+    )
+    return walk_class()
+
+
+def _sample(shape, depth=0):
+    # A value for every member of ``shape``, cut off at a depth that still
+    # reaches into recursive shapes such as DynamoDB's AttributeValue.
+    type_name = shape.type_name
+    if shape.serialization.get('jsonvalue'):
+        return {'attributes': [1, 'two', {'three': None}]}
+    if type_name == 'structure':
+        if shape.is_document_type:
+            return {'document': [1, {'nested': True}]}
+        if depth > 4:
+            return {}
+        return {
+            name: _sample(member, depth + 1)
+            for name, member in shape.members.items()
+        }
+    if type_name == 'list':
+        if depth > 4:
+            return []
+        return [_sample(shape.member, depth + 1) for _ in range(2)]
+    if type_name == 'map':
+        if depth > 4:
+            return {}
+        return {
+            f'key{i}': _sample(shape.value, depth + 1) for i in range(2)
+        }
+    if type_name == 'string':
+        return shape.enum[0] if shape.enum else 'value'
+    if type_name in ('integer', 'long'):
+        return 42
+    if type_name in ('float', 'double'):
+        return 1.5
+    if type_name == 'boolean':
+        return depth % 2 == 0
+    if type_name == 'blob':
+        return b'\x00\xffbinary'
+    if type_name == 'timestamp':
+        return TIMESTAMP
+    raise AssertionError(type_name)
+
+
+def _serialize_both(protocol, params, operation_model):
+    compiled = serialize.SERIALIZERS[protocol]().serialize_to_request(
+        params, operation_model
+    )
+    walked = _walk_serializer(protocol).serialize_to_request(
+        params, operation_model
+    )
+    return compiled, walked
+
+
+def _assert_same(compiled, walked):
+    assert compiled == walked
+    if isinstance(compiled['body'], dict):
+        # Query bodies are sent in their insertion order.
+        assert list(compiled['body'].items()) == list(walked['body'].items())
+
+
+def _operations(service_name):
+    service_model = botocore.session.get_session().get_service_model(
+        service_name
+    )
+    names = service_model.operation_names
+    if len(names) > 100:
+        names = names[::10]
+    return [
+        (service_model.protocol, service_model.operation_model(name))
+        for name in names
+    ]
+
+
+@pytest.mark.parametrize('service_name', SERVICES)
+def test_every_operation_matches_the_walk(service_name):
+    for protocol, operation_model in _operations(service_name):
+        input_shape = operation_model.input_shape
+        params = {} if input_shape is None else _sample(input_shape)
+        _assert_same(*_serialize_both(protocol, params, operation_model))
+
+
+@pytest.mark.parametrize('service_name', SERVICES)
+def test_empty_inputs_match_the_walk(service_name):
+    for protocol, operation_model in _operations(service_name):
+        if operation_model.input_shape is None:
+            continue
+        if operation_model.input_shape.required_members or protocol in (
+            'rest-json',
+            'rest-xml',
+        ):
+            # URI labels and host prefixes need their members.
+            continue
+        _assert_same(*_serialize_both(protocol, {}, operation_model))
+
+
+def _operation_model(protocol, shapes, input_name='Input'):
+    service_model = model.ServiceModel(
+        {
+            'metadata': {
+                'protocol': protocol,
+                'apiVersion': '2014-01-01',
+                'jsonVersion': '1.1',
+                'targetPrefix': 'Test',
+            },
+            'operations': {
+                'Op': {
+                    'name': 'Op',
+                    'http': {'method': 'POST', 'requestUri': '/'},
+                    'input': {'shape': input_name},
+                }
+            },
+            'shapes': shapes,
+        }
+    )
+    return service_model.operation_model('Op')
+
+
+TIMESTAMP_SHAPES = {
+    'Input': {
+        'type': 'structure',
+        'members': {
+            'Default': {'shape': 'Timestamp'},
+            'Iso': {'shape': 'IsoTimestamp'},
+            'Rfc': {'shape': 'RfcTimestamp'},
+            'Unix': {'shape': 'UnixTimestamp'},
+            'List': {'shape': 'TimestampList'},
+            'Blob': {'shape': 'Blob'},
+            'Blobs': {'shape': 'BlobMap'},
+            'Empty': {'shape': 'Empty'},
+        },
+    },
+    'Timestamp': {'type': 'timestamp'},
+    'IsoTimestamp': {'type': 'timestamp', 'timestampFormat': 'iso8601'},
+    'RfcTimestamp': {'type': 'timestamp', 'timestampFormat': 'rfc822'},
+    'UnixTimestamp': {
+        'type': 'timestamp',
+        'timestampFormat': 'unixTimestamp',
+    },
+    'TimestampList': {'type': 'list', 'member': {'shape': 'IsoTimestamp'}},
+    'Blob': {'type': 'blob'},
+    'BlobMap': {
+        'type': 'map',
+        'key': {'shape': 'String'},
+        'value': {'shape': 'Blob'},
+    },
+    'String': {'type': 'string'},
+    'Empty': {'type': 'structure', 'members': {}},
+}
+
+
+@pytest.mark.parametrize('protocol', ['json', 'query', 'ec2', 'rest-json'])
+@pytest.mark.parametrize(
+    'timestamp',
+    [
+        TIMESTAMP,
+        TIMESTAMP.replace(microsecond=0),
+        datetime.datetime(2023, 1, 2, 3, 4, 5),
+        '2023-01-02T03:04:05+01:00',
+        1672628645,
+    ],
+)
+def test_timestamps_blobs_and_empty_structures(protocol, timestamp):
+    operation_model = _operation_model(protocol, TIMESTAMP_SHAPES)
+    params = {
+        'Default': timestamp,
+        'Iso': timestamp,
+        'Rfc': timestamp,
+        'Unix': timestamp,
+        'List': [timestamp, timestamp],
+        'Blob': 'text is encoded first',
+        'Blobs': {'a': b'\x00', 'b': b''},
+        'Empty': {},
+    }
+    _assert_same(*_serialize_both(protocol, params, operation_model))
+
+
+QUERY_SHAPES = {
+    'Input': {
+        'type': 'structure',
+        'members': {
+            'Flat': {'shape': 'FlatList'},
+            'FlatNamed': {'shape': 'FlatNamedList', 'locationName': 'Item'},
+            'Named': {'shape': 'NamedList'},
+            'Plain': {'shape': 'PlainList'},
+            'Map': {'shape': 'NamedMap'},
+            'FlatMap': {'shape': 'FlatMap'},
+            'Nested': {'shape': 'Nested', 'locationName': 'Inner'},
+            'Empty': {'shape': 'PlainList'},
+        },
+    },
+    'String': {'type': 'string'},
+    'NamedString': {'type': 'string', 'locationName': 'Value'},
+    'FlatList': {
+        'type': 'list',
+        'member': {'shape': 'String'},
+        'flattened': True,
+    },
+    'FlatNamedList': {
+        'type': 'list',
+        'member': {'shape': 'String', 'locationName': 'Element'},
+        'flattened': True,
+    },
+    'NamedList': {
+        'type': 'list',
+        'member': {'shape': 'String', 'locationName': 'Entry'},
+    },
+    'PlainList': {'type': 'list', 'member': {'shape': 'String'}},
+    'NamedMap': {
+        'type': 'map',
+        'key': {'shape': 'String', 'locationName': 'Name'},
+        'value': {'shape': 'Nested', 'locationName': 'Data'},
+    },
+    'FlatMap': {
+        'type': 'map',
+        'key': {'shape': 'String'},
+        'value': {'shape': 'String'},
+        'flattened': True,
+    },
+    'Nested': {
+        'type': 'structure',
+        'members': {
+            'Values': {'shape': 'NamedList', 'locationName': 'Vals'},
+            'Flag': {'shape': 'Boolean'},
+            'Deeper': {'shape': 'Nested'},
+        },
+    },
+    'Boolean': {'type': 'boolean'},
+}
+
+
+@pytest.mark.parametrize('protocol', ['query', 'ec2'])
+def test_query_flattened_and_location_names(protocol):
+    operation_model = _operation_model(protocol, QUERY_SHAPES)
+    nested = {'Values': ['x', 'y'], 'Flag': False}
+    params = {
+        'Flat': ['a', 'b'],
+        'FlatNamed': ['c', 'd'],
+        'Named': ['e'],
+        'Plain': ['f', 'g'],
+        'Map': {'k1': nested, 'k2': {'Deeper': nested, 'Flag': True}},
+        'FlatMap': {'k': 'v', 'l': 'w'},
+        'Nested': {'Deeper': {'Deeper': nested}},
+        'Empty': [],
+    }
+    _assert_same(*_serialize_both(protocol, params, operation_model))
@@ -0,0 +1,131 @@
+"""Session.get_cached_client shares clients without holding on to secrets."""
+import threading
+
+import pytest
+
+import botocore.session
+from botocore import session as session_module
+
+
+@pytest.fixture
+def session(monkeypatch):
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'env-access')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'env-secret')
+    return botocore.session.get_session()
+
+
+def _client(session, service='dynamodb', **kwargs):
+    return session.get_cached_client(
+        service, region_name='us-east-1', **kwargs
+    )
+
+
+def test_same_arguments_share_a_client(session):
+    client = _client(session)
+
+    assert _client(session) is client
+    assert session.get_client_cache_stats() == {'hits': 1, 'constructions': 1}
+
+
+def test_explicit_credentials_are_keyed_by_digest(session):
+    first = _client(
+        session, aws_access_key_id='AKID', aws_secret_access_key='secret-1'
+    )
+    second = _client(
+        session, aws_access_key_id='AKID', aws_secret_access_key='secret-2'
+    )
+
+    assert first is not second
+    assert first is _client(
+        session, aws_access_key_id='AKID', aws_secret_access_key='secret-1'
+    )
+    for cache_key in session._client_cache:
+        assert 'secret-1' not in cache_key
+        assert 'secret-2' not in cache_key
+
+
+def test_cache_is_bounded(session, monkeypatch):
+    monkeypatch.setattr(session_module, '_CLIENT_CACHE_SIZE', 3)
+    clients = [
+        _client(session, endpoint_url='https://localhost:%d' % port)
+        for port in range(8000, 8005)
+    ]
+
+    assert len(session._client_cache) == 3
+    assert _client(session, endpoint_url='https://localhost:8004') is (
+        clients[-1]
+    )
+
+
+def test_evicted_clients_are_closed(session, monkeypatch):
+    monkeypatch.setattr(session_module, '_CLIENT_CACHE_SIZE', 2)
+    closed = []
+    create_client = session.create_client
+
+    def tracked_create_client(*args, **kwargs):
+        client = create_client(*args, **kwargs)
+        client.close = lambda: closed.append(client)
+        return client
+
+    monkeypatch.setattr(session, 'create_client', tracked_create_client)
+    clients = [
+        _client(session, endpoint_url='https://localhost:%d' % port)
+        for port in range(8000, 8004)
+    ]
+
+    assert closed == clients[:2]
+
+
+def test_client_is_built_outside_of_the_lock(session, monkeypatch):
+    create_client = session.create_client
+    lock_held = []
+
+    def checked_create_client(*args, **kwargs):
+        lock_held.append(session._client_cache_lock.locked())
+        return create_client(*args, **kwargs)
+
+    monkeypatch.setattr(session, 'create_client', checked_create_client)
+    _client(session)
+
+    assert lock_held == [False]
+
+
+def test_concurrent_first_calls_return_one_client(session):
+    barrier = threading.Barrier(4)
+    clients = []
+
+    def get():
+        barrier.wait()
+        clients.append(_client(session, 'sts'))
+
+    threads = [threading.Thread(target=get) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(client) for client in clients}) == 1
+
+
+def test_losing_concurrent_client_is_closed_and_not_counted(
+    session, monkeypatch
+):
+    closed = []
+    create_client = session.create_client
+    winner = []
+
+    def racing_create_client(*args, **kwargs):
+        client = create_client(*args, **kwargs)
+        client.close = lambda: closed.append(client)
+        if not winner:
+            winner.append(None)
+            # Another caller caches its client while this one is built.
+            winner[0] = _client(session, 'sts')
+        return client
+
+    monkeypatch.setattr(session, 'create_client', racing_create_client)
+    client = _client(session, 'sts')
+
+    assert client is winner[0]
+    assert len(closed) == 1 and closed[0] is not client
+    assert session.get_client_cache_stats() == {'hits': 0, 'constructions': 1}
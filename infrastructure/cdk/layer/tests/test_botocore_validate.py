@@ -0,0 +1,146 @@
+"""The compiled validation checks agree with the full validation walk."""
+import datetime
+import decimal
+import io
+
+import pytest
+
+import botocore.session
+from botocore import model, validate
+
+
+def _walk(validator, params, shape):
+    errors = validate.ValidationErrors()
+    validator._validate(params, shape, errors, name='')
+    return errors
+
+
+def _assert_parity(params, shape):
+    validator = validate.ParamValidator()
+    expected = _walk(validator, params, shape)
+    check = validator._get_compiled_check(shape)
+
+    assert check(params) is not expected.has_errors()
+    report = validator.validate(params, shape).generate_report()
+    assert report == expected.generate_report()
+
+
+def _attribute_value(depth):
+    if depth == 0:
+        return {'S': 'leaf'}
+    return {
+        'M': {
+            'a': _attribute_value(depth - 1),
+            'l': {'L': [{'N': '1'}, {'BOOL': True}, {'B': b'x'}]},
+        }
+    }
+
+
+def _put(item):
+    return {'PutRequest': {'Item': item}}
+
+
+@pytest.fixture(scope='module')
+def batch_write_shape():
+    session = botocore.session.get_session()
+    operation_model = session.get_service_model('dynamodb').operation_model(
+        'BatchWriteItem'
+    )
+    return operation_model.input_shape
+
+
+@pytest.mark.parametrize(
+    'params',
+    [
+        {'RequestItems': {'t': [_put({'pk': _attribute_value(4)})]}},
+        {
+            'RequestItems': {'t': [_put({'pk': {'S': 'a'}})] * 25},
+            'ReturnConsumedCapacity': 'TOTAL',
+        },
+        {},
+        {'RequestItems': {'t': []}},
+        {'RequestItems': {'': [_put({'pk': {'S': 'a'}})]}},
+        {'RequestItems': {'t': [_put({'pk': {'S': 1}})]}},
+        {'RequestItems': {'t': [_put({'pk': {'N': 1.5}})]}},
+        {'RequestItems': {'t': [_put({'pk': {'BOOL': 1}})]}},
+        {'RequestItems': {'t': [_put({'pk': {'SS': 'a'}})]}},
+        {'RequestItems': {'t': [{'Bogus': 1}]}},
+        {'RequestItems': {'t': [{'PutRequest': {}}]}},
+        {'RequestItems': [], 'ReturnConsumedCapacity': 5},
+        {'RequestItems': {'t': [_put({'pk': {'S': 'a'}})]}, 'Extra': 1},
+        {'RequestItems': {'t': ({'DeleteRequest': {'Key': {}}},)}},
+    ],
+)
+def test_batch_write_item_parity(batch_write_shape, params):
+    _assert_parity(params, batch_write_shape)
+
+
+@pytest.fixture(scope='module')
+def scalar_shape():
+    resolver = model.ShapeResolver(
+        {
+            'Input': {
+                'type': 'structure',
+                'required': ['Name'],
+                'members': {
+                    'Name': {'shape': 'Name'},
+                    'Count': {'shape': 'Count'},
+                    'Ratio': {'shape': 'Ratio'},
+                    'Data': {'shape': 'Data'},
+                    'When': {'shape': 'When'},
+                    'Choice': {'shape': 'Choice'},
+                },
+            },
+            'Name': {'type': 'string', 'min': 2},
+            'Count': {'type': 'integer', 'min': 1},
+            'Ratio': {'type': 'double'},
+            'Data': {'type': 'blob'},
+            'When': {'type': 'timestamp'},
+            'Choice': {
+                'type': 'structure',
+                'union': True,
+                'members': {
+                    'A': {'shape': 'Name'},
+                    'B': {'shape': 'Count'},
+                },
+            },
+        }
+    )
+    return resolver.get_shape_by_name('Input')
+
+
+@pytest.mark.parametrize(
+    'params',
+    [
+        {'Name': 'ab'},
+        {'Name': 'a'},
+        {'Count': 1},
+        {'Name': 'ab', 'Count': 0},
+        {'Name': 'ab', 'Count': True},
+        {'Name': 'ab', 'Count': '1'},
+        {'Name': 'ab', 'Ratio': 1},
+        {'Name': 'ab', 'Ratio': decimal.Decimal('0.5')},
+        {'Name': 'ab', 'Ratio': '0.5'},
+        {'Name': 'ab', 'Data': 'text'},
+        {'Name': 'ab', 'Data': io.BytesIO(b'data')},
+        {'Name': 'ab', 'Data': 1},
+        {'Name': 'ab', 'When': datetime.datetime(2023, 1, 1)},
+        {'Name': 'ab', 'When': '2023-01-01T00:00:00Z'},
+        {'Name': 'ab', 'When': 'not a date'},
+        {'Name': 'ab', 'Choice': {'A': 'ab'}},
+        {'Name': 'ab', 'Choice': {'A': 'ab', 'B': 1}},
+        {'Name': 'ab', 'Choice': {}},
+    ],
+)
+def test_scalar_and_union_parity(scalar_shape, params):
+    _assert_parity(params, scalar_shape)
+
+
+def test_overridden_validator_takes_the_full_walk(scalar_shape):
+    class StrictStrings(validate.ParamValidator):
+        def _validate_string(self, param, shape, errors, name):
+            errors.report(name, 'invalid type', param=param, valid_types=[])
+
+    errors = StrictStrings().validate({'Name': 'ab'}, scalar_shape)
+
+    assert errors.has_errors()
@@ -0,0 +1,76 @@
+"""IncrementalDetector agrees with from_bytes on payloads cut anywhere."""
+import json
+
+import pytest
+
+from charset_normalizer import from_bytes
+from charset_normalizer.api import IncrementalDetector
+from charset_normalizer.utils import strip_incomplete_utf8_tail
+
+NAMES = {
+    "latin": "Société Générale café",
+    "cjk": "東京都の充電スタンド",
+    "emoji": "charge ⚡🔋 é",
+    "cyrillic": "Зарядная станция Москва",
+}
+
+
+def _minified(name):
+    # No newline, so the sample can only end where the chunk was cut.
+    return json.dumps(
+        [{"name": NAMES[name], "id": i} for i in range(5000)], ensure_ascii=False
+    ).encode("utf-8")
+
+
+@pytest.mark.parametrize("name", sorted(NAMES))
+@pytest.mark.parametrize("cut", range(65536, 65536 + 48, 3))
+def test_sample_cut_mid_character(name, cut):
+    payload = _minified(name)
+    detector = IncrementalDetector()
+    detector.feed(payload[:cut])
+
+    if detector.done:
+        assert detector.close().best().encoding == "utf_8"
+    detector = IncrementalDetector()
+    for start in range(0, len(payload), 10000):
+        if detector.feed(payload[start : start + 10000]):
+            break
+
+    assert detector.close().best().encoding == from_bytes(payload).best().encoding
+
+
+def test_single_byte_payload_without_newline():
+    payload = ("Société Générale café, " * 4000).encode("cp1252")
+    detector = IncrementalDetector()
+    detector.feed(payload)
+
+    assert detector.close().best().encoding == from_bytes(payload).best().encoding
+
+
+@pytest.mark.parametrize(
+    "sequence, expected",
+    [
+        (b"", b""),
+        (b"abc", b"abc"),
+        ("café".encode(), "café".encode()),
+        ("café".encode()[:-1], b"caf"),
+        ("€".encode()[:2], b""),
+        ("x🔋".encode()[:-1], b"x"),
+        ("x🔋".encode(), "x🔋".encode()),
+        (b"\xe9\xe9", b"\xe9"),
+        (b"\x80\x80\x80\x80\x80", b"\x80\x80\x80\x80\x80"),
+    ],
+)
+def test_strip_incomplete_utf8_tail(sequence, expected):
+    assert strip_incomplete_utf8_tail(sequence) == expected
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "cp1252"])
+def test_non_ascii_only_on_unfinished_last_line(encoding):
+    lines = "".join(f"{i},charging station,{i * 7},available\n" for i in range(3200))
+    payload = (lines + "Société Générale café").encode(encoding)
+    assert len(payload) > 65536
+    detector = IncrementalDetector()
+    detector.feed(payload)
+
+    assert detector.close().best().encoding == from_bytes(payload).best().encoding
@@ -0,0 +1,142 @@
+"""parser.parse() returns the same results with and without the ISO fast path."""
+import itertools
+import time
+
+import pytest
+
+from dateutil import tz
+from dateutil.parser import ParserError, parser, parserinfo
+
+DATES = ["2023-01-01", "2024-02-29", "2023-02-30", "2023-13-01", "0001-01-01"]
+TIMES = [
+    "",
+    "T00:00",
+    "T10:30",
+    "T23:59:59",
+    "T24:00",
+    "T24:00:00",
+    "T12:60",
+    " 08:15:30",
+    "T08:15:30.5",
+    "T08:15:30.123456",
+    "T08:15:30.1234567",
+    "T08:15:30.",
+]
+OFFSETS = [
+    "",
+    "Z",
+    "+00",
+    "+0000",
+    "+00:00",
+    "-00:00",
+    "+01",
+    "+0130",
+    "+01:30",
+    "-05:00",
+    "+01:60",
+    "+14:00",
+    "+24:00",
+    "+99:99",
+]
+STRINGS = [
+    date + time_ + (offset if time_ else "")
+    for date, time_, offset in itertools.product(DATES, TIMES, OFFSETS)
+] + [
+    "2023-01-01T10",
+    "2023-01-01T10:00:00Zjunk",
+    "20230101T100000Z",
+    "2023-01-01t10:00:00z",
+    "  2023-01-01T10:00:00Z",
+    "2023-01-01T10:00:00 UTC",
+]
+
+
+@pytest.fixture(params=["UTC", "Europe/Paris", "America/New_York"])
+def local_zone(request, monkeypatch):
+    monkeypatch.setenv("TZ", request.param)
+    time.tzset()
+    yield request.param
+    monkeypatch.undo()
+    time.tzset()
+
+
+class SlowParser(parser):
+    def _parse_iso(self, timestr, ignoretz):
+        return None
+
+
+def _outcome(parser_, timestr, **kwargs):
+    try:
+        result = parser_.parse(timestr, **kwargs)
+        # Offsets of a day or more only fail once they are used.
+        return (
+            result.replace(tzinfo=None),
+            type(result.tzinfo),
+            result.utcoffset(),
+            result.tzname(),
+        )
+    except (ParserError, ValueError, OverflowError) as e:
+        return type(e)
+
+
+def test_fast_path_matches_tokenizer(local_zone):
+    fast, slow = parser(), SlowParser()
+    for timestr in STRINGS:
+        for ignoretz in (False, True):
+            assert _outcome(fast, timestr, ignoretz=ignoretz) == _outcome(
+                slow, timestr, ignoretz=ignoretz
+            ), (local_zone, timestr, ignoretz)
+
+
+@pytest.mark.parametrize(
+    "timestr", ["2023-06-01T10:00:00Z", "2023-06-01T10:00:00-00:00"]
+)
+def test_zero_offsets_are_local_when_the_local_zone_is_utc(local_zone, timestr):
+    result = parser().parse(timestr)
+
+    if local_zone == "UTC":
+        assert isinstance(result.tzinfo, tz.tzlocal)
+    else:
+        assert result.tzinfo is tz.UTC
+
+
+def test_offset_minutes_are_not_range_checked():
+    result = parser().parse("2023-01-01T10:00:00+01:60")
+
+    assert result.utcoffset().total_seconds() == 7200
+    assert result == SlowParser().parse("2023-01-01T10:00:00+01:60")
+
+
+def test_offsets_are_cached_and_shared():
+    first = parser().parse("2023-01-01T10:00:00+05:30")
+    second = parser().parse("2023-06-01T10:00:00+05:30")
+
+    assert first.tzinfo is second.tzinfo
+    assert parser._iso_tzinfos["+05:30"] is first.tzinfo
+
+
+@pytest.mark.parametrize(
+    "timestr, kwargs, info",
+    [
+        ("2023-01-02", {"dayfirst": True}, None),
+        ("2023-01-02", {}, parserinfo(dayfirst=True)),
+        ("2023-01-02", {}, parserinfo(yearfirst=True)),
+        (b"2023-01-02T10:00:00Z", {}, None),
+        ("2023-01-02T10:00:00Z", {"default": None, "fuzzy": True}, None),
+        ("2023-01-02T10:00:00+01:00", {"tzinfos": {}}, None),
+    ],
+)
+def test_other_parses_use_the_tokenizer(timestr, kwargs, info):
+    fast = parser(info)
+    results = []
+
+    def parse_iso(*args):
+        results.append(parser._parse_iso(fast, *args))
+        return results[-1]
+
+    fast._parse_iso = parse_iso
+
+    assert _outcome(fast, timestr, **kwargs) == _outcome(
+        SlowParser(info), timestr, **kwargs
+    )
+    assert results in ([], [None])
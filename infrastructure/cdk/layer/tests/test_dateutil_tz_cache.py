@@ -0,0 +1,98 @@
+"""tzfile's cached transition period gives the same offsets as a lookup."""
+import datetime
+import os
+import pickle
+import zoneinfo
+
+import pytest
+
+from dateutil import tz
+
+ZONEINFO = '/usr/share/zoneinfo'
+# Wall times around each transition, in seconds, covering the ambiguous
+# and the skipped periods.
+AROUND = (-1, 0, 1, 3599, 3600, 7200)
+EPOCH = datetime.datetime(1970, 1, 1)
+FIRST = (datetime.datetime(1990, 1, 1) - EPOCH).total_seconds()
+LAST = (datetime.datetime(2038, 1, 1) - EPOCH).total_seconds()
+
+pytestmark = pytest.mark.skipif(
+    not os.path.isdir(ZONEINFO), reason='no system time zone database'
+)
+
+
+def _zones():
+    # One name for each distinct zone file; many names are aliases.
+    zones = {}
+    for name in sorted(zoneinfo.available_timezones()):
+        with open(os.path.join(ZONEINFO, name), 'rb') as f:
+            zones.setdefault(f.read(), name)
+    return list(zones.values())
+
+
+def _uncached_ttinfo(zone, dt):
+    # The lookup of tzfile._find_ttinfo before the cache.
+    return zone._get_ttinfo(zone._resolve_ambiguous_time(dt))
+
+
+def _wall_times(zone):
+    for transition in zone._trans_list:
+        if FIRST <= transition <= LAST:
+            for delta in AROUND:
+                dt = EPOCH + datetime.timedelta(seconds=transition + delta)
+                for fold in (0, 1):
+                    yield tz.enfold(dt.replace(tzinfo=zone), fold=fold)
+
+
+def test_cached_lookups_match_uncached_lookups():
+    mismatches = []
+    for name in _zones():
+        zone = tz.tzfile(os.path.join(ZONEINFO, name))
+        wall_times = list(_wall_times(zone))
+        # In order, mostly hitting the cache, then in reverse, mostly not.
+        for dt in wall_times + wall_times[::-1]:
+            if zone._find_ttinfo(dt) != _uncached_ttinfo(zone, dt):
+                mismatches.append((name, dt))
+
+    assert not mismatches
+
+
+def test_zone_without_transitions():
+    zone = tz.tzfile(os.path.join(ZONEINFO, 'UTC'))
+    dt = datetime.datetime(2023, 6, 1, tzinfo=zone)
+
+    assert dt.utcoffset() == datetime.timedelta(0)
+    assert zone._find_ttinfo(dt) == _uncached_ttinfo(zone, dt)
+
+
+def test_unpickled_zone_keeps_working():
+    zone = tz.tzfile(os.path.join(ZONEINFO, 'Europe/London'))
+    summer = datetime.datetime(2023, 7, 1)
+    summer.replace(tzinfo=zone).utcoffset()
+
+    copy = pickle.loads(pickle.dumps(zone))
+    # Zones pickled before the cache existed have no cache in their state.
+    del copy.__dict__['_ttinfo_cache']
+
+    assert summer.replace(tzinfo=copy).utcoffset() == datetime.timedelta(
+        hours=1
+    )
+    assert datetime.datetime(2023, 1, 1, tzinfo=copy).utcoffset() == (
+        datetime.timedelta(0)
+    )
+
+
+def test_localize_many_matches_replace():
+    zone = tz.tzfile(os.path.join(ZONEINFO, 'Europe/London'))
+    slots = [
+        datetime.datetime(2023, 1, 1) + datetime.timedelta(minutes=30 * i)
+        for i in range(17520)
+    ]
+
+    localized = tz.localize_many(slots, zone)
+
+    assert [dt.utcoffset() for dt in localized] == [
+        dt.replace(tzinfo=zone).utcoffset() for dt in slots
+    ]
+    with pytest.raises(ValueError):
+        tz.localize_many([localized[0]], zone)
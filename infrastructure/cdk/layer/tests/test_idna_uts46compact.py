@@ -0,0 +1,160 @@
+"""The compact UTS46 table and the encode cache behave like upstream idna."""
+import bisect
+import itertools
+import os
+import subprocess
+import sys
+
+import pytest
+
+import idna
+from idna import core
+from idna.uts46compact import replacements, starts, statuses
+from idna.uts46data import uts46data
+
+MODES = list(itertools.product([False, True], repeat=2))
+
+
+def _reference_remap(char, std3_rules, transitional):
+    # The lookup of uts46_remap before the compact table, for one character.
+    code_point = ord(char)
+    row = uts46data[
+        code_point
+        if code_point < 256
+        else bisect.bisect_left(uts46data, (code_point, 'Z')) - 1
+    ]
+    status = row[1]
+    replacement = row[2] if len(row) == 3 else None
+    if (
+        status == 'V'
+        or (status == 'D' and not transitional)
+        or (status == '3' and not std3_rules and replacement is None)
+    ):
+        return char
+    if replacement is not None and (
+        status == 'M'
+        or (status == '3' and not std3_rules)
+        or (status == 'D' and transitional)
+    ):
+        return replacement
+    if status == 'I':
+        return ''
+    return None
+
+
+def _remap(char, std3_rules, transitional):
+    try:
+        return core.uts46_remap(char, std3_rules, transitional)
+    except core.InvalidCodepoint:
+        return None
+
+
+def test_compact_table_holds_the_rows_of_uts46data():
+    assert list(starts) == [row[0] for row in uts46data]
+    assert statuses == ''.join(row[1] for row in uts46data)
+    assert replacements == tuple(
+        row[2] if len(row) == 3 else None for row in uts46data
+    )
+
+
+@pytest.mark.parametrize('std3_rules, transitional', MODES)
+def test_remap_matches_uts46data_around_every_row_start(
+    std3_rules, transitional
+):
+    code_points = sorted(
+        {
+            code_point
+            for start in starts
+            for code_point in (start - 1, start, start + 1)
+            if 0 <= code_point <= sys.maxunicode
+            and not 0xD800 <= code_point <= 0xDFFF
+        }
+    )
+    for code_point in code_points:
+        char = chr(code_point)
+        expected = _reference_remap(char, std3_rules, transitional)
+        if expected is not None:
+            expected = core.unicodedata.normalize('NFC', expected)
+        assert _remap(char, std3_rules, transitional) == expected, hex(
+            code_point
+        )
+
+
+@pytest.mark.parametrize(
+    'domain',
+    [
+        'Straße.de',
+        'ÖBB.at',
+        'xn--nxasmq6b.com',
+        'Ｅｘａｍｐｌｅ．ｃｏｍ',
+        'ドメイン.テスト',
+    ],
+)
+@pytest.mark.parametrize('std3_rules, transitional', MODES)
+def test_encode_with_uts46(domain, std3_rules, transitional):
+    expected = ''.join(
+        _reference_remap(char, std3_rules, transitional) for char in domain
+    )
+    expected = core.unicodedata.normalize('NFC', expected)
+
+    assert idna.encode(
+        domain, uts46=True, std3_rules=std3_rules, transitional=transitional
+    ) == idna.encode(expected)
+
+
+def test_encode_results_are_cached():
+    core._encode.cache_clear()
+    first = idna.encode('bücher.example')
+    second = idna.encode(b'xn--bcher-kva.example')
+    third = idna.encode('bücher.example')
+
+    assert first == second == third == b'xn--bcher-kva.example'
+    assert core._encode.cache_info().hits == 1
+
+
+def test_encode_errors_are_not_cached():
+    core._encode.cache_clear()
+    for _ in range(2):
+        with pytest.raises(idna.IDNAError):
+            idna.encode('a..b')
+
+    assert core._encode.cache_info().currsize == 0
+    with pytest.raises(idna.IDNAError):
+        idna.encode(b'\xff.example')
+
+
+def test_tables_are_loaded_on_first_use():
+    layer = os.path.dirname(os.path.dirname(idna.__file__))
+    code = (
+        'import sys\n'
+        f'sys.path.insert(0, {layer!r})\n'
+        'import idna\n'
+        'print("idna.idnadata" in sys.modules)\n'
+        'idna.encode("bücher.example", uts46=True)\n'
+        'print("idna.idnadata" in sys.modules)\n'
+        'print("idna.uts46data" in sys.modules)\n'
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    assert output.split() == ['False', 'True', 'False']
+
+
+def test_compact_table_is_generated_from_uts46data():
+    from idna import uts46compact, uts46data as data
+
+    tools = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'tools')
+    sys.path.insert(0, tools)
+    try:
+        import gen_uts46compact
+    finally:
+        sys.path.remove(tools)
+    with open(uts46compact.__file__, encoding='utf-8') as f:
+        source = f.read()
+
+    assert source == gen_uts46compact.generate(uts46data, data.__version__)
+    assert uts46compact.__doc__.startswith('IDNA Mapping Table from UTS46')
@@ -0,0 +1,128 @@
+"""Response.json() parses UTF-8 JSON bodies from bytes like from text."""
+import decimal
+import json
+
+import pytest
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+DOCUMENT = {"name": "Société Générale café", "values": [1, 2.5, None, True]}
+UTF8 = json.dumps(DOCUMENT, ensure_ascii=False).encode("utf-8")
+
+BODIES = [
+    ("application/json", UTF8),
+    ("application/json; charset=utf-8", UTF8),
+    ("application/json; charset=UTF8", UTF8),
+    ("application/geo+json", UTF8),
+    ("application/json", b"\xef\xbb\xbf" + UTF8),
+    ("application/json", json.dumps(DOCUMENT).encode("utf-16")),
+    ("application/json", json.dumps(DOCUMENT).encode("utf-32-le")),
+    ("application/json", json.dumps(DOCUMENT, ensure_ascii=False).encode("latin-1")),
+    ("application/json; charset=iso-8859-1", "[\"café\"]".encode("latin-1")),
+    ("text/plain", UTF8),
+    (None, UTF8),
+    ("application/json", b"[1, 2"),
+    ("application/json", b""),
+    ("application/json", b"12"),
+]
+
+
+def _response(content_type, body):
+    response = Response()
+    response.status_code = 200
+    response.headers = CaseInsensitiveDict()
+    if content_type is not None:
+        response.headers["Content-Type"] = content_type
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = body
+    return response
+
+
+def _outcome(response, **kwargs):
+    try:
+        return response.json(**kwargs)
+    except requests.JSONDecodeError as e:
+        return type(e)
+
+
+@pytest.mark.parametrize("content_type, body", BODIES)
+def test_bytes_path_matches_text_path(content_type, body):
+    text_path = _response(content_type, body)
+    text_path._is_utf8_json = lambda: False
+
+    assert _outcome(_response(content_type, body)) == _outcome(text_path)
+
+
+def test_invalid_json_raises_requests_error():
+    with pytest.raises(requests.JSONDecodeError) as info:
+        _response("application/json", b'{"a": }').json()
+
+    assert isinstance(info.value, json.JSONDecodeError)
+    assert info.value.pos == 6
+
+
+def test_json_loads_is_used_without_kwargs():
+    calls = []
+
+    def loads(body):
+        calls.append(body)
+        return json.loads(body)
+
+    response = _response("application/json", UTF8)
+    response.json_loads = loads
+
+    assert response.json() == DOCUMENT
+    assert calls == [UTF8]
+
+
+def test_kwargs_use_the_standard_library():
+    response = _response("application/json", b"[0.1]")
+    response.json_loads = lambda body: pytest.fail("json_loads called")
+
+    assert response.json(parse_float=decimal.Decimal) == [
+        decimal.Decimal("0.1")
+    ]
+
+
+class StaticAdapter(BaseAdapter):
+    def send(self, request, **kwargs):
+        response = _response("application/json", UTF8)
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+def test_session_json_loads_is_copied_to_responses():
+    session = requests.Session()
+    session.mount("https://", StaticAdapter())
+    calls = []
+
+    def loads(body):
+        calls.append(body)
+        return json.loads(body)
+
+    assert session.get("https://example.com").json_loads is None
+
+    session.json_loads = loads
+    response = session.get("https://example.com")
+
+    assert response.json() == DOCUMENT
+    assert calls == [UTF8]
+
+
+@pytest.mark.parametrize("content_type, body", BODIES)
+def test_orjson_loader_matches_text_path(content_type, body):
+    orjson = pytest.importorskip("orjson")
+    text_path = _response(content_type, body)
+    text_path._is_utf8_json = lambda: False
+    response = _response(content_type, body)
+    response.json_loads = orjson.loads
+
+    assert _outcome(response) == _outcome(text_path)
@@ -0,0 +1,85 @@
+"""requests imports its character detection library only to guess an encoding."""
+import os
+import subprocess
+import sys
+
+import requests
+
+LAYER = os.path.dirname(os.path.dirname(requests.__file__))
+
+RESPONSE = """
+from requests.models import Response
+
+def response(body, detect_encoding=True):
+    r = Response()
+    r.status_code = 200
+    r._content = body
+    r.detect_encoding = detect_encoding
+    return r
+"""
+
+
+def _run(code):
+    code = f"import sys\nsys.path.insert(0, {LAYER!r})\n" + RESPONSE + code
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.split()
+
+
+def test_import_leaves_detection_unloaded():
+    assert _run(
+        "import requests\n"
+        "requests.Session()\n"
+        'print("charset_normalizer" in sys.modules)\n'
+        'print("chardet" in sys.modules)\n'
+    ) == ["False", "False"]
+
+
+def test_text_without_detection_is_decoded_as_utf8():
+    assert _run(
+        'r = response("café".encode("utf-8"), detect_encoding=False)\n'
+        "print(r.apparent_encoding)\n"
+        'print(r.text == "café")\n'
+        'print("charset_normalizer" in sys.modules)\n'
+    ) == ["None", "True", "False"]
+
+
+def test_session_setting_applies_to_its_responses():
+    assert _run(
+        "import requests\n"
+        "from requests.adapters import BaseAdapter\n"
+        "class Adapter(BaseAdapter):\n"
+        "    def send(self, request, **kwargs):\n"
+        '        r = response("naïve".encode("utf-8"))\n'
+        "        r.request = request\n"
+        "        r.url = request.url\n"
+        "        return r\n"
+        "session = requests.Session()\n"
+        "session.detect_encoding = False\n"
+        'session.mount("http://", Adapter())\n'
+        'r = session.get("http://example.com")\n'
+        'print(r.detect_encoding, r.text == "naïve")\n'
+        'print("charset_normalizer" in sys.modules)\n'
+    ) == ["False", "True", "False"]
+
+
+def test_text_with_detection_imports_the_library():
+    assert _run(
+        'r = response("café".encode("utf-8"))\n'
+        'print(r.text == "café")\n'
+        'print("charset_normalizer" in sys.modules)\n'
+    ) == ["True", "True"]
+
+
+def test_packages_alias_resolves_before_first_detection():
+    assert _run(
+        "import charset_normalizer\n"
+        "import requests\n"
+        "from requests.packages import chardet\n"
+        "print(chardet is charset_normalizer)\n"
+        "print(requests.packages.chardet is charset_normalizer)\n"
+        'print(sys.modules["requests.packages.chardet"] is chardet)\n'
+    ) == ["True", "True", "True"]
@@ -0,0 +1,182 @@
+"""Pools report their events to PoolMetrics, aggregated by PoolStatistics."""
+import ssl
+import time
+
+import pytest
+
+import botocore.session
+import urllib3
+from botocore.config import Config
+from urllib3.exceptions import EmptyPoolError
+from urllib3.util import PoolStatistics
+from urllib3.util.metrics import Histogram
+
+TIMEOUT = 5
+
+
+def test_histogram_counts_values_up_to_each_bound():
+    histogram = Histogram(bounds=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot['buckets'] == {0.1: 2, 1.0: 1, float('inf'): 1}
+    assert snapshot['count'] == 4
+    assert snapshot['sum'] == pytest.approx(2.65)
+    assert snapshot['mean'] == pytest.approx(2.65 / 4)
+    assert snapshot['max'] == 2.0
+
+    histogram.reset()
+    snapshot = histogram.snapshot()
+    assert snapshot['count'] == 0
+    assert snapshot['mean'] == 0.0
+    assert set(snapshot['buckets'].values()) == {0}
+
+
+def test_statistics_aggregate_events():
+    stats = PoolStatistics()
+    pool = urllib3.HTTPConnectionPool('localhost')
+    stats.on_request(pool, reused=False)
+    stats.on_request(pool, reused=True)
+    stats.on_request(pool, reused=True)
+    stats.on_new_connection(pool)
+    stats.on_reconnection(pool)
+    stats.on_connection_discarded(pool)
+    stats.on_tls_handshake(pool, 0.02)
+    stats.on_tls_session_resumed(pool)
+    stats.on_pool_wait(pool, 0.001)
+
+    snapshot = stats.snapshot()
+    assert snapshot['requests'] == 3
+    assert snapshot['reused_requests'] == 2
+    assert snapshot['reuse_ratio'] == pytest.approx(2 / 3)
+    assert snapshot['new_connections'] == 1
+    assert snapshot['reconnections'] == 1
+    assert snapshot['discarded_connections'] == 1
+    assert snapshot['resumed_tls_sessions'] == 1
+    assert snapshot['tls_handshake']['count'] == 1
+    assert snapshot['pool_wait']['count'] == 1
+
+    stats.reset()
+    snapshot = stats.snapshot()
+    assert snapshot['requests'] == 0
+    assert snapshot['reuse_ratio'] == 0.0
+    assert snapshot['pool_wait']['count'] == 0
+
+
+def test_requests_on_a_pool_are_counted(serve):
+    server = serve()
+    stats = PoolStatistics()
+    pool = urllib3.HTTPConnectionPool('127.0.0.1', server.port, metrics=stats)
+
+    for _ in range(3):
+        pool.request('GET', '/')
+
+    snapshot = stats.snapshot()
+    assert snapshot['requests'] == 3
+    assert snapshot['reused_requests'] == 2
+    assert snapshot['new_connections'] == 1
+    assert snapshot['reconnections'] == 0
+    assert snapshot['pool_wait']['count'] == 3
+
+
+def test_closed_connections_are_counted_as_reconnections(serve):
+    server = serve()
+    stats = PoolStatistics()
+    pool = urllib3.HTTPConnectionPool('127.0.0.1', server.port, metrics=stats)
+
+    pool.request('GET', '/close')
+    pool.request('GET', '/')
+
+    assert server.connections(2) == 2
+    snapshot = stats.snapshot()
+    assert snapshot['requests'] == 2
+    assert snapshot['reused_requests'] == 0
+    assert snapshot['new_connections'] == 1
+    assert snapshot['reconnections'] == 1
+
+
+def test_dropped_idle_connections_are_counted_as_reconnections(serve):
+    server = serve(idle_timeout=0.05)
+    stats = PoolStatistics()
+    pool = urllib3.HTTPConnectionPool('127.0.0.1', server.port, metrics=stats)
+    assert pool.prewarm(1) == 1
+    conn = pool.pool.queue[-1]
+    deadline = time.monotonic() + TIMEOUT
+    while conn.is_connected and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    pool.request('GET', '/')
+
+    snapshot = stats.snapshot()
+    assert snapshot['new_connections'] == 1
+    assert snapshot['reconnections'] == 1
+    assert snapshot['reused_requests'] == 0
+
+
+def test_timed_out_pool_wait_is_recorded():
+    stats = PoolStatistics()
+    pool = urllib3.HTTPConnectionPool(
+        'localhost', maxsize=1, block=True, metrics=stats
+    )
+    pool._get_conn()
+
+    with pytest.raises(EmptyPoolError):
+        pool._get_conn(timeout=0.05)
+
+    pool_wait = stats.snapshot()['pool_wait']
+    assert pool_wait['count'] == 2
+    assert pool_wait['max'] >= 0.05
+
+
+def test_connections_beyond_maxsize_are_discarded():
+    stats = PoolStatistics()
+    pool = urllib3.HTTPConnectionPool('localhost', maxsize=1, metrics=stats)
+    conns = [pool._get_conn(), pool._get_conn()]
+
+    for conn in conns:
+        pool._put_conn(conn)
+
+    snapshot = stats.snapshot()
+    assert snapshot['new_connections'] == 2
+    assert snapshot['discarded_connections'] == 1
+
+
+def test_tls_handshakes_are_recorded(serve, tls_cert):
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(*tls_cert)
+    server = serve(context)
+    stats = PoolStatistics()
+    pool = urllib3.HTTPSConnectionPool(
+        'localhost', server.port, ca_certs=tls_cert[0], metrics=stats
+    )
+
+    pool.request('GET', '/')
+
+    handshake = stats.snapshot()['tls_handshake']
+    assert handshake['count'] == 1
+    assert handshake['max'] > 0
+
+
+@pytest.mark.parametrize('transport', ['urllib3', 'asyncio'])
+def test_client_config_passes_metrics_to_its_pools(
+    serve, monkeypatch, transport
+):
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'access')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'secret')
+    server = serve()
+    stats = PoolStatistics()
+    client = botocore.session.get_session().create_client(
+        'dynamodb',
+        region_name='us-east-1',
+        endpoint_url='http://127.0.0.1:%d' % server.port,
+        config=Config(pool_metrics=stats, http_transport=transport),
+    )
+
+    client.list_tables()
+    client.list_tables()
+
+    snapshot = stats.snapshot()
+    assert snapshot['requests'] == 2
+    assert snapshot['reused_requests'] == 1
+    assert snapshot['new_connections'] == 1
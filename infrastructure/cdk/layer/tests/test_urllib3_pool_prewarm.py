@@ -0,0 +1,110 @@
+"""Pools open connections ahead of time and report how they are reused."""
+import ssl
+import time
+
+import botocore.session
+import urllib3
+from urllib3.util.wait import wait_for_read
+
+TIMEOUT = 5
+
+
+def test_prewarmed_connections_are_reused(serve):
+    server = serve()
+    pool = urllib3.HTTPConnectionPool('127.0.0.1', server.port, maxsize=4)
+
+    assert pool.prewarm(3) == 3
+    stats = pool.connection_stats()
+    assert stats['num_connections'] == 3
+    assert stats['num_requests'] == 0
+    assert stats['idle_connections'] == 3
+
+    for _ in range(3):
+        assert pool.request('GET', '/').data == b'ok'
+
+    assert server.connections(3) == 3
+    stats = pool.connection_stats()
+    assert stats['num_connections'] == 3
+    assert stats['num_requests'] == 3
+    assert stats['num_connection_reuses'] == 3
+    assert stats['reuse_ratio'] == 1.0
+    ages = stats['idle_connection_ages']
+    assert len(ages) == 3
+    assert ages == sorted(ages, reverse=True)
+
+
+def test_prewarm_opens_only_missing_connections(serve):
+    server = serve()
+    pool = urllib3.HTTPConnectionPool('127.0.0.1', server.port, maxsize=4)
+    pool.request('GET', '/')
+
+    assert pool.prewarm(2) == 1
+    assert pool.prewarm(2) == 0
+    # The pool never holds more than maxsize connections.
+    assert pool.prewarm(10) == 2
+
+    assert server.connections(4) == 4
+    stats = pool.connection_stats()
+    assert stats['num_connections'] == 4
+    assert stats['idle_connections'] == 4
+
+
+def _tls13_server(serve, tls_cert, idle_timeout=None):
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.minimum_version = ssl.TLSVersion.TLSv1_3
+    context.load_cert_chain(*tls_cert)
+    return serve(context, idle_timeout)
+
+
+def test_tls13_connection_with_pending_tickets_is_not_dropped(
+    serve, tls_cert
+):
+    server = _tls13_server(serve, tls_cert)
+    pool = urllib3.HTTPSConnectionPool(
+        'localhost', server.port, ca_certs=tls_cert[0]
+    )
+
+    assert pool.prewarm(1) == 1
+    conn = pool.pool.queue[-1]
+    # The server's session tickets arrive after the handshake and are
+    # left unread until the connection is used.
+    assert wait_for_read(conn.sock, timeout=TIMEOUT)
+    assert conn.sock.version() == 'TLSv1.3'
+    assert conn.is_connected
+
+    assert pool.request('GET', '/').data == b'ok'
+    assert server.connections(1) == 1
+    assert pool.connection_stats()['num_connection_reuses'] == 1
+
+
+def test_closed_tls_connection_is_dropped(serve, tls_cert):
+    server = _tls13_server(serve, tls_cert, idle_timeout=0.1)
+    pool = urllib3.HTTPSConnectionPool(
+        'localhost', server.port, ca_certs=tls_cert[0]
+    )
+    pool.prewarm(1)
+    conn = pool.pool.queue[-1]
+
+    deadline = time.monotonic() + TIMEOUT
+    while conn.is_connected and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert not conn.is_connected
+
+
+def test_client_prewarms_its_endpoint(serve, monkeypatch):
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'access')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'secret')
+    server = serve()
+    url = 'http://127.0.0.1:%d' % server.port
+    client = botocore.session.get_session().create_client(
+        'dynamodb', region_name='us-east-1', endpoint_url=url
+    )
+
+    assert client.prewarm_connections(2) == 2
+    assert client.prewarm_connections(2) == 0
+
+    assert server.connections(2) == 2
+    stats = client.get_connection_stats()[url]
+    assert stats['num_connections'] == 2
+    assert stats['idle_connections'] == 2
@@ -0,0 +1,90 @@
+"""TLS session resumption is opt-in for urllib3 and enabled by botocore."""
+import ssl
+
+import pytest
+import requests
+import urllib3
+from botocore.httpsession import URLLib3Session
+from urllib3.util import PoolStatistics, TLSSessionCache
+from urllib3.util.ssl_ import create_urllib3_context
+
+
+def test_pool_manager_has_no_session_cache_by_default():
+    manager = urllib3.PoolManager()
+    pool = manager.connection_from_url('https://example.com')
+
+    assert 'tls_session_cache' not in manager.connection_pool_kw
+    assert pool.conn_kw.get('tls_session_cache') is None
+
+
+def test_requests_sessions_do_not_resume_tls_sessions():
+    adapter = requests.Session().get_adapter('https://example.com')
+
+    assert 'tls_session_cache' not in adapter.poolmanager.connection_pool_kw
+
+
+def test_pool_manager_uses_a_given_session_cache():
+    cache = TLSSessionCache()
+    manager = urllib3.PoolManager(tls_session_cache=cache)
+    pool = manager.connection_from_url('https://example.com')
+
+    assert pool.conn_kw['tls_session_cache'] is cache
+
+
+def test_botocore_sessions_share_one_cache_between_managers():
+    session = URLLib3Session()
+    proxy_manager = session._get_proxy_manager('http://proxy.example.com')
+    cache = session._manager.connection_pool_kw['tls_session_cache']
+
+    assert isinstance(cache, TLSSessionCache)
+    assert proxy_manager.connection_pool_kw['tls_session_cache'] is cache
+    assert URLLib3Session()._manager.connection_pool_kw[
+        'tls_session_cache'
+    ] is not cache
+
+
+@pytest.fixture
+def tls13_server(serve, tls_cert):
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.minimum_version = ssl.TLSVersion.TLSv1_3
+    context.load_cert_chain(*tls_cert)
+    return serve(context)
+
+
+def _pool(server, tls_cert, stats):
+    context = create_urllib3_context()
+    context.load_verify_locations(tls_cert[0])
+    return urllib3.HTTPSConnectionPool(
+        'localhost',
+        server.port,
+        ssl_context=context,
+        tls_session_cache=TLSSessionCache(),
+        metrics=stats,
+    )
+
+
+def test_new_connections_resume_the_pooled_session(tls13_server, tls_cert):
+    stats = PoolStatistics()
+    pool = _pool(tls13_server, tls_cert, stats)
+    pool.request('GET', '/')
+
+    # The second connection is opened while the first one is in use.
+    conns = [pool._get_conn(), pool._get_conn()]
+    for conn in conns:
+        pool._validate_conn(conn)
+        pool._put_conn(conn)
+
+    assert stats.snapshot()['resumed_tls_sessions'] == 1
+    assert conns[1].tls_session_reused
+
+
+def test_sessions_of_closed_connections_are_resumed(tls13_server, tls_cert):
+    stats = PoolStatistics()
+    pool = _pool(tls13_server, tls_cert, stats)
+
+    for _ in range(3):
+        assert pool.request('GET', '/close').data == b'ok'
+
+    snapshot = stats.snapshot()
+    assert snapshot['tls_handshake']['count'] == 3
+    assert snapshot['resumed_tls_sessions'] == 2
@@ -0,0 +1,81 @@
+"""Generate python/idna/uts46compact.py from python/idna/uts46data.py.
+
+Run it again after updating idna, e.g. ``python tools/gen_uts46compact.py``.
+"""
+import array
+import os
+import sys
+
+LAYER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'python'
+)
+OUTPUT = os.path.join(LAYER_PATH, 'idna', 'uts46compact.py')
+WIDTH = 72
+
+HEADER = '''\
+# This file is automatically generated from uts46data.py by
+# tools/gen_uts46compact.py
+# vim: set fileencoding=utf-8 :
+
+"""IDNA Mapping Table from UTS46, in a compact form.
+
+The rows of uts46data as three parallel sequences: row i covers the code points
+from starts[i] up to starts[i + 1], with status statuses[i] and replacement
+replacements[i] (None when the row has none).
+"""
+
+from array import array
+import sys
+from typing import Optional, Tuple
+
+
+__version__ = '{version}'
+
+'''
+
+
+def _chunks(text):
+    for i in range(0, len(text), WIDTH):
+        yield "    '{}'\n".format(text[i : i + WIDTH])
+
+
+def generate(rows, version):
+    starts = array.array('I', (row[0] for row in rows))
+    if sys.byteorder == 'big':
+        starts.byteswap()
+    statuses = ''.join(row[1] for row in rows)
+    replacements = [row[2] if len(row) == 3 else None for row in rows]
+
+    out = [HEADER.format(version=version)]
+    out.append('# Little-endian unsigned 32 bit integers.\n')
+    out.append("starts = array('I', bytes.fromhex(\n")
+    out.extend(_chunks(starts.tobytes().hex()))
+    out.append('))\n')
+    out.append("if sys.byteorder == 'big':\n")
+    out.append('    starts.byteswap()\n\n')
+    out.append('statuses = (\n')
+    out.extend(_chunks(statuses))
+    out.append(')\n\n')
+    out.append('replacements = (\n')
+    line = '   '
+    for replacement in replacements:
+        item = f' {replacement!r},'
+        if len(line) + len(item) > 79:
+            out.append(line + '\n')
+            line = '   '
+        line += item
+    out.append(line + '\n')
+    out.append(')  # type: Tuple[Optional[str], ...]\n')
+    return ''.join(out)
+
+
+def main():
+    sys.path.insert(0, LAYER_PATH)
+    from idna.uts46data import __version__, uts46data
+
+    with open(OUTPUT, 'w', encoding='utf-8') as f:
+        f.write(generate(uts46data, __version__))
+
+
+if __name__ == '__main__':
+    main()
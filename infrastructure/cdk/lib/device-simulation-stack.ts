@@ -20,7 +20,7 @@ export class DeviceSimulationStack extends cdk.Stack {
     const apiURL = "https://alkg4x7726.execute-api.us-east-1.amazonaws.com/dev";
 
     const pythonLayer = new LayerVersion(this, 'shared-layer', {
-      code: Code.fromAsset('layer'),
+      code: Code.fromAsset('layer', { exclude: ['tests', 'benchmarks'] }),
       compatibleRuntimes: [Runtime.PYTHON_3_11],
       layerVersionName: 'shared-layer',
     })